@@ -92,6 +92,16 @@ BOTTOM_FACTOR = 0.7
 UPPER_FACTOR = 1.2
 DEC_RANGE_BOTTOM = 0.97
 DEC_RANGE_UPPER = 1.03
+# Max number of elements of the quantized tensors of a batch of candidates evaluated at once in the quantization
+# parameters search (kept small so a chunk stays in cache, larger chunks are memory bound).
+QPARAMS_SEARCH_MAX_BATCH_ELEMENTS = 2 ** 16
+# Max fraction of the available memory for the quantized tensors of a batch of candidates of a tensor that is larger
+# than the max batch elements.
+QPARAMS_SEARCH_MAX_MEMORY_FRACTION = 0.1
+# Memory per element of the quantized tensors of a batch of candidates in the numpy search (float64 temporaries).
+QPARAMS_SEARCH_BATCH_ELEMENT_NBYTES = 32
+# Available memory to assume when the platform doesn't report it.
+QPARAMS_SEARCH_DEFAULT_AVAILABLE_MEMORY = 2 ** 30
 
 NUM_QPARAM_HESSIAN_SAMPLES = 16
 
@@ -113,6 +123,12 @@ DUMMY_TENSOR = 'dummy_tensor'
 # Hessian scores constants
 MIN_HESSIAN_ITER = 10
 HESSIAN_COMP_TOLERANCE = 1e-3
+# Activation hessians estimation stops for a target when the confidence interval (with the given z-score) of its
+# estimation is narrower than the tolerance, relative to the estimation.
+ACT_HESSIAN_CONVERGENCE_TOLERANCE = 1e-1
+HESSIAN_CONVERGENCE_CONFIDENCE_Z = 1.96
+# Max number of target tensors to compute gradients for in a single backward pass (bounds the gradients memory).
+HESSIAN_MAX_GRAD_TARGETS = 64
 
 
 # Hessian configuration default constants
@@ -46,14 +46,18 @@ class HistogramCollector(BaseCollector):
     Collector for holding histogram of tensors going through it.
     """
 
-    def __init__(self, n_bins: int = 2048):
+    def __init__(self, n_bins: int = 2048, streaming: bool = False):
         """
         Args:
             n_bins: Number of bins in the histogram.
+            streaming: Whether to merge each new histogram into a single running histogram (so the memory is
+                fixed regardless of the number of iterations), instead of keeping the histogram of each
+                iteration and merging them lazily.
         """
 
         super().__init__()
         self._n_bins = n_bins
+        self._streaming = streaming
         self._bins = None
         self._counts = None
         self._histogram_per_iteration = []
@@ -85,6 +89,46 @@ class HistogramCollector(BaseCollector):
             self._counts = merged_histogram_counts
             self._bins = merged_histogram_bins
 
+    def _merge_to_running_histogram(self, counts: np.ndarray, bins: np.ndarray):
+        """
+        Merge a new histogram into the running histogram (used in streaming mode).
+        The running histogram is kept between the min/max of all histograms merged so far. If the new histogram
+        exceeds the running histogram range, the range is expanded and both histograms are interpolated to the
+        new bins. Otherwise, only the new histogram is interpolated to the running histogram bins.
+
+        Args:
+            counts: Counts of the histogram to merge.
+            bins: Bins of the histogram to merge.
+        """
+        if self._counts is None:
+            self._counts = interpolate_histogram(bins, bins, counts)
+            self._bins = bins
+            return
+
+        merged_histogram_min = min(self._bins[0], bins[0])
+        merged_histogram_max = max(self._bins[-1], bins[-1])
+        if merged_histogram_min == self._bins[0] and merged_histogram_max == self._bins[-1]:
+            self._counts = self._counts + interpolate_histogram(self._bins, bins, counts)
+        else:
+            merged_histogram_bins = np.linspace(merged_histogram_min, merged_histogram_max, self._n_bins + 1)
+            self._counts = interpolate_histogram(merged_histogram_bins, self._bins, self._counts) + \
+                           interpolate_histogram(merged_histogram_bins, bins, counts)
+            self._bins = merged_histogram_bins
+
+    def _add_histogram(self, counts: np.ndarray, bins: np.ndarray):
+        """
+        Add a histogram of a new tensor that goes through the collector. In streaming mode, the histogram
+        is merged into the running histogram, otherwise it's kept for a lazy merge.
+
+        Args:
+            counts: Counts of the histogram to add.
+            bins: Bins of the histogram to add.
+        """
+        if self._streaming:
+            self._merge_to_running_histogram(counts, bins)
+        else:
+            self._histogram_per_iteration.append((counts, bins))
+
     def scale(self, scale_factor: np.ndarray):
         """
         Scale all statistics in collector by some factor.
@@ -156,4 +200,4 @@ class HistogramCollector(BaseCollector):
             x: Tensor going through the collector to update the histogram according to.
         """
         count, bins = np.histogram(x, bins=self._n_bins)
-        self._histogram_per_iteration.append((count, bins))
\ No newline at end of file
+        self._add_histogram(count, bins)
\ No newline at end of file
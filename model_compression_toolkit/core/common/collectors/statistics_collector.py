@@ -16,13 +16,33 @@
 
 import math
 from copy import deepcopy
-from typing import Any, Tuple
+from typing import Any, Tuple, NamedTuple
 import numpy as np
 
 from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
 from model_compression_toolkit.core.common.collectors.mean_collector import MeanCollector
 from model_compression_toolkit.core.common.collectors.min_max_per_channel_collector import MinMaxPerChannelCollector
 from model_compression_toolkit.core.common.collectors.weighted_histogram_collector import WeightedHistogramCollector
+from model_compression_toolkit.logger import Logger
+
+
+class StatsCollectorPlan(NamedTuple):
+    """
+    Defines which statistics a StatsCollector collects (min/max per channel are always collected),
+    so statistics that are not used by the quantization process are not computed.
+
+    Args:
+        histogram: Whether to collect a histogram.
+        weighted_histogram: Whether to collect a weighted histogram (used by HMSE).
+        mean: Whether to collect a mean per channel (used by bias correction).
+        histogram_streaming: Whether the histogram collectors merge each new histogram into a single
+            running histogram (fixed memory) instead of keeping a histogram per iteration.
+    """
+
+    histogram: bool = True
+    weighted_histogram: bool = True
+    mean: bool = True
+    histogram_streaming: bool = False
 
 
 class BaseStatsCollector(object):
@@ -52,29 +72,44 @@ class BaseStatsCollector(object):
 class StatsCollector(BaseStatsCollector):
     """
     Class to wrap all statistics that are being collected for an input/output node.
+    The collectors classes can be overridden by framework-specific statistics collectors
+    (e.g. collectors that keep their state on the framework's device).
     """
 
+    histogram_collector_cls = HistogramCollector
+    weighted_histogram_collector_cls = WeightedHistogramCollector
+    mean_collector_cls = MeanCollector
+    min_max_collector_cls = MinMaxPerChannelCollector
+
+    # Whether update_statistics expects framework tensors (rather than numpy arrays).
+    accepts_framework_tensors = False
+
     def __init__(self,
                  out_channel_axis: int,
                  init_min_value: float = None,
-                 init_max_value: float = None):
+                 init_max_value: float = None,
+                 collectors_plan: StatsCollectorPlan = StatsCollectorPlan()):
         """
-        Instantiate three statistics collectors: histogram, mean and min/max per channel.
+        Instantiate the statistics collectors: histogram, weighted histogram, mean and min/max per channel.
+        Collectors that are disabled in the collectors plan are not created (set to None).
         Set initial min/max values if are known.
 
         Args:
             out_channel_axis: Index of output channels.
             init_min_value: Initial min value for min/max stored values.
             init_max_value: Initial max value for min/max stored values.
+            collectors_plan: Which statistics to collect.
         """
 
         super().__init__()
-        self.hc = HistogramCollector()
-        self.weighted_hc = WeightedHistogramCollector()
-        self.mc = MeanCollector(axis=out_channel_axis)
-        self.mpcc = MinMaxPerChannelCollector(init_min_value=init_min_value,
-                                              init_max_value=init_max_value,
-                                              axis=out_channel_axis)
+        streaming = collectors_plan.histogram_streaming
+        self.hc = self.histogram_collector_cls(streaming=streaming) if collectors_plan.histogram else None
+        self.weighted_hc = self.weighted_histogram_collector_cls(streaming=streaming) \
+            if collectors_plan.weighted_histogram else None
+        self.mc = self.mean_collector_cls(axis=out_channel_axis) if collectors_plan.mean else None
+        self.mpcc = self.min_max_collector_cls(init_min_value=init_min_value,
+                                               init_max_value=init_max_value,
+                                               axis=out_channel_axis)
 
     def update_statistics(self, x: Any, weights: Any=None):
         """
@@ -86,9 +121,23 @@ class StatsCollector(BaseStatsCollector):
         """
 
         x = standardize_tensor(x)
-        self.hc.update(x)
-        self.weighted_hc.update(x, weights)
-        self.mc.update(x)
+        self._update_collectors(x, weights)
+
+    def _update_collectors(self, x: Any, weights: Any = None):
+        """
+        Update all existing collectors with a new (standardized) tensor to consider.
+
+        Args:
+            x: Standardized tensor to consider when updating statistics.
+            weights: Weights tensor to consider when updating statistics.
+        """
+
+        if self.hc is not None:
+            self.hc.update(x)
+        if self.weighted_hc is not None:
+            self.weighted_hc.update(x, weights)
+        if self.mc is not None:
+            self.mc.update(x)
         self.mpcc.update(x)
 
     def get_mean(self) -> np.ndarray:
@@ -99,6 +148,8 @@ class StatsCollector(BaseStatsCollector):
         Returns: Mean per-channel from mean collector.
         """
 
+        if self.mc is None:
+            Logger.critical('Mean per-channel was not collected by the statistics collector.')  # pragma: no cover
         return self.mc.state
 
     def get_min_max_values(self) -> Tuple[float, float]:
@@ -227,10 +278,13 @@ def shift_statistics(collector: BaseStatsCollector,
     shifted_collector = deepcopy(collector)
     if isinstance(collector, StatsCollector):
         shifted_collector.mpcc.shift(shift_value)
-        shifted_collector.mc.shift(shift_value)
+        if shifted_collector.mc is not None:
+            shifted_collector.mc.shift(shift_value)
         if shifted_collector.require_collection():
-            shifted_collector.hc.shift(shift_value)
-            shifted_collector.weighted_hc.shift(shift_value)
+            if shifted_collector.hc is not None:
+                shifted_collector.hc.shift(shift_value)
+            if shifted_collector.weighted_hc is not None:
+                shifted_collector.weighted_hc.shift(shift_value)
 
     return shifted_collector
 
@@ -253,9 +307,12 @@ def scale_statistics(collector: BaseStatsCollector,
     scaled_collector = deepcopy(collector)
     if isinstance(collector, StatsCollector):
         scaled_collector.mpcc.scale(scale_value)
-        scaled_collector.mc.scale(scale_value)
+        if scaled_collector.mc is not None:
+            scaled_collector.mc.scale(scale_value)
         if scaled_collector.require_collection():
-            scaled_collector.hc.scale(scale_value)
-            scaled_collector.weighted_hc.scale(scale_value)
+            if scaled_collector.hc is not None:
+                scaled_collector.hc.scale(scale_value)
+            if scaled_collector.weighted_hc is not None:
+                scaled_collector.weighted_hc.scale(scale_value)
 
     return scaled_collector
@@ -53,13 +53,14 @@ class WeightedHistogramCollector(HistogramCollector):
     Extends the functionality of the base HistogramCollector by incorporating weights
     into the histogram calculation, allowing for weighted distributions.
     """
-    def __init__(self, n_bins: int = 2048):
+    def __init__(self, n_bins: int = 2048, streaming: bool = False):
         """
         Args:
             n_bins: Number of bins in the histogram.
+            streaming: Whether to merge each new histogram into a single running histogram.
         """
 
-        super().__init__(n_bins)
+        super().__init__(n_bins, streaming=streaming)
 
     def update(self, x: np.ndarray, weights: np.ndarray = None):
         """
@@ -111,4 +112,4 @@ class WeightedHistogramCollector(HistogramCollector):
         count, bins = np.histogram(x, bins=self._n_bins, weights=weights)
 
         # Store the weighted histogram (counts and bins) for this iteration.
-        self._histogram_per_iteration.append((count, bins))
+        self._add_histogram(count, bins)
@@ -0,0 +1,98 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import multiprocessing
+from typing import Callable, Any, Sequence, Iterator
+
+from model_compression_toolkit.logger import Logger
+
+
+# The function mapped by a worker process. It's set by the worker's initializer, and inherited by the forked worker
+# (with the objects it references) without pickling.
+_worker_func = None
+
+
+def _init_worker(fw_impl: Any, func: Callable[[Any], Any]):
+    """
+    Initialize a forked worker process.
+
+    Args:
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        func: Function to map in the worker.
+    """
+    global _worker_func
+    fw_impl.init_forked_worker()
+    _worker_func = func
+
+
+def _run_in_worker(item: Any) -> Any:
+    """
+    Apply the worker's function on an item.
+
+    Args:
+        item: Item to apply the function on.
+
+    Returns:
+        The function's result.
+    """
+    return _worker_func(item)
+
+
+def map_in_forked_workers(func: Callable[[Any], Any],
+                          items: Sequence,
+                          num_workers: int,
+                          fw_impl: Any,
+                          task_name: str,
+                          requires_inference: bool = True,
+                          chunksize: int = 1) -> Iterator:
+    """
+    Map a function over items in a pool of worker processes forked from the current process. The function is
+    inherited by the workers, so it (and the objects it references, e.g. graphs and models) is not pickled, only the
+    items and the results are. Results are yielded in the items order.
+    If forking is not possible (e.g. unsupported platform, a framework's GPU runtime is initialized in the current
+    process) or num_workers is 1, the function is mapped in the current process.
+
+    Args:
+        func: Function to apply on each item.
+        items: Items to apply the function on.
+        num_workers: Number of worker processes.
+        fw_impl: FrameworkImplementation object with a specific framework methods implementation.
+        task_name: Name of the task, for the warning when falling back to the current process.
+        requires_inference: Whether the function runs models inference of the framework.
+        chunksize: Number of items sent to a worker per task.
+
+    Returns:
+        An iterator over the results of the function on the items.
+    """
+    num_workers = min(num_workers, len(items))
+    if num_workers > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        Logger.warning(f'Parallel {task_name} requires forking worker processes, which is not supported on this '
+                       f'platform. Running {task_name} in a single process.')
+        num_workers = 1
+    elif num_workers > 1 and not fw_impl.supports_forked_workers():
+        Logger.warning(f'Parallel {task_name} can\'t fork worker processes after {fw_impl.__class__.__name__} '
+                       f'initialized a GPU runtime in the current process. Running {task_name} in a single process.')
+        num_workers = 1
+    elif num_workers > 1 and requires_inference and not fw_impl.supports_forked_inference():
+        Logger.warning(f'Parallel {task_name} is not supported by {fw_impl.__class__.__name__} in the current setup '
+                       f'(e.g. inference on GPU). Running {task_name} in a single process.')
+        num_workers = 1
+
+    if num_workers <= 1:
+        yield from map(func, items)
+        return
+
+    with multiprocessing.get_context('fork').Pool(num_workers, initializer=_init_worker,
+                                                  initargs=(fw_impl, func)) as pool:
+        yield from pool.imap(_run_in_worker, items, chunksize=chunksize)
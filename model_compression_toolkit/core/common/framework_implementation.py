@@ -13,20 +13,24 @@
 # limitations under the License.
 # ==============================================================================
 from abc import ABC, abstractmethod
-from typing import Callable, Any, List, Tuple, Generator, Type
+from typing import Callable, Any, List, Tuple, Generator, Type, Dict, Collection
 
 import numpy as np
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import BaseNode
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.graph.base_graph import Graph
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
 from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QParamsSearchBackend
 
 
 class FrameworkImplementation(ABC):
@@ -38,6 +42,10 @@ class FrameworkImplementation(ABC):
     activation_quant_layer_cls: Type
     configurable_weights_quantizer_cls: Type
     configurable_activation_quantizer_cls: Type
+    stats_collector_cls: Type = StatsCollector
+    # Whether the framework supports partial inference of a mixed precision model (see
+    # sensitivity_eval_inference_and_cache and sensitivity_eval_partial_inference).
+    supports_partial_sensitivity_eval_inference: bool = False
 
     @property
     def constants(self):
@@ -53,7 +61,8 @@ class FrameworkImplementation(ABC):
                                       graph: Graph,
                                       input_images: List[Any],
                                       hessian_scores_request: HessianScoresRequest,
-                                      num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                                      num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                                      models_pool: HessianModelsPool = None):
         """
         Get framework hessian-approximation scores calculator based on the hessian scores request.
         Args:
@@ -61,6 +70,7 @@ class FrameworkImplementation(ABC):
             graph: Float graph to compute the approximation of its different nodes.
             hessian_scores_request: HessianScoresRequest to search for the desired calculator.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian-approximation scores.
+            models_pool: A pool of float models of the graph to reuse across calculators.
 
         Returns: HessianScoresCalculator to use for the hessian approximation scores computation for this request.
         """
@@ -435,6 +445,72 @@ class FrameworkImplementation(ABC):
         raise NotImplementedError(f'{self.__class__.__name__} has to implement the '
                              f'framework\'s sensitivity_eval_inference method.')  # pragma: no cover
 
+    def sensitivity_eval_inference_and_cache(self,
+                                             model: Any,
+                                             inputs: Any,
+                                             nodes_to_cache: Collection[str]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Calls for a model inference during mixed precision sensitivity evaluation, and caches the output tensors
+        of some of the model's nodes for later partial inferences (see sensitivity_eval_partial_inference).
+
+        Args:
+            model: A model to run inference for.
+            inputs: Input tensors to run inference on.
+            nodes_to_cache: Names of nodes to cache their output tensors.
+
+        Returns:
+            The output of the model inference on the given input, and a dictionary from a cached node name to its
+            output tensors.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} has to implement the '
+                                  f'framework\'s sensitivity_eval_inference_and_cache method.')  # pragma: no cover
+
+    def sensitivity_eval_partial_inference(self,
+                                           model: Any,
+                                           cached_outputs: Dict[str, Any],
+                                           nodes_to_run: Collection[str]) -> Any:
+        """
+        Calls for a partial model inference during mixed precision sensitivity evaluation: only the given nodes are
+        run, and the outputs of the rest of the nodes are taken from the cache.
+
+        Args:
+            model: A model to run inference for.
+            cached_outputs: A dictionary from a node name to its cached output tensors.
+            nodes_to_run: Names of nodes to run.
+
+        Returns:
+            The output of the model inference.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} has to implement the '
+                                  f'framework\'s sensitivity_eval_partial_inference method.')  # pragma: no cover
+
+    def supports_forked_inference(self) -> bool:
+        """
+        Returns: Whether models can run inference in processes that are forked from the current process
+        (e.g. for parallel mixed precision sensitivity evaluation).
+        """
+        return False
+
+    def supports_forked_workers(self) -> bool:
+        """
+        Returns: Whether the current process can be forked into worker processes (e.g. for parallel quantization
+        params computation), regardless of whether the workers run models inference.
+        """
+        return True
+
+    def init_forked_worker(self):
+        """
+        Initialize the framework in a worker process that was forked from the current process.
+        """
+        pass
+
+    def get_qparams_search_backend(self) -> QParamsSearchBackend:
+        """
+        Returns: An array backend to run the weights quantization parameters search with the framework's tensors on
+        its working device. By default, the search runs in numpy on the host.
+        """
+        return QParamsSearchBackend()
+
     def get_inferable_quantizers(self, node: BaseNode):
         """
         Returns sets of framework compatible weights and activation quantizers for the given node.
@@ -291,6 +291,7 @@ class FusingInfo:
         """
         graph_nodes = set(graph.get_topo_sorted_nodes())  # Retrieve all nodes from the graph
         all_fused_nodes = set()  # Track all nodes used in fusions to ensure no overlap
+        valid_fusing_patterns = _get_fusing_layer_patterns(self.fusing_patterns)
 
         for op_id, nodes in self.fusing_data.items():
             # Check 1: Ensure all fused nodes exist in the graph
@@ -299,16 +300,7 @@ class FusingInfo:
                     raise ValueError(f"Fused operation {op_id} contains node {node.name} not present in the graph.")
 
             # Check 2: Validate the fusion sequence forms a valid linear chain
-            for i in range(len(nodes) - 1):  # Up to the second-to-last node
-                current_node = nodes[i]
-                next_node = nodes[i + 1]
-                successors = graph.get_next_nodes(current_node)
-                if len(successors) != 1 or successors[0] != next_node:
-                    raise ValueError(
-                        f"Fused operation {op_id} is not a valid linear chain: "
-                        f"node {current_node.name} does not connect directly to {next_node.name} "
-                        f"with exactly one successor (found successors: {[n.name for n in successors]})."
-                    )
+            self._validate_fused_op_chain(graph, op_id, nodes)
 
             # Check 3: Ensure no node is reused across fusions
             node_set = set(nodes)
@@ -321,13 +313,80 @@ class FusingInfo:
             all_fused_nodes.update(node_set)
 
             # Check 4: Ensure the sequence matches a valid fusing pattern
-            valid_fusing_patterns = _get_fusing_layer_patterns(self.fusing_patterns)
-            if not is_valid_fusion(valid_fusing_patterns, nodes, self._manual_fused_ops):
+            self._validate_fused_op_pattern(op_id, nodes, valid_fusing_patterns)
+
+    def validate_nodes(self, graph: 'Graph', nodes: List['BaseNode']) -> None:
+        """
+        Validate the fused operations that contain any of the given nodes against the graph.
+
+        This is an incremental version of `validate`, for a graph change that only affects the given nodes
+        (e.g. adding or removing an edge affects its source and sink nodes). Only checks 1, 2 and 4 of `validate`
+        are performed on the relevant fused operations, as check 3 doesn't depend on the graph.
+
+        Args:
+            graph: The computational graph to validate against.
+            nodes: The nodes that were affected by the graph change.
+
+        Raises:
+            ValueError: If any validation check fails.
+        """
+        op_ids = {self.node_name_to_fused_op_id[n.name] for n in nodes if n.name in self.node_name_to_fused_op_id}
+        if not op_ids:
+            return
+
+        valid_fusing_patterns = _get_fusing_layer_patterns(self.fusing_patterns)
+        for op_id in op_ids:
+            fused_nodes = self.fusing_data[op_id]
+            for node in fused_nodes:
+                if not graph.has_node(node):
+                    raise ValueError(f"Fused operation {op_id} contains node {node.name} not present in the graph.")
+            self._validate_fused_op_chain(graph, op_id, fused_nodes)
+            self._validate_fused_op_pattern(op_id, fused_nodes, valid_fusing_patterns)
+
+    @staticmethod
+    def _validate_fused_op_chain(graph: 'Graph', op_id: str, nodes: Tuple['BaseNode']) -> None:
+        """
+        Validate that a fused operation's nodes form a linear chain in the graph: each node (except the last)
+        has exactly one successor, which is the next node in the sequence.
+
+        Args:
+            graph: The computational graph to validate against.
+            op_id: The fused operation's identifier.
+            nodes: The fused operation's nodes.
+
+        Raises:
+            ValueError: If the nodes don't form a linear chain.
+        """
+        for i in range(len(nodes) - 1):  # Up to the second-to-last node
+            current_node = nodes[i]
+            next_node = nodes[i + 1]
+            successors = graph.get_next_nodes(current_node)
+            if len(successors) != 1 or successors[0] != next_node:
                 raise ValueError(
-                    f"Fused operation {op_id} does not match any valid fusing pattern "
-                    f"from {valid_fusing_patterns}."
+                    f"Fused operation {op_id} is not a valid linear chain: "
+                    f"node {current_node.name} does not connect directly to {next_node.name} "
+                    f"with exactly one successor (found successors: {[n.name for n in successors]})."
                 )
 
+    def _validate_fused_op_pattern(self, op_id: str, nodes: Tuple['BaseNode'],
+                                   valid_fusing_patterns: List[List[Any]]) -> None:
+        """
+        Validate that a fused operation's nodes match a valid fusing pattern.
+
+        Args:
+            op_id: The fused operation's identifier.
+            nodes: The fused operation's nodes.
+            valid_fusing_patterns: The layer patterns of the fusing patterns.
+
+        Raises:
+            ValueError: If the nodes don't match any of the patterns.
+        """
+        if not is_valid_fusion(valid_fusing_patterns, nodes, self._manual_fused_ops):
+            raise ValueError(
+                f"Fused operation {op_id} does not match any valid fusing pattern "
+                f"from {valid_fusing_patterns}."
+            )
+
     def is_nodes_eligible_to_be_fused(self, nodes: List['BaseNode']) -> bool:
         """
         Check whether the given nodes are eligible to be fused based on predefined fusing patterns.
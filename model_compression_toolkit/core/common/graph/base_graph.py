@@ -40,6 +40,35 @@ from model_compression_toolkit.target_platform_capabilities.targetplatform2frame
     FrameworkQuantizationCapabilities
 
 
+def _run_and_validate(graph: 'Graph', method: Callable, args: tuple, kwargs: dict,
+                      changed_nodes: List[BaseNode] = None) -> Any:
+    """
+    Runs a graph-mutating method and validates the graph after it.
+    Changes that are made during another graph-mutating method are not validated on their own,
+    so the graph is validated once, when the outermost change is done.
+
+    Args:
+        graph: The graph to modify.
+        method: The graph-modifying method.
+        args: Positional arguments to the method.
+        kwargs: Keyword arguments to the method.
+        changed_nodes: The nodes that are affected by the change. If None, the whole graph is validated.
+
+    Returns:
+        The result of the method.
+    """
+    if graph.skip_validation_check or graph._in_graph_change:
+        return method(graph, *args, **kwargs)
+
+    graph._in_graph_change = True
+    try:
+        result = method(graph, *args, **kwargs)
+    finally:
+        graph._in_graph_change = False
+    graph.validate(changed_nodes)  # Ensure graph consistency after changes.
+    return result
+
+
 def validate_graph_after_change(method: Callable) -> Callable:
     """
     Decorator for graph-mutating methods. After the decorated method executes,
@@ -53,13 +82,29 @@ def validate_graph_after_change(method: Callable) -> Callable:
     """
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        result = method(self, *args, **kwargs)
-        if not self.skip_validation_check:
-            self.validate()  # calls Graph.validate(). Ensure graph consistency after changes.
-        return result
+        return _run_and_validate(self, method, args, kwargs)
     return wrapper
 
 
+def validate_graph_nodes_after_change(get_changed_nodes: Callable) -> Callable:
+    """
+    Decorator for graph-mutating methods that only affect a few nodes of the graph. After the decorated method
+    executes, this decorator calls `self.validate()` only on the affected nodes, instead of on the whole graph.
+
+    Args:
+        get_changed_nodes: A function that gets the method's arguments and returns the nodes affected by it.
+
+    Returns:
+        A decorator of a graph-modifying method.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return _run_and_validate(self, method, args, kwargs, get_changed_nodes(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
 OutTensor = namedtuple('OutTensor', 'node node_out_index')
 
 
@@ -88,6 +133,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
 
         # This must be set first to ensure it's available when validation runs during graph creation.
         self._skip_validation_check = False
+        self._in_graph_change = False
         self._fusing_info = FusingInfo()
 
         self.name = name
@@ -450,7 +496,7 @@ class Graph(nx.MultiDiGraph, GraphSearches):
             new_graph_inputs.append(new_node)
         self.set_inputs(new_graph_inputs)
 
-    @validate_graph_after_change
+    @validate_graph_nodes_after_change(lambda node_to_remove, *args, **kwargs: [node_to_remove])
     def remove_node(self,
                     node_to_remove: BaseNode,
                     new_graph_inputs: List[BaseNode] = None,
@@ -886,24 +932,31 @@ class Graph(nx.MultiDiGraph, GraphSearches):
                         uniq_qcs.append(qc)
                 node.quantization_cfg.candidates_quantization_cfg = uniq_qcs
 
-    def validate(self):
+    def validate(self, changed_nodes: List[BaseNode] = None):
         """
         Validate that the current state of the graph is consistent with
         the fusing information (e.g., no missing or incorrect fused node mapping).
 
+        Args:
+            changed_nodes: If given, only the fusing information of these nodes is validated (useful after a
+                change that only affects these nodes). Otherwise, the whole graph is validated.
+
         Returns:
             The result of the FusingInfo validation logic (typically None or raises error).
         """
+        if changed_nodes is not None:
+            return self.fusing_info.validate_nodes(self, changed_nodes)
         return self.fusing_info.validate(self)
 
-    @validate_graph_after_change
+    # An edge change only affects the successors of its source node, so only the edge nodes are validated.
+    @validate_graph_nodes_after_change(lambda u, v, *args, **kwargs: [u, v])
     def add_edge(self, *args, **kwargs):
         """
         Wrap networkx functions (that modifies the graph) with our validate decorator.
         """
         return super().add_edge(*args, **kwargs)
 
-    @validate_graph_after_change
+    @validate_graph_nodes_after_change(lambda u, v, *args, **kwargs: [u, v])
     def remove_edge(self, *args, **kwargs):
         """
         Wrap networkx functions (that modifies the graph) with our validate decorator.
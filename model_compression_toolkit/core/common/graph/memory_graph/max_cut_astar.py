@@ -13,7 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 import copy
-from typing import List, Tuple, Dict, Set
+import heapq
+from itertools import count
+from typing import List, Tuple
 from time import time
 
 from model_compression_toolkit.core.common import BaseNode
@@ -141,102 +143,87 @@ class MaxCutAstar:
 
         """
 
-        open_list = {self.src_cut}
-        closed_list = set()
-        costs = {self.src_cut: self.src_cut.memory_size()}
-        routes = {self.src_cut: [self.src_cut]}
+        # The open list is a heap of entries (sort key, cut, cost, route). A cut that is re-discovered with a
+        # lower cost gets a new entry, and its previous entry is invalidated lazily: an entry popped from the heap
+        # is skipped unless it is the latest one that was pushed for its cut.
+        # Cuts are identified by their memory elements (see Cut.__eq__).
+        # Routes are kept as linked (cut, parent route) pairs, so extending a route doesn't copy it.
+        open_heap = []
+        open_entries = {}
+        best_costs = {}
+        entries_counter = count()
+
+        def push(cut: Cut, cost: float, route: Tuple[Cut, Tuple], route_len: int):
+            key = frozenset(cut.mem_elements.elements)
+            entry = ((self.accumulate(cost, self.estimate(cut, estimate)), -route_len, cut.sorted_elements_signature,
+                      next(entries_counter)), cut, cost, route, route_len)
+            heapq.heappush(open_heap, entry)
+            open_entries[key] = entry
+            best_costs[key] = cost
+
+        push(self.src_cut, self.src_cut.memory_size(), (self.src_cut, None), 1)
 
         expansion_count = 0
 
         t1 = time()
-        while expansion_count < iter_limit and len(open_list) > 0:
+        while expansion_count < iter_limit and len(open_heap) > 0:
             if time_limit is not None and time() - t1 > time_limit:
                 # TODO: add test for this.
                 raise TimeoutError  # pragma: no cover
             # Choose next node to expand
-            next_cut = self._get_cut_to_expand(open_list, costs, routes, estimate)
-
-            cut_cost = costs[next_cut]
-            cut_route = routes[next_cut]
+            entry = heapq.heappop(open_heap)
+            _, next_cut, cut_cost, cut_route, route_len = entry
+            next_cut_key = frozenset(next_cut.mem_elements.elements)
+            if open_entries.get(next_cut_key) is not entry:
+                # A stale entry of a cut that was re-discovered with a lower cost or already expanded.
+                continue
 
             if next_cut == self.target_cut:
-                return self._remove_dummy_nodes_from_path(cut_route[0].op_order), cut_cost,\
-                       list(set([self._remove_dummy_tensors_from_cut(c) for c in cut_route]))
+                route_cuts = self._unroll_route(cut_route)
+                return self._remove_dummy_nodes_from_path(route_cuts[0].op_order), cut_cost, \
+                       list(set([self._remove_dummy_tensors_from_cut(c) for c in route_cuts]))
 
             if self.is_pivot(next_cut):
                 # Can clear all search history
-                open_list.clear()
-                closed_list.clear()
-                routes = {}
+                open_heap.clear()
+                open_entries.clear()
+                best_costs.clear()
             else:
-                # Can remove only next_cut and put it in closed_list
-                open_list.remove(next_cut)
-                del routes[next_cut]
-                closed_list.add(next_cut)
+                # Can remove only next_cut from the open list. Its cost is kept in best_costs, which makes it closed.
+                del open_entries[next_cut_key]
 
             # Expand the chosen cut
             expanded_cuts = self.expand(next_cut)
             expansion_count += 1
 
-            # Only consider nodes that where not already visited
-            for c in filter(lambda _c: _c not in closed_list, expanded_cuts):
+            for c in expanded_cuts:
                 cost = self.accumulate(cut_cost, c.memory_size())
-                if c not in open_list:
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
-                # TODO maxcut: this isn't covered in the coverage test. check if needed and remove no cover
-                elif self.ordering(cost, costs[c]):  # pragma: no cover
-                    # If we already saw this cut during the search with a larger cost, then we want to update the order
-                    # of the schedule in the cut
-                    # Remove call - removes the cut with the same memory elements but different ordering from open
-                    # Then - adds the cut with the improved ordering from open
-                    open_list.remove(c)
-                    self._update_expanded_node(c, cost, cut_route, open_list, costs, routes)
+                prev_cost = best_costs.get(frozenset(c.mem_elements.elements))
+                # Only consider cuts that were not already visited, or that were visited with a larger cost, in which
+                # case we want to update the order of the schedule in the cut (and reopen it if it was closed).
+                if prev_cost is None or self.ordering(cost, prev_cost):
+                    push(c, cost, (c, cut_route), route_len + 1)
 
         # Halt or No Solution
         # TODO maxcut: this isn't covered in the coverage test. Add test and remove no cover
         return None, 0, None  # pragma: no cover
 
     @staticmethod
-    def _update_expanded_node(cut: Cut, cost: float, route: List[Cut], open_list: Set[Cut],
-                              costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]]):
-        """
-        An auxiliary method for updating search data structures according to an expanded node.
-
-        Args:
-            cut: A cut to expand the search to.
-            cost: The cost of the cut.
-            route: The rout to the cut.
-            open_list: The search open set.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
-
-        """
-        open_list.add(cut)
-        costs.update({cut: cost})
-        routes.update({cut: [cut] + route})
-
-    def _get_cut_to_expand(self, open_list: Set[Cut], costs: Dict[Cut, float], routes: Dict[Cut, List[Cut]],
-                           estimate: float) -> Cut:
+    def _unroll_route(route: Tuple[Cut, Tuple]) -> List[Cut]:
         """
-        An auxiliary method for finding a cut for expanding the search out of a set of potential cuts for expansion.
+        An auxiliary method for converting a linked route of the search to a list of cuts.
 
         Args:
-            open_list: The search open list.
-            costs: The search utility mapping between cuts and their cost.
-            routes: The search utility mapping between cuts and their routes.
-            estimate: Cut size estimation to set extended boundaries on the potential cuts to expand.
+            route: A route in the form of nested (cut, parent route) pairs, ending with the source cut.
 
-        Returns: A sorted list of potential cuts for expansion (ordered by lowest cost first).
+        Returns: A list of the route's cuts, ordered from the last cut in the route to the source cut.
 
         """
-        max_cut_len = max([len(routes[c]) for c in open_list])
-        ordered_cuts_list = sorted(open_list,
-                                   key=lambda c: (self.accumulate(costs[c], self.estimate(c, estimate)),
-                                                  max_cut_len - len(routes[c]),
-                                                  c.sorted_elements_signature))
-
-        assert len(ordered_cuts_list) > 0
-        return ordered_cuts_list[0]
+        cuts = []
+        while route is not None:
+            cut, route = route
+            cuts.append(cut)
+        return cuts
 
     def clean_memory_for_next_step(self, cut: Cut) -> Cut:
         """
@@ -273,7 +260,20 @@ class MaxCutAstar:
 
         clean_cut = self.clean_memory_for_next_step(cut)
         return op_node not in cut.op_record and len(cut.mem_elements.elements) > 0 and \
-               all([parent_mem_element in clean_cut.mem_elements.elements for parent_mem_element in self.memory_graph.operation_node_parents(op_node)])
+               self._has_op_inputs(op_node, clean_cut)
+
+    def _has_op_inputs(self, op_node: BaseNode, clean_cut: Cut) -> bool:
+        """
+        Checks whether all the memory elements that an operation node depends on exist in a cleaned cut.
+
+        Args:
+            op_node: An operation node to check.
+            clean_cut: A cut after removing its irrelevant memory elements.
+
+        Returns: Whether the cut contains all the inputs of the op_node.
+        """
+
+        return all([parent_mem_element in clean_cut.mem_elements.elements for parent_mem_element in self.memory_graph.operation_node_parents(op_node)])
 
     def expand(self, cut: Cut) -> List[Cut]:
         """
@@ -288,11 +288,16 @@ class MaxCutAstar:
         clean_cut = self.clean_memory_for_next_step(cut)
 
         # candidates for expansion are children of the memory elements from the cleaned cut that can be expanded
+        # (the cut is already cleaned, so can_expand conditions are checked without cleaning it again for each op)
         candidates = []
-        for mem_element in clean_cut.mem_elements.elements:
-            child_ops = self.memory_graph.activation_tensor_children(mem_element)
-            ops_to_expand = list(filter(lambda op: self.can_expand(op, clean_cut) and op not in candidates, child_ops))
-            candidates.extend(ops_to_expand)
+        if len(clean_cut.mem_elements.elements) > 0:
+            visited_ops = set()
+            for mem_element in clean_cut.mem_elements.elements:
+                for op in self.memory_graph.activation_tensor_children(mem_element):
+                    if op not in visited_ops:
+                        visited_ops.add(op)
+                        if op not in clean_cut.op_record and self._has_op_inputs(op, clean_cut):
+                            candidates.append(op)
 
         # for each candidate a cut is returned with the candidate expanded
         # (operation is added to record / order and resulting memory elements added to memory elements)
@@ -358,8 +363,7 @@ class MaxCutAstar:
         Returns: True if the first cost is smaller than the second one, else otherwise.
 
         """
-        # TODO maxcut: this isn't covered in the coverage test. check if needed and remove no cover
-        return cost_1 < cost_2  # pragma: no cover
+        return cost_1 < cost_2
 
     @staticmethod
     def estimate(cut: Cut, estimate: float) -> float:
@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import hashlib
+import os
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
+from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.hessian.hessian_scores_request import HessianScoresRequest, HessianMode, \
     HessianScoresGranularity
 from model_compression_toolkit.logger import Logger
@@ -39,10 +43,73 @@ class Query:
     node: LayerName
 
 
+class HessianBuffer:
+    """
+    Growable buffer of hessians, stacked along the samples axis.
+
+    The buffer is preallocated and grown geometrically, so that appending hessians batch by batch takes amortized
+    linear time, and the stored hessians are returned as views without copying (unless they are stored in a
+    different type than the appended hessians).
+    """
+    def __init__(self, dtype: Optional[np.dtype] = None):
+        """
+        Args:
+            dtype: Type to store the hessians in. If None, the type of the first appended hessians is used.
+                The hessians are returned in the type of the first appended hessians in either case.
+        """
+        self.dtype = dtype
+        self._data: Optional[np.ndarray] = None
+        self._hess_dtype: Optional[np.dtype] = None
+        self.n_samples = 0
+
+    def append(self, hess: np.ndarray):
+        """
+        Append hessians to the buffer.
+
+        Args:
+            hess: hessians tensor, with the samples on the first axis.
+        """
+        if self._data is None:
+            self._data = np.empty_like(hess, dtype=self.dtype or hess.dtype)
+            self._hess_dtype = hess.dtype
+        n_samples = self.n_samples + hess.shape[0]
+        if n_samples > self._data.shape[0]:
+            new_data = np.empty((max(n_samples, 2 * self._data.shape[0]),) + self._data.shape[1:],
+                                dtype=self._data.dtype)
+            new_data[:self.n_samples] = self._data[:self.n_samples]
+            self._data = new_data
+        self._data[self.n_samples:n_samples] = hess
+        self.n_samples = n_samples
+
+    def get(self, n_samples: Optional[int] = None) -> np.ndarray:
+        """
+        Get the first stored hessians, in the type of the appended hessians.
+
+        Args:
+            n_samples: max number of samples to get. If None, all stored samples are returned.
+
+        Returns:
+            A read-only view of the hessians tensor, or a read-only copy if the hessians are stored in a different
+            type.
+        """
+        n_samples = self.n_samples if n_samples is None else min(n_samples, self.n_samples)
+        view = self._data[:n_samples]
+        if view.dtype != self._hess_dtype:
+            view = view.astype(self._hess_dtype)
+        view.flags.writeable = False
+        return view
+
+
 class HessianCache:
     """ Hessian cache """
-    def __init__(self):
-        self._data: Dict[Query, Tensor] = {}
+    def __init__(self, float16: bool = False):
+        """
+        Args:
+            float16: whether to store the hessians in float16, to reduce the cache memory. The fetched hessians
+                are cast back to the type they were computed in.
+        """
+        self._data: Dict[Query, HessianBuffer] = {}
+        self.dtype = np.float16 if float16 else None
 
     def update(self, layers_hessians: Dict[str, np.ndarray], request: HessianScoresRequest) -> int:
         """
@@ -66,10 +133,9 @@ class HessianCache:
         n_nodes_samples = []   # samples count per node after update
         for node_name, hess in layers_hessians.items():
             query = Query(request.mode, request.granularity, node_name)
-            saved_hess = self._data.get(query)
-            new_hess = hess if saved_hess is None else np.concatenate([saved_hess, hess], axis=0)
-            self._data[query] = new_hess
-            n_nodes_samples.append(new_hess.shape[0])
+            buffer = self._data.setdefault(query, HessianBuffer(self.dtype))
+            buffer.append(hess)
+            n_nodes_samples.append(buffer.n_samples)
 
         return min(n_nodes_samples)
 
@@ -84,7 +150,7 @@ class HessianCache:
 
         Returns:
             A tuple of two dictionaries:
-            - A dictionary from layer name to a tensor of its hessian.
+            - A dictionary from layer name to a tensor of its hessian (a read-only view of the cached hessians).
             - A dictionary from layer name to a number of missing samples.
         """
         assert request.n_samples is not None
@@ -93,14 +159,14 @@ class HessianCache:
         missing = {}
         for node in request.target_nodes:
             query = Query(request.mode, request.granularity, node.name)
-            hess = self._data.get(query)
-            if hess is None:
+            buffer = self._data.get(query)
+            if buffer is None:
                 missing[node.name] = request.n_samples
                 continue
-            n_missing = request.n_samples - hess.shape[0]
+            n_missing = request.n_samples - buffer.n_samples
             if n_missing > 0:
                 missing[node.name] = n_missing
-            result[node.name] = hess[:request.n_samples, ...]
+            result[node.name] = buffer.get(request.n_samples)
 
         return result, missing
 
@@ -109,6 +175,70 @@ class HessianCache:
         self._data.clear()
 
 
+class PersistentHessianCache:
+    """
+    On-disk hessians cache, for reusing hessians across runs on the same model and data.
+
+    Hessians are stored per query and inputs batch, in a separate .npy file under a directory of the graph they were
+    computed on. A stored hessian is identified by the fingerprints of the graph and of the inputs batch (see
+    HessianInfoService), the query and the number of estimation iterations.
+    """
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Directory to store the hessians in.
+        """
+        self.cache_dir = cache_dir
+
+    def load(self, graph_fingerprint: str, request: HessianScoresRequest, n_iterations: int,
+             batch_fingerprint: str) -> Dict[LayerName, Tensor]:
+        """
+        Load the stored hessians of a request's target nodes for an inputs batch.
+
+        Args:
+            graph_fingerprint: fingerprint of the graph the hessians are computed on.
+            request: hessian estimation request.
+            n_iterations: the number of iterations for hessian estimation.
+            batch_fingerprint: fingerprint of the inputs batch.
+
+        Returns:
+            A dictionary from layer name to its (memory-mapped) hessian, for layers with stored hessians only.
+        """
+        res = {}
+        for node in request.target_nodes:
+            path = self._get_path(graph_fingerprint, request, node.name, n_iterations, batch_fingerprint)
+            if os.path.exists(path):
+                res[node.name] = np.load(path, mmap_mode='r')
+        return res
+
+    def save(self, graph_fingerprint: str, request: HessianScoresRequest, n_iterations: int,
+             batch_fingerprint: str, layers_hessians: Dict[LayerName, Tensor]):
+        """
+        Store the hessians of an inputs batch.
+
+        Args:
+            graph_fingerprint: fingerprint of the graph the hessians are computed on.
+            request: hessian estimation request.
+            n_iterations: the number of iterations for hessian estimation.
+            batch_fingerprint: fingerprint of the inputs batch.
+            layers_hessians: a dictionary from layer names to their hessian score tensors.
+        """
+        os.makedirs(os.path.join(self.cache_dir, graph_fingerprint), exist_ok=True)
+        for node_name, hess in layers_hessians.items():
+            path = self._get_path(graph_fingerprint, request, node_name, n_iterations, batch_fingerprint)
+            # Write to a temporary file first, so that a concurrent or interrupted run never sees a partial file.
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.save(f, hess)
+            os.replace(tmp_path, path)
+
+    def _get_path(self, graph_fingerprint: str, request: HessianScoresRequest, node_name: LayerName,
+                  n_iterations: int, batch_fingerprint: str) -> str:
+        """ Returns the file path of a stored hessian. """
+        key = f'{request.mode.name}_{request.granularity.name}_{n_iterations}_{node_name}_{batch_fingerprint}'
+        return os.path.join(self.cache_dir, graph_fingerprint, hashlib.sha1(key.encode()).hexdigest() + '.npy')
+
+
 class HessianInfoService:
     """
     A service to manage, store, and compute information based on the Hessian matrix approximation.
@@ -122,22 +252,49 @@ class HessianInfoService:
     - The Hessian provides valuable information about the curvature of the loss function.
     - Computation can be computationally heavy and time-consuming.
     - The computed information is based on Hessian approximation (and not the precise Hessian matrix).
+    - The cached hessians and float models are built from the graph. If the graph is modified in place, the cache
+      should be cleared (see clear_cache). Replacing the graph clears the cache.
     """
 
     def __init__(self,
                  graph,
                  fw_impl,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 cache_dir: Optional[str] = None,
+                 cache_float16: bool = False):
         """
         Args:
             graph: Float graph.
             fw_impl: Framework-specific implementation for Hessian approximation scores computation.
             num_iterations_for_approximation: the number of iterations for hessian estimation.
+            cache_dir: Optional directory to persist computed hessians in, so that they can be reused by other runs
+                on the same graph and data. If None, hessians are only cached in memory.
+            cache_float16: whether to store the hessians cached in memory in float16, to reduce the cache memory.
+                The fetched hessians are returned in the type they were computed in either way.
         """
-        self.graph = graph
+        self._graph = graph
         self.fw_impl = fw_impl
         self.num_iterations_for_approximation = num_iterations_for_approximation
-        self.cache = HessianCache()
+        self.cache = HessianCache(float16=cache_float16)
+        # Float models for the hessian computation are built once and reused by all requests and batches.
+        self.models_pool = HessianModelsPool()
+        self.persistent_cache = None if cache_dir is None else PersistentHessianCache(cache_dir)
+        # Fingerprint of the graph for the persistent cache, computed once per graph.
+        self._graph_fingerprint: Optional[str] = None
+        # Number of random iterations that were run per computed batch, for each node (by name), for calculators
+        # that stop the estimation of each node separately once it has converged.
+        self.achieved_iterations: Dict[LayerName, List[int]] = {}
+
+    @property
+    def graph(self):
+        """ The float graph the hessians are computed on. """
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph):
+        """ Replace the graph, purging everything that was computed on the previous graph. """
+        self._graph = graph
+        self.clear_cache()
 
     def fetch_hessian(self, request: HessianScoresRequest,
                       activation_tensors: Optional[Tuple[Any]] = None,
@@ -191,8 +348,20 @@ class HessianInfoService:
         return res
 
     def clear_cache(self):
-        """ Purge the cached hessians. """
+        """ Purge the cached hessians, float models and graph fingerprint. """
         self.cache.clear()
+        self.models_pool.clear()
+        self._graph_fingerprint = None
+
+    def get_achieved_iterations(self) -> Dict[LayerName, List[int]]:
+        """
+        Get the number of random iterations that were actually run for the estimation of the computed hessians.
+
+        Returns:
+            A dictionary from layers (by name) to the number of iterations run for each batch computed for the layer.
+            Only layers whose hessians were computed by calculators that report it are included.
+        """
+        return {layer: list(iters) for layer, iters in self.achieved_iterations.items()}
 
     def _fetch_hessians_with_compute(self, request: HessianScoresRequest, n_iterations: int) -> Dict[LayerName, Tensor]:
         """
@@ -248,31 +417,28 @@ class HessianInfoService:
         if count_by_cache:
             assert request.n_samples is not None
 
+        graph_fingerprint = None if self.persistent_cache is None else self._get_graph_fingerprint()
+
         n_samples = 0
-        hess_per_layer = []
+        hess_per_layer = {layer.name: HessianBuffer() for layer in request.target_nodes}
         for batch in request.data_loader:
-            batch_hess_per_layer = self._compute_hessian_for_batch(request, batch, n_iterations)
-            hess_per_layer.append(batch_hess_per_layer)
+            if graph_fingerprint is None:
+                batch_hess_per_layer = self._compute_hessian_for_batch(request, batch, n_iterations)
+            else:
+                batch_hess_per_layer = self._fetch_hessian_for_batch_with_compute(request, batch, n_iterations,
+                                                                                  graph_fingerprint)
+            for layer, hess in batch_hess_per_layer.items():
+                hess_per_layer[layer].append(hess)
             min_count = self.cache.update(batch_hess_per_layer, request)
             n_samples = min_count if count_by_cache else (n_samples + batch[0].shape[0])
             if request.n_samples and n_samples >= request.n_samples:
                 break
 
-        hess_per_layer = {
-            layer.name: np.concatenate([hess[layer.name] for hess in hess_per_layer], axis=0)
-            for layer in request.target_nodes
-        }
-
-        if request.n_samples:
-            if n_samples < request.n_samples:
-                Logger.critical(f'Could not compute the requested number of Hessians ({request.n_samples}), '
-                                 f'not enough samples in the provided representative dataset.')
+        if request.n_samples and n_samples < request.n_samples:
+            Logger.critical(f'Could not compute the requested number of Hessians ({request.n_samples}), '
+                             f'not enough samples in the provided representative dataset.')
 
-            if n_samples > request.n_samples:
-                hess_per_layer = {
-                    layer: hess[:request.n_samples, ...] for layer, hess in hess_per_layer.items()
-                }
-        return hess_per_layer
+        return {layer: buffer.get(request.n_samples) for layer, buffer in hess_per_layer.items()}
 
     def _compute_hessian_for_batch(self,
                                    request: HessianScoresRequest,
@@ -293,16 +459,97 @@ class HessianInfoService:
             graph=self.graph,
             input_images=inputs_batch,
             hessian_scores_request=request,
-            num_iterations_for_approximation=n_iterations
+            num_iterations_for_approximation=n_iterations,
+            models_pool=self.models_pool
         )
 
         hessian_scores: list = fw_hessian_calculator.compute()
 
+        if fw_hessian_calculator.achieved_iterations is not None:
+            for layer, n_iter in zip(request.target_nodes, fw_hessian_calculator.achieved_iterations):
+                self.achieved_iterations.setdefault(layer.name, []).append(n_iter)
+
         layers_hessian_scores = {
             layer.name: score for layer, score in zip(request.target_nodes, hessian_scores)
         }
         return layers_hessian_scores
 
+    def _fetch_hessian_for_batch_with_compute(self,
+                                              request: HessianScoresRequest,
+                                              inputs_batch: List[Tensor],
+                                              n_iterations: int,
+                                              graph_fingerprint: str) -> Dict[LayerName, Tensor]:
+        """
+        Fetch hessian approximations for a batch of inputs from the persistent cache. Hessians that are not
+        available in the persistent cache are computed and stored in it.
+
+        Args:
+            request: hessian estimation request.
+            inputs_batch: a batch of inputs to estimate hessians on.
+            n_iterations: the number of iterations for hessian estimation.
+            graph_fingerprint: fingerprint of the graph.
+
+        Returns:
+            A dictionary from layers (by name) to their hessians.
+        """
+        batch_fingerprint = self._get_batch_fingerprint(inputs_batch)
+        res = self.persistent_cache.load(graph_fingerprint, request, n_iterations, batch_fingerprint)
+        missing_nodes = [n for n in request.target_nodes if n.name not in res]
+        if missing_nodes:
+            missing_request = request.clone(target_nodes=missing_nodes)
+            computed = self._compute_hessian_for_batch(missing_request, inputs_batch, n_iterations)
+            self.persistent_cache.save(graph_fingerprint, missing_request, n_iterations, batch_fingerprint, computed)
+            res.update(computed)
+        return {n.name: res[n.name] for n in request.target_nodes}
+
+    def _get_graph_fingerprint(self) -> str:
+        """
+        Get a fingerprint of the graph, which identifies the graph's topology, layers and weights. The fingerprint
+        is computed once, and recomputed only after the cache is cleared.
+
+        Returns:
+            Fingerprint string.
+        """
+        if self._graph_fingerprint is not None:
+            return self._graph_fingerprint
+
+        def _attr_repr(attr: Dict[Any, Any]) -> str:
+            # Only values of built-in types have a representation that is stable across runs.
+            return repr(sorted((str(k), v) for k, v in attr.items()
+                               if isinstance(v, (int, float, str, bool, tuple, list, type(None)))))
+
+        h = hashlib.sha1()
+        for n in self.graph.get_topo_sorted_nodes():
+            h.update(f'{n.name}|{getattr(n.type, "__name__", n.type)}|{n.input_shape}|{n.output_shape}|'
+                     f'{_attr_repr(n.framework_attr)}'.encode())
+            if isinstance(n, FunctionalNode):
+                h.update(f'{_attr_repr(dict(enumerate(n.op_call_args)))}|{_attr_repr(n.op_call_kwargs or {})}'.encode())
+            for k in sorted(n.weights, key=str):
+                w = np.asarray(n.weights[k])
+                h.update(f'{k}|{w.dtype}|{w.shape}'.encode())
+                h.update(np.ascontiguousarray(w).tobytes())
+        for e in sorted(self.graph.edges(data=True), key=lambda e: (e[0].name, e[1].name, str(e[2]))):
+            h.update(f'{e[0].name}->{e[1].name}|{sorted(e[2].items())}'.encode())
+        self._graph_fingerprint = h.hexdigest()
+        return self._graph_fingerprint
+
+    def _get_batch_fingerprint(self, inputs_batch: List[Tensor]) -> str:
+        """
+        Compute a fingerprint of a batch of inputs, which identifies the samples in the batch.
+
+        Args:
+            inputs_batch: a batch of inputs.
+
+        Returns:
+            Fingerprint string.
+        """
+        h = hashlib.sha1()
+        for t in inputs_batch:
+            t = np.ascontiguousarray(self.fw_impl.to_numpy(t))
+            h.update(f'{t.dtype}|{t.shape}'.encode())
+            h.update(t.tobytes())
+        return h.hexdigest()
+
     def _get_primary_node(self, node: 'BaseNode') -> 'BaseNode':
         """
         Get node's primary node that it reuses, or itself if not reused.
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+from typing import List, Union
 import numpy as np
-from model_compression_toolkit.constants import EPS
+from model_compression_toolkit.constants import EPS, MIN_HESSIAN_ITER, ACT_HESSIAN_CONVERGENCE_TOLERANCE, \
+    HESSIAN_CONVERGENCE_CONFIDENCE_Z
 
 
 def normalize_scores(hessian_approximations: List) -> List[np.ndarray]:
@@ -33,3 +34,87 @@ def normalize_scores(hessian_approximations: List) -> List[np.ndarray]:
 
     return [norm_scores_per_image[i] for i in range(norm_scores_per_image.shape[0])]
 
+
+class HutchinsonConvergenceTracker:
+    """
+    Tracks the convergence of Hutchinson estimations of the hessians of multiple targets.
+
+    Each random iteration yields an estimation of a target's hessian for each sample (image), whose sum is tracked
+    per sample. The estimation of a target is considered converged when, for each sample, the confidence interval of
+    the mean of its estimations is narrower than the tolerance, relative to the sample's mean. Thus, neither samples
+    with large scores nor many converged samples hide a sample that hasn't converged yet. Converged targets are
+    frozen, so that the following iterations only compute hessians for the active targets.
+    """
+
+    def __init__(self,
+                 num_targets: int,
+                 tolerance: float = ACT_HESSIAN_CONVERGENCE_TOLERANCE,
+                 confidence_z: float = HESSIAN_CONVERGENCE_CONFIDENCE_Z,
+                 min_iterations: int = MIN_HESSIAN_ITER):
+        """
+        Args:
+            num_targets: Number of targets to track.
+            tolerance: Max width of the confidence interval (on each side), relative to the mean estimation.
+            confidence_z: The z-score of the confidence interval.
+            min_iterations: Min number of iterations before a target can be considered converged.
+        """
+        self.tolerance = tolerance
+        self.confidence_z = confidence_z
+        self.min_iterations = min_iterations
+        self.num_iterations = [0] * num_targets
+        self._mean = [0.0] * num_targets
+        self._m2 = [0.0] * num_targets
+        self._frozen = [False] * num_targets
+
+    def get_active_targets(self) -> List[int]:
+        """
+        Returns: Indices of the targets that are not frozen.
+        """
+        return [i for i, frozen in enumerate(self._frozen) if not frozen]
+
+    def freeze(self, target: int):
+        """
+        Stop tracking a target.
+
+        Args:
+            target: The target's index.
+        """
+        self._frozen[target] = True
+
+    def update(self, target: int, estimation: Union[float, np.ndarray]):
+        """
+        Update a target with the (summed) estimations of an iteration, and freeze it if it has converged.
+
+        Args:
+            target: The target's index.
+            estimation: The sum of the target's hessian estimation in the iteration, per sample (or a single sum).
+        """
+        # Welford's online mean and variance, per sample.
+        estimation = np.asarray(estimation, dtype=np.float64)
+        self.num_iterations[target] += 1
+        n = self.num_iterations[target]
+        delta = estimation - self._mean[target]
+        self._mean[target] = self._mean[target] + delta / n
+        self._m2[target] = self._m2[target] + delta * (estimation - self._mean[target])
+
+        if n >= self.min_iterations:
+            mean, var = self._mean[target], self._m2[target] / (n - 1)
+            # Variance relative to the mean of each sample (zero for constant estimations).
+            rel_var = np.divide(var, np.square(mean), out=np.where(var > 0, np.inf, 0.), where=mean != 0)
+            # Relative confidence interval of the mean estimation of the least converged sample.
+            ci = self.confidence_z * np.sqrt(np.max(rel_var) / n)
+            if ci <= self.tolerance:
+                self.freeze(target)
+
+    def update_targets(self, targets: List[int], estimations: np.ndarray):
+        """
+        Update multiple targets with their estimations of an iteration (see update). The estimations of all the
+        targets are passed together, so they can be fetched from the device at once.
+
+        Args:
+            targets: The targets' indices.
+            estimations: The sums of the targets' hessian estimations in the iteration, with a leading targets axis
+              (by the order of targets), followed by the samples axis.
+        """
+        for target, estimation in zip(targets, estimations):
+            self.update(target, estimation)
@@ -0,0 +1,50 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:    # pragma: no cover
+    from model_compression_toolkit.core.common import BaseNode
+
+
+class HessianModelsPool:
+    """
+    A pool of float models that are built from a graph for Hessian approximation, so that a model is built once
+    and reused by all the Hessian computations on the graph (across batches and requests).
+
+    Models are keyed by the nodes whose outputs are appended to the model outputs.
+    """
+    def __init__(self):
+        self._models: Dict[Optional[Tuple[str, ...]], Any] = {}
+
+    def get_model(self, append2output: Optional[Sequence['BaseNode']],
+                  build_model_fn: Callable[[Optional[Sequence['BaseNode']]], Any]) -> Any:
+        """
+        Get a model from the pool, building it if it's not in the pool yet.
+
+        Args:
+            append2output: Nodes whose outputs are appended to the model outputs, or None for the graph outputs only.
+            build_model_fn: A function to build the model, given append2output.
+
+        Returns:
+            The float model.
+        """
+        key = None if append2output is None else tuple(n.name for n in append2output)
+        if key not in self._models:
+            self._models[key] = build_model_fn(append2output)
+        return self._models[key]
+
+    def clear(self):
+        """ Remove all the models from the pool. """
+        self._models.clear()
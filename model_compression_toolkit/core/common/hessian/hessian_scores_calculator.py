@@ -14,11 +14,12 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import List, Any, Optional, Sequence
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
-from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.logger import Logger
 
 
@@ -36,7 +37,8 @@ class HessianScoresCalculator(ABC):
                  input_images: List[Any],
                  fw_impl,
                  hessian_scores_request: HessianScoresRequest,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 models_pool: Optional[HessianModelsPool] = None):
         """
         Args:
             graph: Computational graph for the float model.
@@ -44,9 +46,12 @@ class HessianScoresCalculator(ABC):
             fw_impl: Framework-specific implementation for Hessian-approximation scores computation.
             hessian_scores_request: Configuration request for which to compute the Hessian-based approximation.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian-approximation scores.
+            models_pool: A pool of float models of the graph to reuse. If None, the float model is built for this
+                calculator only.
 
         """
         self.graph = graph
+        self.models_pool = HessianModelsPool() if models_pool is None else models_pool
 
         for output_node in graph.get_outputs():
             if not fw_impl.is_output_node_compatible_for_hessian_score_computation(output_node.node):
@@ -61,6 +66,9 @@ class HessianScoresCalculator(ABC):
 
         self.fw_impl = fw_impl
         self.hessian_request = hessian_scores_request
+        # The number of random iterations that were run per target node. Set by compute() of calculators that
+        # stop the estimation of each target separately.
+        self.achieved_iterations: Optional[List[int]] = None
 
     @abstractmethod
     def compute(self) -> List[float]:
@@ -72,6 +80,30 @@ class HessianScoresCalculator(ABC):
         """
         raise NotImplemented(f'{self.__class__.__name__} have to implement compute method.')  # pragma: no cover
 
+    def get_float_model(self, append2output: Optional[Sequence[BaseNode]] = None) -> Any:
+        """
+        Get a float model of the graph from the models pool (the model is built if it's not in the pool).
+
+        Args:
+            append2output: Nodes whose outputs are appended to the model outputs.
+
+        Returns:
+            The float model.
+        """
+        return self.models_pool.get_model(append2output, self._build_float_model)
+
+    def _build_float_model(self, append2output: Optional[Sequence[BaseNode]]) -> Any:
+        """
+        Build a framework float model of the graph.
+
+        Args:
+            append2output: Nodes whose outputs are appended to the model outputs.
+
+        Returns:
+            The float model.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} has to implement _build_float_model method.')  # pragma: no cover
+
     def unfold_tensors_list(self, tensors_to_unfold: Any) -> List[Any]:
         """
         Unfold (flatten) a nested tensors list.
@@ -80,6 +80,13 @@ class MixedPrecisionQuantizationConfig:
           is normalized by sigma prior to applying exponent.
         custom_metric_fn (Callable): Function to compute a custom metric. As input gets the model_mp and returns a
           float value for metric. If None, uses interest point metric.
+        incremental_sensitivity_evaluation (bool): Whether to compute the distance metric of a configuration by running
+          only the sub-graph downstream of the configured layers, using cached activations of the un-configured model
+          for the rest of the graph. Trades memory (cached activations of all evaluation images) for run time.
+        sensitivity_evaluation_num_workers (int): Number of worker processes to evaluate the sensitivity metrics of
+          the candidates in parallel. Each worker holds its own copy of the MP model (the workers are forked from the
+          main process, and run with a single framework thread). Only supported when inference runs on CPU, and a
+          GPU runtime was not initialized in the main process. If 1, the metrics are evaluated in the main process.
 
     """
     compute_distance_fn: Optional[Callable] = None
@@ -96,6 +103,8 @@ class MixedPrecisionQuantizationConfig:
     metric_epsilon: Optional[float] = 1e-6
     exp_distance_weighting_sigma: float = 0.1
     custom_metric_fn: Optional[Callable] = None
+    incremental_sensitivity_evaluation: bool = False
+    sensitivity_evaluation_num_workers: int = 1
     _is_mixed_precision_enabled: bool = field(init=False, default=False)
 
     def __post_init__(self):
@@ -111,6 +120,8 @@ class MixedPrecisionQuantizationConfig:
             self.distance_weighting_method = MpDistanceWeighting.HESSIAN
         elif self.distance_weighting_method is None and self.custom_metric_fn is None:
             self.distance_weighting_method = MpDistanceWeighting.AVG
+        assert self.sensitivity_evaluation_num_workers >= 1, (f'sensitivity_evaluation_num_workers should be at least '
+                                                              f'1, but got {self.sensitivity_evaluation_num_workers}')
         assert self.exp_distance_weighting_sigma > 0, (f'exp_distance_weighting_sigma should be positive, but got '
                                                        f'{self.exp_distance_weighting_sigma}')
 
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Set, Dict, Tuple
+from typing import Set, Dict, Tuple, FrozenSet
 
 import numpy as np
 
@@ -20,9 +20,9 @@ from model_compression_toolkit.core import FrameworkInfo
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import \
-    RUTarget
+    RUTarget, ResourceUtilization
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization_calculator import \
-    ResourceUtilizationCalculator, BitwidthMode, TargetInclusionCriterion
+    ResourceUtilizationCalculator, TargetInclusionCriterion, ConfigurationRUTables
 from model_compression_toolkit.core.common.quantization.node_quantization_config import NodeWeightsQuantizationConfig, \
     NodeActivationQuantizationConfig
 
@@ -34,6 +34,7 @@ class MixedPrecisionRUHelper:
         self.graph = graph
         self.fw_impl = fw_impl
         self.ru_calculator = ResourceUtilizationCalculator(graph, fw_impl)
+        self._ru_tables: Dict[Tuple[FrozenSet[RUTarget], FrozenSet[BaseNode]], ConfigurationRUTables] = {}
 
     def compute_utilization(self, ru_targets: Set[RUTarget], mp_cfg: Dict[BaseNode, int]) -> Dict[RUTarget, np.ndarray]:
         """
@@ -48,22 +49,7 @@ class MixedPrecisionRUHelper:
         Returns:
             Dict of the computed utilization per target, as 1d vector.
         """
-        act_qcs, w_qcs = self.get_quantization_candidates(mp_cfg)
-
-        ru, detailed_ru = self.ru_calculator.compute_resource_utilization(TargetInclusionCriterion.AnyQuantizedNonFused,
-                                                                          BitwidthMode.QCustom,
-                                                                          act_qcs=act_qcs,
-                                                                          w_qcs=w_qcs,
-                                                                          ru_targets=ru_targets,
-                                                                          allow_unused_qcs=True,
-                                                                          return_detailed=True)
-
-        ru_dict = {k: np.array([v]) for k, v in ru.get_resource_utilization_dict(restricted_only=True).items()}
-        # For activation and total we need utilization per cut, as different mp configurations might result in
-        # different cuts to be maximal.
-        for target in [RUTarget.ACTIVATION, RUTarget.TOTAL]:
-            if target in ru_dict:
-                ru_dict[target] = np.array(list(detailed_ru[target].values()))
+        ru_dict = self.get_ru_tables(ru_targets, mp_cfg).compute_utilization(mp_cfg)
 
         assert all(v.ndim == 1 for v in ru_dict.values())
         if RUTarget.ACTIVATION in ru_targets and RUTarget.TOTAL in ru_targets:
@@ -73,6 +59,55 @@ class MixedPrecisionRUHelper:
                                                  f'Requested {ru_targets}')
         return ru_dict
 
+    def compute_utilization_delta(self, ru_targets: Set[RUTarget], mp_cfg: Dict[BaseNode, int], node: BaseNode,
+                                  candidate_idx: int) -> Dict[RUTarget, np.ndarray]:
+        """
+        Compute the change in the utilization of requested targets for a configuration when replacing the
+        candidate of a single node (see compute_utilization).
+
+        Args:
+            ru_targets: resource utilization targets to compute.
+            mp_cfg: a list of candidates indices for configurable layers.
+            node: node to replace the candidate for.
+            candidate_idx: index of the new candidate.
+
+        Returns:
+            Dict of the utilization change per target, as 1d vector.
+        """
+        return self.get_ru_tables(ru_targets, mp_cfg).compute_utilization_delta(mp_cfg, node, candidate_idx)
+
+    def compute_resource_utilization(self, ru_targets: Set[RUTarget], mp_cfg: Dict[BaseNode, int]) -> ResourceUtilization:
+        """
+        Compute resource utilization of requested targets for a specific configuration.
+
+        Args:
+            ru_targets: resource utilization targets to compute.
+            mp_cfg: a list of candidates indices for configurable layers.
+
+        Returns:
+            A ResourceUtilization object.
+        """
+        return self.get_ru_tables(ru_targets, mp_cfg).compute_resource_utilization(mp_cfg)
+
+    def get_ru_tables(self, ru_targets: Set[RUTarget], mp_cfg: Dict[BaseNode, int]) -> ConfigurationRUTables:
+        """
+        Get the per-candidate utilization tables of the configuration nodes for the requested targets.
+        The tables are computed once per targets and nodes, and any configuration of these nodes is then computed
+        from the tables.
+
+        Args:
+            ru_targets: resource utilization targets to compute.
+            mp_cfg: a list of candidates indices for configurable layers.
+
+        Returns:
+            ConfigurationRUTables object.
+        """
+        key = (frozenset(ru_targets), frozenset(mp_cfg))
+        if key not in self._ru_tables:
+            self._ru_tables[key] = self.ru_calculator.compute_configuration_ru_tables(
+                TargetInclusionCriterion.AnyQuantizedNonFused, ru_targets, list(mp_cfg))
+        return self._ru_tables[key]
+
     def get_quantization_candidates(self, mp_cfg: Dict[BaseNode, int]) \
             -> Tuple[Dict[str, NodeActivationQuantizationConfig], Dict[str, NodeWeightsQuantizationConfig]]:
         """
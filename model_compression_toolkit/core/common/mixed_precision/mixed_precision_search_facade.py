@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 
+from dataclasses import dataclass
 from enum import Enum
 from typing import List, Callable
 
@@ -34,6 +35,26 @@ class BitWidthSearchMethod(Enum):
     INTEGER_PROGRAMMING = 0
 
 
+@dataclass
+class MixedPrecisionFrontierPoint:
+    """
+    A mixed-precision configuration found for one of the target resource utilizations of a sweep
+    (see search_bit_width_frontier).
+
+    Args:
+        target_resource_utilization: Target resource utilization the configuration was searched for.
+        bit_widths_config: MP configuration for the graph (the bit-width index of each configurable node, by the
+          nodes topological order).
+        resource_utilization: Resource utilization of the restricted targets for the configuration.
+        sensitivity: Sensitivity of the configuration (the search objective, i.e. the sum of the selected candidates
+          sensitivity).
+    """
+    target_resource_utilization: ResourceUtilization
+    bit_widths_config: List[int]
+    resource_utilization: ResourceUtilization
+    sensitivity: float
+
+
 def search_bit_width(graph: Graph,
                      fw_impl: FrameworkImplementation,
                      target_resource_utilization: ResourceUtilization,
@@ -67,19 +88,8 @@ def search_bit_width(graph: Graph,
 
     assert target_resource_utilization.is_any_restricted()
 
-    # If we only run weights compression with MP than no need to consider activation quantization when computing the
-    # MP metric (it adds noise to the computation)
-    tru = target_resource_utilization
-    weight_only_restricted = tru.weight_restricted() and not (tru.activation_restricted() or
-                                                              tru.total_mem_restricted() or
-                                                              tru.bops_restricted())
-    disable_activation_for_metric = weight_only_restricted or not graph.has_any_configurable_activation()
-
-    # Set Sensitivity Evaluator for MP search. It should always work with the original MP graph,
-    # even if a virtual graph was created (and is used only for BOPS utilization computation purposes)
-    se = SensitivityEvaluation(graph, mp_config, representative_data_gen=representative_data_gen,
-                               fw_impl=fw_impl, disable_activation_for_metric=disable_activation_for_metric,
-                               hessian_info_service=hessian_info_service)
+    se = _get_sensitivity_evaluator(graph, fw_impl, target_resource_utilization, mp_config, representative_data_gen,
+                                    hessian_info_service)
 
     if search_method != BitWidthSearchMethod.INTEGER_PROGRAMMING:
         raise NotImplementedError()
@@ -105,3 +115,96 @@ def search_bit_width(graph: Graph,
     topo_bit_cfg = [nodes_bit_cfg[n] for n in graph.get_configurable_sorted_nodes()]
     assert len(topo_bit_cfg) == len(nodes_bit_cfg)
     return topo_bit_cfg
+
+
+def search_bit_width_frontier(graph: Graph,
+                              fw_impl: FrameworkImplementation,
+                              target_resource_utilizations: List[ResourceUtilization],
+                              mp_config: MixedPrecisionQuantizationConfig,
+                              representative_data_gen: Callable,
+                              hessian_info_service: HessianInfoService = None) -> List[MixedPrecisionFrontierPoint]:
+    """
+    Search for MP configurations for a graph for each of several target resource utilizations (e.g. a sweep of memory
+    budgets), to get the frontier of the sensitivity vs. the resource utilization.
+    Unlike calling search_bit_width for each target, the sensitivity of the candidates and their resource utilization
+    are computed only once, and the integer programming problem is solved for each target, warm-started from the
+    solution of the previous target.
+    All targets have to restrict the same resource utilization targets (e.g. a sweep of weights memory budgets).
+
+    Args:
+        graph: Graph to search MP configurations for.
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_resource_utilizations: Target Resource Utilizations to search a configuration for each.
+        mp_config: Mixed-precision quantization configuration.
+        representative_data_gen: Dataset to use for retrieving images for the models inputs.
+        hessian_info_service: HessianInfoService to fetch Hessian-approximation information.
+
+    Returns:
+        A list with the frontier point (the configuration, its resource utilization and sensitivity) of each target,
+        in the order of the targets.
+    """
+    assert target_resource_utilizations and all(tru.is_any_restricted() for tru in target_resource_utilizations)
+
+    se = _get_sensitivity_evaluator(graph, fw_impl, target_resource_utilizations[0], mp_config,
+                                    representative_data_gen, hessian_info_service)
+
+    graph.skip_validation_check = True
+    search_manager = MixedPrecisionSearchManager(graph,
+                                                 fw_impl=fw_impl,
+                                                 sensitivity_evaluator=se,
+                                                 target_resource_utilization=target_resource_utilizations[0],
+                                                 mp_config=mp_config)
+    results = search_manager.search_frontier(target_resource_utilizations)
+    graph.skip_validation_check = False
+
+    frontier = []
+    for tru, (nodes_bit_cfg, sensitivity) in zip(target_resource_utilizations, results):
+        if mp_config.refine_mp_solution:
+            refined_bit_cfg = greedy_solution_refinement_procedure(nodes_bit_cfg, search_manager, tru)
+            if refined_bit_cfg != nodes_bit_cfg:
+                # The refinement runs only on the original graph, whose nodes are the searched nodes.
+                nodes_bit_cfg = refined_bit_cfg
+                sensitivity = float(sum(search_manager.layers_candidates_sensitivity[n][ind]
+                                        for n, ind in nodes_bit_cfg.items()))
+
+        frontier.append(MixedPrecisionFrontierPoint(
+            target_resource_utilization=tru,
+            bit_widths_config=[nodes_bit_cfg[n] for n in graph.get_configurable_sorted_nodes()],
+            resource_utilization=search_manager.compute_resource_utilization_for_config(nodes_bit_cfg),
+            sensitivity=sensitivity))
+    return frontier
+
+
+def _get_sensitivity_evaluator(graph: Graph,
+                               fw_impl: FrameworkImplementation,
+                               target_resource_utilization: ResourceUtilization,
+                               mp_config: MixedPrecisionQuantizationConfig,
+                               representative_data_gen: Callable,
+                               hessian_info_service: HessianInfoService) -> SensitivityEvaluation:
+    """
+    Create the sensitivity evaluator for the MP search.
+
+    Args:
+        graph: Graph to search a MP configuration for.
+        fw_impl: FrameworkImplementation object with specific framework methods implementation.
+        target_resource_utilization: Target Resource Utilization of the search.
+        mp_config: Mixed-precision quantization configuration.
+        representative_data_gen: Dataset to use for retrieving images for the models inputs.
+        hessian_info_service: HessianInfoService to fetch Hessian-approximation information.
+
+    Returns:
+        A SensitivityEvaluation object.
+    """
+    # If we only run weights compression with MP than no need to consider activation quantization when computing the
+    # MP metric (it adds noise to the computation)
+    tru = target_resource_utilization
+    weight_only_restricted = tru.weight_restricted() and not (tru.activation_restricted() or
+                                                              tru.total_mem_restricted() or
+                                                              tru.bops_restricted())
+    disable_activation_for_metric = weight_only_restricted or not graph.has_any_configurable_activation()
+
+    # Set Sensitivity Evaluator for MP search. It should always work with the original MP graph,
+    # even if a virtual graph was created (and is used only for BOPS utilization computation purposes)
+    return SensitivityEvaluation(graph, mp_config, representative_data_gen=representative_data_gen,
+                                 fw_impl=fw_impl, disable_activation_for_metric=disable_activation_for_metric,
+                                 hessian_info_service=hessian_info_service)
@@ -33,8 +33,6 @@ from model_compression_toolkit.core.common.graph.virtual_activation_weights_node
     VirtualSplitWeightsNode, VirtualSplitActivationNode, VirtualNode
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import \
     RUTarget, ResourceUtilization
-from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization_calculator import \
-    TargetInclusionCriterion, BitwidthMode
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_ru_helper import \
     MixedPrecisionRUHelper
 from model_compression_toolkit.core.common.mixed_precision.search_methods.linear_programming import \
@@ -92,6 +90,9 @@ class MixedPrecisionSearchManager:
             orig_min_config = self.config_reconstructor.reconstruct_full_configuration(self.min_ru_config)
         self.min_ru = self.orig_graph_ru_helper.compute_utilization(self.ru_targets, orig_min_config)
 
+        # Sensitivity of the candidates of the mp graph configurable nodes, computed by search_frontier.
+        self.layers_candidates_sensitivity: Optional[Dict[BaseNode, List[float]]] = None
+
     def search(self) -> Dict[BaseNode, int]:
         """
         Run mixed precision search.
@@ -106,6 +107,46 @@ class MixedPrecisionSearchManager:
 
         return mp_config
 
+    def search_frontier(self,
+                        target_resource_utilizations: List[ResourceUtilization]) -> List[Tuple[Dict[BaseNode, int], float]]:
+        """
+        Run mixed precision search for each of several target resource utilizations. The sensitivity and the
+        candidates resource utilization are computed once and shared by all searches, and each search is warm-started
+        from the solution of the previous one.
+        The targets are expected to restrict the same ru targets as the target resource utilization the manager was
+        created with.
+
+        Args:
+            target_resource_utilizations: Target resource utilizations to search a configuration for.
+
+        Returns:
+            A list with the mapping from nodes to indices of the selected bit-widths candidate, and the sensitivity of
+            the selected configuration (the sum of the selected candidates sensitivity), for each target.
+        """
+        for tru in target_resource_utilizations:
+            if tru.get_restricted_targets() != self.ru_targets:
+                raise ValueError(f'Expected all target resource utilizations to restrict the targets '
+                                 f'{sorted(t.value for t in self.ru_targets)}, but got a target that restricts '
+                                 f'{sorted(t.value for t in tru.get_restricted_targets())}.')
+
+        candidates_ru = self._compute_relative_ru_matrices()
+        self.layers_candidates_sensitivity = self._build_sensitivity_mapping()
+
+        results = []
+        prev_mp_config = None
+        for tru in target_resource_utilizations:
+            rel_target_ru = self._get_relative_ru_constraint_per_mem_element(tru)
+            solver = MixedPrecisionIntegerLPSolver(self.layers_candidates_sensitivity, candidates_ru, rel_target_ru)
+            mp_config = solver.run(warm_start_config=prev_mp_config)
+            prev_mp_config = mp_config
+            sensitivity = float(sum(self.layers_candidates_sensitivity[n][ind] for n, ind in mp_config.items()))
+
+            if self.using_virtual_graph:
+                mp_config = self.config_reconstructor.reconstruct_full_configuration(mp_config)
+            results.append((mp_config, sensitivity))
+
+        return results
+
     def _prepare_and_run_solver(self) -> Dict[BaseNode, int]:
         """
         Prepare sensitivity and ru data for LP solver and run the solver.
@@ -120,12 +161,17 @@ class MixedPrecisionSearchManager:
         mp_config = solver.run()
         return mp_config
 
-    def _get_relative_ru_constraint_per_mem_element(self) -> Dict[RUTarget, np.ndarray]:
+    def _get_relative_ru_constraint_per_mem_element(
+            self, target_resource_utilization: Optional[ResourceUtilization] = None) -> Dict[RUTarget, np.ndarray]:
         """
         Computes resource utilization constraint with respect to the minimal bit configuration, i.e. corresponding
         constraint for each memory element is the relative utilization between the target utilization and
         element's utilization for min-bit configuration.
 
+        Args:
+            target_resource_utilization: Target resource utilization to compute the constraint for. If None, the
+              manager's target resource utilization is used.
+
         Returns:
             A dictionary of relative resource utilization constraints per ru target.
 
@@ -133,7 +179,8 @@ class MixedPrecisionSearchManager:
             ValueError: if target resource utilization cannot be satisfied (utilization for the minimal bit
               configuration exceeds the requested target utilization for any target).
         """
-        target_ru = self.target_resource_utilization.get_resource_utilization_dict(restricted_only=True)
+        target_resource_utilization = target_resource_utilization or self.target_resource_utilization
+        target_ru = target_resource_utilization.get_resource_utilization_dict(restricted_only=True)
         rel_target_ru = {
             ru_target: (ru - self.min_ru[ru_target]) for ru_target, ru in target_ru.items()
         }
@@ -180,20 +227,30 @@ class MixedPrecisionSearchManager:
             metrics[max_ind] = max_val
             return metrics
 
-        layer_to_metrics_mapping = {}
-        debug_mapping = {}
-        for node_idx, node in tqdm(enumerate(self.mp_topo_configurable_nodes)):
-            raw_candidates_sensitivity = np.empty(len(node.candidates_quantization_cfg))
+        # Configurations to evaluate: a single candidate of a single configurable node at a time.
+        mp_configs = []
+        for node in self.mp_topo_configurable_nodes:
             for bitwidth_idx, _ in enumerate(node.candidates_quantization_cfg):
                 if self.using_virtual_graph:
                     a_cfg, w_cfg = self.config_reconstructor.reconstruct_separate_aw_configs({node: bitwidth_idx})
                 else:
                     a_cfg = {node: bitwidth_idx} if node.has_configurable_activation() else {}
                     w_cfg = {node: bitwidth_idx} if node.has_any_configurable_weight() else {}
-                raw_candidates_sensitivity[bitwidth_idx] = self.sensitivity_evaluator.compute_metric(
-                    mp_a_cfg={n.name: ind for n, ind in a_cfg.items()},
-                    mp_w_cfg={n.name: ind for n, ind in w_cfg.items()}
-                )
+                mp_configs.append(({n.name: ind for n, ind in a_cfg.items()}, {n.name: ind for n, ind in w_cfg.items()}))
+
+        if self.mp_config.sensitivity_evaluation_num_workers > 1:
+            metrics = self.sensitivity_evaluator.compute_metrics(mp_configs,
+                                                                 self.mp_config.sensitivity_evaluation_num_workers)
+        else:
+            metrics = [self.sensitivity_evaluator.compute_metric(mp_a_cfg=a_cfg, mp_w_cfg=w_cfg)
+                       for a_cfg, w_cfg in tqdm(mp_configs)]
+
+        layer_to_metrics_mapping = {}
+        debug_mapping = {}
+        metrics_iter = iter(metrics)
+        for node in self.mp_topo_configurable_nodes:
+            raw_candidates_sensitivity = np.array([next(metrics_iter) for _ in node.candidates_quantization_cfg],
+                                                  dtype=float)
             max_ind = node.find_max_candidate_index()
             normalized_sensitivity = normalize(raw_candidates_sensitivity, max_ind)
             candidates_sensitivity = ensure_maxbit_minimal_metric(normalized_sensitivity, max_ind)
@@ -255,12 +312,15 @@ class MixedPrecisionSearchManager:
             for candidate_idx, _ in enumerate(node.candidates_quantization_cfg):
                 if candidate_idx == self.min_ru_config[node]:
                     candidate_rus = self.min_ru
-                else:
+                elif self.using_virtual_graph:
                     cfg = self.min_ru_config.copy()
                     cfg[node] = candidate_idx
-                    if self.using_virtual_graph:
-                        cfg = self.config_reconstructor.reconstruct_full_configuration(cfg)
+                    cfg = self.config_reconstructor.reconstruct_full_configuration(cfg)
                     candidate_rus = self.orig_graph_ru_helper.compute_utilization(self.ru_targets, cfg)
+                else:
+                    delta_rus = self.orig_graph_ru_helper.compute_utilization_delta(self.ru_targets, self.min_ru_config,
+                                                                                    node, candidate_idx)
+                    candidate_rus = {target: self.min_ru[target] + delta for target, delta in delta_rus.items()}
 
                 for target, ru in candidate_rus.items():
                     rus_per_candidate[target].append(ru)
@@ -298,15 +358,7 @@ class MixedPrecisionSearchManager:
         with the given config.
 
         """
-        act_qcs, w_qcs = self.orig_graph_ru_helper.get_quantization_candidates(config)
-        ru = self.orig_graph_ru_helper.ru_calculator.compute_resource_utilization(
-            target_criterion=TargetInclusionCriterion.AnyQuantizedNonFused,
-            bitwidth_mode=BitwidthMode.QCustom,
-            act_qcs=act_qcs,
-            w_qcs=w_qcs,
-            ru_targets=self.ru_targets,
-            allow_unused_qcs=True)
-        return ru
+        return self.orig_graph_ru_helper.compute_resource_utilization(self.ru_targets, config)
 
     def _finalize_distance_metric(self, layer_to_metrics_mapping: Dict[BaseNode, List[float]]):
         """
@@ -18,6 +18,8 @@ from copy import deepcopy
 from enum import Enum, auto
 from typing import Dict, NamedTuple, Optional, Tuple, List, Iterable, Union, Literal, Sequence
 
+import numpy as np
+
 from model_compression_toolkit.core.common.fusion.graph_fuser import GraphFuser
 
 from model_compression_toolkit.constants import FLOAT_BITWIDTH
@@ -563,6 +565,96 @@ class ResourceUtilizationCalculator:
         node_bops = a_nbits * w_nbits * node_mac
         return node_bops
 
+    def compute_configuration_ru_tables(self,
+                                       target_criterion: TargetInclusionCriterion,
+                                       ru_targets: Iterable[RUTarget],
+                                       nodes: Sequence[BaseNode]) -> 'ConfigurationRUTables':
+        """
+        Precompute the contribution of each candidate of the given nodes to the resource utilization, for a fast
+        computation of the utilization of custom configurations of these nodes (equivalent to
+        compute_resource_utilization in QCustom mode with the candidates configs of the nodes).
+
+        Args:
+            target_criterion: criterion to include targets for computation.
+            ru_targets: metrics to include for computation.
+            nodes: nodes to be configured by the custom configurations. The rest of the nodes use their default
+              configuration.
+
+        Returns:
+            ConfigurationRUTables object.
+        """
+        ru_targets = set(ru_targets)
+        nodes = list(nodes)
+        nodes_set = set(nodes)
+        offsets = np.cumsum([0] + [len(n.candidates_quantization_cfg) for n in nodes])
+        nodes_rows = {n: slice(offsets[i], offsets[i + 1]) for i, n in enumerate(nodes)}
+
+        constant = {}
+        per_candidate = {}
+        pairwise = []
+
+        if {RUTarget.WEIGHTS, RUTarget.TOTAL}.intersection(ru_targets):
+            const, table = np.zeros(1), np.zeros((offsets[-1], 1))
+            for n, attrs in self._collect_target_nodes_w_attrs(target_criterion, include_reused=False).items():
+                if n in nodes_set:
+                    table[nodes_rows[n], 0] += [
+                        self.compute_node_weights_utilization(n, attrs, BitwidthMode.QCustom,
+                                                              qc.weights_quantization_cfg)[0].bytes
+                        for qc in n.candidates_quantization_cfg]
+                else:
+                    const[0] += self.compute_node_weights_utilization(n, attrs, BitwidthMode.QCustom)[0].bytes
+            constant[RUTarget.WEIGHTS], per_candidate[RUTarget.WEIGHTS] = const, table
+
+        if {RUTarget.ACTIVATION, RUTarget.TOTAL}.intersection(ru_targets):
+            cuts_nodes = []
+            # if there are no target activations in the graph, don't waste time looking for cuts
+            if self._get_target_activation_nodes(target_criterion, include_reused=True):
+                cuts_nodes = [cut_nodes for cut in self.cuts
+                              if (cut_nodes := self._get_cut_target_nodes(cut, target_criterion))]
+            const, table = np.zeros(len(cuts_nodes)), np.zeros((offsets[-1], len(cuts_nodes)))
+            for cut_idx, cut_nodes in enumerate(cuts_nodes):
+                # nodes are counted once per cut
+                for n in {n.name: n for n in cut_nodes}.values():
+                    qn = self.graph.retrieve_preserved_quantization_node(n)
+                    if qn in nodes_set:
+                        table[nodes_rows[qn], cut_idx] += [
+                            self.compute_node_activation_tensor_utilization(n, target_criterion, BitwidthMode.QCustom,
+                                                                            qc.activation_quantization_cfg).bytes
+                            for qc in qn.candidates_quantization_cfg]
+                    else:
+                        const[cut_idx] += self.compute_node_activation_tensor_utilization(n, target_criterion,
+                                                                                          BitwidthMode.QCustom).bytes
+            constant[RUTarget.ACTIVATION], per_candidate[RUTarget.ACTIVATION] = const, table
+
+        if RUTarget.BOPS in ru_targets:
+            const, table = np.zeros(1), np.zeros((offsets[-1], 1))
+            for n in self.graph.get_topo_sorted_nodes():
+                if not n.kernel_attr:
+                    continue
+                # BOPS of a node depend on its weights and on its input activation, so the contribution of a
+                # configurable node whose input activation is also configurable depends on both configurations.
+                prev_nodes = self.graph.get_prev_nodes(n)
+                a_node = self.graph.retrieve_preserved_quantization_node(prev_nodes[0]) \
+                    if len(prev_nodes) == 1 else None
+                a_qcs = a_node.candidates_quantization_cfg if a_node in nodes_set else [None]
+                w_qcs = n.candidates_quantization_cfg if n in nodes_set else [None]
+                bops = np.array([[self.compute_node_bops(n, target_criterion, BitwidthMode.QCustom,
+                                                         act_qcs={a_node.name: a_qc.activation_quantization_cfg}
+                                                         if a_qc else None,
+                                                         w_qc=w_qc.weights_quantization_cfg if w_qc else None)
+                                  for w_qc in w_qcs] for a_qc in a_qcs], dtype=float)
+                if a_node in nodes_set and n in nodes_set:
+                    pairwise.append((a_node, n, bops))
+                elif a_node in nodes_set:
+                    table[nodes_rows[a_node], 0] += bops[:, 0]
+                elif n in nodes_set:
+                    table[nodes_rows[n], 0] += bops[0]
+                else:
+                    const[0] += bops[0, 0]
+            constant[RUTarget.BOPS], per_candidate[RUTarget.BOPS] = const, table
+
+        return ConfigurationRUTables(nodes, ru_targets, constant, per_candidate, pairwise)
+
     def _compute_cuts(self):
         """ Compute activation cuts of the graph. """
         # Compute memory graph on fused graph with fused nodes
@@ -787,3 +879,126 @@ class ResourceUtilizationCalculator:
         unknown_nodes = set(qcs.keys()) - self._nodes_names
         if unknown_nodes:
             raise ValueError(self.unexpected_qc_nodes_error, unknown_nodes)
+
+
+class ConfigurationRUTables:
+    """
+    Precomputed resource utilization contributions of the candidates of a set of configurable nodes (built by
+    ResourceUtilizationCalculator.compute_configuration_ru_tables).
+    Weights memory and BOPS are sums over the nodes, and the activation memory of each cut is a sum over the cut's
+    nodes, so the utilization of a configuration is the sum of a constant part (non-configured nodes), the rows of the
+    selected candidates, and for BOPS, the entries of kernel nodes whose weights and input activation are both
+    configured.
+    """
+
+    def __init__(self,
+                 nodes: List[BaseNode],
+                 ru_targets: Iterable[RUTarget],
+                 constant: Dict[RUTarget, np.ndarray],
+                 per_candidate: Dict[RUTarget, np.ndarray],
+                 pairwise: List[Tuple[BaseNode, BaseNode, np.ndarray]]):
+        """
+        Args:
+            nodes: configured nodes.
+            ru_targets: resource utilization targets.
+            constant: utilization per memory element of the non-configured nodes, for the weights, activation and
+              bops targets.
+            per_candidate: utilization per memory element of each candidate of the configured nodes (a matrix of
+              num candidates of all nodes X num memory elements, in the nodes order), for the weights, activation and
+              bops targets.
+            pairwise: bops of the kernel nodes whose input activation node is also configured, as
+              (activation node, kernel node, matrix of activation candidates X weights candidates).
+        """
+        self.nodes = nodes
+        self.ru_targets = set(ru_targets)
+        self.constant = constant
+        self.per_candidate = per_candidate
+        self.pairwise = pairwise
+
+        offsets = np.cumsum([0] + [len(n.candidates_quantization_cfg) for n in nodes])
+        self._offsets = {n: offsets[i] for i, n in enumerate(nodes)}
+        self._node_pairwise = defaultdict(list)
+        for a_node, w_node, bops in pairwise:
+            self._node_pairwise[a_node].append((a_node, w_node, bops))
+            self._node_pairwise[w_node].append((a_node, w_node, bops))
+
+    def compute_utilization(self, cfg: Dict[BaseNode, int]) -> Dict[RUTarget, np.ndarray]:
+        """
+        Compute the utilization of a configuration:
+          for weights and bops - total utilization,
+          for activations and total - utilization per cut.
+
+        Args:
+            cfg: a mapping from the configured nodes to candidate indices.
+
+        Returns:
+            Dict of the computed utilization per target, as 1d vector.
+        """
+        return self._to_targets(self._compute_components(cfg))
+
+    def compute_utilization_delta(self, cfg: Dict[BaseNode, int], node: BaseNode,
+                                  candidate_idx: int) -> Dict[RUTarget, np.ndarray]:
+        """
+        Compute the change in the utilization of a configuration when replacing the candidate of a single node.
+
+        Args:
+            cfg: a mapping from the configured nodes to candidate indices.
+            node: node to replace the candidate for.
+            candidate_idx: index of the new candidate.
+
+        Returns:
+            Dict of the utilization change per target, as 1d vector (see compute_utilization).
+        """
+        new_row, old_row = self._offsets[node] + candidate_idx, self._offsets[node] + cfg[node]
+        delta = {target: table[new_row] - table[old_row] for target, table in self.per_candidate.items()}
+        for a_node, w_node, bops in self._node_pairwise.get(node, []):
+            a_ind = candidate_idx if a_node is node else cfg[a_node]
+            w_ind = candidate_idx if w_node is node else cfg[w_node]
+            delta[RUTarget.BOPS] = delta[RUTarget.BOPS] + bops[a_ind, w_ind] - bops[cfg[a_node], cfg[w_node]]
+        return self._to_targets(delta)
+
+    def compute_resource_utilization(self, cfg: Dict[BaseNode, int]) -> ResourceUtilization:
+        """
+        Compute the resource utilization of a configuration.
+
+        Args:
+            cfg: a mapping from the configured nodes to candidate indices.
+
+        Returns:
+            Resource utilization object.
+        """
+        util = self._compute_components(cfg)
+        ru = ResourceUtilization()
+        w_total = float(util[RUTarget.WEIGHTS][0]) if RUTarget.WEIGHTS in util else None
+        a_total = float(util[RUTarget.ACTIVATION].max(initial=0)) if RUTarget.ACTIVATION in util else None
+        if RUTarget.WEIGHTS in self.ru_targets:
+            ru.weights_memory = w_total
+        if RUTarget.ACTIVATION in self.ru_targets:
+            ru.activation_memory = a_total
+        if RUTarget.TOTAL in self.ru_targets:
+            ru.total_memory = w_total + a_total
+        if RUTarget.BOPS in self.ru_targets:
+            ru.bops = float(util[RUTarget.BOPS][0])
+        return ru
+
+    def _compute_components(self, cfg: Dict[BaseNode, int]) -> Dict[RUTarget, np.ndarray]:
+        """ Compute the weights, activation and bops utilization of a configuration. """
+        if cfg.keys() != self._offsets.keys():
+            raise ValueError('Configuration nodes do not match the nodes the tables were computed for.')
+        rows = np.fromiter((self._offsets[n] + ind for n, ind in cfg.items()), dtype=int, count=len(cfg))
+        util = {target: self.constant[target] + self.per_candidate[target][rows].sum(axis=0)
+                for target in self.constant}
+        if self.pairwise:
+            util[RUTarget.BOPS] = util[RUTarget.BOPS] + sum(bops[cfg[a_node], cfg[w_node]]
+                                                            for a_node, w_node, bops in self.pairwise)
+        return util
+
+    def _to_targets(self, util: Dict[RUTarget, np.ndarray]) -> Dict[RUTarget, np.ndarray]:
+        """ Collect the requested targets from the weights, activation and bops utilization. """
+        ru_dict = {}
+        for target in self.ru_targets:
+            if target == RUTarget.TOTAL:
+                ru_dict[target] = util[RUTarget.ACTIVATION] + util[RUTarget.WEIGHTS]
+            else:
+                ru_dict[target] = util[target]
+        return ru_dict
@@ -16,7 +16,7 @@ from collections import defaultdict
 
 import numpy as np
 from pulp import *
-from typing import Dict, Tuple, Any, List
+from typing import Dict, Tuple, Any, List, Optional
 
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import RUTarget
 
@@ -43,18 +43,28 @@ class MixedPrecisionIntegerLPSolver:
 
         self.layer_to_indicator_vars, self.objective_vars = self._init_problem_vars(layer_to_sensitivity_mapping)
 
-    def run(self) -> Dict[Any, int]:
+    def run(self, warm_start_config: Optional[Dict[Any, int]] = None) -> Dict[Any, int]:
         """
         Build and solve an ILP optimization problem.
 
+        Args:
+            warm_start_config: An optional initial solution for the solver (a dictionary from layer to the index of a
+              bitwidth candidate), e.g. a solution of the same problem with different resource utilization
+              constraints. If it's feasible, the solver starts its search from it.
+
         Returns:
             A dictionary from layer to the index of the selected bitwidth candidate.
         """
         # Add all equations and inequalities that define the problem.
         lp_problem = self._formalize_problem()
 
+        if warm_start_config is not None:
+            for layer, layer_vars in self.layer_to_indicator_vars.items():
+                for qc_idx, v in enumerate(layer_vars):
+                    v.setInitialValue(int(qc_idx == warm_start_config[layer]))
+
         # Use default PULP solver. Limit runtime in seconds
-        solver = PULP_CBC_CMD(timeLimit=SOLVER_TIME_LIMIT)
+        solver = PULP_CBC_CMD(timeLimit=SOLVER_TIME_LIMIT, warmStart=warm_start_config is not None)
         lp_problem.solve(solver=solver)  # Try to solve the problem.
 
         if lp_problem.status != LpStatusOptimal:
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import networkx as nx
 import numpy as np
-from typing import runtime_checkable, Protocol, Callable, Any, List, Tuple
+from typing import runtime_checkable, Protocol, Callable, Any, List, Tuple, Collection, Optional, Dict, Set
 
 from model_compression_toolkit.core import MixedPrecisionQuantizationConfig, MpDistanceWeighting
 from model_compression_toolkit.core.common import Graph, BaseNode
@@ -30,8 +31,9 @@ class MetricCalculator(Protocol):
     # all interest points (including graph outputs)
     all_interest_points: list
 
-    def compute(self, mp_model) -> float:
-        """ Compute the metric for the given model. """
+    def compute(self, mp_model, configured_nodes: Optional[Collection[str]] = None) -> float:
+        """ Compute the metric for the given model. configured_nodes are the names of nodes whose quantization is
+        enabled in the model. """
         raise NotImplementedError    # pragma: no cover
 
 
@@ -47,7 +49,7 @@ class CustomMetricCalculator(MetricCalculator):
         self.all_interest_points = [n.node for n in graph.get_outputs()]
         self.metric_fn = custom_metric_fn
 
-    def compute(self, mp_model: Any) -> float:
+    def compute(self, mp_model: Any, configured_nodes: Optional[Collection[str]] = None) -> float:
         """ Compute the metric for the given model. """
         sensitivity_metric = self.metric_fn(mp_model)
         if not isinstance(sensitivity_metric, (float, np.floating)):
@@ -119,17 +121,51 @@ class DistanceMetricCalculator(MetricCalculator):
         if self.mp_config.distance_weighting_method == MpDistanceWeighting.HESSIAN:
             self.interest_points_hessians = self._compute_hessian_based_scores(hessian_info_service)
 
-    def compute(self, mp_model) -> float:
+        # Cached outputs of the un-configured mp model per images batch, and the sub-graph (nodes names) downstream
+        # of each configurable node, for incremental metric computation (see cache_mp_model_outputs).
+        self.mp_cached_outputs = None
+        self.conf_node_to_subgraph = None
+
+    def cache_mp_model_outputs(self, mp_model: Any, configurable_nodes_names: Collection[str]):
+        """
+        Run the un-configured MP model on all images batches and cache the outputs of the nodes needed for
+        running only the sub-graph downstream of configured nodes: inputs to each sub-graph from outside of it,
+        and the interest points. Afterwards, computing the metric for a configuration only runs the sub-graphs of
+        the configured nodes.
+
+        Args:
+            mp_model: MP model with all configurable quantizers disabled.
+            configurable_nodes_names: Names of the configurable nodes of the MP model.
+        """
+        name_to_node = {n.name: n for n in self.graph.nodes}
+        nodes_to_cache = {n.name for n in self.all_interest_points}
+        self.conf_node_to_subgraph = {}
+        for name in configurable_nodes_names:
+            subgraph = {name_to_node[name]} | nx.descendants(self.graph, name_to_node[name])
+            self.conf_node_to_subgraph[name] = {n.name for n in subgraph}
+            nodes_to_cache.update(ie.source_node.name for n in subgraph for ie in self.graph.incoming_edges(n)
+                                  if ie.source_node not in subgraph)
+
+        self.mp_cached_outputs = [self.fw_impl.sensitivity_eval_inference_and_cache(mp_model, images, nodes_to_cache)[1]
+                                  for images in self.images_batches]
+
+    def compute(self, mp_model, configured_nodes: Optional[Collection[str]] = None) -> float:
         """
         Compute the metric for the given model.
 
         Args:
             mp_model: MP configured model.
+            configured_nodes: Names of the nodes whose quantization is enabled in the MP model. If outputs of the
+              un-configured model were cached, only the sub-graph downstream of these nodes is run.
 
         Returns:
             Computed metric.
         """
-        ipts_distances, out_pts_distances = self._compute_distance(mp_model)
+        if self.mp_cached_outputs is not None and configured_nodes:
+            nodes_to_run = set().union(*[self.conf_node_to_subgraph[n] for n in configured_nodes])
+            ipts_distances, out_pts_distances = self._compute_distance(mp_model, nodes_to_run)
+        else:
+            ipts_distances, out_pts_distances = self._compute_distance(mp_model)
         sensitivity_metric = self._compute_mp_distance_measure(ipts_distances, out_pts_distances)
         return sensitivity_metric
 
@@ -222,11 +258,16 @@ class DistanceMetricCalculator(MetricCalculator):
 
         return np.asarray(distance_v)
 
-    def _compute_distance(self, mp_model) -> Tuple[np.ndarray, np.ndarray]:
+    def _compute_distance(self, mp_model, nodes_to_run: Optional[Set[str]] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Computing the interest points distance and the output points distance, and using them to build a
         unified distance vector.
 
+        Args:
+            mp_model: MP configured model.
+            nodes_to_run: Names of nodes to run in the MP model, taking the outputs of the rest of the nodes from
+              the cached outputs. If None, the entire model is run.
+
         Returns: A distance vector.
         """
 
@@ -234,9 +275,14 @@ class DistanceMetricCalculator(MetricCalculator):
         out_pts_per_batch_distance = []
 
         # Compute the distance matrix for num_of_images images.
-        for images, baseline_tensors in zip(self.images_batches, self.baseline_tensors_list):
-            # when using model.predict(), it does not use the QuantizeWrapper functionality
-            mp_tensors = self.fw_impl.sensitivity_eval_inference(mp_model, images)
+        for batch_idx, (images, baseline_tensors) in enumerate(zip(self.images_batches, self.baseline_tensors_list)):
+            if nodes_to_run is None:
+                # when using model.predict(), it does not use the QuantizeWrapper functionality
+                mp_tensors = self.fw_impl.sensitivity_eval_inference(mp_model, images)
+            else:
+                mp_tensors = self.fw_impl.sensitivity_eval_partial_inference(mp_model,
+                                                                             self.mp_cached_outputs[batch_idx],
+                                                                             nodes_to_run)
             mp_tensors = self.fw_impl.to_numpy(mp_tensors)
 
             # Compute distance: similarity between the baseline model to the float model
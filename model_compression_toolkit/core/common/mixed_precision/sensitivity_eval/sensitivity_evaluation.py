@@ -15,11 +15,14 @@
 import contextlib
 import copy
 import itertools
+import math
 
-from typing import Callable, Any, Tuple, Dict, Optional
+from tqdm import tqdm
+from typing import Callable, Any, Tuple, Dict, Optional, List
 
 from model_compression_toolkit.core import FrameworkInfo, MixedPrecisionQuantizationConfig
 from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.forked_workers import map_in_forked_workers
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_eval.metric_calculators import \
     CustomMetricCalculator, DistanceMetricCalculator
 from model_compression_toolkit.core.common.mixed_precision.sensitivity_eval.set_layer_to_bitwidth import \
@@ -27,6 +30,7 @@ from model_compression_toolkit.core.common.mixed_precision.sensitivity_eval.set_
 from model_compression_toolkit.core.common.quantization.node_quantization_config import ActivationQuantizationMode
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.hessian import HessianInfoService
+from model_compression_toolkit.logger import Logger
 
 
 class SensitivityEvaluation:
@@ -68,6 +72,16 @@ class SensitivityEvaluation:
         self.mp_model, self.conf_node2layers = self._build_mp_model(graph, self.metric_calculator.all_interest_points,
                                                                     disable_activation_for_metric)
 
+        if self.mp_config.incremental_sensitivity_evaluation:
+            if not isinstance(self.metric_calculator, DistanceMetricCalculator):
+                Logger.warning('Incremental sensitivity evaluation is not supported with a custom metric function, '
+                               'running full sensitivity evaluation.')
+            elif not fw_impl.supports_partial_sensitivity_eval_inference:
+                Logger.warning(f'Incremental sensitivity evaluation is not supported by '
+                               f'{fw_impl.__class__.__name__}, running full sensitivity evaluation.')
+            else:
+                self.metric_calculator.cache_mp_model_outputs(self.mp_model, self.conf_node2layers.keys())
+
     def compute_metric(self, mp_a_cfg: Dict[str, Optional[int]], mp_w_cfg: Dict[str, Optional[int]]) -> float:
         """
         Compute the sensitivity metric of the MP model for a given configuration.
@@ -80,11 +94,34 @@ class SensitivityEvaluation:
         Returns:
             The sensitivity metric of the MP model for a given configuration.
         """
+        configured_nodes = {n for n, ind in itertools.chain(mp_a_cfg.items(), mp_w_cfg.items()) if ind is not None}
         with self._configured_mp_model(mp_a_cfg, mp_w_cfg):
-            sensitivity_metric = self.metric_calculator.compute(self.mp_model)
+            sensitivity_metric = self.metric_calculator.compute(self.mp_model, configured_nodes)
 
         return sensitivity_metric
 
+    def compute_metrics(self,
+                        mp_cfgs: List[Tuple[Dict[str, Optional[int]], Dict[str, Optional[int]]]],
+                        num_workers: int) -> List[float]:
+        """
+        Compute the sensitivity metrics of the MP model for a list of configurations, split into contiguous shards
+        between worker processes. Each worker is forked from the current process, and holds its own copy of the MP
+        model. The results are identical to computing the metrics one by one with compute_metric.
+        If the framework doesn't support inference in forked processes, the metrics are computed in the current
+        process.
+
+        Args:
+            mp_cfgs: A list of bitwidth activations and weights configurations (see compute_metric).
+            num_workers: Number of worker processes.
+
+        Returns:
+            The sensitivity metrics of the configurations, by their order.
+        """
+        return list(tqdm(map_in_forked_workers(lambda mp_cfg: self.compute_metric(*mp_cfg), mp_cfgs, num_workers,
+                                               self.fw_impl, 'sensitivity evaluation',
+                                               chunksize=math.ceil(len(mp_cfgs) / max(num_workers, 1))),
+                         total=len(mp_cfgs)))
+
     def _build_mp_model(self, graph, outputs, disable_activations: bool) -> Tuple[Any, dict]:
         """
         Builds an MP model with configurable layers.
@@ -15,7 +15,7 @@
 
 
 import numpy as np
-from typing import List, Union, Tuple, Optional
+from typing import List, Union, Tuple, Optional, Type, Any
 
 from networkx.algorithms.dag import topological_sort
 from model_compression_toolkit.core import QuantizationErrorMethod
@@ -26,11 +26,36 @@ from model_compression_toolkit.core.common.hessian import HessianInfoService, He
     HessianScoresRequest
 from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
-from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector
+from model_compression_toolkit.core.common.collectors.statistics_collector import BaseStatsCollector, StatsCollector, \
+    StatsCollectorPlan
+
+
+def get_stats_collector_plan(qc: common.QuantizationConfig) -> StatsCollectorPlan:
+    """
+    Build a plan of the statistics that should be collected according to the quantization configuration,
+    so statistics that are not used by the quantization process are not computed:
+    the weighted histogram is used only by the HMSE activation error method, the histogram by the
+    rest of the activation error methods, shift negative correction and activation bias correction,
+    and the mean per channel only by bias correction.
+
+    Args:
+        qc: Quantization configuration containing parameters for how the graph should be quantized.
+
+    Returns:
+        The statistics collector plan.
+    """
+    use_hmse = qc.activation_error_method == QuantizationErrorMethod.HMSE
+    return StatsCollectorPlan(histogram=(not use_hmse or qc.shift_negative_activation_correction or
+                                         qc.activation_bias_correction),
+                              weighted_histogram=use_hmse,
+                              mean=qc.weights_bias_correction,
+                              histogram_streaming=qc.streaming_histogram_collection)
 
 
 def create_stats_collector_for_node(node: common.BaseNode,
-                                    quant_node_in_fln: bool) -> BaseStatsCollector:
+                                    quant_node_in_fln: bool,
+                                    stats_collector_cls: Type[StatsCollector] = StatsCollector,
+                                    collectors_plan: StatsCollectorPlan = StatsCollectorPlan()) -> BaseStatsCollector:
     """
     Gets a node and a groups list and create and return a statistics collector for a node
     according to whether its statistics should be collected and the prior information we
@@ -39,6 +64,8 @@ def create_stats_collector_for_node(node: common.BaseNode,
     Args:
         node: Node to create its statistics collector.
         quant_node_in_fln: Whether the node should be quantized as part of an FLN.
+        stats_collector_cls: Statistics collector class to instantiate for nodes that require collection.
+        collectors_plan: Which statistics the statistics collector should collect.
 
     Returns:
         Statistics collector for statistics collection for the node.
@@ -47,9 +74,10 @@ def create_stats_collector_for_node(node: common.BaseNode,
     if node.is_activation_quantization_enabled() or quant_node_in_fln:
         min_output = getattr(node.prior_info, 'min_output', None)
         max_output = getattr(node.prior_info, 'max_output', None)
-        stats_collector = common.StatsCollector(out_channel_axis=node.out_channel_axis,
-                                                init_min_value=min_output,
-                                                init_max_value=max_output)
+        stats_collector = stats_collector_cls(out_channel_axis=node.out_channel_axis,
+                                              init_min_value=min_output,
+                                              init_max_value=max_output,
+                                              collectors_plan=collectors_plan)
     else:
         stats_collector = common.NoStatsCollector()
 
@@ -57,19 +85,23 @@ def create_stats_collector_for_node(node: common.BaseNode,
 
 
 def create_tensor2node(graph: common.Graph,
-                       node: common.BaseNode):
+                       node: common.BaseNode,
+                       stats_collector_cls: Type[StatsCollector] = StatsCollector,
+                       collectors_plan: StatsCollectorPlan = StatsCollectorPlan()):
     """
     Force statistic collector creation and assignment for a node.
     Args:
         graph: Graph of the node (for retrieving the current tensor).
         node: Node to create a tensor for.
+        stats_collector_cls: Statistics collector class to instantiate.
+        collectors_plan: Which statistics the statistics collector should collect.
 
     """
     current_sc = graph.get_out_stats_collector(node)
     is_list_nostat_collectors = isinstance(current_sc, list) and len(
         [sc for sc in current_sc if not isinstance(sc, common.NoStatsCollector)]) == 0
     if isinstance(current_sc, common.NoStatsCollector) or current_sc is None or is_list_nostat_collectors:
-        stats_collector = common.StatsCollector(node.out_channel_axis)
+        stats_collector = stats_collector_cls(node.out_channel_axis, collectors_plan=collectors_plan)
         graph.set_out_stats_collector_to_node(node, stats_collector)
 
 
@@ -138,7 +170,9 @@ class ModelCollector:
     def __init__(self, graph: Graph,
                  fw_impl: FrameworkImplementation,
                  hessian_info_service: HessianInfoService = None,
-                 qc: common.QuantizationConfig = common.DEFAULTCONFIG):
+                 qc: common.QuantizationConfig = common.DEFAULTCONFIG,
+                 stats_collector_cls: Type[StatsCollector] = StatsCollector,
+                 collectors_plan: StatsCollectorPlan = None):
         """
         Build a model from a graph per framework for statistics collection.
 
@@ -146,18 +180,25 @@ class ModelCollector:
             graph: Graph to build a model from it.
             fw_impl: FrameworkImplementation object with a specific framework methods implementation.
             qc: Quantization configuration containing parameters for how the graph should be quantized.
+            stats_collector_cls: Statistics collector class to use for nodes that require statistics collection.
+                Collectors that accept framework tensors are fed the model's outputs without converting them to numpy.
+            collectors_plan: Which statistics to collect. If None, it's built from the quantization configuration.
         """
 
         self.fw_impl = fw_impl
         self.hessian_service = hessian_info_service
         self.qc = qc
+        self.stats_collector_cls = stats_collector_cls
+        self.collectors_plan = get_stats_collector_plan(qc) if collectors_plan is None else collectors_plan
         self.model_outputs = [out.node for out in graph.get_outputs()]
 
         # Assign statistics collectors to nodes
         for n in graph.get_topo_sorted_nodes():
             quant_node_in_fln = n.is_fln_quantization() and graph.fusing_info.is_quantized_node_in_fln(n)
-            sc = create_stats_collector_for_node(n, quant_node_in_fln=quant_node_in_fln)  # Get static collector for the node
-            if isinstance(sc, common.StatsCollector) and (sc.mc.axis is None or sc.mpcc.axis is None):
+            sc = create_stats_collector_for_node(n, quant_node_in_fln=quant_node_in_fln,
+                                                 stats_collector_cls=stats_collector_cls,
+                                                 collectors_plan=self.collectors_plan)  # Get static collector for the node
+            if isinstance(sc, StatsCollector) and sc.mpcc.axis is None:
                 # Missing output channel axis info, so try to extract it from previous and next nodes output channel axis.
                 possible_output_channel_axis_set = {nn.out_channel_axis for nn in graph.get_next_nodes(n) + graph.get_prev_nodes(n)}
                 # Filter out None values.
@@ -165,7 +206,8 @@ class ModelCollector:
                 if len(possible_output_channel_axis_list) > 0:
                     if len(possible_output_channel_axis_list) > 1:
                         Logger.warning(f'Ambiguous input channel data from next nodes for {n.name}.')
-                    sc.mc.axis = possible_output_channel_axis_list[0]
+                    if sc.mc is not None:
+                        sc.mc.axis = possible_output_channel_axis_list[0]
                     sc.mpcc.axis = possible_output_channel_axis_list[0]
 
             # If we use bias correction, and the node has kernel weights to quantize, we need to make sure
@@ -175,7 +217,9 @@ class ModelCollector:
                 for ie in graph.incoming_edges(n):
                     input_node = ie.source_node
                     create_tensor2node(graph,
-                                       input_node)
+                                       input_node,
+                                       stats_collector_cls,
+                                       self.collectors_plan)
             if sc is not None:
                 graph.set_out_stats_collector_to_node(n, sc)
 
@@ -261,8 +305,24 @@ class ModelCollector:
                     hessian_tensor = [None for _ in range(len(activation_tensor))]
                 ensure_matching_data_lengths(activation_tensor, hessian_tensor, stats_container)
                 for activation_tensor_i, hessian_tensor_i, sci in zip(activation_tensor, hessian_tensor, stats_container):
-                    sci.update_statistics(self.fw_impl.to_numpy(activation_tensor_i),
+                    sci.update_statistics(self._to_collector_input(activation_tensor_i),
                                           convert_to_numpy_and_abs(hessian_tensor_i, self.fw_impl))
             else:
-                stats_container.update_statistics(self.fw_impl.to_numpy(activation_tensor),
+                stats_container.update_statistics(self._to_collector_input(activation_tensor),
                                                   convert_to_numpy_and_abs(hessian_tensor, self.fw_impl))
+
+    def _to_collector_input(self, tensor: Any) -> Any:
+        """
+        Prepare a model's output tensor to be passed to the statistics collectors. Collectors that accept
+        framework tensors get the tensor as is (avoiding a device to host copy), otherwise it's converted
+        to a numpy array.
+
+        Args:
+            tensor: Framework tensor of a model's output.
+
+        Returns:
+            The tensor to pass to the statistics collectors.
+        """
+        if self.stats_collector_cls.accepts_framework_tensors:
+            return tensor
+        return self.fw_impl.to_numpy(tensor)
@@ -100,6 +100,17 @@ class QuantizationConfig:
     activation_bias_correction: bool = False
     activation_bias_correction_threshold: float = 0.0
     custom_tpc_opset_to_layer: Optional[Dict[str, CustomOpsetLayers]] = None
+    streaming_histogram_collection: bool = False
+    # Directory to persist Hessian estimations in, for reuse by runs on the same model and representative data.
+    hessian_cache_dir: Optional[str] = None
+    # Store the Hessian estimations cached in memory in float16, to reduce the cache memory (they are still returned in
+    # the type they were computed in).
+    hessian_cache_float16: bool = False
+    # Number of worker processes to compute the nodes quantization parameters in (1 computes them in the main process).
+    qparams_computation_num_workers: int = 1
+    # Run the weights quantization parameters search with the framework's tensors on its working device, instead of
+    # numpy on the host (supported for PyTorch models).
+    weights_qparams_search_on_device: bool = False
 
 
 # Default quantization configuration the library use.
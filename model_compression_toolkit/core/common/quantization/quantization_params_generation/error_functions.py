@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 from copy import deepcopy
-from typing import Tuple, Callable, List, Iterable, Optional
+from typing import Tuple, Callable, List, Iterable, Optional, Any
 import numpy as np
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from mct_quantizers import QuantizationMethod
@@ -24,6 +24,8 @@ from model_compression_toolkit.logger import Logger
 from model_compression_toolkit.constants import FLOAT_32, NUM_QPARAM_HESSIAN_SAMPLES
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import uniform_quantize_tensor, \
     reshape_tensor_for_per_channel_search
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    get_qparams_search_backend
 
 
 def _mse_error_histogram(q_bins: np.ndarray,
@@ -423,7 +425,7 @@ def _hmse_error_function_wrapper(float_tensor: np.ndarray,
     if axis is not None:
         hessian_scores = reshape_tensor_for_per_channel_search(hessian_scores, 0)
 
-    return compute_mse(float_tensor, fxp_tensor, axis, norm, weights=hessian_scores)
+    return compute_mse(float_tensor, fxp_tensor, norm=norm, axis=axis, weights=hessian_scores)
 
 
 def get_threshold_selection_tensor_error_function(quantization_method: QuantizationMethod,
@@ -498,6 +500,73 @@ def get_threshold_selection_tensor_error_function(quantization_method: Quantizat
     return quant_method_error_function_mapping[quant_error_method]
 
 
+def get_threshold_selection_tensor_batch_error_function(quant_error_method: qc.QuantizationErrorMethod,
+                                                        p: int,
+                                                        axis: int = None,
+                                                        norm: bool = False,
+                                                        node=None,
+                                                        hessian_info_service: HessianInfoService = None,
+                                                        num_hessian_samples: int = NUM_QPARAM_HESSIAN_SAMPLES
+                                                        ) -> Optional[Callable]:
+    """
+    Returns an error function that evaluates a batch of quantization candidates at once, to be used in a vectorized
+    threshold optimization search for tensor quantization. The returned function is equivalent to the function
+    returned by get_threshold_selection_tensor_error_function, except that the quantized tensor has an additional
+    leading candidates axis, and an error is returned per candidate. The tensors and errors are arrays of the
+    quantization parameters search backend (see get_qparams_search_backend).
+
+    Args:
+        quant_error_method: Type of error function requested.
+        p: P-norm to use for calculating the Lp-norm distance.
+        axis: Axis along which the operation has been performed (only -1 is supported for per-channel search).
+        norm: Indicates whether to normalize the result of the error function.
+        node: The node for which the quantization error is computed (used only with HMSE error method).
+        hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
+        num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+
+    Returns: a Callable method that calculates the errors between a tensor and a batch of quantized tensors,
+        or None if the error method can't be evaluated for a batch of candidates.
+    """
+    if quant_error_method == qc.QuantizationErrorMethod.KL or axis not in (None, -1):
+        return None
+
+    # The errors are computed with the arrays of the backend the search runs with.
+    backend = get_qparams_search_backend()
+
+    weights = None
+    if quant_error_method == qc.QuantizationErrorMethod.HMSE:
+        node_hessian_scores = _compute_hessian_for_hmse(node, hessian_info_service, num_hessian_samples, None)
+        weights = np.sqrt(np.mean(node_hessian_scores[node.name], axis=0))
+        if axis is not None:
+            weights = reshape_tensor_for_per_channel_search(weights, 0)
+        weights = backend.to_native(weights)
+
+    distance_fns = {
+        qc.QuantizationErrorMethod.MSE: lambda d: d ** 2,
+        qc.QuantizationErrorMethod.HMSE: lambda d: (weights * d) ** 2,
+        qc.QuantizationErrorMethod.MAE: backend.abs,
+        qc.QuantizationErrorMethod.LP: lambda d: backend.abs(d) ** p,
+    }
+    norm_fns = {
+        qc.QuantizationErrorMethod.MSE: lambda x: x ** 2,
+        qc.QuantizationErrorMethod.HMSE: lambda x: x ** 2,
+        qc.QuantizationErrorMethod.MAE: backend.abs,
+        qc.QuantizationErrorMethod.LP: lambda x: backend.abs(x) ** p,
+    }
+    distance_fn, norm_fn = distance_fns[quant_error_method], norm_fns[quant_error_method]
+
+    def _batch_error_function(x: Any, q_x: Any, threshold: np.ndarray) -> Any:
+        # Per-channel errors are computed over the last axis (x is reshaped to (channels, elements)), and per-tensor
+        # errors over all axes but the candidates axis.
+        reduce_axes = -1 if axis is not None else tuple(range(1, q_x.ndim))
+        error = backend.mean(distance_fn(x - q_x), axis=reduce_axes)
+        if norm:
+            error = error / (backend.mean(norm_fn(x), axis=-1 if axis is not None else None) + 1e-8)
+        return error
+
+    return _batch_error_function
+
+
 def get_threshold_selection_histogram_error_function(quantization_method: QuantizationMethod,
                                                      quant_error_method: qc.QuantizationErrorMethod,
                                                      p: int) -> Callable:
@@ -527,3 +596,31 @@ def get_threshold_selection_histogram_error_function(quantization_method: Quanti
     }
 
     return quant_method_error_function_mapping[quant_error_method]
+
+
+def get_threshold_selection_histogram_batch_error_function(quant_error_method: qc.QuantizationErrorMethod,
+                                                           p: int) -> Optional[Callable]:
+    """
+    Returns an error function that evaluates a batch of quantization candidates at once, to be used in a vectorized
+    threshold optimization search for histogram quantization. The returned function gets the quantized bins of all
+    candidates (with a leading candidates axis), the bins and the counts of the histogram, and returns an error per
+    candidate, equal to the error of the function returned by get_threshold_selection_histogram_error_function.
+
+    Args:
+        quant_error_method: the requested error function type.
+        p: p-norm to use for the Lp-norm distance.
+
+    Returns: a Callable method that calculates the errors between a histogram and a batch of quantized histograms,
+        or None if the error method can't be evaluated for a batch of candidates.
+    """
+    distance_fns = {
+        qc.QuantizationErrorMethod.MSE: lambda d: np.power(d, 2.0),
+        qc.QuantizationErrorMethod.HMSE: lambda d: np.power(d, 2.0),  # HMSE need the same functionality as MSE
+        qc.QuantizationErrorMethod.MAE: np.abs,
+        qc.QuantizationErrorMethod.LP: lambda d: np.power(np.abs(d), p),
+    }
+    distance_fn = distance_fns.get(quant_error_method)
+    if distance_fn is None:
+        return None
+
+    return lambda q_bins, bins, counts: np.sum(distance_fn((q_bins - bins)[..., :-1]) * counts, axis=-1) / np.sum(counts)
@@ -15,14 +15,13 @@
 
 from typing import Dict, Tuple
 import numpy as np
-from sklearn.cluster import KMeans
 
 import model_compression_toolkit.core.common.quantization.quantization_config as qc
 from model_compression_toolkit.constants import LUT_VALUES, MIN_THRESHOLD, SCALE_PER_CHANNEL, \
     LUT_VALUES_BITWIDTH, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES, SIGNED
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import \
-    max_power_of_two, int_quantization_with_threshold
+    max_power_of_two, int_quantization_with_threshold, kmeans_1d
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
     symmetric_selection_tensor
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
@@ -48,7 +47,7 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
     The quantizer first finds the closest max value per channel of tensor_data.
     Now, we divide tensor_data with the threshold vector per channel. In addition, we scale the result to the range
     [-2^(LUT_VALUES_BITWIDTH-1), 2^(LUT_VALUES_BITWIDTH-1)-1].
-    Next, we take the scaled tensor_data and perform k-means clustering with 2^nbit clusters.
+    Next, we take the scaled tensor_data and perform k-means clustering with 2^nbit clusters (see kmeans_1d).
     We return the rounded cluster centers, and threshold per channel. We use these to quantize the data.
     Args:
         tensor_data: Tensor content as Numpy array.
@@ -76,7 +75,6 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
         n_clusters = n_data_points
     else:
         n_clusters = 2 ** n_bits
-    kmeans = KMeans(n_clusters=n_clusters, n_init=10)
 
     threshold_selection_tensor = symmetric_selection_tensor if is_symmetric else power_of_two_selection_tensor
 
@@ -86,10 +84,10 @@ def lut_kmeans_tensor(tensor_data: np.ndarray,
     thresholds_per_channel = _params[THRESHOLD]
 
     tensor_for_kmeans = int_quantization_with_threshold(tensor_data, thresholds_per_channel, LUT_VALUES_BITWIDTH)
-    kmeans.fit(tensor_for_kmeans.reshape(-1, 1))
+    cluster_centers = kmeans_1d(tensor_for_kmeans, n_clusters)
 
     # Add 0 to the LUT
-    cc = np.round(kmeans.cluster_centers_)
+    cc = np.round(cluster_centers)
     if n_data_points < 2 ** n_bits and np.all(cc != 0):
         # In case there are fewer data points than potential clusters, we can add the cluster 0.0
         # to the original clusters array to improve quantization (i.e. no need to zero one of the clusters).
@@ -116,7 +114,8 @@ def lut_kmeans_histogram(bins: np.ndarray,
     Finds quantization cluster points for non-uniform activation quantization.
     The quantizer first finds the closest power-of-two number to the max value of the given histogram,
     and scales the bins within 8-bit quantization range.
-    Next, it performs a weighted k-means clustering with 2^nbit clusters (using the histogram counts as weights).
+    Next, it performs a weighted k-means clustering with 2^nbit clusters (using the histogram counts as weights,
+    see kmeans_1d).
     Returns the rounded cluster centers, and 8-bit quantization threshold.
 
     Args:
@@ -146,13 +145,12 @@ def lut_kmeans_histogram(bins: np.ndarray,
     else:
         n_clusters = 2 ** n_bits
 
-    kmeans = KMeans(n_clusters=n_clusters, n_init=10)
     tensor_max = np.max(bins_with_values)
     threshold = max_power_of_two(tensor_max, min_threshold)
 
     signed = np.any(bins[:-1][counts != 0] < 0) if is_signed is None else is_signed  # Whether histogram contains negative values or not.
     tensor_for_kmeans = int_quantization_with_threshold(data=bins, threshold=threshold, n_bits=LUT_VALUES_BITWIDTH, signed=signed)
-    kmeans.fit(tensor_for_kmeans.reshape(-1, 1), sample_weight=np.insert(counts, 0, 0))
+    cluster_centers = kmeans_1d(tensor_for_kmeans, n_clusters, sample_weight=np.insert(counts, 0, 0))
 
-    return {LUT_VALUES: np.float32(np.round(kmeans.cluster_centers_)),
+    return {LUT_VALUES: np.float32(np.round(cluster_centers)),
             THRESHOLD: threshold, SIGNED: signed}
@@ -23,7 +23,8 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     qparams_selection_tensor_search, qparams_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, get_tensor_max
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batch_error_function, get_threshold_selection_histogram_batch_error_function
 from model_compression_toolkit.core.common.similarity_analyzer import compute_mse
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import quantize_tensor
 
@@ -85,6 +86,10 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                                                        n_bits=n_bits, signed=signed, node=node,
                                                                        hessian_info_service=hessian_info_service,
                                                                        num_hessian_samples=num_hessian_samples)
+        batch_error_function = get_threshold_selection_tensor_batch_error_function(quant_error_method, p, axis=axis,
+                                                                                    norm=False, node=node,
+                                                                                    hessian_info_service=hessian_info_service,
+                                                                                    num_hessian_samples=num_hessian_samples)
         threshold, channel_axis = qparams_selection_tensor_search(error_function,
                                                                   tensor_data,
                                                                   n_bits,
@@ -92,7 +97,8 @@ def power_of_two_selection_tensor(tensor_data: np.ndarray,
                                                                   channel_axis=channel_axis,
                                                                   n_iter=n_iter,
                                                                   min_threshold=min_threshold,
-                                                                  signed=signed)
+                                                                  signed=signed,
+                                                                  batch_error_function=batch_error_function)
     return {THRESHOLD: threshold}, channel_axis
 
 
@@ -142,7 +148,10 @@ def power_of_two_selection_histogram(bins: np.ndarray,
                                                                constrained=constrained,
                                                                n_iter=n_iter,
                                                                min_threshold=min_threshold,
-                                                               is_signed=is_signed)
+                                                               is_signed=is_signed,
+                                                               batch_error_function=
+                                                               get_threshold_selection_histogram_batch_error_function(
+                                                                   quant_error_method, p))
     return {THRESHOLD: threshold, SIGNED: signed}
 
 
@@ -15,12 +15,13 @@
 import copy
 
 from tqdm import tqdm
-from typing import List, Callable, Generator
+from typing import List, Callable, Generator, Dict, Tuple, Optional
 
 from model_compression_toolkit.constants import NUM_QPARAM_HESSIAN_SAMPLES
 from model_compression_toolkit.core import QuantizationErrorMethod, QuantizationConfig
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_info import ChannelAxisMapping
+from model_compression_toolkit.core.common.forked_workers import map_in_forked_workers
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.hessian import HessianInfoService, HessianScoresRequest, HessianMode, \
     HessianScoresGranularity
@@ -28,6 +29,8 @@ from model_compression_toolkit.core.common.quantization.quantization_params_gene
     import compute_activation_qparams
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_weights_computation import \
     compute_weights_qparams
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QParamsSearchBackend, qparams_search_backend_context
 from model_compression_toolkit.logger import Logger
 
 
@@ -76,40 +79,132 @@ def calculate_quantization_params(graph: Graph,
                                            target_nodes=nodes_for_hmse)
             hessian_info_service.fetch_hessian(request)
 
-    for n in tqdm(nodes_list, "Calculating quantization parameters"):  # iterate only nodes that we should compute their thresholds
-        for candidate_qc in n.candidates_quantization_cfg:
-            for attr in n.get_node_weights_attributes():
-                if n.is_weights_quantization_enabled(attr):
-                    # If the node's weights attribute should be quantized, we compute its quantization parameters
-                    attr_cfg = candidate_qc.weights_quantization_cfg.get_attr_config(attr)
-                    output_channels_axis = attr_cfg.weights_channels_axis.output
-
-                    weights_error_method = quant_cfg.weights_error_method
-                    if weights_error_method == QuantizationErrorMethod.HMSE:
-                        # Although we collected nodes for HMSE before running the loop, we keep this verification to
-                        # notify the user in case of HMSE configured for node that is not compatible for this method
-                        if n.kernel_attr is None or n.kernel_attr not in attr:
-                            Logger.warning(f"The HMSE error method for parameters selection is only supported for "
-                                           f"kernel weights attributes. Running parameters selection for attribute "
-                                           f"'{attr}' in node '{n.name}' with the default MSE error method instead.")
-                            weights_error_method = QuantizationErrorMethod.MSE
-
-                    weights_params, output_channels_axis = compute_weights_qparams(n.get_weights_by_keys(attr),
-                                                                                   attr_cfg,
-                                                                                   weights_error_method,
-                                                                                   quant_cfg.l_p_value,
-                                                                                   output_channels_axis,
-                                                                                   node=n,
-                                                                                   hessian_info_service=hessian_info_service,
-                                                                                   num_hessian_samples=num_hessian_samples)
-                    attr_cfg.weights_channels_axis = ChannelAxisMapping(output_channels_axis, attr_cfg.weights_channels_axis.input)
-                    attr_cfg.set_weights_quantization_param(weights_params)
-
-            if n.is_activation_quantization_enabled() or n.is_fln_quantization():
-                # If node's activations should be quantized as well, we compute its activation quantization parameters
-                activation_params = compute_activation_qparams(quant_cfg=quant_cfg,
-                                                               node_activation_quant_cfg=candidate_qc.activation_quantization_cfg,
-                                                               node_prior_info=n.prior_info,
-                                                               out_stats_container=graph.get_out_stats_collector(n))
-                # Create a NodeQuantizationConfig containing all quantization params and attach it to the node
-                candidate_qc.activation_quantization_cfg.set_activation_quantization_param(activation_params)
+    # The framework's search backend is used only for the weights params. The activation params are searched on
+    # histograms in numpy.
+    weights_search_backend = fw_impl.get_qparams_search_backend() if quant_cfg.weights_qparams_search_on_device \
+        else None
+    _calculate_nodes_qparams(nodes_list, graph, quant_cfg, fw_impl, hessian_info_service, num_hessian_samples,
+                             weights_search_backend)
+
+
+def _calculate_nodes_qparams(nodes_list: List[BaseNode],
+                             graph: Graph,
+                             quant_cfg: QuantizationConfig,
+                             fw_impl: FrameworkImplementation,
+                             hessian_info_service: HessianInfoService,
+                             num_hessian_samples: int,
+                             weights_search_backend: Optional[QParamsSearchBackend] = None):
+    """
+    Compute the quantization params of the nodes and set them on the nodes, in the main process or in worker
+    processes (by quant_cfg.qparams_computation_num_workers).
+
+    Args:
+        nodes_list: Nodes to compute their quantization params.
+        graph: Graph the nodes belong to.
+        quant_cfg: quantization config.
+        fw_impl: FrameworkImplementation object.
+        hessian_info_service: HessianInfoService object for retrieving Hessian-based scores.
+        num_hessian_samples: Number of samples to approximate Hessian-based scores on.
+        weights_search_backend: Backend to run the weights params search with. If None, the current backend is used.
+    """
+    # Each node's params are computed independently (possibly in a worker process), and set on the node in the main
+    # process by the nodes order, so the results are identical to the sequential computation. The nodes are passed
+    # to the workers by their indices, so they are not pickled.
+    nodes_list = list(nodes_list)
+    nodes_qparams = map_in_forked_workers(
+        lambda i: _compute_node_qparams(nodes_list[i], graph, quant_cfg, hessian_info_service, num_hessian_samples,
+                                        weights_search_backend),
+        range(len(nodes_list)), quant_cfg.qparams_computation_num_workers, fw_impl,
+        'quantization parameters computation', requires_inference=weights_search_backend is not None)
+    for n, node_qparams in tqdm(zip(nodes_list, nodes_qparams), "Calculating quantization parameters",
+                                total=len(nodes_list)):
+        _set_node_qparams(n, node_qparams)
+
+
+def _compute_node_qparams(n: BaseNode,
+                          graph: Graph,
+                          quant_cfg: QuantizationConfig,
+                          hessian_info_service: HessianInfoService,
+                          num_hessian_samples: int,
+                          weights_search_backend: Optional[QParamsSearchBackend] = None
+                          ) -> List[Tuple[Dict[str, Tuple[dict, int]], Optional[dict]]]:
+    """
+    Compute the quantization params of a node's candidates, without setting them.
+
+    Args:
+        n: Node to compute its quantization params.
+        graph: Graph of the node.
+        quant_cfg: quantization config.
+        hessian_info_service: HessianInfoService object for retrieving Hessian-based scores (used only with HMSE error method).
+        num_hessian_samples: Number of samples to approximate Hessian-based scores on (used only with HMSE error method).
+        weights_search_backend: Backend to run the weights params search with. If None, the current backend is used.
+
+    Returns:
+        Per candidate, a dictionary from each quantized weights attribute to its quantization params and output
+        channels axis, and the activation quantization params (None if the activation is not quantized).
+    """
+    # Candidates often share the same weights attribute config (e.g. when they differ only in the activation
+    # bit-width), so the computed weights params are memoized per node and reused by equal attribute configs.
+    weights_params_memo = {}
+    node_qparams = []
+    for candidate_qc in n.candidates_quantization_cfg:
+        attrs_params = {}
+        for attr in n.get_node_weights_attributes():
+            if n.is_weights_quantization_enabled(attr):
+                # If the node's weights attribute should be quantized, we compute its quantization parameters
+                attr_cfg = candidate_qc.weights_quantization_cfg.get_attr_config(attr)
+                output_channels_axis = attr_cfg.weights_channels_axis.output
+
+                weights_error_method = quant_cfg.weights_error_method
+                if weights_error_method == QuantizationErrorMethod.HMSE:
+                    # Although we collected nodes for HMSE before running the loop, we keep this verification to
+                    # notify the user in case of HMSE configured for node that is not compatible for this method
+                    if n.kernel_attr is None or n.kernel_attr not in attr:
+                        Logger.warning(f"The HMSE error method for parameters selection is only supported for "
+                                       f"kernel weights attributes. Running parameters selection for attribute "
+                                       f"'{attr}' in node '{n.name}' with the default MSE error method instead.")
+                        weights_error_method = QuantizationErrorMethod.MSE
+
+                memo_key = (attr, attr_cfg.weights_quantization_method, attr_cfg.weights_n_bits,
+                            attr_cfg.weights_per_channel_threshold, weights_error_method, output_channels_axis)
+                if memo_key not in weights_params_memo:
+                    with qparams_search_backend_context(weights_search_backend):
+                        weights_params_memo[memo_key] = compute_weights_qparams(
+                            n.get_weights_by_keys(attr),
+                            attr_cfg,
+                            weights_error_method,
+                            quant_cfg.l_p_value,
+                            output_channels_axis,
+                            node=n,
+                            hessian_info_service=hessian_info_service,
+                            num_hessian_samples=num_hessian_samples)
+                attrs_params[attr] = weights_params_memo[memo_key]
+
+        activation_params = None
+        if n.is_activation_quantization_enabled() or n.is_fln_quantization():
+            # If node's activations should be quantized as well, we compute its activation quantization parameters
+            activation_params = compute_activation_qparams(quant_cfg=quant_cfg,
+                                                           node_activation_quant_cfg=candidate_qc.activation_quantization_cfg,
+                                                           node_prior_info=n.prior_info,
+                                                           out_stats_container=graph.get_out_stats_collector(n))
+        node_qparams.append((attrs_params, activation_params))
+    return node_qparams
+
+
+def _set_node_qparams(n: BaseNode, node_qparams: List[Tuple[Dict[str, Tuple[dict, int]], Optional[dict]]]):
+    """
+    Set the quantization params computed by _compute_node_qparams on the node's candidates.
+
+    Args:
+        n: Node to set its quantization params.
+        node_qparams: The computed quantization params per candidate.
+    """
+    for candidate_qc, (attrs_params, activation_params) in zip(n.candidates_quantization_cfg, node_qparams):
+        for attr, (weights_params, output_channels_axis) in attrs_params.items():
+            attr_cfg = candidate_qc.weights_quantization_cfg.get_attr_config(attr)
+            attr_cfg.weights_channels_axis = ChannelAxisMapping(output_channels_axis, attr_cfg.weights_channels_axis.input)
+            attr_cfg.set_weights_quantization_param(weights_params)
+
+        if activation_params is not None:
+            # Create a NodeQuantizationConfig containing all quantization params and attach it to the node
+            candidate_qc.activation_quantization_cfg.set_activation_quantization_param(activation_params)
@@ -14,7 +14,7 @@
 # ==============================================================================
 import itertools
 from collections.abc import Callable
-from typing import Any, Tuple, Dict
+from typing import Any, Tuple, Dict, Optional
 
 import numpy as np
 
@@ -28,6 +28,8 @@ from model_compression_toolkit.core.common.quantization.quantizers.quantizers_he
     reshape_tensor_for_per_channel_search, uniform_quantize_tensor, get_output_shape
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import max_power_of_two, \
     get_tensor_max, get_tensor_min
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QParamsSearchBackend, get_qparams_search_backend
 
 
 def qparams_selection_tensor_search(error_function: Callable,
@@ -37,7 +39,8 @@ def qparams_selection_tensor_search(error_function: Callable,
                                     channel_axis: int = 1,
                                     n_iter: int = 10,
                                     min_threshold=MIN_THRESHOLD,
-                                    signed: bool = True) -> Any:
+                                    signed: bool = True,
+                                    batch_error_function: Optional[Callable] = None) -> Any:
     """
     Search for an optimal threshold to quantize a tensor.
     The search_methods starts with the constrained no-clipping threshold the tensor has, and continues with
@@ -54,6 +57,8 @@ def qparams_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        batch_error_function: Optional error function that evaluates a batch of candidates at once. If passed, all
+            candidate thresholds are evaluated together instead of one by one.
 
     Returns:
         Optimal constrained threshold to quantize the tensor, and best channel axis if input channel_axis was None,
@@ -76,23 +81,37 @@ def qparams_selection_tensor_search(error_function: Callable,
         if per_channel:
             tensor_data_r = reshape_tensor_for_per_channel_search(tensor_data, _axis)
 
-        error_list = []  # init an empty error list
-        # On each iteration a new constrained threshold which equal to half of the previous tested threshold
-        # is used for quantizing the tensor and computing the error. The error is appended to an error list, which
-        # eventually used to select the threshold with the minimal error.
-        for i in range(n_iter):
+        if batch_error_function is not None:
+            # Evaluate all constrained thresholds (each equal to half of the previous one) together.
+            x = tensor_data_r if per_channel else tensor_data
             if per_channel:
-                threshold_hat = (threshold / (2 ** i)).reshape([-1, 1])
-                qt = quantize_tensor(tensor_data_r, threshold_hat, n_bits, signed)
-                per_channel_error = _error_function_wrapper(error_function, tensor_data_r, qt, threshold_hat)
-                error_list.append(per_channel_error)
-            else:  # quantize per-tensor
-                qt = quantize_tensor(tensor_data, threshold / (2 ** i), n_bits, signed)
-                error = error_function(qt, tensor_data, threshold=threshold / (2 ** i))
-                error_list.append(error)
+                thresholds = threshold.reshape([1, -1, 1]) / np.power(2, np.arange(n_iter)).reshape([-1, 1, 1])
+            else:
+                thresholds = threshold / np.power(2, np.arange(n_iter)).reshape([-1] + [1] * x.ndim)
+            backend = get_qparams_search_backend()
+            err_mat = _compute_candidates_errors(batch_error_function, x, thresholds,
+                                                 lambda _x, th: backend.quantize_tensor(_x, th, n_bits, signed),
+                                                 backend)
+            # Candidates errors per channel are arranged as (channels, candidates), as in the iterative search.
+            err_mat = err_mat.T
+        else:
+            error_list = []  # init an empty error list
+            # On each iteration a new constrained threshold which equal to half of the previous tested threshold
+            # is used for quantizing the tensor and computing the error. The error is appended to an error list, which
+            # eventually used to select the threshold with the minimal error.
+            for i in range(n_iter):
+                if per_channel:
+                    threshold_hat = (threshold / (2 ** i)).reshape([-1, 1])
+                    qt = quantize_tensor(tensor_data_r, threshold_hat, n_bits, signed)
+                    per_channel_error = _error_function_wrapper(error_function, tensor_data_r, qt, threshold_hat)
+                    error_list.append(per_channel_error)
+                else:  # quantize per-tensor
+                    qt = quantize_tensor(tensor_data, threshold / (2 ** i), n_bits, signed)
+                    error = error_function(qt, tensor_data, threshold=threshold / (2 ** i))
+                    error_list.append(error)
+            err_mat = np.stack(error_list, axis=-1)
 
         # Take the index of the minimal error, and use it compute the threshold which yielded it.
-        err_mat = np.stack(error_list, axis=-1)
         i = np.argmin(err_mat, axis=-1)
         th_list.append(np.maximum(np.reshape(threshold.flatten() / np.power(2, i), output_shape), min_threshold))
         total_error_list.append(err_mat.min(axis=-1).mean())
@@ -108,7 +127,8 @@ def qparams_selection_histogram_search(error_function: Callable,
                                        constrained: bool = True,
                                        n_iter: int = 10,
                                        min_threshold: float = MIN_THRESHOLD,
-                                       is_signed: bool = None) -> Tuple[np.ndarray, bool]:
+                                       is_signed: bool = None,
+                                       batch_error_function: Optional[Callable] = None) -> Tuple[np.ndarray, bool]:
     """
     Search for an optimal threshold to quantize a histogram of collected float values.
     The search_methods starts with the constrained no-clipping threshold by the bins' maximal value, and continues with
@@ -125,6 +145,9 @@ def qparams_selection_histogram_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         is_signed: Whether the quantization is signed or not. If None then compute SIGNED value.
+        batch_error_function: Optional error function that evaluates a batch of candidates at once (gets the
+            quantized bins of all candidates, the bins and the counts). If passed, all candidate thresholds are
+            evaluated together instead of one by one.
 
     Returns:
         Optimal constrained threshold to quantize the tensor.
@@ -142,14 +165,20 @@ def qparams_selection_histogram_search(error_function: Callable,
     error_list = []
     threshold_list = threshold / np.power(2, np.linspace(0, n_iter - 1, n_iter))
 
-    # On each iteration a new constrained threshold which equal to half of the previous tested threshold
-    # is used for quantizing the histogram and computing the error. The error is appended to an error list, which
-    # eventually used to select the threshold with the minimal error.
-    for threshold in threshold_list:
-        q_bins = quantize_tensor(bins, threshold, n_bits, signed)  # compute the quantized values of the bins.
-        error = qparams_selection_histogram_search_error_function(error_function, bins, q_bins, counts,
-                                                                  threshold=threshold)
-        error_list.append(error)
+    if batch_error_function is not None:
+        error_list = _compute_candidates_errors(lambda x, q_x, th: batch_error_function(q_x, x, counts), bins,
+                                                threshold_list.reshape([-1, 1]),
+                                                lambda x, th: quantize_tensor(x, th, n_bits, signed),
+                                                QParamsSearchBackend())
+    else:
+        # On each iteration a new constrained threshold which equal to half of the previous tested threshold
+        # is used for quantizing the histogram and computing the error. The error is appended to an error list, which
+        # eventually used to select the threshold with the minimal error.
+        for threshold in threshold_list:
+            q_bins = quantize_tensor(bins, threshold, n_bits, signed)  # compute the quantized values of the bins.
+            error = qparams_selection_histogram_search_error_function(error_function, bins, q_bins, counts,
+                                                                      threshold=threshold)
+            error_list.append(error)
 
     # Return the threshold with the minimal error.
     return np.maximum(threshold_list[np.argmin(error_list)], min_threshold), signed
@@ -167,7 +196,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
                                              dec_factor: Tuple = DEFAULT_DEC_FACTOR,
                                              dec_freq: int = SYMMETRIC_TENSOR_DEC_FREQ,
                                              tolerance: float = DEFAULT_TOL,
-                                             per_channel=False) -> Dict[str, np.ndarray]:
+                                             per_channel=False,
+                                             batch_loss_fn: Optional[Callable] = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal threshold to for symmetric tensor quantization.
     The search starts with the no-clipping threshold the tensor has, and continues with
@@ -191,6 +221,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         dec_freq: Frequency for decreasing the multiplication factors.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        batch_loss_fn: Optional loss function that evaluates a batch of candidates at once (see
+            search_fixed_range_intervals).
 
     Returns:
         Dictionary with optimized threshold for symmetric tensor quantization (best obtained during the search),
@@ -214,7 +246,8 @@ def qparams_symmetric_iterative_minimization(x0: np.ndarray,
         prev_best_loss = best['loss']
         new_range_bounds = curr_threshold * range_scale
 
-        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel)
+        curr_res = search_fixed_range_intervals(new_range_bounds, x, loss_fn, n_bits, signed, n_intervals, per_channel,
+                                                batch_loss_fn=batch_loss_fn)
         curr_threshold = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -243,7 +276,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
                                            n_bits: int,
                                            n_iter: int = UNIFORM_TENSOR_N_ITER,
                                            tolerance: float = DEFAULT_TOL,
-                                           per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                           per_channel: bool = False,
+                                           batch_loss_fn: Optional[Callable] = None) -> Dict[str, np.ndarray]:
     """
     Search for an optimal quantization range for uniform tensor quantization.
     The search starts with the no-clipping range the tensor has, and continues with
@@ -259,6 +293,8 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
         n_iter: Number of searching iterations.
         tolerance: If the improvement between iterations is smaller than tolerance, then early stop.
         per_channel: Whether quantization is done per-channel or per-tensor.
+        batch_loss_fn: Optional loss function that evaluates a batch of candidates at once (see
+            search_dynamic_range).
 
     Returns:
         Dictionary with optimized quantization range for uniform tensor quantization (best obtained during the search),
@@ -285,7 +321,7 @@ def iterative_uniform_dynamic_range_search(x0: np.ndarray,
     for n in range(n_iter):
         prev_best_loss = best['loss']
         curr_res = search_dynamic_range(base_range=curr_range_bounds, scalers=scalers, x=x, loss_fn=loss_fn,
-                                        n_bits=n_bits, per_channel=per_channel)
+                                        n_bits=n_bits, per_channel=per_channel, batch_loss_fn=batch_loss_fn)
         curr_range_bounds = curr_res['param']
         curr_loss = curr_res['loss']
 
@@ -307,7 +343,8 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
                                  n_bits: int,
                                  signed: bool = True,
                                  n_intervals: int = 100,
-                                 per_channel: bool = False) -> Dict[str, np.ndarray]:
+                                 per_channel: bool = False,
+                                 batch_loss_fn: Optional[Callable] = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of n_intervals thresholds, taken from evenly-space intervales from the constructed range.
 
@@ -319,10 +356,27 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
         signed: Whether quantization range is signed or not.
         n_intervals: Number of locations to examine each iteration from the given range.
         per_channel: Whether the search is done per-channel or per-tensor.
+        batch_loss_fn: Optional loss function that evaluates a batch of candidates at once. It gets the tensor, the
+            quantized tensors of all candidates (with a leading candidates axis) and the candidates thresholds, and
+            returns the loss of each candidate (per channel, if per_channel). If passed, all thresholds are
+            evaluated together instead of one by one.
 
     Returns: Dictionary with best obtained threshold and the threshold's matching loss.
 
     """
+    if batch_loss_fn is not None:
+        backend = get_qparams_search_backend()
+        quantize_fn = lambda _x, th: backend.quantize_tensor(_x, th, n_bits, signed)
+        if per_channel:
+            intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
+            losses = _compute_candidates_errors(batch_loss_fn, x, intervals[..., np.newaxis], quantize_fn, backend)
+            best_idx = (np.argmin(losses, axis=0), np.arange(intervals.shape[1]))
+            return {"param": intervals[best_idx].reshape([-1, 1]), "loss": losses[best_idx].reshape([-1, 1])}
+        intervals = np.linspace(start=range_bounds[0], stop=range_bounds[1], num=n_intervals, dtype=float)
+        losses = _compute_candidates_errors(batch_loss_fn, x, intervals.reshape([-1] + [1] * x.ndim), quantize_fn,
+                                            backend)
+        return {"param": intervals[np.argmin(losses)], "loss": np.min(losses)}
+
     if per_channel:
         # search per-channel
         intervals = np.linspace(start=range_bounds[:, 0], stop=range_bounds[:, 1], num=n_intervals, dtype=float)
@@ -351,7 +405,7 @@ def search_fixed_range_intervals(range_bounds: np.ndarray,
 
 
 def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndarray, loss_fn: Callable, n_bits: int,
-                         per_channel: bool = False) -> Dict[str, np.ndarray]:
+                         per_channel: bool = False, batch_loss_fn: Optional[Callable] = None) -> Dict[str, np.ndarray]:
     """
     Searches in a set of constructed quantization ranges.
 
@@ -362,10 +416,30 @@ def search_dynamic_range(base_range: np.ndarray, x: np.ndarray, scalers: np.ndar
         loss_fn: Function to compute the error between the original and quantized tensors.
         n_bits: Number of bits to quantize the
         per_channel: Whether the search is done per-channel or per-tensor.
+        batch_loss_fn: Optional loss function that evaluates a batch of candidates at once. It gets the tensor, the
+            quantized tensors of all candidates (with a leading candidates axis) and the candidates ranges, and
+            returns the loss of each candidate (per channel, if per_channel). If passed, all ranges are evaluated
+            together instead of one by one.
 
     Returns: Dictionary with best obtained quantization range and the threshold's matching loss.
 
     """
+    if batch_loss_fn is not None:
+        # Candidate ranges are arranged such that their min and max broadcast to the candidates quantized tensors.
+        backend = get_qparams_search_backend()
+        quantize_fn = lambda _x, r: backend.uniform_quantize_tensor(_x, r[..., 0], r[..., 1], n_bits)
+        if per_channel:
+            # ranges of shape (candidates, channels, 2)
+            ranges = np.stack([np.multiply.outer(scalers[:, 0], base_range[:, 0]),
+                               np.multiply.outer(scalers[:, 1], base_range[:, 1])], axis=2)
+            losses = _compute_candidates_errors(batch_loss_fn, x, ranges[:, :, np.newaxis, :], quantize_fn, backend)
+            best_idx = (np.argmin(losses, axis=0), np.arange(ranges.shape[1]))
+            return {"param": ranges[best_idx], "loss": losses[best_idx].reshape([-1, 1])}
+        ranges = base_range * scalers
+        losses = _compute_candidates_errors(batch_loss_fn, x, ranges.reshape([-1] + [1] * x.ndim + [2]), quantize_fn,
+                                            backend)
+        return {"param": ranges[np.argmin(losses)], "loss": np.min(losses)}
+
     if per_channel:
         # search per-channel
         ranges = np.stack([np.multiply.outer(base_range[:, 0], scalers[:, 0]),
@@ -405,7 +479,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                               channel_axis: int = 1,
                                               n_iter: int = SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                               min_threshold=MIN_THRESHOLD,
-                                              signed: bool = True) -> Tuple[np.ndarray, int]:
+                                              signed: bool = True,
+                                              batch_error_function: Optional[Callable] = None) -> Tuple[np.ndarray, int]:
     """
     Search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a tensor,
     using the iterative optimizer method.
@@ -419,6 +494,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         signed: a flag whether the tensor is signed.
+        batch_error_function: Optional error function that evaluates a batch of candidates at once. If passed, the
+            candidate thresholds of each search iteration are evaluated together instead of one by one.
 
     Returns:
         Ndarray with an optimized threshold (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -445,7 +522,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                            n_intervals=SYMMETRIC_TENSOR_PER_CHANNEL_N_INTERVALS,
                                                            n_iter=SYMMETRIC_TENSOR_PER_CHANNEL_N_ITER,
                                                            dec_freq=SYMMETRIC_TENSOR_PER_CHANNEL_DEC_FREQ,
-                                                           per_channel=True)
+                                                           per_channel=True,
+                                                           batch_loss_fn=batch_error_function)
             th = np.reshape(np.maximum(min_threshold, res['param']), output_shape)
         else:
             # quantize per-tensor
@@ -457,7 +535,8 @@ def qparams_symmetric_selection_tensor_search(error_function: Callable,
                                                            n_intervals=SYMMETRIC_TENSOR_N_INTERVALS,
                                                            n_iter=SYMMETRIC_TENSOR_N_ITER,
                                                            dec_freq=SYMMETRIC_TENSOR_DEC_FREQ,
-                                                           per_channel=False)
+                                                           per_channel=False,
+                                                           batch_loss_fn=batch_error_function)
             th = max(min_threshold, res['param'])
 
         total_error_list.append(res['loss'].mean())
@@ -473,6 +552,7 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                             per_channel: bool = False,
                                             channel_axis: int = 1,
                                             n_iter: int = UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
+                                            batch_error_function: Optional[Callable] = None
                                             ) -> Tuple[Tuple[np.ndarray, np.ndarray], int]:
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a tensor,
@@ -486,6 +566,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
         per_channel: Whether the tensor should be quantized per-channel or per-tensor.
         channel_axis: Index of output channels dimension.
         n_iter: Number of searching iterations.
+        batch_error_function: Optional error function that evaluates a batch of candidates at once. If passed, the
+            candidate ranges of each search iteration are evaluated together instead of one by one.
 
     Returns:
         Ndarray with an optimized range (or set of thresholds shaped according to the channels_axis if per-channel).
@@ -515,7 +597,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                                          loss_fn=error_function,
                                                          n_bits=n_bits,
                                                          n_iter=UNIFORM_TENSOR_PER_CHANNEL_N_ITER,
-                                                         per_channel=True)
+                                                         per_channel=True,
+                                                         batch_loss_fn=batch_error_function)
             th_list.append((np.reshape(res['param'][:, 0], output_shape), np.reshape(res['param'][:, 1], output_shape)))
         else:
             # quantize per-tensor
@@ -525,7 +608,8 @@ def qparams_uniform_selection_tensor_search(error_function: Callable,
                                                          loss_fn=error_function,
                                                          n_bits=n_bits,
                                                          n_iter=UNIFORM_TENSOR_N_ITER,
-                                                         per_channel=False)
+                                                         per_channel=False,
+                                                         batch_loss_fn=batch_error_function)
             th_list.append(tuple(np.split(res['param'], 2)))
         total_error_list.append(res['loss'].mean())
 
@@ -540,7 +624,9 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                  n_bits: int,
                                                  n_iter: int = SYMMETRIC_HISTOGRAM_N_ITER,
                                                  min_threshold: float = MIN_THRESHOLD,
-                                                 is_signed: bool = None) -> Tuple[np.ndarray, bool]:
+                                                 is_signed: bool = None,
+                                                 batch_error_function: Optional[Callable] = None
+                                                 ) -> Tuple[np.ndarray, bool]:
     """
     search for optimal threshold (per-channel or per-tensor) for symmetric quantization of a histogram,
     using the iterative optimizer method.
@@ -554,6 +640,9 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
         n_iter: Number of searching iterations.
         min_threshold: Threshold to return if the computed threshold is smaller that min_threshold.
         is_signed: Whether the quantization is signed or not. If None then compute SIGNED value.
+        batch_error_function: Optional error function that evaluates a batch of candidates at once (gets the
+            quantized bins of all candidates, the bins and the counts). If passed, the candidate thresholds of each
+            search iteration are evaluated together instead of one by one.
 
     Returns:
         Optimized threshold for quantifying the histogram.
@@ -573,7 +662,9 @@ def qparams_symmetric_selection_histogram_search(error_function: Callable,
                                                    n_intervals=SYMMETRIC_HISTOGRAM_N_INTERVALS,
                                                    n_iter=SYMMETRIC_HISTOGRAM_N_ITER,
                                                    dec_freq=SYMMETRIC_HISTOGRAM_DEC_FREQ,
-                                                   per_channel=False)
+                                                   per_channel=False,
+                                                   batch_loss_fn=None if batch_error_function is None else
+                                                   lambda x, q_x, t: batch_error_function(q_x, x, counts))
     return max(min_threshold, res['param']), signed
 
 
@@ -630,7 +721,8 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
                                                bins: np.ndarray,
                                                counts: np.ndarray,
                                                n_bits: int,
-                                               n_iter: int = UNIFORM_HISTOGRAM_N_ITER):
+                                               n_iter: int = UNIFORM_HISTOGRAM_N_ITER,
+                                               batch_error_function: Optional[Callable] = None):
     """
     Search for optimal quantization range (per-channel or per-tensor) for uniform quantization of a histogram,
     using the iterative optimizer method and built-in scale factors
@@ -643,6 +735,9 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
         counts: Number of elements in the bins to search_methods for a threshold.
         n_bits: Number of bits to quantize the tensor.
         n_iter: Number of searching iterations.
+        batch_error_function: Optional error function that evaluates a batch of candidates at once (gets the
+            quantized bins of all candidates, the bins and the counts). If passed, the candidate ranges of each
+            search iteration are evaluated together instead of one by one.
 
     Returns:
         Optimized range for quantifying the histogram.
@@ -662,7 +757,9 @@ def qparams_uniform_selection_histogram_search(error_function: Callable,
                                                                                                    min_max_range=mm),
                                                  n_bits=n_bits,
                                                  n_iter=UNIFORM_HISTOGRAM_N_ITER,
-                                                 per_channel=False)
+                                                 per_channel=False,
+                                                 batch_loss_fn=None if batch_error_function is None else
+                                                 lambda x, q_x, mm: batch_error_function(q_x, x, counts))
     return res['param']
 
 
@@ -756,3 +853,31 @@ def _error_function_wrapper(error_function: Callable,
     """
     return error_function(float_tensor, q_tensor, in_params)
 
+
+def _compute_candidates_errors(batch_error_function: Callable,
+                               x: np.ndarray,
+                               candidates: np.ndarray,
+                               quantize_fn: Callable,
+                               backend: QParamsSearchBackend) -> np.ndarray:
+    """
+    Compute the errors of a batch of quantization parameters candidates at once. The candidates are quantized
+    together by broadcasting, in chunks whose size is set by the backend (see QParamsSearchBackend.get_chunk_size).
+
+    Args:
+        batch_error_function: Function to compute the errors of a batch of candidates. Gets the tensor, the
+            quantized tensors of the candidates and the candidates, and returns the error of each candidate.
+        x: Numpy array with tensor's content.
+        candidates: Quantization parameters candidates, on the first axis, shaped to broadcast with x.
+        quantize_fn: Function to quantize the tensor (in the backend's array type) by a batch of candidates.
+        backend: Array backend to quantize the tensor and compute the errors with.
+
+    Returns:
+        An array of the candidates errors, with the candidates on the first axis.
+    """
+    chunk_size = backend.get_chunk_size(x.size)
+    x = backend.to_native(x)
+    errors = []
+    for i in range(0, candidates.shape[0], chunk_size):
+        chunk = candidates[i:i + chunk_size]
+        errors.append(backend.to_numpy(batch_error_function(x, quantize_fn(x, chunk), chunk)))
+    return np.concatenate(errors, axis=0)
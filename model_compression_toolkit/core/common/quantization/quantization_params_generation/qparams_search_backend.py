@@ -0,0 +1,195 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import contextlib
+import os
+from typing import Any, Generator, Optional
+
+import numpy as np
+
+from model_compression_toolkit.constants import QPARAMS_SEARCH_MAX_BATCH_ELEMENTS, QPARAMS_SEARCH_MAX_MEMORY_FRACTION, \
+    QPARAMS_SEARCH_BATCH_ELEMENT_NBYTES, QPARAMS_SEARCH_DEFAULT_AVAILABLE_MEMORY
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import calculate_delta, \
+    fix_range_to_include_zero
+
+
+class QParamsSearchBackend:
+    """
+    Array backend for evaluating quantization parameters candidates in the vectorized parameters search.
+
+    The candidates and their quantization ranges are always computed in numpy (they are small), while the tensor is
+    converted once to the backend's native array type, and the quantization of the tensor by the candidates and the
+    errors reduction run with the backend's ops. This default backend runs everything in numpy on the host.
+    A framework may provide a backend that runs on its working device (see
+    FrameworkImplementation.get_qparams_search_backend).
+    """
+
+    # Max number of elements of the quantized tensors of a batch of candidates evaluated at once.
+    max_batch_elements = QPARAMS_SEARCH_MAX_BATCH_ELEMENTS
+    # Min number of candidates evaluated at once for tensors larger than max_batch_elements, if they fit in memory.
+    # On the host the evaluation of a large tensor is memory bound, so batching its candidates doesn't pay off (a
+    # 256x256x3x3 kernel is searched ~1.8x slower in chunks of 8 candidates than one by one).
+    min_batch_candidates = 1
+    # Memory per element of the quantized tensors of a batch of candidates, including temporaries.
+    batch_element_nbytes = QPARAMS_SEARCH_BATCH_ELEMENT_NBYTES
+
+    def get_available_memory(self) -> int:
+        """
+        Returns: The available memory in bytes for evaluating the candidates (host memory for this backend).
+        """
+        try:
+            return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except (AttributeError, ValueError, OSError):    # pragma: no cover
+            return QPARAMS_SEARCH_DEFAULT_AVAILABLE_MEMORY
+
+    def get_chunk_size(self, tensor_size: int) -> int:
+        """
+        Get the number of candidates to evaluate at once. A chunk is bound to max_batch_elements elements of
+        quantized tensors. Tensors larger than that are still evaluated min_batch_candidates candidates at once, as
+        long as the chunk fits in a fraction of the available memory.
+
+        Args:
+            tensor_size: Number of elements of the tensor to quantize.
+
+        Returns:
+            The number of candidates in a chunk.
+        """
+        tensor_size = max(tensor_size, 1)
+        chunk_size = self.max_batch_elements // tensor_size
+        if chunk_size < self.min_batch_candidates:
+            memory_budget = int(self.get_available_memory() * QPARAMS_SEARCH_MAX_MEMORY_FRACTION)
+            memory_chunk_size = memory_budget // (tensor_size * self.batch_element_nbytes)
+            chunk_size = max(chunk_size, min(self.min_batch_candidates, memory_chunk_size))
+        return max(1, chunk_size)
+
+    def to_native(self, x: np.ndarray) -> Any:
+        """
+        Args:
+            x: Numpy array.
+
+        Returns:
+            The array converted to the backend's native array type.
+        """
+        return x
+
+    def to_numpy(self, x: Any) -> np.ndarray:
+        """
+        Args:
+            x: Backend's native array.
+
+        Returns:
+            The array converted to a numpy array.
+        """
+        return x
+
+    def abs(self, x: Any) -> Any:
+        """
+        Returns: Element-wise absolute value of a native array.
+        """
+        return np.abs(x)
+
+    def mean(self, x: Any, axis=None) -> Any:
+        """
+        Returns: Mean of a native array over the given axis (or axes). If axis is None, the mean over all elements.
+        """
+        return x.mean(axis=axis)
+
+    def quantize_to_grid(self, x: Any, range_min: np.ndarray, range_max: np.ndarray, delta: np.ndarray) -> Any:
+        """
+        Quantize a native array to a uniform grid, which includes zero.
+
+        Args:
+            x: Native array to quantize.
+            range_min: Min of the grid (numpy array that broadcasts with x).
+            range_max: Max of the grid (numpy array that broadcasts with x).
+            delta: Step size of the grid (numpy array that broadcasts with x).
+
+        Returns:
+            The quantized native array.
+        """
+        return delta * np.round((np.clip(x, a_min=range_min, a_max=range_max) - range_min) / delta) + range_min
+
+    def uniform_quantize_tensor(self, x: Any, range_min: np.ndarray, range_max: np.ndarray, n_bits: int) -> Any:
+        """
+        Quantize a native array according to given range (min, max) and number of bits
+        (same as quantizers_helpers.uniform_quantize_tensor).
+
+        Args:
+            x: Native array to quantize.
+            range_min: Minimum bound of the range for quantization (numpy array that broadcasts with x).
+            range_max: Maximum bound of the range for quantization (numpy array that broadcasts with x).
+            n_bits: Number of bits to quantize the tensor.
+
+        Returns:
+            The quantized native array.
+        """
+        a, b = fix_range_to_include_zero(range_min, range_max, n_bits)
+        return self.quantize_to_grid(x, a, b, (b - a) / (2 ** n_bits - 1))
+
+    def quantize_tensor(self, x: Any, threshold: np.ndarray, n_bits: int, signed: bool) -> Any:
+        """
+        Quantize a native array according to given threshold, number of bits and sign
+        (same as quantizers_helpers.quantize_tensor).
+
+        Args:
+            x: Native array to quantize.
+            threshold: Threshold for quantization ranges (numpy array that broadcasts with x).
+            n_bits: Number of bits to quantize the tensor.
+            signed: Whether the tensor contains negative values or not.
+
+        Returns:
+            The quantized native array.
+        """
+        delta = calculate_delta(threshold, n_bits, signed=signed)
+        return self.uniform_quantize_tensor(x, -threshold * int(signed), threshold - delta, n_bits)
+
+
+# The backend the weights quantization parameters search runs with.
+_qparams_search_backend = QParamsSearchBackend()
+
+
+def get_qparams_search_backend() -> QParamsSearchBackend:
+    """
+    Returns: The backend the weights quantization parameters search runs with.
+    """
+    return _qparams_search_backend
+
+
+def set_qparams_search_backend(backend: QParamsSearchBackend):
+    """
+    Set the backend the weights quantization parameters search runs with.
+
+    Args:
+        backend: Backend to set.
+    """
+    global _qparams_search_backend
+    _qparams_search_backend = backend
+
+
+@contextlib.contextmanager
+def qparams_search_backend_context(backend: Optional[QParamsSearchBackend]) -> Generator:
+    """
+    Context in which the weights quantization parameters search runs with a given backend. The previous backend is
+    restored when the context exits.
+
+    Args:
+        backend: Backend to set. If None, the current backend is kept.
+    """
+    prev_backend = get_qparams_search_backend()
+    if backend is not None:
+        set_qparams_search_backend(backend)
+    try:
+        yield
+    finally:
+        set_qparams_search_backend(prev_backend)
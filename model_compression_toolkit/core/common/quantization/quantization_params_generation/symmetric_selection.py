@@ -19,7 +19,9 @@ import model_compression_toolkit.core.common.quantization.quantization_config as
 from model_compression_toolkit.constants import MIN_THRESHOLD, THRESHOLD, NUM_QPARAM_HESSIAN_SAMPLES, SIGNED
 from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, _kl_error_histogram
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    _kl_error_histogram, get_threshold_selection_tensor_batch_error_function, \
+    get_threshold_selection_histogram_batch_error_function
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_symmetric_selection_tensor_search, \
     qparams_symmetric_selection_histogram_search, kl_qparams_symmetric_selection_histogram_search
@@ -87,13 +89,18 @@ def symmetric_selection_tensor(tensor_data: np.ndarray,
                                                                        signed=signed, node=node,
                                                                        hessian_info_service=hessian_info_service,
                                                                        num_hessian_samples=num_hessian_samples)
+        batch_error_function = get_threshold_selection_tensor_batch_error_function(quant_error_method, p, axis=axis,
+                                                                                    norm=False, node=node,
+                                                                                    hessian_info_service=hessian_info_service,
+                                                                                    num_hessian_samples=num_hessian_samples)
         threshold, channel_axis = qparams_symmetric_selection_tensor_search(error_function,
                                                                             tensor_data,
                                                                             n_bits,
                                                                             per_channel,
                                                                             channel_axis,
                                                                             min_threshold=min_threshold,
-                                                                            signed=signed)
+                                                                            signed=signed,
+                                                                            batch_error_function=batch_error_function)
     return {THRESHOLD: threshold}, channel_axis
 
 
@@ -150,7 +157,10 @@ def symmetric_selection_histogram(bins: np.ndarray,
                                                                          counts,
                                                                          n_bits,
                                                                          min_threshold=min_threshold,
-                                                                         is_signed=is_signed)
+                                                                         is_signed=is_signed,
+                                                                         batch_error_function=
+                                                                         get_threshold_selection_histogram_batch_error_function(
+                                                                             quant_error_method, p))
     return {THRESHOLD: threshold, SIGNED: signed}
 
 
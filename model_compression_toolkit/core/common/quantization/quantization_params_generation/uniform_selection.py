@@ -21,7 +21,8 @@ from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search import \
     qparams_uniform_selection_tensor_search, qparams_uniform_selection_histogram_search
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.error_functions import \
-    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function
+    get_threshold_selection_tensor_error_function, get_threshold_selection_histogram_error_function, \
+    get_threshold_selection_tensor_batch_error_function, get_threshold_selection_histogram_batch_error_function
 from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import get_tensor_max, \
     get_tensor_min
 from mct_quantizers import QuantizationMethod
@@ -85,11 +86,16 @@ def uniform_selection_tensor(tensor_data: np.ndarray,
                                                                        p, axis=axis, norm=False, node=node,
                                                                        hessian_info_service=hessian_info_service,
                                                                        num_hessian_samples=num_hessian_samples)
+        batch_error_function = get_threshold_selection_tensor_batch_error_function(quant_error_method, p, axis=axis,
+                                                                                    norm=False, node=node,
+                                                                                    hessian_info_service=hessian_info_service,
+                                                                                    num_hessian_samples=num_hessian_samples)
         mm, channel_axis = qparams_uniform_selection_tensor_search(error_function,
                                                                    tensor_data,
                                                                    n_bits,
                                                                    per_channel,
-                                                                   channel_axis)
+                                                                   channel_axis,
+                                                                   batch_error_function=batch_error_function)
     # In case the tensor\axis has a single value, then min==max, so need to adjust either min or max to zero.
     if not isinstance(mm[0], np.ndarray):
         if mm[0] > 0:
@@ -150,7 +156,10 @@ def uniform_selection_histogram(bins: np.ndarray,
                                                         tensor_min_max,
                                                         bins,
                                                         counts,
-                                                        n_bits)
+                                                        n_bits,
+                                                        batch_error_function=
+                                                        get_threshold_selection_histogram_batch_error_function(
+                                                            quant_error_method, p))
 
     return {RANGE_MIN: mm[0],
             RANGE_MAX: mm[1], SIGNED: signed}
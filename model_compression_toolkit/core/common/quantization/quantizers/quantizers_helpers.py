@@ -143,6 +143,69 @@ def kmeans_assign_clusters(lut_values: np.ndarray,
     return np.argmin(np.abs(query_ - cluster_centers_), axis=1)
 
 
+def kmeans_1d(data: np.ndarray,
+              n_clusters: int,
+              sample_weight: np.ndarray = None) -> np.ndarray:
+    """
+    Weighted k-means clustering of one-dimensional data, on the data scaled to an integer grid
+    (e.g. by int_quantization_with_threshold).
+    The data is binned into unit-width bins around the grid's integers, and the clusters are computed by
+    dynamic programming over the bins, where the error of a cluster is computed exactly from the weight, sum and sum
+    of squares of the data in its bins. This gives the optimal clustering among the clusterings whose boundaries
+    lie between the bins, at a cost that depends on the number of bins and not on the data size.
+
+    Args:
+        data: Data values to cluster.
+        n_clusters: Number of clusters.
+        sample_weight: Weight of each data value. If None, all values have a weight of 1.
+
+    Returns:
+        The cluster centers (the weighted means of the clusters data) in ascending order, in an array of shape
+        (clusters, 1). If the data occupies fewer bins than n_clusters, a cluster is returned per occupied bin.
+    """
+    data = data.flatten().astype(np.float64)
+    sample_weight = np.ones_like(data) if sample_weight is None else sample_weight.flatten().astype(np.float64)
+    data, sample_weight = data[sample_weight > 0], sample_weight[sample_weight > 0]
+
+    # Weight, sum and sum of squares of the data in each non-empty bin.
+    bin_idx = np.round(data).astype(np.int64)
+    bin_idx -= bin_idx.min()
+    bins_weight = np.bincount(bin_idx, weights=sample_weight)
+    non_empty = bins_weight > 0
+    bins_weight = bins_weight[non_empty]
+    bins_sum = np.bincount(bin_idx, weights=sample_weight * data)[non_empty]
+    bins_sq_sum = np.bincount(bin_idx, weights=sample_weight * data ** 2)[non_empty]
+
+    n_bins = len(bins_weight)
+    n_clusters = min(n_clusters, n_bins)
+    cum_weight, cum_sum, cum_sq_sum = [np.concatenate([[0.], np.cumsum(v)]) for v in
+                                       [bins_weight, bins_sum, bins_sq_sum]]
+
+    # cost[i, j] is the error of a cluster of bins i to j-1 (infinite for empty clusters).
+    i, j = np.triu_indices(n_bins + 1, k=1)
+    cost = np.full([n_bins + 1, n_bins + 1], np.inf)
+    cost[i, j] = np.maximum(cum_sq_sum[j] - cum_sq_sum[i] -
+                            (cum_sum[j] - cum_sum[i]) ** 2 / (cum_weight[j] - cum_weight[i]), 0)
+
+    # min_cost[j] is the minimal error of clustering bins 0 to j-1 into the current number of clusters, and each
+    # row of first_bins holds the first bin of the last cluster of these clusterings.
+    min_cost = cost[0]
+    first_bins = []
+    for _ in range(n_clusters - 1):
+        total_cost = min_cost[:, np.newaxis] + cost
+        first_bins.append(np.argmin(total_cost, axis=0))
+        min_cost = total_cost[first_bins[-1], np.arange(n_bins + 1)]
+
+    boundaries = [n_bins]
+    for first_bin in reversed(first_bins):
+        boundaries.insert(0, first_bin[boundaries[0]])
+    boundaries = np.array([0] + boundaries)
+
+    centers = (cum_sum[boundaries[1:]] - cum_sum[boundaries[:-1]]) / \
+              (cum_weight[boundaries[1:]] - cum_weight[boundaries[:-1]])
+    return centers.reshape([-1, 1])
+
+
 def int_quantization_with_threshold(data: np.ndarray,
                                     threshold: np.ndarray,
                                     n_bits: int,
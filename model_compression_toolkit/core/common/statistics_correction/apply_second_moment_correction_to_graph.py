@@ -20,9 +20,11 @@ from model_compression_toolkit.core import common
 from model_compression_toolkit.core.common import FrameworkInfo
 from model_compression_toolkit.core.common import Graph
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.hessian import HessianInfoService
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.model_collector import ModelCollector
 from model_compression_toolkit.core.common.quantization.core_config import CoreConfig
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationErrorMethod
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_activations_computation \
     import compute_activation_qparams
 from model_compression_toolkit.core.common.quantization.quantize_graph_weights import quantize_graph_weights
@@ -43,9 +45,16 @@ def _collect_and_assign_act_threshold(graph: Graph,
         fw_impl: FrameworkImplementation object with a specific framework methods implementation.
      """
 
+    # The HMSE activation error method weights the collected histograms by Hessians of the corrected graph.
+    hessian_info_service = None
+    if core_config.quantization_config.activation_error_method == QuantizationErrorMethod.HMSE:
+        hessian_info_service = HessianInfoService(graph=graph, fw_impl=fw_impl)
+
     mi = ModelCollector(graph,
                         fw_impl,
-                        core_config.quantization_config)  # Mark points for statistics collection
+                        hessian_info_service=hessian_info_service,
+                        qc=core_config.quantization_config,
+                        stats_collector_cls=fw_impl.stats_collector_cls)  # Mark points for statistics collection
 
     for _data in tqdm(representative_data_gen()):
         mi.infer(_data)
@@ -98,7 +98,7 @@ def compute_activation_bias_correction(graph: Graph,
 
     # Check if the previous node's has activation quantization configuration and if the previous node have the
     # histogram collector.
-    if prev_node_act_quant_cfg is None or not hasattr(graph.get_out_stats_collector(prev_node), 'hc'):
+    if prev_node_act_quant_cfg is None or getattr(graph.get_out_stats_collector(prev_node), 'hc', None) is None:
         return graph  # pragma: no cover
 
     float_bins, float_count = graph.get_out_stats_collector(prev_node).hc.get_histogram()
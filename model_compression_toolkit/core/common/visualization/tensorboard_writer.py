@@ -155,7 +155,7 @@ class TensorboardWriter(object):
 
             """
             if statistics_collector.require_collection():
-                if hasattr(statistics_collector, 'hc'):
+                if getattr(statistics_collector, 'hc', None) is not None:
                     if statistics_collector.hc.is_legal:
                         bins, counts = statistics_collector.hc.get_histogram()
                         if bins is not None and counts is not None:
@@ -392,7 +392,7 @@ class TensorboardWriter(object):
         for n in graph.nodes:
             collector = graph.get_out_stats_collector(n)
             if collector is not None:
-                if hasattr(collector, 'mpcc'):
+                if getattr(collector, 'mpcc', None) is not None:
                     if collector.mpcc.is_legal:
                         mpcc = deepcopy(collector.mpcc)
                         min_pc = mpcc.min_per_channel
@@ -433,7 +433,7 @@ class TensorboardWriter(object):
         for n in graph.nodes:
             collector = graph.get_out_stats_collector(n)
             if collector is not None:
-                if hasattr(collector, 'mc'):
+                if getattr(collector, 'mc', None) is not None:
                     if collector.mc.is_legal:
                         mc = deepcopy(collector.mc)
                         mean_pc = mc.state
@@ -13,17 +13,17 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import List
+from typing import List, Optional
 
 import tensorflow as tf
 from tqdm import tqdm
 import numpy as np
 
-from model_compression_toolkit.constants import MIN_HESSIAN_ITER, HESSIAN_COMP_TOLERANCE, \
-    HESSIAN_NUM_ITERATIONS
+from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianScoresGranularity
-from model_compression_toolkit.core.keras.back2framework.float_model_builder import FloatKerasModelBuilder
+from model_compression_toolkit.core.common.hessian.hessian_info_utils import HutchinsonConvergenceTracker
 from model_compression_toolkit.core.keras.hessian.hessian_scores_calculator_keras import HessianScoresCalculatorKeras
 from model_compression_toolkit.logger import Logger
 
@@ -37,7 +37,8 @@ class ActivationHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
                  input_images: List[tf.Tensor],
                  fw_impl,
                  hessian_scores_request: HessianScoresRequest,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 models_pool: Optional[HessianModelsPool] = None):
         """
         Args:
             graph: Computational graph for the float model.
@@ -45,13 +46,15 @@ class ActivationHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
             fw_impl: Framework-specific implementation for Hessian approximation scores computation.
             hessian_scores_request: Configuration request for which to compute the Hessian approximation scores.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian scores.
+            models_pool: A pool of float models of the graph to reuse.
 
         """
         super(ActivationHessianScoresCalculatorKeras, self).__init__(graph=graph,
                                                                      input_images=input_images,
                                                                      fw_impl=fw_impl,
                                                                      hessian_scores_request=hessian_scores_request,
-                                                                     num_iterations_for_approximation=num_iterations_for_approximation)
+                                                                     num_iterations_for_approximation=num_iterations_for_approximation,
+                                                                     models_pool=models_pool)
 
     def compute(self) -> List[np.ndarray]:
         """
@@ -70,7 +73,7 @@ class ActivationHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
         grad_model_outputs = self.hessian_request.target_nodes + model_output_nodes
 
         # Building a model to run Hessian approximation on
-        model, _ = FloatKerasModelBuilder(graph=self.graph, append2output=grad_model_outputs).build_model()
+        model = self.get_float_model(grad_model_outputs)
 
         # Record operations for automatic differentiation
         with tf.GradientTape(persistent=True, watch_accessed_variables=False) as g:
@@ -101,55 +104,58 @@ class ActivationHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
             ipts_hessian_approximations = [tf.Variable([0.0], dtype=tf.float32, trainable=True)
                                            for _ in range(len(target_activation_tensors))]
 
-            # Loop through each interest point activation tensor
-            prev_mean_results = None
-            for j in tqdm(range(self.num_iterations_for_approximation)):  # Approximation iterations
+            convergence_tracker = HutchinsonConvergenceTracker(len(target_activation_tensors))
+            for _ in tqdm(range(self.num_iterations_for_approximation)):  # Approximation iterations
+                # Targets whose estimation has converged are frozen, and no longer participate in the gradient
+                # computation.
+                active_targets = convergence_tracker.get_active_targets()
+                if not active_targets:
+                    break
                 # Generate random tensor of 1s and -1s
                 v = self._generate_random_vectors_batch(output.shape)
                 f_v = tf.reduce_sum(v * output)
-                for i, ipt in enumerate(target_activation_tensors):  # Per Interest point activation tensor
-                    interest_point_scores = []  # List to store scores for each interest point
-                    with g.stop_recording():
-                        # Computing the approximation by getting the gradient of (output * v)
-                        hess_v = g.gradient(f_v, ipt)
-
-                        if hess_v is None:
-                            # In case we have an output node, which is an interest point, but it is not
-                            # differentiable, we consider its Hessian to be the initial value 0.
-                            continue  # pragma: no cover
-
-                        if self.hessian_request.granularity == HessianScoresGranularity.PER_TENSOR:
-                            # Mean over all dims but the batch (CXHXW for conv)
-                            hessian_approx = tf.reduce_sum(hess_v ** 2.0,
-                                                           axis=tuple(d for d in range(1, len(hess_v.shape))))
-                        elif self.hessian_request.granularity == HessianScoresGranularity.PER_ELEMENT:
-                            hessian_approx = hess_v ** 2
-                        elif self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL:
-                            axes_to_sum = tuple(d for d in range(1, len(hess_v.shape)-1))
-                            hessian_approx = tf.reduce_sum(hess_v ** 2.0, axis=axes_to_sum)
-
-                        else:  # pragma: no cover
-                            Logger.critical(f"{self.hessian_request.granularity} "
-                                            f"is not supported for Keras activation hessian\'s approximation scores calculator.")
-
-                        # Free gradients
-                        del hess_v
-
-                        # Update node Hessian approximation mean over random iterations
-                        ipts_hessian_approximations[i] = (j * ipts_hessian_approximations[i] + hessian_approx) / (j + 1)
-
-                # If the change to the mean approximation is insignificant (to all outputs)
-                # we stop the calculation.
-                if j > MIN_HESSIAN_ITER and prev_mean_results is not None:
-                    new_mean_res = tf.reduce_mean(tf.stack(ipts_hessian_approximations), axis=1)
-                    relative_delta_per_node = (tf.abs(new_mean_res - prev_mean_results) /
-                                               (tf.abs(new_mean_res) + 1e-6))
-                    max_delta = tf.reduce_max(relative_delta_per_node)
-                    if max_delta < HESSIAN_COMP_TOLERANCE:
-                        break
-
-                if self.hessian_request.granularity == HessianScoresGranularity.PER_TENSOR:
-                    prev_mean_results = tf.reduce_mean(tf.stack(ipts_hessian_approximations), axis=1)
+                with g.stop_recording():
+                    # Computing the approximation by getting the gradient of (output * v) w.r.t all active
+                    # interest points together
+                    hess_vs = g.gradient(f_v, [target_activation_tensors[i] for i in active_targets])
+
+                updated_targets, estimations = [], []
+                for i, hess_v in zip(active_targets, hess_vs):  # Per Interest point activation tensor
+                    if hess_v is None:
+                        # In case we have an output node, which is an interest point, but it is not
+                        # differentiable, we consider its Hessian to be the initial value 0.
+                        convergence_tracker.freeze(i)  # pragma: no cover
+                        continue  # pragma: no cover
+
+                    if self.hessian_request.granularity == HessianScoresGranularity.PER_TENSOR:
+                        # Mean over all dims but the batch (CXHXW for conv)
+                        hessian_approx = tf.reduce_sum(hess_v ** 2.0,
+                                                       axis=tuple(d for d in range(1, len(hess_v.shape))))
+                    elif self.hessian_request.granularity == HessianScoresGranularity.PER_ELEMENT:
+                        hessian_approx = hess_v ** 2
+                    elif self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL:
+                        axes_to_sum = tuple(d for d in range(1, len(hess_v.shape)-1))
+                        hessian_approx = tf.reduce_sum(hess_v ** 2.0, axis=axes_to_sum)
+
+                    else:  # pragma: no cover
+                        Logger.critical(f"{self.hessian_request.granularity} "
+                                        f"is not supported for Keras activation hessian\'s approximation scores calculator.")
+
+                    # Update node Hessian approximation mean over random iterations
+                    j = convergence_tracker.num_iterations[i]
+                    ipts_hessian_approximations[i] = (j * ipts_hessian_approximations[i] + hessian_approx) / (j + 1)
+                    updated_targets.append(i)
+                    estimations.append(tf.reduce_sum(tf.reshape(hessian_approx, (hessian_approx.shape[0], -1)),
+                                                     axis=1))
+
+                if updated_targets:
+                    # The per-sample estimations of all targets are fetched from the device at once.
+                    convergence_tracker.update_targets(updated_targets, tf.stack(estimations).numpy())
+
+                # Free gradients
+                del hess_vs
+
+            self.achieved_iterations = convergence_tracker.num_iterations
 
             # Convert results to list of numpy arrays
             hessian_results = [h.numpy() for h in ipts_hessian_approximations]
@@ -16,7 +16,7 @@ from tensorflow import TensorShape
 
 from model_compression_toolkit.core.common.hessian.hessian_scores_calculator import HessianScoresCalculator
 
-from typing import List, Tuple, Dict, Any, Union
+from typing import List, Tuple, Dict, Any, Union, Optional, Sequence
 
 import tensorflow as tf
 from tensorflow.python.keras.engine.base_layer import Layer
@@ -24,7 +24,9 @@ from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core.common.graph.edge import EDGE_SINK_INDEX
 from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest
+from model_compression_toolkit.core.keras.back2framework.float_model_builder import FloatKerasModelBuilder
 from model_compression_toolkit.core.keras.back2framework.instance_builder import OperationHandler
 from tensorflow.python.util.object_identity import Reference as TFReference
 
@@ -41,7 +43,8 @@ class HessianScoresCalculatorKeras(HessianScoresCalculator):
                  input_images: List[tf.Tensor],
                  fw_impl,
                  hessian_scores_request: HessianScoresRequest,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 models_pool: Optional[HessianModelsPool] = None):
         """
 
         Args:
@@ -50,12 +53,27 @@ class HessianScoresCalculatorKeras(HessianScoresCalculator):
             fw_impl: Framework-specific implementation for Hessian-approximation scores computation.
             hessian_scores_request: Configuration request for which to compute the Hessian approximation scores.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian-based scores.
+            models_pool: A pool of float models of the graph to reuse.
         """
         super(HessianScoresCalculatorKeras, self).__init__(graph=graph,
                                                            input_images=input_images,
                                                            fw_impl=fw_impl,
                                                            hessian_scores_request=hessian_scores_request,
-                                                           num_iterations_for_approximation=num_iterations_for_approximation)
+                                                           num_iterations_for_approximation=num_iterations_for_approximation,
+                                                           models_pool=models_pool)
+
+    def _build_float_model(self, append2output: Optional[Sequence[BaseNode]]) -> tf.keras.Model:
+        """
+        Build a Keras float model of the graph.
+
+        Args:
+            append2output: Nodes whose outputs are appended to the model outputs.
+
+        Returns:
+            The float model.
+        """
+        model, _ = FloatKerasModelBuilder(graph=self.graph, append2output=append2output).build_model()
+        return model
 
     def _concat_tensors(self, tensors_to_concate: Union[tf.Tensor, List[tf.Tensor]]) -> tf.Tensor:
         """
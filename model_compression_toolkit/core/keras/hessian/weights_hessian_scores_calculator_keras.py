@@ -16,12 +16,12 @@
 import numpy as np
 import tensorflow as tf
 from tqdm import tqdm
-from typing import List
+from typing import List, Optional
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS, MIN_HESSIAN_ITER, HESSIAN_COMP_TOLERANCE
 from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianScoresGranularity
-from model_compression_toolkit.core.keras.back2framework.float_model_builder import FloatKerasModelBuilder
 from model_compression_toolkit.core.keras.hessian.hessian_scores_calculator_keras import HessianScoresCalculatorKeras
 from model_compression_toolkit.logger import Logger
 
@@ -36,7 +36,8 @@ class WeightsHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
                  input_images: List[tf.Tensor],
                  fw_impl,
                  hessian_scores_request: HessianScoresRequest,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 models_pool: Optional[HessianModelsPool] = None):
         """
 
         Args:
@@ -45,13 +46,15 @@ class WeightsHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
             fw_impl: Framework-specific implementation for Hessian scores computation.
             hessian_scores_request: Configuration request for which to compute the Hessian-approximation scores.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian-based scores.
+            models_pool: A pool of float models of the graph to reuse.
         """
 
         super(WeightsHessianScoresCalculatorKeras, self).__init__(graph=graph,
                                                                   input_images=input_images,
                                                                   fw_impl=fw_impl,
                                                                   hessian_scores_request=hessian_scores_request,
-                                                                  num_iterations_for_approximation=num_iterations_for_approximation)
+                                                                  num_iterations_for_approximation=num_iterations_for_approximation,
+                                                                  models_pool=models_pool)
 
     def compute(self) -> List[np.ndarray]:
         """
@@ -70,7 +73,7 @@ class WeightsHessianScoresCalculatorKeras(HessianScoresCalculatorKeras):
         """
 
         # Construct the Keras float model for inference
-        model, _ = FloatKerasModelBuilder(graph=self.graph).build_model()
+        model = self.get_float_model()
 
         # Initiate a gradient tape for automatic differentiation
         with tf.GradientTape(persistent=True) as tape:
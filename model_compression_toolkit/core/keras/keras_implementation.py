@@ -23,6 +23,7 @@ from tensorflow.keras.models import Model
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianMode
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.keras.data_util import data_gen_to_dataloader
 from model_compression_toolkit.core.keras.graph_substitutions.substitutions.remove_identity import RemoveIdentity
 from model_compression_toolkit.core.keras.hessian.activation_hessian_scores_calculator_keras import \
@@ -465,7 +466,8 @@ class KerasImplementation(FrameworkImplementation):
                                       graph: Graph,
                                       input_images: List[Any],
                                       hessian_scores_request: HessianScoresRequest,
-                                      num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                                      num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                                      models_pool: HessianModelsPool = None):
         """
         Get Keras Hessian-approximation scores calculator based on the request.
         Args:
@@ -473,6 +475,7 @@ class KerasImplementation(FrameworkImplementation):
             graph: Float graph to compute the approximation of its different nodes.
             hessian_scores_request: HessianScoresRequest to search for the desired calculator.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian scores.
+            models_pool: A pool of float models of the graph to reuse across calculators.
 
         Returns: HessianScoresCalculatorKeras to use for the Hessian-approximation scores computation for this request.
 
@@ -482,13 +485,15 @@ class KerasImplementation(FrameworkImplementation):
                                                           hessian_scores_request=hessian_scores_request,
                                                           input_images=input_images,
                                                           fw_impl=self,
-                                                          num_iterations_for_approximation=num_iterations_for_approximation)
+                                                          num_iterations_for_approximation=num_iterations_for_approximation,
+                                                          models_pool=models_pool)
         elif hessian_scores_request.mode == HessianMode.WEIGHTS:
             return WeightsHessianScoresCalculatorKeras(graph=graph,
                                                        hessian_scores_request=hessian_scores_request,
                                                        input_images=input_images,
                                                        fw_impl=self,
-                                                       num_iterations_for_approximation=num_iterations_for_approximation)
+                                                       num_iterations_for_approximation=num_iterations_for_approximation,
+                                                       models_pool=models_pool)
         else:
             Logger.critical(f"Unsupported Hessian mode for Keras: {hessian_scores_request.mode}.")   # pragma: no cover
 
@@ -66,24 +66,28 @@ class FloatPyTorchModelBuilder(PyTorchModelBuilder):
     def __init__(self,
                  graph: common.Graph,
                  append2output=None,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 use_fx_graph_module: bool = False):
         """
 
         Args:
             graph: Graph to build the model from.
             append2output: Nodes to append to model's output.
             return_float_outputs: Whether the model returns float tensors or not.
+            use_fx_graph_module: Whether to compile the built model into a torch.fx GraphModule.
         """
 
         super().__init__(graph,
                          append2output,
-                         return_float_outputs)
+                         return_float_outputs,
+                         use_fx_graph_module=use_fx_graph_module)
 
-    def build_model(self) -> Tuple[PytorchModel, UserInformation]:
+    def build_model(self) -> Tuple[torch.nn.Module, UserInformation]:
         """
         Build a PyTorch float model and return it.
         Returns: Float PyTorch model and user information.
 
         """
-        return FloatPyTorchModel(self.graph,
-                                 self.append2output), self.graph.user_info
+        model = FloatPyTorchModel(self.graph,
+                                  self.append2output)
+        return self._finalize_model(model), self.graph.user_info
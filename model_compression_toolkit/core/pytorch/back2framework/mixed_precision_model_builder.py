@@ -37,13 +37,15 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
     def __init__(self,
                  graph: common.Graph,
                  append2output=None,
-                 return_float_outputs: bool = False):
+                 return_float_outputs: bool = False,
+                 use_fx_graph_module: bool = False):
         """
 
         Args:
             graph: Graph to build the model from.
             append2output: Nodes to append to model's output.
             return_float_outputs: Whether the model returns float tensors or not.
+            use_fx_graph_module: Whether to compile the built model into a torch.fx GraphModule.
         """
 
         self.graph = graph
@@ -52,7 +54,8 @@ class MixedPrecisionPyTorchModelBuilder(PyTorchModelBuilder):
                          append2output,
                          return_float_outputs,
                          wrapper=self.mixed_precision_wrapper,
-                         get_activation_quantizer_holder_fn=self.mixed_precision_activation_holder)
+                         get_activation_quantizer_holder_fn=self.mixed_precision_activation_holder,
+                         use_fx_graph_module=use_fx_graph_module)
 
     def mixed_precision_wrapper(self,
                                 n: common.BaseNode,
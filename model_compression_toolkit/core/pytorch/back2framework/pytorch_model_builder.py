@@ -15,9 +15,10 @@
 import copy
 from abc import abstractmethod
 from functools import partial
-from typing import Tuple, Any, Dict, List, Callable
+from typing import Tuple, Any, Dict, List, Callable, Collection
 
 import torch
+import torch.fx
 import numpy as np
 from networkx import topological_sort
 
@@ -200,6 +201,25 @@ def _generate_outputs(
     return output
 
 
+class PytorchModelTracer(torch.fx.Tracer):
+    """
+    torch.fx tracer of a PytorchModel. Every submodule of the model (layers, wrappers and activation holders) is
+    a leaf, so the traced graph holds a single call for each node of the MCT graph, and the python logic of
+    PytorchModel.forward (graph traversal, inputs building and outputs lookup) is resolved during tracing.
+    """
+
+    def is_leaf_module(self, m: torch.nn.Module, module_qualified_name: str) -> bool:
+        """
+        Args:
+            m: Module to check.
+            module_qualified_name: Path to the module from the traced root.
+
+        Returns:
+            Whether the module should be a leaf in the traced graph.
+        """
+        return module_qualified_name != ''
+
+
 class PytorchModel(torch.nn.Module):
     """
     Class for reconstructing a Pytorch model from a graph
@@ -237,6 +257,49 @@ class PytorchModel(torch.nn.Module):
         self._reused_nodes = []
 
         self._add_all_modules()
+        # Computed lazily on the first forward pass.
+        self._node_to_released_nodes = None
+
+    def _get_output_nodes(self) -> List[BaseNode]:
+        """
+        Returns: The nodes whose outputs are the model's outputs.
+        """
+        if self.append2output:
+            return self.append2output
+        return [ot.node for ot in self.graph.get_outputs()]
+
+    def _get_node_to_released_nodes(self) -> Dict[BaseNode, List[BaseNode]]:
+        """
+        Compute the liveness of each node's output tensors during the forward pass: map each node to the
+        nodes whose output tensors are no longer needed after it runs (it's their last consumer in node_sort).
+        Output tensors of the model's outputs nodes are kept until the end of the forward pass.
+
+        Returns:
+            A dictionary from a node to a list of nodes whose outputs can be released after running it.
+        """
+        output_nodes_names = {n.name for n in self._get_output_nodes()}
+        last_consumer = {}
+        for node in self.node_sort:
+            for ie in self.graph.incoming_edges(node):
+                last_consumer[ie.source_node] = node
+
+        node_to_released_nodes = {node: [] for node in self.node_sort}
+        for node in self.node_sort:
+            if node.name not in output_nodes_names:
+                # Outputs of nodes without consumers are released right after they are computed.
+                node_to_released_nodes[last_consumer.get(node, node)].append(node)
+        return node_to_released_nodes
+
+    def to_fx_graph_module(self) -> torch.fx.GraphModule:
+        """
+        Compile the model into a torch.fx GraphModule: the forward pass is traced once, and the GraphModule runs
+        generated python code that calls the model's layers with direct references to their input tensors.
+        The GraphModule shares the layers (and their parameters) of this model.
+
+        Returns:
+            A GraphModule with the same forward logic (and partial inference methods) as the model.
+        """
+        return PytorchFxGraphModule(self, PytorchModelTracer().trace(self))
 
     # todo: Move to parent class BaseModelBuilder
     @property
@@ -361,10 +424,76 @@ class PytorchModel(torch.nn.Module):
         Returns:
             torch Tensor/s which is/are the output of the model logic.
         """
-        node_to_output_tensors_dict = dict()
-        node_to_output_tensors_dict_float = dict()
+        node_to_output_tensors_dict, node_to_output_tensors_dict_float = self._run_nodes(self.node_sort, args)
+        return self._get_model_outputs(node_to_output_tensors_dict, node_to_output_tensors_dict_float)
+
+    def forward_and_cache(self,
+                          *args: Any,
+                          nodes_to_cache: Collection[str]) -> Tuple[Any, Dict[str, List[torch.Tensor]]]:
+        """
+        Run the model and cache the output tensors of some of its nodes, for a later forward_from_cache call.
+
+        Args:
+            args: argument input tensors to model.
+            nodes_to_cache: Names of nodes to cache their output tensors.
+
+        Returns:
+            The output of the model, and a dictionary from a cached node name to its output tensors.
+        """
+        cached_outputs = {}
+        node_to_output_tensors_dict, node_to_output_tensors_dict_float = self._run_nodes(
+            self.node_sort, args, nodes_to_cache=set(nodes_to_cache), cached_outputs=cached_outputs)
+        return self._get_model_outputs(node_to_output_tensors_dict, node_to_output_tensors_dict_float), cached_outputs
+
+    def forward_from_cache(self,
+                           cached_outputs: Dict[str, List[torch.Tensor]],
+                           nodes_to_run: Collection[str]) -> Any:
+        """
+        Run only some of the model's nodes, and take the output tensors of the rest of the nodes from a cache.
+        The cache must hold the outputs of any node that is not run and is an input to a node that is run or
+        is an output of the model.
+
+        Args:
+            cached_outputs: A dictionary from a node name to its output tensors (see forward_and_cache).
+            nodes_to_run: Names of nodes to run.
+
+        Returns:
+            torch Tensor/s which is/are the output of the model logic.
+        """
+        name_to_node = {n.name: n for n in self.node_sort}
+        node_to_output_tensors_dict = {name_to_node[name]: tensors for name, tensors in cached_outputs.items()}
+        nodes = [n for n in self.node_sort if n.name in nodes_to_run]
+        node_to_output_tensors_dict, node_to_output_tensors_dict_float = self._run_nodes(
+            nodes, (), node_to_output_tensors_dict=node_to_output_tensors_dict)
+        return self._get_model_outputs(node_to_output_tensors_dict, node_to_output_tensors_dict_float)
+
+    def _run_nodes(self,
+                   nodes: List[BaseNode],
+                   args: Tuple[Any],
+                   node_to_output_tensors_dict: Dict[BaseNode, List] = None,
+                   nodes_to_cache: Collection[str] = (),
+                   cached_outputs: Dict[str, List] = None) -> Tuple[Dict[BaseNode, List], Dict[BaseNode, List]]:
+        """
+        Run the given nodes by their order.
+
+        Args:
+            nodes: Nodes to run, sorted topologically.
+            args: argument input tensors to model.
+            node_to_output_tensors_dict: Output tensors of nodes that are not run (cached outputs).
+            nodes_to_cache: Names of nodes to store their output tensors in cached_outputs.
+            cached_outputs: A dictionary to fill with output tensors of nodes_to_cache.
+
+        Returns:
+            Dictionaries from a node to its output tensors (and float output tensors), for nodes whose outputs
+            are still alive after the run.
+        """
+        node_to_output_tensors_dict = dict(node_to_output_tensors_dict or {})
+        # Cached outputs are used for float outputs as well.
+        node_to_output_tensors_dict_float = dict(node_to_output_tensors_dict) if self.return_float_outputs else dict()
         configurable_nodes = self.graph.get_configurable_sorted_nodes_names()
-        for node in self.node_sort:
+        if self._node_to_released_nodes is None:
+            self._node_to_released_nodes = self._get_node_to_released_nodes()
+        for node in nodes:
             op_func = self._get_op_func(node, configurable_nodes)
             input_tensors = _build_input_tensors_list(node,
                                                       self.graph,
@@ -380,16 +509,33 @@ class PytorchModel(torch.nn.Module):
                                                                       use_activation_quantization=use_activation_quantization)
 
             node_to_output_tensors_dict.update({node: out_tensors_of_n})
-            node_to_output_tensors_dict_float.update({node: out_tensors_of_n_float})
+            if self.return_float_outputs:
+                node_to_output_tensors_dict_float.update({node: out_tensors_of_n_float})
+            if node.name in nodes_to_cache:
+                cached_outputs[node.name] = out_tensors_of_n
 
-        if self.append2output:
-            outputs = _generate_outputs(self.append2output,
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-        else:
-            outputs = _generate_outputs([ot.node for ot in self.graph.get_outputs()],
-                                        node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
-            if len(outputs) == 1:
-                outputs = outputs[0]
+            # Release output tensors that are not used by the rest of the nodes.
+            for released_node in self._node_to_released_nodes[node]:
+                node_to_output_tensors_dict.pop(released_node, None)
+                node_to_output_tensors_dict_float.pop(released_node, None)
+
+        return node_to_output_tensors_dict, node_to_output_tensors_dict_float
+
+    def _get_model_outputs(self,
+                           node_to_output_tensors_dict: Dict[BaseNode, List],
+                           node_to_output_tensors_dict_float: Dict[BaseNode, List]) -> Any:
+        """
+        Args:
+            node_to_output_tensors_dict: A dictionary from a node to its output tensors.
+            node_to_output_tensors_dict_float: A dictionary from a node to its float output tensors.
+
+        Returns:
+            torch Tensor/s which is/are the output of the model logic.
+        """
+        outputs = _generate_outputs(self._get_output_nodes(),
+                                    node_to_output_tensors_dict_float if self.return_float_outputs else node_to_output_tensors_dict)
+        if not self.append2output and len(outputs) == 1:
+            outputs = outputs[0]
         return outputs
 
     def _get_op_func(self,
@@ -431,6 +577,50 @@ class PytorchModel(torch.nn.Module):
         return use_activation_quantization, activation_quantization_fn
 
 
+class PytorchFxGraphModule(torch.fx.GraphModule):
+    """
+    torch.fx GraphModule compiled from a PytorchModel (see PytorchModel.to_fx_graph_module). The forward pass runs
+    the generated code, and the partial inference methods (forward_and_cache and forward_from_cache) run the
+    PytorchModel it was compiled from, which shares its layers.
+    """
+
+    def __init__(self, model: PytorchModel, fx_graph: torch.fx.Graph):
+        """
+        Args:
+            model: The PytorchModel the GraphModule is compiled from.
+            fx_graph: The traced graph of the model's forward pass.
+        """
+        super().__init__(model, fx_graph, class_name=model.__class__.__name__)
+        # Set directly in the attributes dictionary, so the model isn't registered as a submodule (its layers are
+        # already the GraphModule's submodules).
+        self.__dict__['_pytorch_model'] = model
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'PytorchFxGraphModule':
+        """
+        Deep copy the GraphModule with its PytorchModel, so the copies of both share the copied layers.
+        """
+        res = super().__deepcopy__(memo)
+        res.__dict__['_pytorch_model'] = copy.deepcopy(self._pytorch_model, memo)
+        return res
+
+    def forward_and_cache(self,
+                          *args: Any,
+                          nodes_to_cache: Collection[str]) -> Tuple[Any, Dict[str, List[torch.Tensor]]]:
+        """
+        Run the model and cache the output tensors of some of its nodes (see PytorchModel.forward_and_cache).
+        """
+        return self._pytorch_model.forward_and_cache(*args, nodes_to_cache=nodes_to_cache)
+
+    def forward_from_cache(self,
+                           cached_outputs: Dict[str, List[torch.Tensor]],
+                           nodes_to_run: Collection[str]) -> Any:
+        """
+        Run only some of the model's nodes, and take the output tensors of the rest of the nodes from a cache
+        (see PytorchModel.forward_from_cache).
+        """
+        return self._pytorch_model.forward_from_cache(cached_outputs, nodes_to_run)
+
+
 class PyTorchModelBuilder(BaseModelBuilder):
     """
     Builder of PyTorch models.
@@ -441,7 +631,8 @@ class PyTorchModelBuilder(BaseModelBuilder):
                  append2output=None,
                  return_float_outputs: bool = False,
                  wrapper: Callable = None,
-                 get_activation_quantizer_holder_fn: Callable = None):
+                 get_activation_quantizer_holder_fn: Callable = None,
+                 use_fx_graph_module: bool = False):
         """
 
         Args:
@@ -450,6 +641,8 @@ class PyTorchModelBuilder(BaseModelBuilder):
             return_float_outputs: Whether the model returns float tensors or not.
             wrapper: A function wrapper Pytorch Layers.
             get_activation_quantizer_holder_fn: Function to retrieve a quantization holder for a node.
+            use_fx_graph_module: Whether to compile the built model into a torch.fx GraphModule, instead of
+              interpreting the graph in each forward pass.
         """
 
         super().__init__(graph,
@@ -458,15 +651,31 @@ class PyTorchModelBuilder(BaseModelBuilder):
 
         self.wrapper = wrapper
         self.get_activation_quantizer_holder_fn = get_activation_quantizer_holder_fn
+        self.use_fx_graph_module = use_fx_graph_module
+
+    def _finalize_model(self, model: PytorchModel) -> torch.nn.Module:
+        """
+        Compile the built model into a torch.fx GraphModule if the builder was set to do so.
+
+        Args:
+            model: The built PytorchModel.
+
+        Returns:
+            The model to return from the builder.
+        """
+        if self.use_fx_graph_module:
+            return model.to_fx_graph_module()
+        return model
 
-    def build_model(self) -> Tuple[PytorchModel, UserInformation]:
+    def build_model(self) -> Tuple[torch.nn.Module, UserInformation]:
         """
         Build a PyTorch model and return it.
         Returns: Pytorch model and user information.
 
         """
-        return PytorchModel(self.graph,
-                            self.append2output,
-                            return_float_outputs=self.return_float_outputs,
-                            wrapper=self.wrapper,
-                            get_activation_quantizer_holder_fn=self.get_activation_quantizer_holder_fn), self.graph.user_info
+        model = PytorchModel(self.graph,
+                             self.append2output,
+                             return_float_outputs=self.return_float_outputs,
+                             wrapper=self.wrapper,
+                             get_activation_quantizer_holder_fn=self.get_activation_quantizer_holder_fn)
+        return self._finalize_model(model), self.graph.user_info
@@ -0,0 +1,357 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Tuple, Optional
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.constants import LAST_AXIS
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
+from model_compression_toolkit.core.common.collectors.mean_collector import MeanCollector
+from model_compression_toolkit.core.common.collectors.min_max_per_channel_collector import MinMaxPerChannelCollector
+from model_compression_toolkit.core.common.collectors.weighted_histogram_collector import WeightedHistogramCollector, \
+    check_broadcastable
+
+
+def reshape_per_channel(x: torch.Tensor, axis: Optional[int]) -> torch.Tensor:
+    """
+    Reshape a tensor to a 2D tensor of shape (channels, elements-per-channel), where the channels
+    are taken from the given axis. If axis is None, the tensor is reshaped to a single channel.
+
+    Args:
+        x: Tensor to reshape.
+        axis: Channels axis.
+
+    Returns:
+        The reshaped tensor.
+    """
+    if axis is None:
+        return torch.reshape(x, [1, -1])
+    axis = (len(x.shape) - 1) if axis == LAST_AXIS else axis
+    return torch.reshape(torch.movedim(x, axis, 0), [x.shape[axis], -1])
+
+
+def torch_histogram(x: torch.Tensor,
+                    n_bins: int,
+                    weights: torch.Tensor = None) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Compute a (weighted) histogram of a tensor on its device, with n_bins equal-width bins between
+    the tensor's min and max (as np.histogram does). The histogram range is returned as tensors, so no
+    device to host synchronization is needed.
+
+    Args:
+        x: Tensor to compute its histogram.
+        n_bins: Number of bins in the histogram.
+        weights: Optional weights tensor (of the same shape as x) for a weighted histogram.
+
+    Returns:
+        A tuple of the histogram's counts, the histogram's min and the histogram's max.
+    """
+    x = x.flatten()
+    x_min, x_max = torch.aminmax(x)
+    # Same as np.histogram, a constant tensor gets a histogram range of width 1 around its value.
+    is_constant = x_min == x_max
+    x_min = torch.where(is_constant, x_min - 0.5, x_min)
+    x_max = torch.where(is_constant, x_max + 0.5, x_max)
+
+    bins_indices = ((x - x_min) * (n_bins / (x_max - x_min))).long().clamp_(0, n_bins - 1)
+    src = x.new_ones(()).expand_as(bins_indices) if weights is None else weights.flatten().to(x.dtype)
+    counts = torch.zeros(n_bins, dtype=x.dtype, device=x.device).scatter_add_(0, bins_indices, src)
+    return counts, x_min, x_max
+
+
+def torch_histogram_bins(hist_min: torch.Tensor, hist_max: torch.Tensor, n_bins: int) -> torch.Tensor:
+    """
+    Compute n_bins + 1 evenly spaced bins edges between hist_min and hist_max (as np.linspace does),
+    without moving the range to the host.
+
+    Args:
+        hist_min: Min value of the histogram (0-dim tensor).
+        hist_max: Max value of the histogram (0-dim tensor).
+        n_bins: Number of bins.
+
+    Returns:
+        Tensor of the bins edges.
+    """
+    step = (hist_max - hist_min) / n_bins
+    bins = hist_min + torch.arange(n_bins + 1, dtype=hist_min.dtype, device=hist_min.device) * step
+    bins[-1] = hist_max
+    return bins
+
+
+def torch_interp(x: torch.Tensor, xp: torch.Tensor, fp: torch.Tensor) -> torch.Tensor:
+    """
+    One-dimensional linear interpolation for monotonically increasing sample points (same as np.interp).
+
+    Args:
+        x: The x-coordinates at which to evaluate the interpolated values.
+        xp: The x-coordinates of the data points (increasing).
+        fp: The y-coordinates of the data points.
+
+    Returns:
+        The interpolated values.
+    """
+    indices = torch.searchsorted(xp, x, right=True).clamp_(1, len(xp) - 1)
+    x0, x1 = xp[indices - 1], xp[indices]
+    f0, f1 = fp[indices - 1], fp[indices]
+    dx = x1 - x0
+    slope = torch.where(dx > 0, (f1 - f0) / torch.where(dx > 0, dx, torch.ones_like(dx)), torch.zeros_like(dx))
+    y = f0 + slope * (x - x0)
+    y = torch.where(x < xp[0], fp[0], y)
+    return torch.where(x >= xp[-1], fp[-1], y)
+
+
+def torch_interpolate_histogram(current_bins: torch.Tensor,
+                                bins_to_interpolate: torch.Tensor,
+                                counts_to_interpolate: torch.Tensor) -> torch.Tensor:
+    """
+    Interpolate a histogram to new bins values on the device (see interpolate_histogram).
+
+    Args:
+        current_bins: Bins to use for interpolation.
+        bins_to_interpolate: Bins to interpolate.
+        counts_to_interpolate: Counts of the histogram to interpolate.
+
+    Returns:
+        Counts of the histogram if it was collected between current_bins values.
+    """
+    cumulative_hist = torch.cat([counts_to_interpolate.new_zeros(1), torch.cumsum(counts_to_interpolate, dim=0)])
+    return torch.diff(torch_interp(current_bins, bins_to_interpolate, cumulative_hist))
+
+
+class PytorchHistogramCollector(HistogramCollector):
+    """
+    Histogram collector that computes the histogram of each tensor going through it on the tensor's device.
+    The histograms are kept (or merged, in streaming mode) on the device and are moved to numpy only when
+    the histogram is requested.
+    """
+
+    def __init__(self, n_bins: int = 2048, streaming: bool = False):
+        """
+        Args:
+            n_bins: Number of bins in the histogram.
+            streaming: Whether to merge each new histogram into a single running histogram.
+        """
+
+        super().__init__(n_bins, streaming=streaming)
+        self._device_histograms = []
+        self._device_running_histogram = None
+
+    def _merge_to_device_running_histogram(self, counts: torch.Tensor, hist_min: torch.Tensor, hist_max: torch.Tensor):
+        """
+        Merge a new histogram into the running histogram on the device (used in streaming mode).
+        Both histograms are interpolated to bins between the min/max of all histograms merged so far. Interpolating
+        the running histogram is exact when its range doesn't change, so no host synchronization is needed to
+        check whether the range should be expanded.
+
+        Args:
+            counts: Counts of the histogram to merge.
+            hist_min: Min value of the histogram to merge.
+            hist_max: Max value of the histogram to merge.
+        """
+        if self._device_running_histogram is None:
+            self._device_running_histogram = (counts, hist_min, hist_max)
+            return
+
+        running_counts, running_min, running_max = self._device_running_histogram
+        merged_min = torch.minimum(running_min, hist_min)
+        merged_max = torch.maximum(running_max, hist_max)
+        merged_bins = torch_histogram_bins(merged_min, merged_max, self._n_bins)
+        merged_counts = torch_interpolate_histogram(merged_bins,
+                                                    torch_histogram_bins(running_min, running_max, self._n_bins),
+                                                    running_counts) + \
+                        torch_interpolate_histogram(merged_bins,
+                                                    torch_histogram_bins(hist_min, hist_max, self._n_bins),
+                                                    counts)
+        self._device_running_histogram = (merged_counts, merged_min, merged_max)
+
+    def _add_device_histogram(self, counts: torch.Tensor, hist_min: torch.Tensor, hist_max: torch.Tensor):
+        """
+        Add a histogram computed on the device. In streaming mode, the histogram is merged into the running
+        histogram, otherwise it's kept for a lazy merge.
+
+        Args:
+            counts: Counts of the histogram to add.
+            hist_min: Min value of the histogram to add.
+            hist_max: Max value of the histogram to add.
+        """
+        if self._streaming:
+            self._merge_to_device_running_histogram(counts, hist_min, hist_max)
+        else:
+            self._device_histograms.append((counts, hist_min, hist_max))
+
+    def _flush_device_histograms(self):
+        """
+        Move the histograms collected on the device to numpy.
+        """
+        if len(self._device_histograms) > 0:
+            counts, mins, maxs = [torch.stack(t).cpu().numpy() for t in zip(*self._device_histograms)]
+            for _counts, _min, _max in zip(counts, mins, maxs):
+                self._add_histogram(_counts, np.linspace(_min, _max, self._n_bins + 1))
+            self._device_histograms = []
+
+        if self._device_running_histogram is not None:
+            counts, _min, _max = [t.cpu().numpy() for t in self._device_running_histogram]
+            self._add_histogram(counts, np.linspace(_min, _max, self._n_bins + 1))
+            self._device_running_histogram = None
+
+    def get_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns: The histogram (bins and counts) the collector holds.
+        """
+        self._flush_device_histograms()
+        return super().get_histogram()
+
+    def update(self, x: torch.Tensor):
+        """
+        Update the current state of the histogram according to a new tensor that goes through the collector.
+
+        Args:
+            x: Tensor going through the collector to update the histogram according to.
+        """
+        self._add_device_histogram(*torch_histogram(x, self._n_bins))
+
+
+class PytorchWeightedHistogramCollector(PytorchHistogramCollector, WeightedHistogramCollector):
+    """
+    Weighted histogram collector that computes the histogram of each tensor going through it on the tensor's device.
+    """
+
+    def update(self, x: torch.Tensor, weights: np.ndarray = None):
+        """
+        Update the current state of the histogram according to a new tensor that goes through the collector,
+        taking weights into account. If no weights are passed (or all weights are zero), uniform
+        weights are used.
+
+        Args:
+            x: Tensor going through the collector to update the histogram according to.
+            weights: Weights corresponding to the elements of the tensor `x`.
+        """
+        if weights is None:
+            self._add_device_histogram(*torch_histogram(x, self._n_bins))
+            return
+
+        check_broadcastable(x, weights)
+        weights = torch.as_tensor(weights, dtype=x.dtype, device=x.device)
+        # Ensure weights has the same number of dimensions as x by adding trailing singleton dimensions.
+        weights = weights.reshape(list(weights.shape) + [1] * (len(x.shape) - len(weights.shape)))
+        weights = weights.expand(x.shape)
+        # Replace all-zeros weights with uniform weights without synchronizing with the host.
+        weights = torch.where(torch.any(weights != 0), weights, torch.ones_like(weights))
+        self._add_device_histogram(*torch_histogram(x, self._n_bins, weights))
+
+
+class PytorchMeanCollector(MeanCollector):
+    """
+    Per-channel mean collector that accumulates the per-channel sum on the tensor's device.
+    The mean is moved to numpy only when it is accessed.
+    """
+
+    def __init__(self, axis: int):
+        """
+        Args:
+            axis: Compute the mean with regard to this axis.
+        """
+        self._device_sum = None
+        super().__init__(axis=axis)
+
+    def _flush(self):
+        """
+        Move the sum accumulated on the device to numpy and update the mean accordingly.
+        """
+        if self._device_sum is not None:
+            self.current_sum = self.current_sum + self._device_sum.cpu().numpy()
+            self._current_mean = self.current_sum / self.i
+            self._device_sum = None
+
+    @property
+    def current_mean(self):
+        """
+        Returns: The mean of all batches that went through the collector.
+        """
+        self._flush()
+        return self._current_mean
+
+    @current_mean.setter
+    def current_mean(self, value):
+        self._current_mean = value
+
+    def update(self, x: torch.Tensor):
+        """
+        Update the per-channel sum using a new tensor x to consider.
+
+        Args:
+            x: Tensor that goes through the mean collector and needs to be considered in the mean computation.
+        """
+        self.i += 1  # Update the iteration index
+        mu = torch.mean(reshape_per_channel(x, self.axis), dim=-1)  # mean per channel for a batch
+        self._device_sum = mu if self._device_sum is None else self._device_sum + mu
+
+
+class PytorchMinMaxPerChannelCollector(MinMaxPerChannelCollector):
+    """
+    Per-channel min/max collector that keeps its running state on the tensor's device.
+    The state is moved to numpy only when it is accessed.
+    """
+
+    def __init__(self,
+                 axis: int,
+                 init_min_value: float = None,
+                 init_max_value: float = None):
+        """
+        Args:
+            axis: Compute the min/max values with regard to this axis.
+            init_max_value: Initial maximal output value.
+            init_min_value: Initial minimal output value.
+        """
+        self._device_state = None
+        super().__init__(axis=axis, init_min_value=init_min_value, init_max_value=init_max_value)
+
+    def _flush(self):
+        """
+        Move the min/max collected on the device to numpy and merge it with the numpy state.
+        """
+        if self._device_state is not None:
+            device_state = self._device_state.cpu().numpy()
+            if self._state is not None:
+                device_state = np.stack([np.maximum(device_state[:, 0], self._state[:, 0]),
+                                         np.minimum(device_state[:, 1], self._state[:, 1])], axis=-1)
+            self._state = device_state
+            self._device_state = None
+
+    @property
+    def state(self) -> np.ndarray:
+        """
+        Returns: Per-channel max and min values the collector observed.
+        """
+        self._flush()
+        return self._state
+
+    @state.setter
+    def state(self, value: np.ndarray):
+        self._state = value
+
+    def update(self, x: torch.Tensor):
+        """
+        Update the min/max values the collector holds using a new tensor x to consider.
+
+        Args:
+            x: Tensor that goes through the collector and needs to be considered in the min/max computation.
+        """
+        x_min, x_max = torch.aminmax(reshape_per_channel(x, self.axis), dim=-1)
+        if self._device_state is not None:
+            x_max = torch.maximum(x_max, self._device_state[:, 0])
+            x_min = torch.minimum(x_min, self._device_state[:, 1])
+        self._device_state = torch.stack([x_max, x_min], dim=-1)
@@ -0,0 +1,69 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollector
+from model_compression_toolkit.core.pytorch.collectors.pytorch_collectors import PytorchHistogramCollector, \
+    PytorchWeightedHistogramCollector, PytorchMeanCollector, PytorchMinMaxPerChannelCollector
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor
+
+
+class PytorchStatsCollector(StatsCollector):
+    """
+    Statistics collector that computes and keeps the statistics of torch tensors on the working device.
+    The statistics are moved to numpy only when they are accessed (e.g. when computing quantization parameters),
+    which saves a device to host copy and host computation for each tensor in each calibration batch.
+    """
+
+    histogram_collector_cls = PytorchHistogramCollector
+    weighted_histogram_collector_cls = PytorchWeightedHistogramCollector
+    mean_collector_cls = PytorchMeanCollector
+    min_max_collector_cls = PytorchMinMaxPerChannelCollector
+
+    accepts_framework_tensors = True
+
+    def update_statistics(self, x: Any, weights: np.ndarray = None):
+        """
+        Update statistics in all collectors with a new tensor to consider.
+
+        Args:
+            x: Tensor to consider when updating statistics (a torch tensor or a numpy array).
+            weights: Weights tensor to consider when updating statistics.
+        """
+
+        x = standardize_torch_tensor(x)
+        self._update_collectors(x, weights)
+
+
+def standardize_torch_tensor(x: Any) -> torch.Tensor:
+    """
+    Standardize tensors that goes through the collectors before using them.
+    Convert them to detached torch tensors of float64 data type (numpy arrays are moved to the working device).
+
+    Args:
+        x: Tensor to standardize.
+
+    Returns:
+        Same tensor as a torch tensor of float64 data type.
+    """
+    if not isinstance(x, torch.Tensor):
+        x = to_torch_tensor(x, dtype=None)
+    x = x.detach().to(torch.float64)
+    if len(x.shape) == 0:
+        x = x.reshape([1])
+    return x
@@ -99,4 +99,13 @@ BATCH_DIM_VALUE = -1
 
 # The maximum and minimum representable values for float16
 MAX_FLOAT16 = torch.finfo(torch.float16).max - 1
-MIN_FLOAT16 = torch.finfo(torch.float16).min - 1
\ No newline at end of file
+MIN_FLOAT16 = torch.finfo(torch.float16).min - 1
+# Max number of elements of the quantized tensors of a batch of candidates evaluated at once in the quantization
+# parameters search with torch tensors (larger than the numpy search default, to utilize accelerators).
+TORCH_QPARAMS_SEARCH_MAX_BATCH_ELEMENTS = 2 ** 22
+# Min number of candidates evaluated at once in the search with torch tensors on an accelerator, for tensors larger
+# than the max batch elements (on the host, the evaluation of large tensors is memory bound).
+TORCH_QPARAMS_SEARCH_MIN_BATCH_CANDIDATES = 8
+# Number of tensors of the size of the quantized tensors of a batch of candidates that are allocated at once
+# (including temporaries) in the search with torch tensors.
+TORCH_QPARAMS_SEARCH_BATCH_ELEMENT_TENSORS = 4
@@ -13,17 +13,17 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import torch
-from torch import autograd
 from tqdm import tqdm
 
-from model_compression_toolkit.constants import MIN_HESSIAN_ITER, HESSIAN_COMP_TOLERANCE, HESSIAN_NUM_ITERATIONS
+from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS
 from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianScoresGranularity
-from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from model_compression_toolkit.core.common.hessian.hessian_info_utils import HutchinsonConvergenceTracker
 from model_compression_toolkit.core.pytorch.hessian.hessian_scores_calculator_pytorch import \
     HessianScoresCalculatorPytorch
 from model_compression_toolkit.core.pytorch.utils import torch_tensor_to_numpy
@@ -39,7 +39,8 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
                  input_images: List[torch.Tensor],
                  fw_impl,
                  hessian_scores_request: HessianScoresRequest,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 models_pool: Optional[HessianModelsPool] = None):
         """
         Args:
             graph: Computational graph for the float model.
@@ -47,13 +48,15 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
             fw_impl: Framework-specific implementation for Hessian approximation scores computation.
             hessian_scores_request: Configuration request for which to compute the Hessian approximation scores.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian scores.
+            models_pool: A pool of float models of the graph to reuse.
 
         """
         super(ActivationHessianScoresCalculatorPytorch, self).__init__(graph=graph,
                                                                        input_images=input_images,
                                                                        fw_impl=fw_impl,
                                                                        hessian_scores_request=hessian_scores_request,
-                                                                       num_iterations_for_approximation=num_iterations_for_approximation)
+                                                                       num_iterations_for_approximation=num_iterations_for_approximation,
+                                                                       models_pool=models_pool)
 
     def forward_pass(self):
         model_output_nodes = [ot.node for ot in self.graph.get_outputs()]
@@ -63,7 +66,7 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
                             "Exclude output nodes from Hessian request targets.")
 
         grad_model_outputs = self.hessian_request.target_nodes + model_output_nodes
-        model, _ = FloatPyTorchModelBuilder(graph=self.graph, append2output=grad_model_outputs).build_model()
+        model = self.get_float_model(grad_model_outputs)
         model.eval()
 
         # Run model inference
@@ -109,18 +112,24 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
         ipts_hessian_approx_scores = [torch.tensor(0.0, requires_grad=True, device=output.device)
                                       for _ in range(len(target_activation_tensors))]
 
-        for j in tqdm(range(self.num_iterations_for_approximation),
+        convergence_tracker = HutchinsonConvergenceTracker(len(target_activation_tensors))
+        for _ in tqdm(range(self.num_iterations_for_approximation),
                       "Hessian random iterations"):  # Approximation iterations
+            # Targets whose estimation has converged are frozen, and no longer participate in the backward pass.
+            active_targets = convergence_tracker.get_active_targets()
+            if not active_targets:
+                break
             v = self._generate_random_vectors_batch(output.shape, output.device)
             f_v = torch.sum(v * output)
-            for i, ipt_tensor in enumerate(target_activation_tensors):  # Per Interest point activation tensor
-                hess_v = autograd.grad(outputs=f_v,
-                                       inputs=ipt_tensor,
-                                       retain_graph=True,
-                                       allow_unused=True)[0]
+            # Gradients w.r.t all interest point activation tensors are computed together.
+            hess_vs = self._compute_gradients(f_v, [target_activation_tensors[i] for i in active_targets],
+                                              allow_unused=True)
+            updated_targets, estimations = [], []
+            for i, hess_v in zip(active_targets, hess_vs):  # Per Interest point activation tensor
                 if hess_v is None:
                     # In case we have an output node, which is an interest point, but it is not differentiable,
                     # we consider its Hessian to be the initial value 0.
+                    convergence_tracker.freeze(i)  # pragma: no cover
                     continue  # pragma: no cover
 
                 hessian_approx_scores = hess_v ** 2
@@ -131,7 +140,17 @@ class ActivationHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
                     hessian_approx_scores = torch.mean(hessian_approx_scores, dim=tuple(range(2, num_dims)))
 
                 # Update node Hessian approximation mean over random iterations
+                j = convergence_tracker.num_iterations[i]
                 ipts_hessian_approx_scores[i] = (j * ipts_hessian_approx_scores[i] + hessian_approx_scores) / (j + 1)
+                updated_targets.append(i)
+                estimations.append(torch.sum(hessian_approx_scores.reshape(hessian_approx_scores.shape[0], -1), dim=1))
+
+            if updated_targets:
+                # The per-sample estimations of all targets are fetched from the device at once.
+                convergence_tracker.update_targets(updated_targets,
+                                                   torch_tensor_to_numpy(torch.stack(estimations)))
+
+        self.achieved_iterations = convergence_tracker.num_iterations
 
         # Convert results to list of numpy arrays
         hessian_results = [torch_tensor_to_numpy(h) for h in ipts_hessian_approx_scores]
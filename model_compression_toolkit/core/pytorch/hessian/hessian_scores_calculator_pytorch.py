@@ -13,11 +13,15 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import Union, List
+from typing import Union, List, Optional, Sequence
 
 import torch
+from torch import autograd
 
+from model_compression_toolkit.constants import HESSIAN_MAX_GRAD_TARGETS
+from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.core.common.hessian.hessian_scores_calculator import HessianScoresCalculator
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
 from model_compression_toolkit.logger import Logger
 
 
@@ -26,6 +30,19 @@ class HessianScoresCalculatorPytorch(HessianScoresCalculator):
     Pytorch-specific implementation of the Hessian approximation scores Calculator.
     This class serves as a base for other Pytorch-specific Hessian approximation scores calculators.
     """
+    def _build_float_model(self, append2output: Optional[Sequence[BaseNode]]) -> torch.nn.Module:
+        """
+        Build a Pytorch float model of the graph.
+
+        Args:
+            append2output: Nodes whose outputs are appended to the model outputs.
+
+        Returns:
+            The float model.
+        """
+        model, _ = FloatPyTorchModelBuilder(graph=self.graph, append2output=append2output).build_model()
+        return model
+
     def _generate_random_vectors_batch(self, shape: tuple, device: torch.device) -> torch.Tensor:
         """
         Generate a batch of random vectors for Hutchinson estimation using Rademacher distribution.
@@ -41,6 +58,29 @@ class HessianScoresCalculatorPytorch(HessianScoresCalculator):
         v[v == 0] = -1
         return v
 
+    def _compute_gradients(self, output: torch.Tensor, inputs: List[torch.Tensor],
+                           allow_unused: bool = False) -> List[Optional[torch.Tensor]]:
+        """
+        Compute the gradients of an output w.r.t all the inputs, using a single backward pass per chunk of
+        (up to HESSIAN_MAX_GRAD_TARGETS) inputs, instead of a backward pass per input.
+        The computation graph is retained for additional backward passes.
+
+        Args:
+            output: A scalar tensor to compute the gradients of.
+            inputs: Tensors to compute the gradients w.r.t.
+            allow_unused: Whether to allow inputs that the output doesn't depend on (their gradient is None).
+
+        Returns:
+            A list of the gradients w.r.t each of the inputs.
+        """
+        grads = []
+        for i in range(0, len(inputs), HESSIAN_MAX_GRAD_TARGETS):
+            grads.extend(autograd.grad(outputs=output,
+                                       inputs=inputs[i: i + HESSIAN_MAX_GRAD_TARGETS],
+                                       retain_graph=True,
+                                       allow_unused=allow_unused))
+        return grads
+
     def concat_tensors(self, tensors_to_concate: Union[torch.Tensor, List[torch.Tensor]]) -> torch.Tensor:
         """
         Concatenate model tensors into a single tensor.
@@ -12,17 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 import torch
-from torch import autograd
 from tqdm import tqdm
 
 from model_compression_toolkit.constants import HESSIAN_NUM_ITERATIONS, MIN_HESSIAN_ITER, HESSIAN_COMP_TOLERANCE
 from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianScoresGranularity
-from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
 from model_compression_toolkit.core.pytorch.hessian.hessian_scores_calculator_pytorch import \
     HessianScoresCalculatorPytorch
 from model_compression_toolkit.logger import Logger
@@ -38,7 +37,8 @@ class WeightsHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
                  input_images: List[torch.Tensor],
                  fw_impl,
                  hessian_scores_request: HessianScoresRequest,
-                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                 num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                 models_pool: Optional[HessianModelsPool] = None):
         """
 
         Args:
@@ -47,13 +47,15 @@ class WeightsHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
             fw_impl: Framework-specific implementation for Hessian scores computation.
             hessian_scores_request: Configuration request for which to compute the Hessian approximation scores.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian scores.
+            models_pool: A pool of float models of the graph to reuse.
         """
 
         super(WeightsHessianScoresCalculatorPytorch, self).__init__(graph=graph,
                                                                     input_images=input_images,
                                                                     fw_impl=fw_impl,
                                                                     hessian_scores_request=hessian_scores_request,
-                                                                    num_iterations_for_approximation=num_iterations_for_approximation)
+                                                                    num_iterations_for_approximation=num_iterations_for_approximation,
+                                                                    models_pool=models_pool)
 
     def compute(self) -> List[np.ndarray]:
         """
@@ -71,13 +73,33 @@ class WeightsHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
         """
 
         # Float model
-        model, _ = FloatPyTorchModelBuilder(graph=self.graph).build_model()
+        model = self.get_float_model()
 
         # Run model inference
         outputs = model(self.input_images)
         output_tensor = self.concat_tensors(outputs)
         device = output_tensor.device
 
+        weights_tensors = []
+        shape_channel_axes = []
+        for ipt_node in self.hessian_request.target_nodes:  # Per Interest point weights tensor
+            # Check if the target node's layer type is supported.
+            if not ipt_node.kernel_attr:
+                Logger.critical(f"Hessian information with respect to weights is not supported for "
+                                f"{ipt_node.type} layers.")  # pragma: no cover
+
+            weights_tensor = getattr(getattr(model, ipt_node.name), ipt_node.kernel_attr)
+            weights_tensors.append(weights_tensor)
+
+            # Get the output channel index
+            output_channel_axis = ipt_node.channel_axis.output
+            shape_channel_axis = [i for i in range(len(weights_tensor.shape))]
+            if self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL:
+                shape_channel_axis.remove(output_channel_axis)
+            elif self.hessian_request.granularity == HessianScoresGranularity.PER_ELEMENT:
+                shape_channel_axis = ()
+            shape_channel_axes.append(shape_channel_axis)
+
         ipts_hessian_approx_scores = [torch.tensor([0.0],
                                                    requires_grad=True,
                                                    device=device)
@@ -88,28 +110,10 @@ class WeightsHessianScoresCalculatorPytorch(HessianScoresCalculatorPytorch):
             # Getting a random vector with the same shape as the model output
             v = self._generate_random_vectors_batch(output_tensor.shape, device=device)
             f_v = torch.mean(torch.sum(v * output_tensor, dim=-1))
-            for i, ipt_node in enumerate(self.hessian_request.target_nodes):  # Per Interest point weights tensor
-
-                # Check if the target node's layer type is supported.
-                if not ipt_node.kernel_attr:
-                    Logger.critical(f"Hessian information with respect to weights is not supported for "
-                                    f"{ipt_node.type} layers.")  # pragma: no cover
-
-                weights_tensor = getattr(getattr(model, ipt_node.name), ipt_node.kernel_attr)
-
-                # Get the output channel index
-                output_channel_axis = ipt_node.channel_axis.output
-                shape_channel_axis = [i for i in range(len(weights_tensor.shape))]
-                if self.hessian_request.granularity == HessianScoresGranularity.PER_OUTPUT_CHANNEL:
-                    shape_channel_axis.remove(output_channel_axis)
-                elif self.hessian_request.granularity == HessianScoresGranularity.PER_ELEMENT:
-                    shape_channel_axis = ()
-
-                # Compute gradients of f_v with respect to the weights
-                f_v_grad = autograd.grad(outputs=f_v,
-                                         inputs=weights_tensor,
-                                         retain_graph=True)[0]
 
+            # Compute gradients of f_v with respect to the weights of all interest points together
+            f_v_grads = self._compute_gradients(f_v, weights_tensors)
+            for i, (f_v_grad, shape_channel_axis) in enumerate(zip(f_v_grads, shape_channel_axes)):
                 # Trace{A^T * A} = sum of all squares values of A
                 approx = f_v_grad ** 2
                 if len(shape_channel_axis) > 0:
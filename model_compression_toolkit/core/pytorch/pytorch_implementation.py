@@ -15,7 +15,7 @@
 import operator
 from copy import deepcopy
 from functools import partial
-from typing import List, Any, Tuple, Callable, Generator
+from typing import List, Any, Tuple, Callable, Generator, Dict, Collection
 
 import numpy as np
 import torch
@@ -32,11 +32,13 @@ from model_compression_toolkit.core.common import Graph, BaseNode
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 from model_compression_toolkit.core.common.graph.functional_node import FunctionalNode
 from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianMode
+from model_compression_toolkit.core.common.hessian.hessian_models_pool import HessianModelsPool
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
 from model_compression_toolkit.core.common.node_prior_info import NodePriorInfo
 from model_compression_toolkit.core.common.similarity_analyzer import compute_mse, compute_kl_divergence, compute_cs
 from model_compression_toolkit.core.pytorch.back2framework import get_pytorch_model_builder
 from model_compression_toolkit.core.pytorch.data_util import data_gen_to_dataloader
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
 from model_compression_toolkit.core.pytorch.graph_substitutions.substitutions.batchnorm_folding import \
     pytorch_batchnorm_folding, pytorch_batchnorm_forward_folding
 from model_compression_toolkit.core.pytorch.graph_substitutions.substitutions.batchnorm_reconstruction import \
@@ -92,11 +94,13 @@ from model_compression_toolkit.core.pytorch.mixed_precision.configurable_activat
 from model_compression_toolkit.core.pytorch.mixed_precision.configurable_weights_quantizer import \
     ConfigurableWeightsQuantizer
 from model_compression_toolkit.core.pytorch.pytorch_node_prior_info import create_node_prior_info
+from model_compression_toolkit.core.pytorch.quantization.qparams_search_backend import PytorchQParamsSearchBackend
 from model_compression_toolkit.core.pytorch.reader.reader import model_reader
 from model_compression_toolkit.core.pytorch.statistics_correction.apply_second_moment_correction import \
     pytorch_apply_second_moment_correction
 from model_compression_toolkit.core.pytorch.statistics_correction.pytorch_compute_activation_bias_correction_of_graph import \
     pytorch_compute_activation_bias_correction_of_graph
+from model_compression_toolkit.core.pytorch.collectors.pytorch_stats_collector import PytorchStatsCollector
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy, set_model
 from model_compression_toolkit.exporter.model_wrapper.fw_agnostic.get_inferable_quantizers import \
     get_inferable_quantizers
@@ -113,6 +117,8 @@ class PytorchImplementation(FrameworkImplementation):
     activation_quant_layer_cls = PytorchActivationQuantizationHolder
     configurable_weights_quantizer_cls = ConfigurableWeightsQuantizer
     configurable_activation_quantizer_cls = ConfigurableActivationQuantizer
+    stats_collector_cls = PytorchStatsCollector
+    supports_partial_sensitivity_eval_inference = True
 
     def __init__(self):
         super().__init__()
@@ -177,7 +183,8 @@ class PytorchImplementation(FrameworkImplementation):
                       graph: Graph,
                       mode: ModelBuilderMode,
                       append2output: List[Any] = None,
-                      return_float_outputs: bool = False) -> Tuple:
+                      return_float_outputs: bool = False,
+                      use_fx_graph_module: bool = False) -> Tuple:
         """
         Build a Pytorch module from a graph.
         The mode determines how the module should be build. append2output is a list of Nodes
@@ -188,6 +195,8 @@ class PytorchImplementation(FrameworkImplementation):
             mode: Mode for how to build the module.
             append2output: List of Nodes to set as the module's outputs.
             return_float_outputs (bool): whether to return outputs before or after quantization nodes (default)
+            use_fx_graph_module: Whether to compile the built module into a torch.fx GraphModule, instead of
+              interpreting the graph in each forward pass.
 
         Returns:
             A tuple with the model and additional relevant supporting objects.
@@ -195,7 +204,8 @@ class PytorchImplementation(FrameworkImplementation):
         pytorch_model_builder = get_pytorch_model_builder(mode)
         return pytorch_model_builder(graph=graph,
                                      append2output=append2output,
-                                     return_float_outputs=return_float_outputs).build_model()
+                                     return_float_outputs=return_float_outputs,
+                                     use_fx_graph_module=use_fx_graph_module).build_model()
 
     def run_model_inference(self,
                             model: Any,
@@ -523,11 +533,74 @@ class PytorchImplementation(FrameworkImplementation):
 
         return model(*inputs)
 
+    def sensitivity_eval_inference_and_cache(self,
+                                             model: Module,
+                                             inputs: Any,
+                                             nodes_to_cache: Collection[str]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Calls for a Pytorch model inference during mixed precision sensitivity evaluation, and caches the output
+        tensors of some of the model's nodes for later partial inferences.
+
+        Args:
+            model: A Pytorch model to run inference for.
+            inputs: Input tensors to run inference on.
+            nodes_to_cache: Names of nodes to cache their output tensors.
+
+        Returns:
+            The output of the model inference on the given input, and a dictionary from a cached node name to its
+            output tensors.
+        """
+        return model.forward_and_cache(*inputs, nodes_to_cache=nodes_to_cache)
+
+    def sensitivity_eval_partial_inference(self,
+                                           model: Module,
+                                           cached_outputs: Dict[str, Any],
+                                           nodes_to_run: Collection[str]) -> Any:
+        """
+        Calls for a partial Pytorch model inference during mixed precision sensitivity evaluation.
+
+        Args:
+            model: A Pytorch model to run inference for.
+            cached_outputs: A dictionary from a node name to its cached output tensors.
+            nodes_to_run: Names of nodes to run.
+
+        Returns:
+            The output of the model inference.
+        """
+        return model.forward_from_cache(cached_outputs, nodes_to_run)
+
+    def supports_forked_inference(self) -> bool:
+        """
+        Returns: Whether models can run inference in processes that are forked from the current process.
+        CUDA can't be used in forked processes, so only CPU inference is supported.
+        """
+        return get_working_device().type == 'cpu'
+
+    def supports_forked_workers(self) -> bool:
+        """
+        Returns: Whether the current process can be forked into worker processes. CUDA can't be used in forked
+        processes once it was initialized, so forking is not supported after CUDA initialization.
+        """
+        return not torch.cuda.is_initialized()
+
+    def init_forked_worker(self):
+        """
+        Limit each forked worker to a single intra-op thread, so the workers don't oversubscribe the CPU cores.
+        """
+        torch.set_num_threads(1)
+
+    def get_qparams_search_backend(self) -> PytorchQParamsSearchBackend:
+        """
+        Returns: A backend to run the weights quantization parameters search with torch tensors on the working device.
+        """
+        return PytorchQParamsSearchBackend()
+
     def get_hessian_scores_calculator(self,
                                       graph: Graph,
                                       input_images: List[Any],
                                       hessian_scores_request: HessianScoresRequest,
-                                      num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS):
+                                      num_iterations_for_approximation: int = HESSIAN_NUM_ITERATIONS,
+                                      models_pool: HessianModelsPool = None):
         """
         Get Pytorch hessian scores calculator based on the hessian scores request.
         Args:
@@ -535,6 +608,7 @@ class PytorchImplementation(FrameworkImplementation):
             graph: Float graph to compute the approximation of its different nodes.
             hessian_scores_request: HessianScoresRequest to search for the desired calculator.
             num_iterations_for_approximation: Number of iterations to use when approximating the Hessian scores.
+            models_pool: A pool of float models of the graph to reuse across calculators.
 
         Returns: HessianScoresCalculatorPytorch to use for the hessian approximation scores computation for this request.
 
@@ -544,13 +618,15 @@ class PytorchImplementation(FrameworkImplementation):
                                                             hessian_scores_request=hessian_scores_request,
                                                             input_images=input_images,
                                                             fw_impl=self,
-                                                            num_iterations_for_approximation=num_iterations_for_approximation)
+                                                            num_iterations_for_approximation=num_iterations_for_approximation,
+                                                            models_pool=models_pool)
         elif hessian_scores_request.mode == HessianMode.WEIGHTS:
             return WeightsHessianScoresCalculatorPytorch(graph=graph,
                                                          hessian_scores_request=hessian_scores_request,
                                                          input_images=input_images,
                                                          fw_impl=self,
-                                                         num_iterations_for_approximation=num_iterations_for_approximation)
+                                                         num_iterations_for_approximation=num_iterations_for_approximation,
+                                                         models_pool=models_pool)
 
     def get_inferable_quantizers(self, node: BaseNode):
         """
@@ -0,0 +1,82 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Optional
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QParamsSearchBackend
+from model_compression_toolkit.core.pytorch.constants import TORCH_QPARAMS_SEARCH_MAX_BATCH_ELEMENTS, \
+    TORCH_QPARAMS_SEARCH_MIN_BATCH_CANDIDATES, TORCH_QPARAMS_SEARCH_BATCH_ELEMENT_TENSORS
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+
+
+class PytorchQParamsSearchBackend(QParamsSearchBackend):
+    """
+    Quantization parameters search backend that quantizes the tensor by the candidates and computes the errors with
+    torch tensors on the working device (multithreaded on CPU, or on an accelerator). The candidates and the selected
+    parameters remain numpy arrays.
+    """
+
+    def __init__(self,
+                 device: torch.device = None,
+                 dtype: torch.dtype = torch.float32,
+                 max_batch_elements: int = TORCH_QPARAMS_SEARCH_MAX_BATCH_ELEMENTS,
+                 min_batch_candidates: Optional[int] = None):
+        """
+        Args:
+            device: Device to run the search on. If None, the working device is used.
+            dtype: Data type of the tensors the search runs with.
+            max_batch_elements: Max number of elements of the quantized tensors of a batch of candidates.
+            min_batch_candidates: Min number of candidates evaluated at once for tensors larger than
+                max_batch_elements (see QParamsSearchBackend.get_chunk_size). If None,
+                TORCH_QPARAMS_SEARCH_MIN_BATCH_CANDIDATES on an accelerator, and 1 on CPU.
+        """
+        self.device = get_working_device() if device is None else device
+        self.dtype = dtype
+        self.max_batch_elements = max_batch_elements
+        if min_batch_candidates is None:
+            min_batch_candidates = 1 if self.device.type == 'cpu' else TORCH_QPARAMS_SEARCH_MIN_BATCH_CANDIDATES
+        self.min_batch_candidates = min_batch_candidates
+        self.batch_element_nbytes = TORCH_QPARAMS_SEARCH_BATCH_ELEMENT_TENSORS * dtype.itemsize
+
+    def get_available_memory(self) -> int:
+        """ Returns: The available memory in bytes on the backend's device. """
+        if self.device.type == 'cuda':
+            return torch.cuda.mem_get_info(self.device)[0]
+        return super().get_available_memory()
+
+    def to_native(self, x: np.ndarray) -> torch.Tensor:
+        """ Returns: The numpy array as a tensor of the backend's dtype on the backend's device. """
+        return torch.as_tensor(x, dtype=self.dtype, device=self.device)
+
+    def to_numpy(self, x: torch.Tensor) -> np.ndarray:
+        """ Returns: The tensor as a numpy array on the host. """
+        return x.cpu().numpy()
+
+    def abs(self, x: torch.Tensor) -> torch.Tensor:
+        """ Returns: Element-wise absolute value of the tensor. """
+        return torch.abs(x)
+
+    def mean(self, x: torch.Tensor, axis=None) -> torch.Tensor:
+        """ Returns: Mean of the tensor over the given axis (or axes), or over all elements if axis is None. """
+        return x.mean() if axis is None else x.mean(dim=axis)
+
+    def quantize_to_grid(self, x: torch.Tensor, range_min: np.ndarray, range_max: np.ndarray,
+                         delta: np.ndarray) -> torch.Tensor:
+        """ Returns: The tensor quantized to the uniform grid of the given (numpy) min, max and step size. """
+        range_min, range_max, delta = self.to_native(range_min), self.to_native(range_max), self.to_native(delta)
+        return delta * torch.round((torch.clamp(x, min=range_min, max=range_max) - range_min) / delta) + range_min
@@ -66,7 +66,8 @@ def quantization_preparation_runner(graph: Graph,
     mi = ModelCollector(graph,
                         fw_impl,
                         hessian_info_service,
-                        core_config.quantization_config)  # Mark points for statistics collection
+                        core_config.quantization_config,
+                        stats_collector_cls=fw_impl.stats_collector_cls)  # Mark points for statistics collection
 
     for _data in tqdm(representative_data_gen(), "Statistics Collection"):
         mi.infer(_data)
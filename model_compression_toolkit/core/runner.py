@@ -103,7 +103,9 @@ def core_runner(in_model: Any,
                                      mixed_precision_enable=core_config.is_mixed_precision_enabled,
                                      running_gptq=running_gptq)
 
-    hessian_info_service = HessianInfoService(graph=graph, fw_impl=fw_impl)
+    hessian_info_service = HessianInfoService(graph=graph, fw_impl=fw_impl,
+                                              cache_dir=core_config.quantization_config.hessian_cache_dir,
+                                              cache_float16=core_config.quantization_config.hessian_cache_float16)
 
     tg = quantization_preparation_runner(graph=graph,
                                          representative_data_gen=representative_data_gen,
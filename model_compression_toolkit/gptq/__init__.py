@@ -18,7 +18,9 @@ from model_compression_toolkit.gptq.common.gptq_config import (
     RoundingType,
     GPTQHessianScoresConfig,
     GradualActivationQuantizationConfig,
-    QFractionLinearAnnealingConfig
+    QFractionLinearAnnealingConfig,
+    GPTQFloatOutputsCacheConfig,
+    GPTQBlockwiseConfig
 )
 
 from model_compression_toolkit.verify_packages import FOUND_TF, FOUND_TORCH
@@ -0,0 +1,373 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+import dataclasses
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Callable, Generator, List, Optional, Any
+
+import numpy as np
+
+from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.hessian import HessianInfoService
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.common.user_info import UserInformation
+from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, GPTQFloatOutputsCacheConfig
+from model_compression_toolkit.gptq.common.gptq_framework_implementation import GPTQFrameworkImplemantation
+from model_compression_toolkit.gptq.common.gptq_graph import get_compare_points
+from model_compression_toolkit.logger import Logger
+
+
+def get_gptq_blocks(graph: Graph,
+                    compare_points: List[BaseNode],
+                    compare_points_per_block: int) -> List[List[BaseNode]]:
+    """
+    Partition a graph into sequential blocks for block-wise GPTQ.
+    A block is closed after it contains at least 'compare_points_per_block' compare points, at the first node
+    whose output is the only tensor passed from the block to the following nodes (nodes of a reused layer are
+    kept in the same block). A block is closed only if at least 'compare_points_per_block' compare points remain
+    after it, so the last block contains the remaining nodes with at least 'compare_points_per_block' compare points
+    (unless the graph has less compare points, in which case it's a single block).
+
+    Args:
+        graph: Graph to partition.
+        compare_points: GPTQ compare points in the graph.
+        compare_points_per_block: Minimal number of compare points in a block.
+
+    Returns:
+        A list of blocks, each is a list of nodes sorted topologically.
+    """
+    nodes = graph.get_topo_sorted_nodes()
+    position = {n: i for i, n in enumerate(nodes)}
+    output_nodes = {ot.node for ot in graph.get_outputs()}
+
+    # Position of the last node that uses each node's output (the graph outputs are used by the last block).
+    last_use = [len(nodes) if n in output_nodes else max([position[e.sink_node] for e in graph.out_edges(n)],
+                                                             default=i)
+                for i, n in enumerate(nodes)]
+
+    # A reused layer can't be split between blocks.
+    reuse_span = {}
+    for i, n in enumerate(nodes):
+        if n.reuse_group is not None:
+            reuse_span[n.reuse_group] = (reuse_span.get(n.reuse_group, (i, i))[0], i)
+    is_in_reuse_span = np.zeros(len(nodes), dtype=bool)
+    for first, last in reuse_span.values():
+        is_in_reuse_span[first: last] = True
+
+    compare_points = set(compare_points)
+    remaining_compare_points = len(compare_points)
+    blocks = [[]]
+    block_compare_points = 0
+    prev_last_use = -1
+    for i, n in enumerate(nodes):
+        blocks[-1].append(n)
+        if n in compare_points:
+            block_compare_points += 1
+            remaining_compare_points -= 1
+        is_cut = (prev_last_use <= i and last_use[i] > i and n not in output_nodes and not is_in_reuse_span[i] and
+                  len({e.source_index for e in graph.out_edges(n)}) == 1)
+        prev_last_use = max(prev_last_use, last_use[i])
+        if (is_cut and block_compare_points >= compare_points_per_block and
+                remaining_compare_points >= compare_points_per_block):
+            blocks.append([])
+            block_compare_points = 0
+
+    return blocks
+
+
+def get_block_graph(graph: Graph,
+                    block_nodes: List[BaseNode],
+                    prev_block_output: Optional[BaseNode],
+                    is_last_block: bool,
+                    fw_impl: GPTQFrameworkImplemantation) -> Graph:
+    """
+    Build a graph of a block (see get_gptq_blocks).
+    The input of a block (except for the first one) is replaced by an input node with the name and the activation
+    quantization configuration of the previous block output node. The output of a block (except for the last one)
+    is its last node.
+
+    Args:
+        graph: Graph the block was taken from.
+        block_nodes: Block nodes sorted topologically.
+        prev_block_output: Output node of the previous block, or None for the first block.
+        is_last_block: Whether the block is the last block of the graph.
+        fw_impl: GPTQ framework implementation.
+
+    Returns:
+        The block graph.
+    """
+    block_nodes_set = set(block_nodes)
+    nodes = list(block_nodes)
+    edges = [e for n in block_nodes for e in graph.out_edges(n) if e.sink_node in block_nodes_set]
+
+    if prev_block_output is None:
+        input_nodes = [n for n in graph.get_inputs() if n in block_nodes_set]
+        user_info = copy.deepcopy(graph.user_info)
+    else:
+        prev_out_edges = graph.out_edges(prev_block_output)
+        input_node = fw_impl.get_block_input_node(
+            prev_block_output.name, prev_block_output.get_output_shapes_list()[prev_out_edges[0].source_index])
+        # The block input is the quantized output of the previous block, thus it is quantized by the same quantizer
+        # (which doesn't change it).
+        quant_source_node = graph.retrieve_preserved_quantization_node(prev_block_output)
+        input_node.quantization_cfg = copy.deepcopy(quant_source_node.quantization_cfg)
+        input_node.final_activation_quantization_cfg = \
+            copy.deepcopy(quant_source_node.final_activation_quantization_cfg)
+        input_node.final_weights_quantization_cfg = \
+            copy.deepcopy(prev_block_output.final_weights_quantization_cfg)
+        nodes.insert(0, input_node)
+        edges += [Edge(input_node, e.sink_node, 0, e.sink_index) for e in prev_out_edges]
+        input_nodes = [input_node]
+        # the input scale is only applied to the model inputs
+        user_info = UserInformation()
+
+    if is_last_block:
+        outputs = graph.get_outputs()
+    else:
+        block_out_edge = graph.out_edges(block_nodes[-1])[0]
+        outputs = [OutTensor(block_nodes[-1], block_out_edge.source_index)]
+
+    block_graph = Graph(graph.name, nodes, input_nodes, outputs, edges)
+    block_graph.set_fqc(graph.fqc)
+    block_graph.user_info = user_info
+    return block_graph
+
+
+class BlockInputsCache:
+    """
+    Inputs of a block for a fixed set of samples. The inputs are appended batch by batch and yielded in the same
+    batches. They are kept in host memory until their total size exceeds a limit, and in memory-mapped files
+    afterwards.
+    """
+
+    def __init__(self,
+                 max_host_memory: int,
+                 cache_dir: Optional[str] = None):
+        """
+        Args:
+            max_host_memory: Maximal size (in bytes) of the inputs to keep in host memory.
+            cache_dir: Directory to create the memory-mapped files in. If None, the default temporary directory is
+              used.
+        """
+        self.max_host_memory = max_host_memory
+        self.cache_dir = cache_dir
+        self.batches: List[List[np.ndarray]] = []
+        self.batch_sizes: List[int] = []
+        self.nbytes = 0
+        self._memmap_dir = None
+        self._memmap_specs = None
+        self._memmaps = None
+        self._finalizer = None
+
+    @property
+    def is_memmap(self) -> bool:
+        """ Whether the inputs are stored in memory-mapped files. """
+        return self._memmap_dir is not None
+
+    def append(self, batch: List[np.ndarray]):
+        """
+        Append a batch of inputs.
+
+        Args:
+            batch: The batch of each input.
+        """
+        self.nbytes += sum(x.nbytes for x in batch)
+        self.batch_sizes.append(batch[0].shape[0])
+        if not self.is_memmap and self.nbytes > self.max_host_memory:
+            # Move the inputs to files, which are appended sequentially and mapped once all inputs are written.
+            self._memmap_dir = tempfile.mkdtemp(prefix='gptq_block_inputs_', dir=self.cache_dir)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._memmap_dir, ignore_errors=True)
+            self._memmap_specs = [(x.dtype, x.shape[1:]) for x in batch]
+            host_batches, self.batches = self.batches, []
+            for host_batch in host_batches:
+                self._write(host_batch)
+        if self.is_memmap:
+            self._write(batch)
+        else:
+            self.batches.append(batch)
+
+    def _write(self, batch: List[np.ndarray]):
+        """
+        Append a batch to the inputs files.
+
+        Args:
+            batch: The batch of each input.
+        """
+        self._memmaps = None
+        for i, x in enumerate(batch):
+            with open(self._get_input_path(i), 'ab') as f:
+                f.write(np.ascontiguousarray(x).tobytes())
+
+    def _get_input_path(self, input_index: int) -> str:
+        """ Returns: Path of the file of an input. """
+        return os.path.join(self._memmap_dir, f'input_{input_index}.dat')
+
+    def data_gen(self) -> Generator[List[np.ndarray], None, None]:
+        """
+        Yield the batches of the inputs (as in a representative dataset). The batches of memory-mapped inputs are
+        views of the files, so they are read from the disk only when used.
+        """
+        if not self.is_memmap:
+            yield from self.batches
+            return
+        if self._memmaps is None:
+            n_samples = sum(self.batch_sizes)
+            self._memmaps = [np.memmap(self._get_input_path(i), dtype=dtype, mode='c', shape=(n_samples, *shape))
+                             for i, (dtype, shape) in enumerate(self._memmap_specs)]
+        start = 0
+        for batch_size in self.batch_sizes:
+            yield [x[start: start + batch_size] for x in self._memmaps]
+            start += batch_size
+
+    def close(self):
+        """
+        Release the inputs and remove the memory-mapped files (if any).
+        """
+        self.batches = []
+        self._memmaps = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def _compute_block_outputs(fw_impl: GPTQFrameworkImplemantation,
+                           block_graph: Graph,
+                           mode: ModelBuilderMode,
+                           block_inputs: BlockInputsCache,
+                           config: Any) -> BlockInputsCache:
+    """
+    Run a block model and cache its outputs, as the inputs of the next block.
+
+    Args:
+        fw_impl: GPTQ framework implementation.
+        block_graph: Block graph.
+        mode: Mode to build the block model in.
+        block_inputs: Inputs of the block.
+        config: Block-wise GPTQ configuration.
+
+    Returns:
+        Cache of the block outputs.
+    """
+    out_node = block_graph.get_outputs()[0].node
+    model, user_info = fw_impl.model_builder(block_graph, mode=mode, append2output=[out_node])
+    outputs_cache = BlockInputsCache(config.max_host_memory, config.cache_dir)
+    for batch in block_inputs.data_gen():
+        outputs = fw_impl.run_model_inference(model, [x * user_info.input_scale for x in batch])
+        outputs = outputs if isinstance(outputs, (list, tuple)) else [outputs]
+        outputs_cache.append([fw_impl.to_numpy(y) for y in outputs])
+    return outputs_cache
+
+
+def blockwise_gptq_training(graph_float: Graph,
+                            graph_quant: Graph,
+                            gptq_config: GradientPTQConfig,
+                            representative_data_gen: Callable,
+                            fw_impl: GPTQFrameworkImplemantation) -> Graph:
+    """
+    Block-wise GPTQ: partition the graphs into sequential blocks (see get_gptq_blocks) and optimize the blocks one at
+    a time. Each block's quantized model is trained on the outputs of the previous (already optimized) quantized
+    blocks, to reconstruct the outputs of its float model on the outputs of the previous float blocks. The inputs of
+    each block are cached, and the float outputs are cached by the GPTQ trainer (using the float outputs cache
+    configuration, or the default one). Hessian scores are computed for each block w.r.t. the block outputs.
+
+    Args:
+        graph_float: Graph to build a float networks from.
+        graph_quant: Graph to build a quantized networks from.
+        gptq_config: GradientPTQConfig with parameters about the tuning process (including the block-wise
+          configuration).
+        representative_data_gen: Dataset to use for inputs of the models.
+        fw_impl: Framework implementation.
+
+    Returns:
+        Quantized graph for export.
+    """
+    if not fw_impl.supports_blockwise_gptq():
+        Logger.critical(f'Block-wise GPTQ is not supported for {fw_impl.__class__.__name__}.')
+
+    blockwise_config = gptq_config.blockwise_config
+    compare_points, _, _, _ = get_compare_points(graph_float)
+    blocks = get_gptq_blocks(graph_float, compare_points, blockwise_config.compare_points_per_block)
+    Logger.info(f'Running block-wise GPTQ on {len(blocks)} blocks.')
+
+    # The float model of a block (except for the first one) runs on different inputs than the quantized model,
+    # so its outputs are precomputed.
+    block_gptq_config = dataclasses.replace(
+        gptq_config,
+        float_outputs_cache_config=gptq_config.float_outputs_cache_config or GPTQFloatOutputsCacheConfig(),
+        blockwise_config=None)
+    trainer_cls = fw_impl.get_gptq_trainer_obj()
+
+    graph_quant = copy.deepcopy(graph_quant)
+    quant_nodes = {n.name: n for n in graph_quant.nodes}
+
+    # The representative dataset is read once, so that all blocks (and the float and quantized models of each
+    # block) run on the same samples, even if the dataset is shuffled or random.
+    model_inputs = BlockInputsCache(blockwise_config.max_host_memory, blockwise_config.cache_dir)
+    for batch in representative_data_gen():
+        model_inputs.append([fw_impl.to_numpy(x) for x in batch])
+
+    quant_inputs = float_inputs = model_inputs
+    prev_block_output = None
+    for i, block_nodes in enumerate(blocks):
+        is_last_block = i == len(blocks) - 1
+        float_block_graph = get_block_graph(graph_float, block_nodes, prev_block_output, is_last_block, fw_impl)
+        quant_block_graph = get_block_graph(graph_quant, [quant_nodes[n.name] for n in block_nodes],
+                                            None if prev_block_output is None else quant_nodes[prev_block_output.name],
+                                            is_last_block, fw_impl)
+        hessian_info_service = None
+        if gptq_config.hessian_weights_config:
+            hessian_info_service = HessianInfoService(graph=float_block_graph, fw_impl=fw_impl)
+
+        Logger.info(f'Running GPTQ on block {i + 1}/{len(blocks)} with {len(block_nodes)} nodes.')
+        # The float model inputs (used for the float outputs and the Hessians) are passed separately only if they
+        # differ from the quantized model inputs.
+        trainer = trainer_cls(float_block_graph,
+                              quant_block_graph,
+                              block_gptq_config,
+                              fw_impl,
+                              quant_inputs.data_gen,
+                              hessian_info_service=hessian_info_service,
+                              float_representative_data_gen=None if float_inputs is quant_inputs
+                              else float_inputs.data_gen)
+        trainer.train()
+        updated_block_graph = trainer.update_graph()
+        del trainer
+
+        block_input_nodes = set(updated_block_graph.get_inputs()) if prev_block_output is not None else set()
+        for n in updated_block_graph.nodes:
+            if n not in block_input_nodes:
+                quant_node = quant_nodes[n.name]
+                quant_node.weights = n.weights
+                quant_node.final_weights_quantization_cfg = n.final_weights_quantization_cfg
+                quant_node.final_activation_quantization_cfg = n.final_activation_quantization_cfg
+
+        if not is_last_block:
+            # Cache the inputs of the next block, and release the inputs of this block.
+            next_float_inputs = _compute_block_outputs(fw_impl, float_block_graph, ModelBuilderMode.FLOAT,
+                                                       float_inputs, blockwise_config)
+            next_quant_inputs = _compute_block_outputs(fw_impl, updated_block_graph, ModelBuilderMode.QUANTIZED,
+                                                       quant_inputs, blockwise_config)
+            float_inputs.close()
+            quant_inputs.close()
+            float_inputs, quant_inputs = next_float_inputs, next_quant_inputs
+            prev_block_output = block_nodes[-1]
+
+    float_inputs.close()
+    quant_inputs.close()
+    return graph_quant
@@ -0,0 +1,176 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import shutil
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from model_compression_toolkit.gptq.common.gptq_config import GPTQFloatOutputsCacheConfig
+from model_compression_toolkit.logger import Logger
+
+
+class FloatOutputsCacheStorage(Enum):
+    """
+    Storage of the float outputs cache.
+
+    DEVICE: tensors on the working device.
+    HOST: host memory.
+    MEMMAP: memory-mapped files.
+    """
+    DEVICE = 0
+    HOST = 1
+    MEMMAP = 2
+
+
+def get_float_outputs_cache_storage(cache_size: int,
+                                    cache_config: GPTQFloatOutputsCacheConfig) -> FloatOutputsCacheStorage:
+    """
+    Select the storage for the float outputs cache by its size.
+
+    Args:
+        cache_size: cache size in bytes.
+        cache_config: float outputs cache configuration.
+
+    Returns:
+        The cache storage.
+    """
+    if cache_size <= cache_config.max_device_memory:
+        return FloatOutputsCacheStorage.DEVICE
+    if cache_size <= cache_config.max_host_memory:
+        return FloatOutputsCacheStorage.HOST
+    return FloatOutputsCacheStorage.MEMMAP
+
+
+class FloatOutputsCache(ABC):
+    """
+    Float model outputs at the GPTQ compare points for a fixed set of samples.
+    The outputs are computed once, stored on the working device, in host memory or in memory-mapped files
+    (depending on their total size), and are retrieved by the samples indices during the training.
+    """
+
+    def __init__(self,
+                 float_model: Callable,
+                 samples: Sequence[Sequence[Any]],
+                 batch_size: int,
+                 input_scale: float,
+                 cache_config: GPTQFloatOutputsCacheConfig):
+        """
+        Args:
+            float_model: float model with the compare points outputs.
+            samples: samples to compute the outputs for. Each sample is a sequence of the model inputs.
+            batch_size: batch size for running the float model.
+            input_scale: scale of the model inputs.
+            cache_config: float outputs cache configuration.
+        """
+        self.storage = None
+        self.outputs = []
+        self._memmap_dir = None
+        n_samples = len(samples)
+
+        for start in range(0, n_samples, batch_size):
+            inputs = [x * input_scale for x in self._stack_samples(samples[start: start + batch_size])]
+            y_float = self._run_float_model(float_model, inputs)
+            if self.storage is None:
+                sample_size = sum(self._get_sample_nbytes(y) for y in y_float)
+                self.storage = get_float_outputs_cache_storage(sample_size * n_samples, cache_config)
+                self.outputs = [self._allocate(i, (n_samples, *y.shape[1:]), y, cache_config)
+                                for i, y in enumerate(y_float)]
+            for out, y in zip(self.outputs, y_float):
+                if self.storage == FloatOutputsCacheStorage.MEMMAP:
+                    out[start: start + y.shape[0]] = self._to_numpy(y)
+                else:
+                    self._write(out, start, y)
+
+        self.outputs = [self._finalize(out) for out in self.outputs]
+        Logger.info(f'Cached float outputs of {len(self.outputs)} compare points for {n_samples} samples '
+                    f'in {self.storage.name.lower()} storage.')
+
+    def _allocate(self, index: int, shape: Tuple[int, ...], y: Any, cache_config: GPTQFloatOutputsCacheConfig) -> Any:
+        """
+        Allocate the cache of a compare point.
+
+        Args:
+            index: index of the compare point.
+            shape: shape of the cache.
+            y: a batch of the compare point outputs.
+            cache_config: float outputs cache configuration.
+
+        Returns:
+            The allocated cache.
+        """
+        if self.storage != FloatOutputsCacheStorage.MEMMAP:
+            return self._allocate_tensor(shape, y)
+
+        if self._memmap_dir is None:
+            self._memmap_dir = tempfile.mkdtemp(prefix='gptq_float_outputs_', dir=cache_config.cache_dir)
+            weakref.finalize(self, shutil.rmtree, self._memmap_dir, ignore_errors=True)
+        return np.memmap(os.path.join(self._memmap_dir, f'output_{index}.dat'), dtype=self._to_numpy(y).dtype,
+                         mode='w+', shape=shape)
+
+    def __len__(self):
+        """ Get the number of cached samples. """
+        return len(self.outputs[0]) if self.outputs else 0
+
+    @abstractmethod
+    def __getitem__(self, indices: Any) -> List[Any]:
+        """
+        Retrieve the float outputs of samples.
+
+        Args:
+            indices: 1d tensor of the samples indices.
+
+        Returns:
+            A list of the outputs batch of each compare point, on the working device.
+        """
+        raise NotImplementedError()    # pragma: no cover
+
+    @abstractmethod
+    def _stack_samples(self, samples: Sequence[Sequence[Any]]) -> List[Any]:
+        """ Stack samples into a batch per model input. """
+        raise NotImplementedError()    # pragma: no cover
+
+    @abstractmethod
+    def _run_float_model(self, float_model: Callable, inputs: List[Any]) -> List[Any]:
+        """ Run the float model (without gradients) and return its outputs. """
+        raise NotImplementedError()    # pragma: no cover
+
+    @abstractmethod
+    def _get_sample_nbytes(self, y: Any) -> int:
+        """ Get the size in bytes of a single sample of an outputs batch. """
+        raise NotImplementedError()    # pragma: no cover
+
+    @abstractmethod
+    def _to_numpy(self, y: Any) -> np.ndarray:
+        """ Convert an outputs batch to numpy. """
+        raise NotImplementedError()    # pragma: no cover
+
+    @abstractmethod
+    def _allocate_tensor(self, shape: Tuple[int, ...], y: Any) -> Any:
+        """ Allocate a device or host cache of a compare point. """
+        raise NotImplementedError()    # pragma: no cover
+
+    @abstractmethod
+    def _write(self, out: Any, start: int, y: Any):
+        """ Write an outputs batch into a device or host cache of a compare point. """
+        raise NotImplementedError()    # pragma: no cover
+
+    def _finalize(self, out: Any) -> Any:
+        """ Finalize the cache of a compare point after all outputs were written. """
+        return out
@@ -14,9 +14,14 @@
 # ==============================================================================
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Any, Dict, Optional
+from typing import Callable, Any, Dict, Optional, TYPE_CHECKING
 
 from model_compression_toolkit.constants import ACT_HESSIAN_DEFAULT_BATCH_SIZE
+from model_compression_toolkit.gptq.common.gptq_constants import FLOAT_OUTPUTS_CACHE_MAX_DEVICE_MEMORY, \
+    FLOAT_OUTPUTS_CACHE_MAX_HOST_MEMORY, BLOCKWISE_COMPARE_POINTS_PER_BLOCK, BLOCKWISE_INPUTS_MAX_HOST_MEMORY
+
+if TYPE_CHECKING:    # pragma: no cover
+    import torch
 
 
 class RoundingType(Enum):
@@ -105,6 +110,48 @@ class GradualActivationQuantizationConfig:
     )
 
 
+@dataclass
+class GPTQFloatOutputsCacheConfig:
+    """
+    Configuration for caching the float model outputs at the compare points. The outputs are computed once per
+    sample before the training, instead of running the float model on each sample in every epoch.
+    Note that the samples are collected once from the representative dataset, so a representative dataset that
+    yields different samples in each pass (e.g. with random augmentations) will yield the same samples in all epochs.
+
+    Args:
+        max_device_memory (int): Maximal size of the cache (in bytes) to keep on the working device.
+        max_host_memory (int): Maximal size of the cache (in bytes) to keep in host memory. A larger cache is
+          stored in a memory-mapped file.
+        cache_dir (str|None): Directory to create the memory-mapped file in. If None, the default temporary
+          directory is used.
+    """
+    max_device_memory: int = FLOAT_OUTPUTS_CACHE_MAX_DEVICE_MEMORY
+    max_host_memory: int = FLOAT_OUTPUTS_CACHE_MAX_HOST_MEMORY
+    cache_dir: Optional[str] = None
+
+
+@dataclass
+class GPTQBlockwiseConfig:
+    """
+    Configuration for block-wise GPTQ. The graph is partitioned into sequential blocks, which are optimized
+    one at a time: each block's quantized model is trained on the outputs of the previous (already optimized)
+    quantized blocks to reconstruct the float model outputs of its compare points, so that only a single
+    block's models are held in memory at once. The inputs of the blocks are cached in host memory or in
+    memory-mapped files (depending on their size). Supported for PyTorch only.
+
+    Args:
+        compare_points_per_block (int): Minimal number of compare points (trainable layers) in a block. A block
+          is closed at the first point afterwards in which the graph can be split by a single tensor.
+        max_host_memory (int): Maximal size (in bytes) of the cached inputs of a block to keep in host memory.
+          Larger inputs are stored in memory-mapped files.
+        cache_dir (str|None): Directory to create the memory-mapped files in. If None, the default temporary
+          directory is used.
+    """
+    compare_points_per_block: int = BLOCKWISE_COMPARE_POINTS_PER_BLOCK
+    max_host_memory: int = BLOCKWISE_INPUTS_MAX_HOST_MEMORY
+    cache_dir: Optional[str] = None
+
+
 @dataclass
 class GradientPTQConfig:
     """
@@ -125,6 +172,14 @@ class GradientPTQConfig:
         optimizer_bias: Optimizer to override the rest optimizer for bias.
         log_function: Function to log information about the GPTQ process.
         gptq_quantizer_params_override: A dictionary of parameters to override in GPTQ quantizer instantiation.
+        float_outputs_cache_config: A configuration for caching the float model outputs. If None, the float model
+            is run on each sample in every epoch.
+        blockwise_config: A configuration for block-wise GPTQ (PyTorch only). If None, the whole model is trained at
+            once.
+        autocast_dtype: Data type (torch.bfloat16 or torch.float16) to run the forward passes of the quantized
+            model in during the training, using automatic mixed precision. The trainable parameters, the float model
+            outputs and the loss remain in float32. If None, the training runs in full precision. Supported for
+            PyTorch only.
     """
     n_epochs: int
     loss: Callable
@@ -139,3 +194,6 @@ class GradientPTQConfig:
     optimizer_bias: Any = None
     log_function: Callable = None
     gptq_quantizer_params_override: Dict[str, Any] = field(default_factory=dict)
+    float_outputs_cache_config: Optional[GPTQFloatOutputsCacheConfig] = None
+    blockwise_config: Optional[GPTQBlockwiseConfig] = None
+    autocast_dtype: Optional['torch.dtype'] = None
@@ -30,3 +30,14 @@ LR_DEFAULT = 3e-2
 LR_REST_DEFAULT = 1e-4
 LR_BIAS_DEFAULT = 1e-4
 GPTQ_MOMENTUM = 0.9
+
+# GPTQ float outputs cache default size limits (bytes)
+FLOAT_OUTPUTS_CACHE_MAX_DEVICE_MEMORY = 2 ** 30
+FLOAT_OUTPUTS_CACHE_MAX_HOST_MEMORY = 2 ** 33
+
+# Number of training steps between copies of the accumulated loss values from the device
+LOSS_FLUSH_STEPS = 50
+
+# Block-wise GPTQ defaults
+BLOCKWISE_COMPARE_POINTS_PER_BLOCK = 4
+BLOCKWISE_INPUTS_MAX_HOST_MEMORY = 2 ** 33
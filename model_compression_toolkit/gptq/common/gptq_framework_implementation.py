@@ -14,7 +14,9 @@
 # ==============================================================================
 
 from abc import abstractmethod
+from typing import Tuple
 
+from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
 
 
@@ -28,5 +30,25 @@ class GPTQFrameworkImplemantation(FrameworkImplementation):
         """
         Returns: GPTQTrainer object
         """
-        raise NotImplemented(f'{self.__class__.__name__} have to implement the '
-                             f'framework\'s get_gptq_trainer method.')  # pragma: no cover
\ No newline at end of file
+        raise NotImplementedError(f'{self.__class__.__name__} have to implement the '
+                                  f'framework\'s get_gptq_trainer method.')  # pragma: no cover
+
+    def supports_blockwise_gptq(self) -> bool:
+        """
+        Returns: Whether the framework supports block-wise GPTQ (see get_block_input_node).
+        """
+        return False
+
+    def get_block_input_node(self, name: str, output_shape: Tuple) -> BaseNode:
+        """
+        Create an input node for a block of a graph in block-wise GPTQ. Frameworks that support block-wise GPTQ
+        have to implement it.
+
+        Args:
+            name: name of the node.
+            output_shape: shape of the block input tensor (including the batch dimension).
+
+        Returns:
+            An input node.
+        """
+        raise NotImplementedError(f'{self.__class__.__name__} doesn\'t support block-wise GPTQ.')  # pragma: no cover
@@ -23,6 +23,7 @@ from model_compression_toolkit.core.common.framework_info import FrameworkInfo
 from model_compression_toolkit.core.common.hessian import HessianInfoService, HessianScoresRequest, HessianMode, \
     HessianScoresGranularity, hessian_info_utils as hessian_utils
 from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.gptq.common.blockwise_gptq import blockwise_gptq_training
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
 from model_compression_toolkit.gptq.common.gptq_constants import QUANT_PARAM_LEARNING_STR
 from model_compression_toolkit.gptq.common.gptq_framework_implementation import GPTQFrameworkImplemantation
@@ -45,7 +46,8 @@ class GPTQTrainer(ABC):
                  gptq_config: GradientPTQConfig,
                  fw_impl: GPTQFrameworkImplemantation,
                  representative_data_gen_fn: Callable[[], Generator],
-                 hessian_info_service: HessianInfoService = None):
+                 hessian_info_service: HessianInfoService = None,
+                 float_representative_data_gen_fn: Optional[Callable[[], Generator]] = None):
         """
         Build two models from a graph: A teacher network (float model) and a student network (quantized model).
         Use the dataset generator to pass images through the teacher and student networks to get intermediate
@@ -59,7 +61,15 @@ class GPTQTrainer(ABC):
             fw_impl: Framework implementation
             representative_data_gen_fn: factory for representative data generator.
             hessian_info_service: HessianInfoService for fetching and computing Hessian-approximation information.
+            float_representative_data_gen_fn: factory for the float model data generator, if its inputs differ from
+              the quantized model inputs (yielding the same samples in the same order). The float outputs and the
+              Hessian scores are computed on it. Requires a float outputs cache configuration. If None, both models
+              run on the representative dataset.
         """
+        if float_representative_data_gen_fn is not None and gptq_config.float_outputs_cache_config is None:
+            Logger.critical('A float outputs cache configuration is required for running the float model on '
+                            'a separate representative dataset.')  # pragma: no cover
+        self.float_representative_data_gen_fn = float_representative_data_gen_fn
         self.graph_float = copy.deepcopy(graph_float)
         self.graph_quant = copy.deepcopy(graph_quant)
         self.gptq_config = gptq_config
@@ -213,7 +223,11 @@ class GPTQTrainer(ABC):
             return mean_approx_scores
 
         # Reduce unnecessary dims, should remain with one dimension for the number of nodes
-        mean_approx_scores = np.squeeze(mean_approx_scores)
+        mean_approx_scores = np.squeeze(mean_approx_scores, axis=tuple(range(1, mean_approx_scores.ndim)))
+        if len(mean_approx_scores) == 1:
+            # The log-normalized scores are relative between the compare points, so a single compare point (e.g.
+            # in a block of block-wise GPTQ) gets a weight of 1.
+            return np.ones_like(mean_approx_scores)
         # Handle zero values to avoid log(0)
         mean_approx_scores = np.where(mean_approx_scores != 0, mean_approx_scores,
                                       np.partition(mean_approx_scores, 1)[1])
@@ -299,6 +313,14 @@ def gptq_training(graph_float: Graph,
         Quantized graph for export
 
     """
+    if gptq_config.blockwise_config is not None:
+        # Hessian scores are computed per block (w.r.t. the block outputs), so the hessian info service is not used.
+        return blockwise_gptq_training(graph_float,
+                                       graph_quant,
+                                       gptq_config,
+                                       representative_data_gen,
+                                       fw_impl)
+
     # Get GPTQ object and initialize it
     gptq_trainer_obj = fw_impl.get_gptq_trainer_obj()
 
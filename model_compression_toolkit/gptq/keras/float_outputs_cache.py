@@ -0,0 +1,66 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+import tensorflow as tf
+
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCache, FloatOutputsCacheStorage
+
+
+class KerasFloatOutputsCache(FloatOutputsCache):
+    """
+    Keras float model outputs cache (see FloatOutputsCache).
+    The outputs are written into numpy arrays, which are converted to tensors on the device for a device storage.
+    """
+
+    def __getitem__(self, indices: tf.Tensor) -> List[tf.Tensor]:
+        """
+        Retrieve the float outputs of samples.
+
+        Args:
+            indices: 1d tensor of the samples indices.
+
+        Returns:
+            A list of the outputs batch of each compare point.
+        """
+        if self.storage == FloatOutputsCacheStorage.DEVICE:
+            return [tf.gather(out, indices) for out in self.outputs]
+        indices = np.asarray(indices)
+        return [tf.convert_to_tensor(out[indices]) for out in self.outputs]
+
+    def _stack_samples(self, samples: Sequence[Sequence[tf.Tensor]]) -> List[tf.Tensor]:
+        return [tf.stack(inputs) for inputs in zip(*samples)]
+
+    def _run_float_model(self, float_model: Callable, inputs: List[tf.Tensor]) -> List[tf.Tensor]:
+        y_float = float_model(inputs)
+        return y_float if isinstance(y_float, (list, tuple)) else [y_float]
+
+    def _get_sample_nbytes(self, y: tf.Tensor) -> int:
+        return int(np.prod(y.shape[1:])) * y.dtype.size
+
+    def _to_numpy(self, y: tf.Tensor) -> np.ndarray:
+        return y.numpy()
+
+    def _allocate_tensor(self, shape: Tuple[int, ...], y: tf.Tensor) -> np.ndarray:
+        return np.empty(shape, dtype=y.dtype.as_numpy_dtype)
+
+    def _write(self, out: np.ndarray, start: int, y: tf.Tensor):
+        out[start: start + y.shape[0]] = y.numpy()
+
+    def _finalize(self, out: np.ndarray) -> tf.Tensor:
+        if self.storage == FloatOutputsCacheStorage.DEVICE:
+            return tf.convert_to_tensor(out)
+        return out
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Callable, List, Tuple, Union, Generator
+from typing import Callable, List, Tuple, Union, Generator, Sequence, Optional
 
 import tensorflow as tf
 from keras import Model
@@ -31,6 +31,7 @@ from model_compression_toolkit.gptq.common.gptq_graph import get_kernel_attribut
 from model_compression_toolkit.gptq.common.gradual_activation_quantization import \
     get_gradual_activation_quantizer_wrapper_factory
 from model_compression_toolkit.gptq.common.regularization_factory import get_regularization
+from model_compression_toolkit.gptq.keras.float_outputs_cache import KerasFloatOutputsCache
 from model_compression_toolkit.gptq.keras.quantizer.quantization_builder import quantization_builder
 from model_compression_toolkit.logger import Logger
 from mct_quantizers import KerasActivationQuantizationHolder
@@ -46,6 +47,7 @@ from model_compression_toolkit.trainable_infrastructure import KerasTrainableQua
 from model_compression_toolkit.core import common
 from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_constants import LOSS_FLUSH_STEPS
 from model_compression_toolkit.core.common import Graph
 from model_compression_toolkit.gptq.keras.graph_info import get_weights_for_loss, get_gptq_trainable_parameters
 from model_compression_toolkit.core.common.framework_info import FrameworkInfo
@@ -82,11 +84,15 @@ class KerasGPTQTrainer(GPTQTrainer):
             hessian_info_service: HessianScoresService for fetching and computing Hessian's approximation scores.
 
         """
+        if gptq_config.autocast_dtype is not None:    # pragma: no cover
+            Logger.critical("Autocast GPTQ training is not supported for Keras models.")
 
         self.fw_soft_quantizer_regularization = SoftQuantizerRegularization
         self.fw_linear_annealing_scheduler = KerasLinearAnnealingScheduler
         self.fw_get_gptq_trainable_parameters_fn = get_gptq_trainable_parameters
         self.fw_get_weights_for_loss_fn = get_weights_for_loss
+        # Set when building the train dataloader if float outputs caching is enabled
+        self.float_outputs_cache: Optional[KerasFloatOutputsCache] = None
 
         super().__init__(graph_float,
                          graph_quant,
@@ -136,15 +142,25 @@ class KerasGPTQTrainer(GPTQTrainer):
         assert hessians_tensor.shape[0] == len(self.compare_points)
         loss_weights = list(hessians_tensor.numpy())  # Convert to a list for compatibility
 
-        # Prepare final dataset with samples and loss weights
-        sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, loss_weights)
-
         # Calculate regularization weights as mean across samples
         reg_weights = tf.reduce_mean(hessians_tensor, axis=1)
 
-        # Define a collate function to add regularization weights to each batch
-        def collate_fn(samples_with_loss_weights):
-            return *samples_with_loss_weights, reg_weights
+        if self.gptq_config.float_outputs_cache_config:
+            self.float_outputs_cache = self._build_float_outputs_cache(fixed_dataset.samples, orig_batch_size)
+            # Prepare final dataset with samples, samples indices (to retrieve the cached outputs) and loss weights
+            sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples,
+                                                       [np.arange(len(fixed_dataset)), *loss_weights])
+
+            def collate_fn(samples_with_info):
+                samples, info = samples_with_info
+                return samples, info[0], info[1:], reg_weights
+        else:
+            # Prepare final dataset with samples and loss weights
+            sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, loss_weights)
+
+            # Define a collate function to add regularization weights to each batch
+            def collate_fn(samples_with_loss_weights):
+                return *samples_with_loss_weights, reg_weights
 
         # Create final dataset using the new dataloader with collate_fn
         final_dataset = create_tf_dataloader(
@@ -167,8 +183,9 @@ class KerasGPTQTrainer(GPTQTrainer):
         Returns:
             A `tf.data.Dataset` yielding samples with loss weights and regularization weights.
         """
-        # Step 1: Create a dataset from the generator
-        dataset = TFDatasetFromGenerator(data_gen_fn)
+        # Step 1: Create a dataset from the generator (the outputs are cached for fixed samples)
+        use_float_outputs_cache = self.gptq_config.float_outputs_cache_config is not None
+        dataset = FixedTFDataset(data_gen_fn) if use_float_outputs_cache else TFDatasetFromGenerator(data_gen_fn)
         num_nodes = len(self.compare_points)
 
         # Step 2: Compute loss weights
@@ -179,15 +196,24 @@ class KerasGPTQTrainer(GPTQTrainer):
         else:
             loss_weights = tf.ones(num_nodes, dtype=tf.float32) / num_nodes
 
-        # Step 3: Create a dataset with samples and loss weights
-        augmented_dataset = IterableSampleWithConstInfoDataset(dataset.tf_dataset, loss_weights)
-
-        # Step 4: Add constant regularization weights
+        # Step 3: Add constant regularization weights
         reg_weights = tf.ones(num_nodes, dtype=tf.float32)
 
-        def collate_fn(batch):
-            samples, loss_weights = batch
-            return samples, loss_weights, reg_weights
+        if use_float_outputs_cache:
+            self.float_outputs_cache = self._build_float_outputs_cache(dataset.samples, dataset.orig_batch_size)
+            # Step 4: Create a dataset with samples and samples indices (to retrieve the cached outputs)
+            augmented_dataset = FixedSampleInfoDataset(dataset.samples, [np.arange(len(dataset))])
+
+            def collate_fn(batch):
+                samples, (indices,) = batch
+                return samples, indices, loss_weights, reg_weights
+        else:
+            # Step 4: Create a dataset with samples and loss weights
+            augmented_dataset = IterableSampleWithConstInfoDataset(dataset.tf_dataset, loss_weights)
+
+            def collate_fn(batch):
+                samples, loss_weights = batch
+                return samples, loss_weights, reg_weights
 
         # Step 5: Create a tf.data.Dataset with collate_fn
         train_dataloader = create_tf_dataloader(augmented_dataset,
@@ -196,6 +222,20 @@ class KerasGPTQTrainer(GPTQTrainer):
 
         return train_dataloader
 
+    def _build_float_outputs_cache(self, samples: Sequence, batch_size: int) -> KerasFloatOutputsCache:
+        """
+        Compute the float model outputs at the compare points for the train samples.
+
+        Args:
+            samples: train samples.
+            batch_size: batch size for running the float model.
+
+        Returns:
+            Float outputs cache.
+        """
+        return KerasFloatOutputsCache(self.float_model, samples, batch_size, self.input_scale,
+                                      self.gptq_config.float_outputs_cache_config)
+
     def _is_gptq_weights_trainable(self,
                                    node: common.BaseNode) -> bool:
         """
@@ -342,7 +382,8 @@ class KerasGPTQTrainer(GPTQTrainer):
                            in_optimizer_with_param,
                            is_training,
                            distill_loss_weights,
-                           reg_weights):
+                           reg_weights,
+                           y_float=None):
         """
         This function run part of the training step, wrapped by a tf.function for acceleration.
         Args:
@@ -350,14 +391,16 @@ class KerasGPTQTrainer(GPTQTrainer):
             in_compute_gradients: A callable function that compute the gradients.
             in_optimizer_with_param: A list of optimizer classes to update with the corresponding parameters.
             is_training: A boolean flag stating if the network is running in training mode.
+            y_float: Cached float model outputs for the step. If None, the float model is run on the input data.
 
         Returns:
             loss value and gradients
 
         """
 
-        # run float model
-        y_float = self.float_model(input_data)
+        if y_float is None:
+            # run float model
+            y_float = self.float_model(input_data)
         # rung quantized model and calculate loss & gradients
         loss_value_step, grads = in_compute_gradients(y_float,
                                                       input_data,
@@ -383,12 +426,20 @@ class KerasGPTQTrainer(GPTQTrainer):
         Returns: None
 
         """
+        # Loss values are accumulated on the device and copied to the host every LOSS_FLUSH_STEPS steps, to avoid
+        # synchronizing the device in each step.
+        losses = []
         with tqdm(range(n_epochs), "Running GPTQ optimization") as epochs_pbar:
             for _ in epochs_pbar:
                 with tqdm(self.train_dataloader, position=1, leave=False) as data_pbar:
                     for data in data_pbar:
 
-                        input_data, distill_loss_weights, reg_weight = data
+                        if self.float_outputs_cache is None:
+                            input_data, distill_loss_weights, reg_weight = data
+                            y_float = None
+                        else:
+                            input_data, indices, distill_loss_weights, reg_weight = data
+                            y_float = self.float_outputs_cache[indices]
 
                         input_data = [d * self.input_scale for d in input_data]
 
@@ -397,7 +448,8 @@ class KerasGPTQTrainer(GPTQTrainer):
                                                                          in_optimizer_with_param,
                                                                          is_training,
                                                                          distill_loss_weights,
-                                                                         reg_weight)
+                                                                         reg_weight,
+                                                                         y_float)
                         # Run one step of gradient descent by updating
                         # the value of the variables to minimize the loss.
                         for i, (o, p) in enumerate(in_optimizer_with_param):
@@ -405,8 +457,22 @@ class KerasGPTQTrainer(GPTQTrainer):
                         if self.gptq_config.log_function is not None:
                             self.gptq_config.log_function(loss_value_step, grads[0], in_optimizer_with_param[0][-1],
                                                           self.compare_points)
-                        self.loss_list.append(loss_value_step.numpy())
-                        Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                        losses.append(loss_value_step)
+                        if len(losses) == LOSS_FLUSH_STEPS:
+                            self._flush_losses(losses)
+                            losses = []
+        self._flush_losses(losses)
+
+    def _flush_losses(self, losses: List[tf.Tensor]):
+        """
+        Copy accumulated loss values to the host and append them to the loss list.
+
+        Args:
+            losses: loss values accumulated since the last flush.
+        """
+        if losses:
+            self.loss_list.extend(tf.stack(losses).numpy())
+            Logger.debug(f'last loss value: {self.loss_list[-1]}')
 
     def update_graph(self):
         """
@@ -29,7 +29,7 @@ from model_compression_toolkit.target_platform_capabilities.tpc_io_handler impor
 from model_compression_toolkit.verify_packages import FOUND_TF
 from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig, GPTQHessianScoresConfig, \
-    GradualActivationQuantizationConfig
+    GradualActivationQuantizationConfig, GPTQFloatOutputsCacheConfig
 from model_compression_toolkit.core.common.mixed_precision.resource_utilization_tools.resource_utilization import ResourceUtilization
 from model_compression_toolkit.core.common.mixed_precision.mixed_precision_quantization_config import MixedPrecisionQuantizationConfig
 from model_compression_toolkit.core import CoreConfig
@@ -69,7 +69,8 @@ if FOUND_TF:
                               regularization_factor: float = None,
                               hessian_batch_size: int = ACT_HESSIAN_DEFAULT_BATCH_SIZE,
                               use_hessian_sample_attention: bool = True,
-                              gradual_activation_quantization: Union[bool, GradualActivationQuantizationConfig] = True) -> GradientPTQConfig:
+                              gradual_activation_quantization: Union[bool, GradualActivationQuantizationConfig] = True,
+                              float_outputs_cache: Union[bool, GPTQFloatOutputsCacheConfig] = False) -> GradientPTQConfig:
         """
         Create a GradientPTQConfig instance for Keras models.
 
@@ -84,6 +85,7 @@ if FOUND_TF:
             hessian_batch_size (int): Batch size for Hessian computation in Hessian-based weights GPTQ.
             use_hessian_sample_attention (bool): whether to use Sample-Layer Attention score for weighted loss.
             gradual_activation_quantization (bool, GradualActivationQuantizationConfig): If False, GradualActivationQuantization is disabled. If True, GradualActivationQuantization is enabled with the default settings. GradualActivationQuantizationConfig object can be passed to use non-default settings.
+            float_outputs_cache (bool, GPTQFloatOutputsCacheConfig): If True, the float model outputs are computed once per sample before the training and cached (on the working device, in host memory or in a memory-mapped file, by their size) with the default settings. GPTQFloatOutputsCacheConfig object can be passed to use non-default settings. Note that caching fixes the samples of the representative dataset for all epochs.
 
         returns:
             a GradientPTQConfig object to use when fine-tuning the quantized model using gptq.
@@ -139,6 +141,14 @@ if FOUND_TF:
             raise TypeError(f'gradual_activation_quantization argument should be bool or '
                             f'GradualActivationQuantizationConfig, received {type(gradual_activation_quantization)}')
 
+        if isinstance(float_outputs_cache, bool):
+            float_outputs_cache_config = GPTQFloatOutputsCacheConfig() if float_outputs_cache else None
+        elif isinstance(float_outputs_cache, GPTQFloatOutputsCacheConfig):
+            float_outputs_cache_config = float_outputs_cache
+        else:
+            raise TypeError(f'float_outputs_cache argument should be bool or '
+                            f'GPTQFloatOutputsCacheConfig, received {type(float_outputs_cache)}')
+
         return GradientPTQConfig(n_epochs=n_epochs,
                                  optimizer=optimizer,
                                  optimizer_rest=optimizer_rest,
@@ -148,7 +158,8 @@ if FOUND_TF:
                                  optimizer_bias=bias_optimizer,
                                  regularization_factor=regularization_factor,
                                  hessian_weights_config=hessian_weights_config,
-                                 gradual_activation_quantization_config=gradual_quant_config)
+                                 gradual_activation_quantization_config=gradual_quant_config,
+                                 float_outputs_cache_config=float_outputs_cache_config)
 
 
     @set_keras_info
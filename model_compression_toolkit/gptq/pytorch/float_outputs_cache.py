@@ -0,0 +1,67 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Any, Callable, List, Sequence, Tuple
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, torch_tensor_to_numpy
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCache, FloatOutputsCacheStorage
+
+
+class PytorchFloatOutputsCache(FloatOutputsCache):
+    """
+    Pytorch float model outputs cache (see FloatOutputsCache).
+    """
+
+    def __getitem__(self, indices: torch.Tensor) -> List[torch.Tensor]:
+        """
+        Retrieve the float outputs of samples.
+
+        Args:
+            indices: 1d tensor of the samples indices.
+
+        Returns:
+            A list of the outputs batch of each compare point, on the working device.
+        """
+        if self.storage == FloatOutputsCacheStorage.DEVICE:
+            return [out[indices.to(out.device)] for out in self.outputs]
+        if self.storage == FloatOutputsCacheStorage.HOST:
+            indices = indices.cpu()
+            return [out[indices].to(get_working_device(), non_blocking=True) for out in self.outputs]
+        indices = indices.cpu().numpy()
+        return [torch.from_numpy(np.asarray(out[indices])).to(get_working_device()) for out in self.outputs]
+
+    def _stack_samples(self, samples: Sequence[Sequence[torch.Tensor]]) -> List[torch.Tensor]:
+        return to_torch_tensor([torch.stack(inputs) for inputs in zip(*samples)])
+
+    def _run_float_model(self, float_model: Callable, inputs: List[torch.Tensor]) -> List[torch.Tensor]:
+        with torch.no_grad():
+            return float_model(inputs)
+
+    def _get_sample_nbytes(self, y: torch.Tensor) -> int:
+        return y[0].numel() * y.element_size()
+
+    def _to_numpy(self, y: torch.Tensor) -> np.ndarray:
+        return torch_tensor_to_numpy(y)
+
+    def _allocate_tensor(self, shape: Tuple[int, ...], y: torch.Tensor) -> torch.Tensor:
+        device = y.device if self.storage == FloatOutputsCacheStorage.DEVICE else 'cpu'
+        return torch.empty(shape, dtype=y.dtype, device=device,
+                           pin_memory=self.storage == FloatOutputsCacheStorage.HOST and torch.cuda.is_available())
+
+    def _write(self, out: torch.Tensor, start: int, y: torch.Tensor):
+        out[start: start + y.shape[0]] = y
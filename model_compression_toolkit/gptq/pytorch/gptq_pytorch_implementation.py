@@ -13,9 +13,11 @@
 # limitations under the License.
 # ==============================================================================
 
-from typing import Type
+from typing import Type, Tuple
 
+from model_compression_toolkit.core.common import BaseNode
 from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.reader.node_holders import DummyPlaceHolder
 from model_compression_toolkit.gptq.common.gptq_framework_implementation import GPTQFrameworkImplemantation
 from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
 
@@ -26,4 +28,23 @@ class GPTQPytorchImplemantation(GPTQFrameworkImplemantation, PytorchImplementati
         """
         Returns:  Pytorch object of GPTQTrainer
         """
-        return PytorchGPTQTrainer
\ No newline at end of file
+        return PytorchGPTQTrainer
+
+    def supports_blockwise_gptq(self) -> bool:
+        """
+        Returns: Whether the framework supports block-wise GPTQ.
+        """
+        return True
+
+    def get_block_input_node(self, name: str, output_shape: Tuple) -> BaseNode:
+        """
+        Create an input node for a block of a graph in block-wise GPTQ.
+
+        Args:
+            name: name of the node.
+            output_shape: shape of the block input tensor (including the batch dimension).
+
+        Returns:
+            An input node.
+        """
+        return BaseNode(name, {}, [], [list(output_shape)], {}, DummyPlaceHolder)
@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 import copy
-from typing import Callable, List, Tuple, Union, Generator
+from typing import Callable, List, Tuple, Union, Generator, Sequence, Optional
 
 import numpy as np
 import torch
@@ -28,12 +28,15 @@ from model_compression_toolkit.core.common.hessian import HessianInfoService, He
 
 from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PyTorchModelBuilder
 from model_compression_toolkit.core.pytorch.constants import BIAS
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
 from model_compression_toolkit.core.pytorch.data_util import FixedDatasetFromGenerator, IterableDatasetFromGenerator, \
     IterableSampleWithConstInfoDataset, FixedSampleInfoDataset, get_collate_fn_with_extra_outputs
 from model_compression_toolkit.core.pytorch.utils import to_torch_tensor, set_model, torch_tensor_to_numpy
 from model_compression_toolkit.gptq.common.gptq_config import GradientPTQConfig
+from model_compression_toolkit.gptq.common.gptq_constants import LOSS_FLUSH_STEPS
 from model_compression_toolkit.gptq.common.gptq_graph import get_kernel_attribute_name_for_gptq
 from model_compression_toolkit.gptq.common.gptq_training import GPTQTrainer
+from model_compression_toolkit.gptq.pytorch.float_outputs_cache import PytorchFloatOutputsCache
 from model_compression_toolkit.gptq.pytorch.graph_info import get_gptq_trainable_parameters, get_weights_for_loss
 from model_compression_toolkit.gptq.pytorch.quantizer.quantization_builder import quantization_builder
 
@@ -55,7 +58,8 @@ class PytorchGPTQTrainer(GPTQTrainer):
                  gptq_config: GradientPTQConfig,
                  fw_impl: FrameworkImplementation,
                  representative_data_gen: Callable,
-                 hessian_info_service: HessianInfoService = None):
+                 hessian_info_service: HessianInfoService = None,
+                 float_representative_data_gen: Optional[Callable] = None):
         """
         Build two models from a graph: A teacher network (float model) and a student network (quantized model).
         Use the dataset generator to pass images through the teacher and student networks to get intermediate
@@ -69,18 +73,23 @@ class PytorchGPTQTrainer(GPTQTrainer):
             fw_impl: FrameworkImplementation object with a specific framework methods implementation.
             representative_data_gen: Dataset to use for inputs of the models.
             hessian_info_service: HessianInfoService to fetch info based on the hessian approximation of the float model.
+            float_representative_data_gen: Dataset to use for inputs of the float model, if they differ from the
+              quantized model inputs (see GPTQTrainer).
         """
         self.fw_soft_quantizer_regularization = PytorchSoftQuantizerRegularization
         self.fw_linear_annealing_scheduler = PytorchLinearAnnealingScheduler
         self.fw_get_gptq_trainable_parameters_fn = get_gptq_trainable_parameters
         self.fw_get_weights_for_loss_fn = get_weights_for_loss
+        # Set when building the train dataloader if float outputs caching is enabled
+        self.float_outputs_cache: Optional[PytorchFloatOutputsCache] = None
 
         super().__init__(graph_float,
                          graph_quant,
                          gptq_config,
                          fw_impl,
                          representative_data_gen_fn=representative_data_gen,
-                         hessian_info_service=hessian_info_service)
+                         hessian_info_service=hessian_info_service,
+                         float_representative_data_gen_fn=float_representative_data_gen)
 
 
     def _prepare_train_dataloader_sla(self, data_gen_fn: Callable[[], Generator]) -> DataLoader:
@@ -96,8 +105,9 @@ class PytorchGPTQTrainer(GPTQTrainer):
         """
         fixed_dataset = FixedDatasetFromGenerator(data_gen_fn)
         orig_batch_size = fixed_dataset.orig_batch_size
-        # compute hessians for the whole dataset
-        hess_data_loader = DataLoader(fixed_dataset,
+        float_dataset = self._get_float_dataset(fixed_dataset)
+        # compute hessians (of the float model) for the whole dataset
+        hess_data_loader = DataLoader(float_dataset,
                                       batch_size=self.gptq_config.hessian_weights_config.hessian_batch_size,
                                       shuffle=False)
         request = self._build_hessian_request(granularity=HessianScoresGranularity.PER_OUTPUT_CHANNEL,
@@ -112,7 +122,13 @@ class PytorchGPTQTrainer(GPTQTrainer):
         hessians_tensor = torch.stack([layers_hessians[layer.name] for layer in self.compare_points], dim=1)    # samples X layers
         assert hessians_tensor.shape[1] == len(self.compare_points)
         loss_weights = list(hessians_tensor)
-        sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, loss_weights)
+        if self.gptq_config.float_outputs_cache_config:
+            self.float_outputs_cache = self._build_float_outputs_cache(float_dataset.samples, orig_batch_size)
+            # samples indices are used to retrieve the cached outputs
+            sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, torch.arange(len(fixed_dataset)),
+                                                       loss_weights)
+        else:
+            sla_train_dataset = FixedSampleInfoDataset(fixed_dataset.samples, loss_weights)
 
         reg_weights = hessians_tensor.mean(dim=0)
         # use collate to add a single value to each batch
@@ -131,27 +147,68 @@ class PytorchGPTQTrainer(GPTQTrainer):
             PyTorch dataloader yielding three outputs - samples, weights for the distillation loss and
               weights for regularization.
         """
-        dataset = IterableDatasetFromGenerator(data_gen_fn)
+        use_float_outputs_cache = self.gptq_config.float_outputs_cache_config is not None
+        # the outputs are cached for fixed samples
+        dataset = FixedDatasetFromGenerator(data_gen_fn) if use_float_outputs_cache \
+            else IterableDatasetFromGenerator(data_gen_fn)
+        float_dataset = self._get_float_dataset(dataset) if use_float_outputs_cache else dataset
         num_nodes = len(self.compare_points)
 
         if self.gptq_config.hessian_weights_config:
-            hess_dataloader = DataLoader(dataset, batch_size=self.gptq_config.hessian_weights_config.hessian_batch_size)
+            hess_dataloader = DataLoader(float_dataset,
+                                         batch_size=self.gptq_config.hessian_weights_config.hessian_batch_size)
             loss_weights = torch.from_numpy(self.compute_hessian_based_weights(hess_dataloader))
         else:
             loss_weights = torch.ones(num_nodes) / num_nodes
 
-        train_dataset = IterableSampleWithConstInfoDataset(dataset, loss_weights)
-
         reg_weights = torch.ones(num_nodes)
         # use collate to add a single value to each batch
         collate_fn = get_collate_fn_with_extra_outputs(reg_weights)
 
+        if use_float_outputs_cache:
+            self.float_outputs_cache = self._build_float_outputs_cache(float_dataset.samples, dataset.orig_batch_size)
+            # samples indices are used to retrieve the cached outputs
+            train_dataset = FixedSampleInfoDataset(dataset.samples, torch.arange(len(dataset)),
+                                                   [loss_weights] * len(dataset))
+            return DataLoader(train_dataset, batch_size=dataset.orig_batch_size, collate_fn=collate_fn)
+
+        train_dataset = IterableSampleWithConstInfoDataset(dataset, loss_weights)
+
         # NOTE: Don't just increase num_workers! With iterable dataset each worker fetches a full pass, so having
         # more workers will result in multiple passes within the same epoch. Special handling is needed either
         # in dataset or in worker_init_fn passed to dataloader, and it might not speed anything up anyway.
         return DataLoader(train_dataset, batch_size=dataset.orig_batch_size,
                           collate_fn=collate_fn, num_workers=1)
 
+    def _get_float_dataset(self, dataset: FixedDatasetFromGenerator) -> FixedDatasetFromGenerator:
+        """
+        Get the float model inputs of the train samples.
+
+        Args:
+            dataset: train dataset (of the quantized model inputs).
+
+        Returns:
+            A dataset of the float model inputs, in the same samples order.
+        """
+        if self.float_representative_data_gen_fn is None:
+            return dataset
+        return FixedDatasetFromGenerator(self.float_representative_data_gen_fn)
+
+    def _build_float_outputs_cache(self, samples: Sequence, batch_size: int) -> PytorchFloatOutputsCache:
+        """
+        Compute the float model outputs at the compare points for the train samples.
+
+        Args:
+            samples: float model inputs of the train samples.
+            batch_size: batch size for running the float model.
+
+        Returns:
+            Float outputs cache.
+        """
+        set_model(self.float_model, False)
+        return PytorchFloatOutputsCache(self.float_model, samples, batch_size, self.input_scale,
+                                        self.gptq_config.float_outputs_cache_config)
+
     def _is_gptq_weights_trainable(self,
                                    node: BaseNode) -> bool:
         """
@@ -262,11 +319,16 @@ class PytorchGPTQTrainer(GPTQTrainer):
             distill_loss_weights: Weights for the distillation loss.
             round_reg_weights: Weight for the rounding regularization loss.
         Returns:
-            Loss and gradients.
+            Loss and gradients. The gradients are only collected if a log function is configured (otherwise, an
+            empty list is returned), since copying them to the host synchronizes the device.
         """
 
-        # Forward-pass
-        y_fxp = self.fxp_model(input_tensors)
+        # Forward-pass. The float outputs are computed in full precision (also when cached), so only the fxp model
+        # runs in the autocast data type, and its outputs are cast back for computing the loss in full precision.
+        with self._autocast():
+            y_fxp = self.fxp_model(input_tensors)
+        if self.gptq_config.autocast_dtype is not None:
+            y_fxp = [y.float() for y in y_fxp]
 
         # Loss
         loss_value = self.gptq_config.loss(y_fxp,
@@ -285,12 +347,23 @@ class PytorchGPTQTrainer(GPTQTrainer):
 
         # Get gradients
         grads = []
-        for param in self.fxp_model.parameters():
-            if param.requires_grad and param.grad is not None:
-                grads.append(torch_tensor_to_numpy(param.grad))
+        if self.gptq_config.log_function is not None:
+            for param in self.fxp_model.parameters():
+                if param.requires_grad and param.grad is not None:
+                    grads.append(torch_tensor_to_numpy(param.grad))
 
         return loss_value, grads
 
+    def _autocast(self) -> torch.autocast:
+        """
+        Returns:
+            A context for running forward passes in the configured autocast data type. The context is disabled if
+            autocast is not configured.
+        """
+        return torch.autocast(device_type=get_working_device().type,
+                              dtype=self.gptq_config.autocast_dtype,
+                              enabled=self.gptq_config.autocast_dtype is not None)
+
     def micro_training_loop(self,
                             n_epochs: int):
         """
@@ -298,14 +371,24 @@ class PytorchGPTQTrainer(GPTQTrainer):
         Args:
             n_epochs: Number of update iterations of representative dataset.
         """
+        # Loss values are accumulated on the device and copied to the host every LOSS_FLUSH_STEPS steps, to avoid
+        # synchronizing the device in each step.
+        losses = []
+        pending_losses = None
         with tqdm(range(n_epochs), "Running GPTQ optimization") as epochs_pbar:
             for _ in epochs_pbar:
                 with tqdm(self.train_dataloader, position=1, leave=False) as data_pbar:
                     for sample in data_pbar:
-                        data, loss_weight, reg_weight = to_torch_tensor(sample)
-                        input_data = [d * self.input_scale for d in data]
-                        input_tensor = to_torch_tensor(input_data)
-                        y_float = self.float_model(input_tensor)  # running float model
+                        if self.float_outputs_cache is None:
+                            data, loss_weight, reg_weight = to_torch_tensor(sample)
+                            input_data = [d * self.input_scale for d in data]
+                            input_tensor = to_torch_tensor(input_data)
+                            y_float = self.float_model(input_tensor)  # running float model
+                        else:
+                            data, indices, loss_weight, reg_weight = sample
+                            data, loss_weight, reg_weight = to_torch_tensor([data, loss_weight, reg_weight])
+                            input_tensor = to_torch_tensor([d * self.input_scale for d in data])
+                            y_float = self.float_outputs_cache[indices]
                         loss_value, grads = self.compute_gradients(y_float, input_tensor, loss_weight, reg_weight)
                         # Run one step of gradient descent by updating the value of the variables to minimize the loss.
                         for (optimizer, _) in self.optimizer_with_param:
@@ -315,8 +398,45 @@ class PytorchGPTQTrainer(GPTQTrainer):
                             self.gptq_config.log_function(loss_value.item(),
                                                           torch_tensor_to_numpy(grads),
                                                           torch_tensor_to_numpy(self.optimizer_with_param[0][-1]))
-                        self.loss_list.append(loss_value.item())
-                        Logger.debug(f'last loss value: {self.loss_list[-1]}')
+                        losses.append(loss_value.detach())
+                        if len(losses) == LOSS_FLUSH_STEPS:
+                            pending_losses = self._flush_losses(losses, pending_losses)
+                            losses = []
+        pending_losses = self._flush_losses(losses, pending_losses)
+        self._flush_losses([], pending_losses)
+
+    def _flush_losses(self,
+                      losses: List[torch.Tensor],
+                      pending_losses: Optional[Tuple[torch.Tensor, Optional[torch.cuda.Event]]]
+                      ) -> Optional[Tuple[torch.Tensor, Optional[torch.cuda.Event]]]:
+        """
+        Start an asynchronous copy of accumulated loss values to the host, and append the values of the previous
+        copy (which has had time to complete) to the loss list.
+
+        Args:
+            losses: loss values (on the device) accumulated since the last flush.
+            pending_losses: the host tensor and the completion event of the previous copy, or None.
+
+        Returns:
+            The host tensor and the completion event of the new copy (None if there are no losses).
+        """
+        if pending_losses is not None:
+            host_losses, copy_done = pending_losses
+            if copy_done is not None:
+                copy_done.synchronize()
+            self.loss_list.extend(host_losses.tolist())
+            Logger.debug(f'last loss value: {self.loss_list[-1]}')
+
+        if not losses:
+            return None
+        losses = torch.stack(losses)
+        if losses.device.type != 'cuda':
+            return losses.cpu(), None
+        host_losses = torch.empty(losses.shape, dtype=losses.dtype, pin_memory=True)
+        host_losses.copy_(losses, non_blocking=True)
+        copy_done = torch.cuda.Event()
+        copy_done.record()
+        return host_losses, copy_done
 
     def update_graph(self) -> Graph:
         """
@@ -26,7 +26,7 @@ from model_compression_toolkit.core.common.user_info import UserInformation
 from model_compression_toolkit.core.common.visualization.tensorboard_writer import init_tensorboard_writer
 from model_compression_toolkit.core.runner import core_runner
 from model_compression_toolkit.gptq.common.gptq_config import (
-    GradientPTQConfig, GPTQHessianScoresConfig, GradualActivationQuantizationConfig)
+    GradientPTQConfig, GPTQHessianScoresConfig, GradualActivationQuantizationConfig, GPTQFloatOutputsCacheConfig, GPTQBlockwiseConfig)
 from model_compression_toolkit.gptq.common.gptq_constants import REG_DEFAULT, LR_DEFAULT, LR_REST_DEFAULT, \
     LR_BIAS_DEFAULT, GPTQ_MOMENTUM, REG_DEFAULT_SLA
 from model_compression_toolkit.gptq.runner import gptq_runner
@@ -64,6 +64,9 @@ if FOUND_TORCH:
                                 hessian_batch_size: int = ACT_HESSIAN_DEFAULT_BATCH_SIZE,
                                 use_hessian_sample_attention: bool = True,
                                 gradual_activation_quantization: Union[bool, GradualActivationQuantizationConfig] = True,
+                                float_outputs_cache: Union[bool, GPTQFloatOutputsCacheConfig] = False,
+                                blockwise: Union[bool, GPTQBlockwiseConfig] = False,
+                                autocast_dtype: Optional[torch.dtype] = None,
                                 ) -> GradientPTQConfig:
         """
         Create a GradientPTQConfig instance for Pytorch models.
@@ -79,6 +82,9 @@ if FOUND_TORCH:
             hessian_batch_size (int): Batch size for Hessian computation in Hessian-based weights GPTQ.
             use_hessian_sample_attention (bool): whether to use Sample-Layer Attention score for weighted loss.
             gradual_activation_quantization (bool, GradualActivationQuantizationConfig): If False, GradualActivationQuantization is disabled. If True, GradualActivationQuantization is enabled with the default settings. GradualActivationQuantizationConfig object can be passed to use non-default settings.
+            float_outputs_cache (bool, GPTQFloatOutputsCacheConfig): If True, the float model outputs are computed once per sample before the training and cached (on the working device, in host memory or in a memory-mapped file, by their size) with the default settings. GPTQFloatOutputsCacheConfig object can be passed to use non-default settings. Note that caching fixes the samples of the representative dataset for all epochs.
+            blockwise (bool, GPTQBlockwiseConfig): If True, the model is optimized block by block with the default settings, so that only a single block is held in memory during the training. GPTQBlockwiseConfig object can be passed to use non-default settings.
+            autocast_dtype (torch.dtype): If set to torch.bfloat16 or torch.float16, the forward passes of the quantized model during the fine-tuning run with automatic mixed precision in this data type, while the trainable parameters, the float model outputs and the loss remain in float32. If None, the fine-tuning runs in full precision.
 
         returns:
             a GradientPTQConfig object to use when fine-tuning the quantized model using gptq.
@@ -131,6 +137,25 @@ if FOUND_TORCH:
             raise TypeError(f'gradual_activation_quantization argument should be bool or '
                             f'GradualActivationQuantizationConfig, received {type(gradual_activation_quantization)}')
 
+        if isinstance(float_outputs_cache, bool):
+            float_outputs_cache_config = GPTQFloatOutputsCacheConfig() if float_outputs_cache else None
+        elif isinstance(float_outputs_cache, GPTQFloatOutputsCacheConfig):
+            float_outputs_cache_config = float_outputs_cache
+        else:    # pragma: no cover
+            raise TypeError(f'float_outputs_cache argument should be bool or '
+                            f'GPTQFloatOutputsCacheConfig, received {type(float_outputs_cache)}')
+
+        if isinstance(blockwise, bool):
+            blockwise_config = GPTQBlockwiseConfig() if blockwise else None
+        elif isinstance(blockwise, GPTQBlockwiseConfig):
+            blockwise_config = blockwise
+        else:    # pragma: no cover
+            raise TypeError(f'blockwise argument should be bool or GPTQBlockwiseConfig, received {type(blockwise)}')
+
+        if autocast_dtype not in (None, torch.bfloat16, torch.float16):
+            raise ValueError(f'autocast_dtype argument should be None, torch.bfloat16 or torch.float16, '
+                             f'received {autocast_dtype}')
+
         return GradientPTQConfig(n_epochs=n_epochs,
                                  loss=loss,
                                  optimizer=optimizer,
@@ -140,6 +165,9 @@ if FOUND_TORCH:
                                  regularization_factor=regularization_factor,
                                  hessian_weights_config=hessian_weights_config,
                                  gradual_activation_quantization_config=gradual_quant_config,
+                                 float_outputs_cache_config=float_outputs_cache_config,
+                                 blockwise_config=blockwise_config,
+                                 autocast_dtype=autocast_dtype,
                                  log_function=log_function)
 
 
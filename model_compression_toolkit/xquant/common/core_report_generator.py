@@ -15,6 +15,7 @@
 from tqdm import tqdm
 from typing import Callable, Any, Dict
 
+from model_compression_toolkit.core.common.collectors.statistics_collector import StatsCollectorPlan
 from model_compression_toolkit.core.common.model_collector import ModelCollector
 from model_compression_toolkit.xquant import XQuantConfig
 from model_compression_toolkit.xquant.common.constants import OUTPUT_SIMILARITY_METRICS_REPR, OUTPUT_SIMILARITY_METRICS_VAL, INTERMEDIATE_SIMILARITY_METRICS_REPR, \
@@ -50,7 +51,8 @@ def core_report_generator(float_model: Any,
 
     # Collect histograms on the float model.
     float_graph = fw_report_utils.model_folding_utils.create_float_folded_graph(float_model, repr_dataset)
-    mi = ModelCollector(float_graph, fw_report_utils.fw_impl)
+    mi = ModelCollector(float_graph, fw_report_utils.fw_impl,
+                        collectors_plan=StatsCollectorPlan(weighted_histogram=False, mean=False))
     for _data in tqdm(repr_dataset(), desc="Collecting Histograms"):
         mi.infer(_data)
 
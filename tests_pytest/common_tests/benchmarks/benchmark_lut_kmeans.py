@@ -0,0 +1,63 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Run time and clustering error of the LUT quantizers k-means, with sklearn's KMeans (the previous implementation)
+and with the 1-D k-means over the data bins (kmeans_1d), on int-quantized kernels of increasing size.
+
+Run with:
+    python -m tests_pytest.common_tests.benchmarks.benchmark_lut_kmeans
+"""
+import argparse
+import time
+
+import numpy as np
+from sklearn.cluster import KMeans
+
+from model_compression_toolkit.constants import LUT_VALUES_BITWIDTH
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import kmeans_1d, \
+    int_quantization_with_threshold
+
+
+def clustering_error(data: np.ndarray, centers: np.ndarray) -> float:
+    """ Returns the squared error of assigning each data value to its closest center. """
+    return float(np.sum(np.min((data.reshape([-1, 1]) - centers.reshape([1, -1])) ** 2, axis=1)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n-bits', type=int, default=4, help='LUT number of bits')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Number of kernel elements')
+    args = parser.parse_args()
+
+    n_clusters = 2 ** args.n_bits
+    for size in args.sizes:
+        data = int_quantization_with_threshold(np.random.default_rng(0).normal(size=size), 4., LUT_VALUES_BITWIDTH)
+
+        start = time.perf_counter()
+        sklearn_centers = KMeans(n_clusters=n_clusters, n_init=10).fit(data.reshape(-1, 1)).cluster_centers_
+        sklearn_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        centers = kmeans_1d(data, n_clusters)
+        kmeans_1d_time = time.perf_counter() - start
+
+        print(f'size={size:8} sklearn={sklearn_time:7.3f}s kmeans_1d={kmeans_1d_time:7.3f}s '
+              f'speedup={sklearn_time / kmeans_1d_time:8.1f}x '
+              f'error ratio={clustering_error(data, centers) / clustering_error(data, sklearn_centers):6.4f}')
+
+
+if __name__ == '__main__':
+    main()
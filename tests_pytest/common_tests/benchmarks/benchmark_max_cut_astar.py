@@ -0,0 +1,113 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Expansion throughput of the max cut AStar search on synthetic memory graphs:
+- wide: an input followed by parallel branches (each a short chain) that are concatenated at the end.
+- deep: a chain of residual blocks.
+
+Run with:
+    python -m tests_pytest.common_tests.benchmarks.benchmark_max_cut_astar
+"""
+import argparse
+import time
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.framework_info import set_fw_info
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import compute_graph_max_cut
+from model_compression_toolkit.core.common.graph.memory_graph.max_cut_astar import MaxCutAstar
+from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
+from tests_pytest._test_util.graph_builder_utils import build_node
+from tests_pytest.conftest import DummyFrameworkInfo
+
+
+def build_wide_graph(num_branches: int, branch_depth: int) -> Graph:
+    """ input -> num_branches parallel chains of branch_depth nodes -> concat. Each chain starts with large
+        activations and ends with a small one, so the schedule order of the branches matters. """
+    inp = build_node('input', output_shape=(None, 8, 8, 1))
+    out = build_node('concat', output_shape=(None, 8, 8, num_branches))
+    nodes, edges = [], []
+    for b in range(num_branches):
+        prev = inp
+        for d in range(branch_depth):
+            channels = 1 if d == branch_depth - 1 else 4 + (b * 7 + d * 3) % 11
+            n = build_node(f'b{b}_n{d}', output_shape=(None, 8, 8, channels))
+            nodes.append(n)
+            edges.append(Edge(prev, n, 0, 0))
+            prev = n
+        edges.append(Edge(prev, out, 0, b))
+    return Graph(f'wide_{num_branches}x{branch_depth}', input_nodes=[inp], nodes=nodes, output_nodes=[out],
+                 edge_list=edges)
+
+
+def build_deep_graph(num_blocks: int) -> Graph:
+    """ A chain of residual blocks: x -> conv1 -> conv2 -> add(x, conv2). """
+    inp = build_node('input', output_shape=(None, 8, 8, 4))
+    nodes, edges = [], []
+    prev = inp
+    for i in range(num_blocks):
+        conv1 = build_node(f'conv1_{i}', output_shape=(None, 8, 8, 8 + i % 5))
+        conv2 = build_node(f'conv2_{i}', output_shape=(None, 8, 8, 4))
+        add = build_node(f'add_{i}', output_shape=(None, 8, 8, 4))
+        nodes.extend([conv1, conv2, add])
+        edges.extend([Edge(prev, conv1, 0, 0), Edge(conv1, conv2, 0, 0), Edge(prev, add, 0, 0),
+                      Edge(conv2, add, 0, 1)])
+        prev = add
+    out = build_node('output', output_shape=(None, 8, 8, 4))
+    edges.append(Edge(prev, out, 0, 0))
+    return Graph(f'deep_{num_blocks}', input_nodes=[inp], nodes=nodes, output_nodes=[out], edge_list=edges)
+
+
+class _CountingMaxCutAstar(MaxCutAstar):
+    """ Counts the number of expansions of the search. """
+    expansions = 0
+
+    def expand(self, cut):
+        _CountingMaxCutAstar.expansions += 1
+        return super().expand(cut)
+
+
+def run(graph: Graph, **kwargs):
+    """ Returns max cut size, number of expansions and run time of compute_graph_max_cut on the graph. """
+    import model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut as max_cut_module
+    orig_cls = max_cut_module.MaxCutAstar
+    max_cut_module.MaxCutAstar = _CountingMaxCutAstar
+    _CountingMaxCutAstar.expansions = 0
+    try:
+        start = time.perf_counter()
+        _, max_cut_size, _ = compute_graph_max_cut(MemoryGraph(graph), **kwargs)
+        run_time = time.perf_counter() - start
+    finally:
+        max_cut_module.MaxCutAstar = orig_cls
+    return max_cut_size, _CountingMaxCutAstar.expansions, run_time
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n-iter', type=int, default=50, help='Number of AStar searches')
+    parser.add_argument('--astar-n-iter', type=int, default=1000, help='Expansions limit per AStar search')
+    args = parser.parse_args()
+    set_fw_info(DummyFrameworkInfo)
+
+    graphs = [build_wide_graph(4, 4), build_wide_graph(8, 4), build_wide_graph(16, 2),
+              build_deep_graph(20), build_deep_graph(100)]
+    for graph in graphs:
+        max_cut_size, expansions, run_time = run(graph, n_iter=args.n_iter, astar_n_iter=args.astar_n_iter)
+        print(f'{graph.name:10} nodes={len(graph.nodes):4} max_cut={max_cut_size:8} expansions={expansions:6} '
+              f'time={run_time:7.2f}s expansions/s={expansions / run_time:9.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Run time of the weights and activation thresholds search, with the candidates evaluated one by one (loop) and
+all at once (vectorized):
+- tensor: symmetric / uniform / power-of-two search on a conv kernel, per-channel and per-tensor.
+- histogram: symmetric / uniform / power-of-two search on an activation histogram.
+
+Run with:
+    python -m tests_pytest.common_tests.benchmarks.benchmark_qparams_search
+"""
+import argparse
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+from model_compression_toolkit.core import QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import \
+    power_of_two_selection, symmetric_selection, uniform_selection
+
+
+def _loop_search():
+    """ Disables the vectorized candidates search in all selection methods. """
+    patches = [patch.object(module, name, return_value=None)
+               for module in [power_of_two_selection, symmetric_selection, uniform_selection]
+               for name in ['get_threshold_selection_tensor_batch_error_function',
+                            'get_threshold_selection_histogram_batch_error_function']]
+    for p in patches:
+        p.start()
+    return patches
+
+
+def timeit(fn, n_iter: int) -> float:
+    """ Returns the mean run time of fn. """
+    start = time.perf_counter()
+    for _ in range(n_iter):
+        fn()
+    return (time.perf_counter() - start) / n_iter
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--n-iter', type=int, default=3, help='Number of searches per measurement')
+    parser.add_argument('--kernel-shape', type=int, nargs='+', default=[256, 128, 3, 3],
+                        help='Shape of the searched kernel (output channels first)')
+    parser.add_argument('--error-method', type=str, default='MSE', choices=['MSE', 'MAE', 'LP'])
+    args = parser.parse_args()
+
+    error_method = QuantizationErrorMethod[args.error_method]
+    kernel = np.random.default_rng(0).normal(size=args.kernel_shape).astype(np.float32)
+    counts, bins = np.histogram(np.random.default_rng(1).normal(size=100000), bins=2048)
+
+    cases = {}
+    for name, fn in [('symmetric', symmetric_selection.symmetric_selection_tensor),
+                     ('uniform', uniform_selection.uniform_selection_tensor),
+                     ('power_of_two', power_of_two_selection.power_of_two_selection_tensor)]:
+        for per_channel in [True, False]:
+            cases[f'tensor {name} {"per-channel" if per_channel else "per-tensor"}'] = \
+                lambda fn=fn, per_channel=per_channel: fn(kernel, p=2, n_bits=8, per_channel=per_channel,
+                                                          channel_axis=0, quant_error_method=error_method)
+    for name, fn in [('symmetric', symmetric_selection.symmetric_selection_histogram),
+                     ('uniform', uniform_selection.uniform_selection_histogram),
+                     ('power_of_two', power_of_two_selection.power_of_two_selection_histogram)]:
+        cases[f'histogram {name}'] = lambda fn=fn: fn(bins, counts, p=2, n_bits=8, min_value=bins[0],
+                                                      max_value=bins[-1], quant_error_method=error_method)
+
+    vectorized_times = {name: timeit(fn, args.n_iter) for name, fn in cases.items()}
+    patches = _loop_search()
+    try:
+        loop_times = {name: timeit(fn, args.n_iter) for name, fn in cases.items()}
+    finally:
+        for p in patches:
+            p.stop()
+
+    for name in cases:
+        print(f'{name:35} loop={loop_times[name]:8.3f}s vectorized={vectorized_times[name]:8.3f}s '
+              f'speedup={loop_times[name] / vectorized_times[name]:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+
+from model_compression_toolkit.core.common.collectors.histogram_collector import HistogramCollector
+from model_compression_toolkit.core.common.collectors.weighted_histogram_collector import WeightedHistogramCollector
+
+
+class TestStreamingHistogramCollector:
+
+    @pytest.mark.parametrize('collector_cls', [HistogramCollector, WeightedHistogramCollector])
+    def test_streaming_matches_lazy_merge(self, collector_cls):
+        np.random.seed(0)
+        lazy_hc = collector_cls(n_bins=256)
+        streaming_hc = collector_cls(n_bins=256, streaming=True)
+        # Increasing ranges force the running histogram range to expand.
+        for i in range(20):
+            x = np.random.randn(1000) * (1 + i / 10) + i / 20
+            lazy_hc.update(x)
+            streaming_hc.update(x)
+
+        assert len(streaming_hc._histogram_per_iteration) == 0
+        lazy_bins, lazy_counts = lazy_hc.get_histogram()
+        streaming_bins, streaming_counts = streaming_hc.get_histogram()
+        assert np.allclose(lazy_bins, streaming_bins)
+        assert np.isclose(lazy_counts.sum(), streaming_counts.sum())
+        # Compare the distributions (cumulative histograms) of the merged histograms.
+        assert np.max(np.abs(np.cumsum(lazy_counts) - np.cumsum(streaming_counts))) / lazy_counts.sum() < 1e-2
+
+    def test_streaming_without_range_expansion_is_exact(self):
+        lazy_hc = HistogramCollector(n_bins=64)
+        streaming_hc = HistogramCollector(n_bins=64, streaming=True)
+        x = np.linspace(-1, 1, 100)
+        for i in range(5):
+            lazy_hc.update(x)
+            streaming_hc.update(x)
+
+        lazy_bins, lazy_counts = lazy_hc.get_histogram()
+        streaming_bins, streaming_counts = streaming_hc.get_histogram()
+        assert np.array_equal(lazy_bins, streaming_bins)
+        assert np.allclose(lazy_counts, streaming_counts)
+
+    def test_streaming_update_after_scale(self):
+        streaming_hc = HistogramCollector(n_bins=64, streaming=True)
+        streaming_hc.update(np.linspace(0, 1, 100))
+        streaming_hc.scale(np.array([2.]))
+        streaming_hc.update(np.linspace(-1, 1, 100))
+
+        bins, counts = streaming_hc.get_histogram()
+        assert bins[0] == -1 and bins[-1] == 2
+        assert np.isclose(counts.sum(), 200)
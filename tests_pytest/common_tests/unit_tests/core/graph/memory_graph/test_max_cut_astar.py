@@ -0,0 +1,60 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import pytest
+
+from model_compression_toolkit.core.common.graph.memory_graph.compute_graph_max_cut import compute_graph_max_cut
+from model_compression_toolkit.core.common.graph.memory_graph.max_cut_astar import MaxCutAstar
+from model_compression_toolkit.core.common.graph.memory_graph.memory_graph import MemoryGraph
+from tests_pytest.common_tests.benchmarks.benchmark_max_cut_astar import build_wide_graph, build_deep_graph
+
+
+@pytest.mark.parametrize('graph_fn', [lambda: build_wide_graph(3, 3),
+                                      lambda: build_wide_graph(4, 4),
+                                      lambda: build_deep_graph(5)])
+def test_max_cut_schedule(patch_fw_info, graph_fn):
+    """ Check that the schedule is a valid topological order of all the graph nodes, and that the max cut is the
+        largest of the returned cuts. """
+    graph = graph_fn()
+    schedule, max_cut_size, cuts = compute_graph_max_cut(MemoryGraph(graph))
+
+    assert sorted(n.name for n in schedule) == sorted(n.name for n in graph.nodes)
+    node_order = {n: i for i, n in enumerate(schedule)}
+    for e in graph.edges:
+        assert node_order[e[0]] < node_order[e[1]]
+    assert max_cut_size == max(c.memory_size() for c in cuts)
+
+
+def test_max_cut_ordered_branches(patch_fw_info):
+    """ Each branch of the graph ends with a small tensor, so the optimal schedule runs the branches one after
+        the other, starting with the branch with the largest tensors. """
+    graph = build_wide_graph(3, 3)
+    _, max_cut_size, _ = compute_graph_max_cut(MemoryGraph(graph))
+    # Tensor sizes are channels * 64: input 1, branches [4, 7, 1], [11, 14, 1], [7, 10, 1].
+    # The peak is running b1_n1, which requires b1_n0's output. Running b1 first, only the input is held as well.
+    assert max_cut_size == 64 * (1 + 11 + 14)
+
+
+def test_max_cut_astar_revisits_cuts_by_memory_elements(patch_fw_info, mocker):
+    """ Cuts with the same memory elements that are reached via different schedules should be expanded once,
+        and not once per schedule, so the search converges after a small number of expansions. """
+    expand_spy = mocker.spy(MaxCutAstar, 'expand')
+    memory_graph = MemoryGraph(build_wide_graph(4, 4))
+    max_cut_astar = MaxCutAstar(memory_graph)
+    u_bound = 2 * sum([t.total_size for t in memory_graph.b_nodes])
+    schedule, _, _ = max_cut_astar.solve(estimate=u_bound, iter_limit=10000)
+
+    assert schedule is not None
+    # 4 branches of 4 ops each have 5 ** 4 execution states.
+    assert expand_spy.call_count <= 5 ** 4 + 10
@@ -0,0 +1,108 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+
+import pytest
+
+from model_compression_toolkit.constants import FUSED_LAYER_PATTERN, FUSED_OP_QUANT_CONFIG
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.fusion.fusing_info import FusingInfo
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from tests_pytest._test_util.graph_builder_utils import build_node
+
+
+class Conv:
+    pass
+
+
+class ReLU:
+    pass
+
+
+class Identity:
+    pass
+
+
+NUM_BLOCKS = 1500
+
+
+@pytest.fixture
+def fused_graph(patch_fw_info):
+    """ A chain of NUM_BLOCKS fused conv -> relu blocks. """
+    nodes = []
+    for i in range(NUM_BLOCKS):
+        nodes.extend([build_node(f'conv{i}', layer_class=Conv), build_node(f'relu{i}', layer_class=ReLU)])
+    edges = [Edge(n1, n2, 0, 0) for n1, n2 in zip(nodes[:-1], nodes[1:])]
+    graph = Graph('g', input_nodes=[nodes[0]], nodes=nodes, output_nodes=[OutTensor(nodes[-1], 0)],
+                  edge_list=edges)
+    fusing_data = {FusingInfo.generate_fused_op_id(nodes[i: i+2]): tuple(nodes[i: i+2])
+                   for i in range(0, len(nodes), 2)}
+    graph.fusing_info = FusingInfo(fusing_patterns=[{FUSED_LAYER_PATTERN: [Conv, ReLU], FUSED_OP_QUANT_CONFIG: None}],
+                                   fusing_data=fusing_data)
+    return graph
+
+
+def _insert_identities(graph):
+    """ Insert an identity node between every pair of fused blocks. """
+    for i in range(NUM_BLOCKS - 1):
+        relu, conv = graph.find_node_by_name(f'relu{i}')[0], graph.find_node_by_name(f'conv{i+1}')[0]
+        identity = build_node(f'identity{i}', layer_class=Identity)
+        graph.add_node(identity)
+        graph.remove_edge(relu, conv)
+        graph.add_edge(relu, identity, source_index=0, sink_index=0)
+        graph.add_edge(identity, conv, source_index=0, sink_index=0)
+
+
+def test_edge_changes_validate_affected_fused_ops_only(fused_graph, mocker):
+    """ Check that edge changes don't validate the whole graph, and that the graph is valid after them. """
+    validate_spy = mocker.spy(fused_graph.fusing_info, 'validate')
+    validate_nodes_spy = mocker.spy(fused_graph.fusing_info, 'validate_nodes')
+
+    start = time.perf_counter()
+    _insert_identities(fused_graph)
+    run_time = time.perf_counter() - start
+
+    assert validate_spy.call_count == 0
+    assert validate_nodes_spy.call_count == 3 * (NUM_BLOCKS - 1)
+    # A full validation after each edge change takes minutes on this graph.
+    assert run_time < 30
+    assert len(fused_graph.nodes) == 3 * NUM_BLOCKS - 1
+    fused_graph.validate()
+
+
+def test_edge_change_breaking_fused_op(fused_graph):
+    """ Check that an edge change that breaks a fused chain fails validation. """
+    conv, relu = fused_graph.find_node_by_name('conv3')[0], fused_graph.find_node_by_name('relu3')[0]
+    with pytest.raises(ValueError, match='is not a valid linear chain'):
+        fused_graph.add_edge(conv, fused_graph.find_node_by_name('conv5')[0], source_index=0, sink_index=0)
+    fused_graph.remove_edge(conv, fused_graph.find_node_by_name('conv5')[0])
+
+    with pytest.raises(ValueError, match='is not a valid linear chain'):
+        fused_graph.remove_edge(conv, relu)
+
+
+def test_nested_changes_validate_once(fused_graph, mocker):
+    """ Check that a change that is composed of other changes is validated once, on the whole graph. """
+    validate_spy = mocker.spy(fused_graph.fusing_info, 'validate')
+    validate_nodes_spy = mocker.spy(fused_graph.fusing_info, 'validate_nodes')
+    relu = fused_graph.find_node_by_name('relu3')[0]
+
+    # The replaced node is part of a fused operation, so the graph is no longer valid after the change.
+    with pytest.raises(ValueError, match='not present in the graph'):
+        fused_graph.replace_node(relu, build_node('new_relu', layer_class=ReLU))
+
+    assert validate_spy.call_count == 1
+    assert validate_nodes_spy.call_count == 0
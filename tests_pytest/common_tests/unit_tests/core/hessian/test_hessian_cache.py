@@ -0,0 +1,87 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianMode, HessianScoresGranularity
+from model_compression_toolkit.core.common.hessian.hessian_info_service import HessianCache, HessianBuffer
+
+
+def _request(n_samples, *names):
+    return HessianScoresRequest(mode=HessianMode.WEIGHTS, granularity=HessianScoresGranularity.PER_ELEMENT,
+                                target_nodes=[SimpleNamespace(name=name) for name in names], data_loader=None,
+                                n_samples=n_samples)
+
+
+class TestHessianBuffer:
+    def test_append_and_get(self):
+        buffer = HessianBuffer()
+        batches = [np.random.rand(n, 3, 2).astype(np.float32) for n in [2, 1, 4, 3]]
+        for i, batch in enumerate(batches):
+            buffer.append(batch)
+            expected = np.concatenate(batches[:i+1])
+            assert buffer.n_samples == expected.shape[0]
+            assert np.array_equal(buffer.get(), expected)
+            assert buffer.get().dtype == np.float32
+        # geometric growth
+        assert buffer._data.shape[0] == 16
+        assert np.array_equal(buffer.get(5), np.concatenate(batches)[:5])
+        assert buffer.get(100).shape[0] == 10
+
+    def test_views_are_read_only_and_stable(self):
+        buffer = HessianBuffer()
+        buffer.append(np.ones((2, 3)))
+        view = buffer.get()
+        assert np.shares_memory(view, buffer._data)
+        with pytest.raises(ValueError):
+            view[0] = 0
+        # appending does not modify previously returned views, and keeps the buffer writable
+        buffer.append(np.zeros((5, 3)))
+        assert np.array_equal(view, np.ones((2, 3)))
+        assert np.array_equal(buffer.get(), np.concatenate([np.ones((2, 3)), np.zeros((5, 3))]))
+
+    def test_dtype(self):
+        buffer = HessianBuffer(np.float16)
+        buffer.append(np.full((2, 3), 1.5, dtype=np.float32))
+        assert buffer._data.dtype == np.float16
+        # hessians are returned in the type they were appended in
+        res = buffer.get()
+        assert res.dtype == np.float32
+        assert np.all(res == 1.5)
+        with pytest.raises(ValueError):
+            res[0] = 0
+
+
+class TestHessianCache:
+    @pytest.mark.parametrize('float16', [False, True])
+    def test_update_and_fetch(self, float16):
+        cache = HessianCache(float16=float16)
+        h1 = [np.random.rand(n, 4).astype(np.float32) for n in [3, 2]]
+        h2 = [np.random.rand(n, 4).astype(np.float32) for n in [3, 2]]
+        assert cache.update({'n1': h1[0], 'n2': h2[0]}, _request(5, 'n1', 'n2')) == 3
+        assert cache.update({'n1': h1[1]}, _request(5, 'n1')) == 5
+
+        res, missing = cache.fetch_hessian(_request(4, 'n1', 'n2', 'n3'))
+        assert missing == {'n2': 1, 'n3': 4}
+        assert res.keys() == {'n1', 'n2'}
+        assert res['n1'].dtype == res['n2'].dtype == np.float32
+        assert np.allclose(res['n1'], np.concatenate(h1)[:4], atol=1e-3)
+        assert np.allclose(res['n2'], h2[0], atol=1e-3)
+
+        cache.clear()
+        res, missing = cache.fetch_hessian(_request(1, 'n1'))
+        assert res == {} and missing == {'n1': 1}
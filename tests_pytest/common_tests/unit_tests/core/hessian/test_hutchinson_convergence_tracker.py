@@ -0,0 +1,73 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+
+from model_compression_toolkit.constants import MIN_HESSIAN_ITER
+from model_compression_toolkit.core.common.hessian.hessian_info_utils import HutchinsonConvergenceTracker
+
+
+class TestHutchinsonConvergenceTracker:
+    def test_converged_targets_are_frozen(self):
+        tracker = HutchinsonConvergenceTracker(3, tolerance=0.05, confidence_z=2.)
+        rng = np.random.default_rng(0)
+        for _ in range(MIN_HESSIAN_ITER - 1):
+            for i in tracker.get_active_targets():
+                # target 0 is constant, target 1 has a small variance, target 2 has a huge variance
+                tracker.update(i, [5., 5. + 0.1 * rng.standard_normal(), 100 * rng.standard_normal()][i])
+        # no target converges before the min number of iterations
+        assert tracker.get_active_targets() == [0, 1, 2]
+
+        tracker.update(0, 5.)
+        assert tracker.get_active_targets() == [1, 2]
+        assert tracker.num_iterations == [MIN_HESSIAN_ITER, MIN_HESSIAN_ITER - 1, MIN_HESSIAN_ITER - 1]
+
+        for _ in range(100):
+            for i in tracker.get_active_targets():
+                tracker.update(i, [5., 5. + 0.1 * rng.standard_normal(), 100 * rng.standard_normal()][i])
+        assert tracker.get_active_targets() == [2]
+        assert tracker.num_iterations[0] == MIN_HESSIAN_ITER
+        assert tracker.num_iterations[1] == MIN_HESSIAN_ITER
+        assert tracker.num_iterations[2] == MIN_HESSIAN_ITER + 99
+
+    def test_freeze(self):
+        tracker = HutchinsonConvergenceTracker(2)
+        tracker.freeze(1)
+        assert tracker.get_active_targets() == [0]
+        assert tracker.num_iterations == [0, 0]
+
+    def test_converged_per_sample(self):
+        """ Check that a target converges only when the estimations of all its samples have converged, even if the
+            estimations of a sample with large scores hide the variance of a sample with small scores. """
+        tracker = HutchinsonConvergenceTracker(2, tolerance=0.05, confidence_z=2.)
+        rng = np.random.default_rng(0)
+        for _ in range(MIN_HESSIAN_ITER + 100):
+            # The sums over the samples of both targets would converge after the min number of iterations.
+            estimations = np.array([[1000., 1. + rng.standard_normal()], [1000., 1. + 0.01 * rng.standard_normal()]])
+            active_targets = tracker.get_active_targets()
+            tracker.update_targets(active_targets, estimations[active_targets])
+        assert tracker.get_active_targets() == [0]
+        assert tracker.num_iterations == [MIN_HESSIAN_ITER + 100, MIN_HESSIAN_ITER]
+
+    def test_noisy_sample_among_converged_samples(self):
+        """ Check that a single noisy sample isn't diluted by many constant samples. """
+        tracker = HutchinsonConvergenceTracker(1, tolerance=0.1, confidence_z=2.)
+        rng = np.random.default_rng(0)
+        for _ in range(10):
+            # relative variance of ~1 for the noisy sample, i.e. a relative confidence interval of ~0.6 after 10
+            # iterations.
+            estimation = np.ones(32)
+            estimation[5] = 1. + rng.standard_normal()
+            tracker.update(0, estimation)
+        assert tracker.get_active_targets() == [0]
@@ -0,0 +1,145 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.core.common.hessian import HessianInfoService, HessianScoresRequest, HessianMode, \
+    HessianScoresGranularity
+from tests_pytest._test_util.graph_builder_utils import build_node
+
+
+@pytest.fixture
+def graph(patch_fw_info):
+    n1 = build_node('n1', canonical_weights={'kernel': np.ones((3, 4))})
+    n2 = build_node('n2', canonical_weights={'kernel': np.full((4, 2), 2.)})
+    return Graph('g', input_nodes=[n1], nodes=[n1, n2], output_nodes=[OutTensor(n2, 0)],
+                 edge_list=[Edge(n1, n2, 0, 0)])
+
+
+@pytest.fixture
+def fw_impl():
+    """ Framework implementation whose hessians of a node are the sum of each sample plus the node's index. """
+    def get_calculator(graph, input_images, hessian_scores_request, num_iterations_for_approximation, **kwargs):
+        calc = Mock(achieved_iterations=None)
+        calc.compute.side_effect = lambda: [
+            input_images[0].reshape(input_images[0].shape[0], -1).sum(axis=1, keepdims=True) + int(n.name[1:])
+            for n in hessian_scores_request.target_nodes]
+        return calc
+
+    fw_impl = Mock()
+    fw_impl.to_numpy.side_effect = lambda x: x
+    fw_impl.get_hessian_scores_calculator.side_effect = get_calculator
+    return fw_impl
+
+
+def _data_loader(seed, n_batches=3):
+    rng = np.random.default_rng(seed)
+    return [[rng.random((2, 5))] for _ in range(n_batches)]
+
+
+def _fetch(graph, fw_impl, cache_dir, data_loader, target_nodes=None):
+    service = HessianInfoService(graph, fw_impl, cache_dir=cache_dir)
+    request = HessianScoresRequest(mode=HessianMode.ACTIVATION, granularity=HessianScoresGranularity.PER_TENSOR,
+                                   target_nodes=target_nodes or list(graph.nodes), data_loader=data_loader,
+                                   n_samples=6)
+    return service.fetch_hessian(request)
+
+
+def test_hessians_reused_across_services(graph, fw_impl, tmp_path):
+    """ Check that hessians computed by one service are loaded from disk by another, without computation. """
+    res = _fetch(graph, fw_impl, str(tmp_path), _data_loader(0))
+    assert fw_impl.get_hessian_scores_calculator.call_count == 3
+    assert len(list(tmp_path.glob('*/*.npy'))) == 6
+
+    fw_impl.get_hessian_scores_calculator.reset_mock()
+    res2 = _fetch(graph, fw_impl, str(tmp_path), _data_loader(0))
+    assert fw_impl.get_hessian_scores_calculator.call_count == 0
+    assert res.keys() == res2.keys()
+    for k in res:
+        assert res[k].shape == (6, 1)
+        assert np.array_equal(res[k], res2[k])
+
+
+def test_hessians_computed_for_new_samples_and_nodes(graph, fw_impl, tmp_path):
+    """ Check that hessians are computed only for samples and nodes that are not stored. """
+    n1, n2 = list(graph.nodes)
+    _fetch(graph, fw_impl, str(tmp_path), _data_loader(0), target_nodes=[n1])
+    assert fw_impl.get_hessian_scores_calculator.call_count == 3
+
+    # Same samples, new node: computed only for the new node.
+    fw_impl.get_hessian_scores_calculator.reset_mock()
+    res = _fetch(graph, fw_impl, str(tmp_path), _data_loader(0))
+    assert fw_impl.get_hessian_scores_calculator.call_count == 3
+    for call in fw_impl.get_hessian_scores_calculator.call_args_list:
+        assert call.kwargs['hessian_scores_request'].target_nodes == [n2]
+    expected = np.concatenate([b[0].sum(axis=1, keepdims=True) for b in _data_loader(0)])
+    assert np.allclose(res['n1'], expected + 1)
+    assert np.allclose(res['n2'], expected + 2)
+
+    # New samples.
+    fw_impl.get_hessian_scores_calculator.reset_mock()
+    _fetch(graph, fw_impl, str(tmp_path), _data_loader(1))
+    assert fw_impl.get_hessian_scores_calculator.call_count == 3
+
+
+def test_graph_fingerprinted_once(graph, fw_impl, tmp_path, mocker):
+    """ Check that the graph is fingerprinted once for all the requests, and again after the cache is cleared. """
+    service = HessianInfoService(graph, fw_impl, cache_dir=str(tmp_path))
+    topo_sort_spy = mocker.spy(graph, 'get_topo_sorted_nodes')
+    for n_samples in [2, 4, 6]:
+        request = HessianScoresRequest(mode=HessianMode.ACTIVATION, granularity=HessianScoresGranularity.PER_TENSOR,
+                                       target_nodes=list(graph.nodes), data_loader=_data_loader(0),
+                                       n_samples=n_samples)
+        service.fetch_hessian(request, force_compute=True)
+    assert topo_sort_spy.call_count == 1
+
+    service.clear_cache()
+    service.fetch_hessian(request, force_compute=True)
+    assert topo_sort_spy.call_count == 2
+
+
+def test_hessians_not_reused_for_modified_graph(graph, fw_impl, tmp_path):
+    """ Check that hessians stored for a graph are not used after its weights change. """
+    _fetch(graph, fw_impl, str(tmp_path), _data_loader(0))
+    fw_impl.get_hessian_scores_calculator.reset_mock()
+
+    n1 = list(graph.nodes)[0]
+    n1.weights = {k: w + 1 for k, w in n1.weights.items()}
+    _fetch(graph, fw_impl, str(tmp_path), _data_loader(0))
+    assert fw_impl.get_hessian_scores_calculator.call_count == 3
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.parametrize('persistent', [False, True])
+def test_hessians_dtype_with_float16_cache(graph, fw_impl, tmp_path, persistent):
+    """ Check that computed, cached and force-computed hessians have the same type when caching in float16. """
+    data_loader = [[x[0].astype(np.float32)] for x in _data_loader(0)]
+    service = HessianInfoService(graph, fw_impl, cache_dir=str(tmp_path) if persistent else None,
+                                 cache_float16=True)
+    request = HessianScoresRequest(mode=HessianMode.ACTIVATION, granularity=HessianScoresGranularity.PER_TENSOR,
+                                   target_nodes=list(graph.nodes), data_loader=data_loader, n_samples=6)
+    computed = service.fetch_hessian(request)
+    fw_impl.get_hessian_scores_calculator.reset_mock()
+    cached = service.fetch_hessian(request)
+    assert fw_impl.get_hessian_scores_calculator.call_count == 0
+    forced = service.fetch_hessian(request, force_compute=True)
+    for k in computed:
+        assert computed[k].dtype == cached[k].dtype == forced[k].dtype == np.float32
+        assert np.allclose(cached[k], forced[k], rtol=1e-3)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import itertools
 import random
 from types import MethodType
 from unittest.mock import Mock
@@ -1242,3 +1243,68 @@ class TestBOPSAndVirtualGraph:
         graph = Graph('g', input_nodes=[n1], nodes=[n2], output_nodes=[n3],
                       edge_list=[Edge(n1, n2, 0, 0), Edge(n2, n3, 0, 0)])
         return graph, n1, n2, n3
+
+
+class TestConfigurationRUTables:
+    """ Test utilization computed from precomputed per-candidate tables against the full computation. """
+    @pytest.fixture(autouse=True)
+    def setup(self, patch_fw_info, fw_info_mock, fw_impl_mock, mocker):
+        mocker.patch.object(fw_info_mock, 'get_kernel_op_attribute',
+                            lambda node_type: 'foo' if node_type == BOPNode else None)
+        fw_impl_mock.get_node_mac_operations = lambda n: {'n2': 42, 'n4': 17}.get(n.name, 0)
+        # n2 bops depend on both n1 activation and n2 weights, n4 input activation is preserved from n2
+        n1 = build_node('n1', qcs=[build_qc(16), build_qc(8), build_qc(4)], output_shape=(None, 5, 10))
+        n2 = build_node('n2', canonical_weights={'foo': np.zeros((3, 14)), 'bar': np.zeros((7,))}, qcs=[
+            build_qc(a, w_attr={'foo': (w, True), 'bar': (8, True)}) for a, w in itertools.product([8, 4], [8, 2])
+        ], output_shape=(None, 2, 111, 3), layer_class=BOPNode)
+        n3 = build_node('n3', qcs=[build_qc(a_enable=False, q_preserving=True)], output_shape=(None, 2, 111, 3))
+        n4 = build_node('n4', canonical_weights={'foo': np.zeros((5, 6))},
+                        qcs=[build_qc(w_attr={'foo': (4, True)})], output_shape=(None, 33), layer_class=BOPNode)
+        n5 = build_node('n5', qcs=[build_qc(6), build_qc(2)], output_shape=(None, 12))
+        self.graph = Graph('g', input_nodes=[n1], nodes=[n2, n3, n4], output_nodes=[n5],
+                           edge_list=[Edge(n1, n2, 0, 0), Edge(n2, n3, 0, 0), Edge(n3, n4, 0, 0), Edge(n4, n5, 0, 0)])
+        self.nodes = [n1, n2, n5]
+        self.fw_impl = fw_impl_mock
+
+    @pytest.mark.parametrize('ru_targets', [{RUTarget.WEIGHTS}, {RUTarget.ACTIVATION}, {RUTarget.TOTAL},
+                                            {RUTarget.BOPS}, set(RUTarget)])
+    def test_compute_config_utilization(self, ru_targets):
+        ru_calc = ResourceUtilizationCalculator(self.graph, self.fw_impl)
+        tables = ru_calc.compute_configuration_ru_tables(TIC.AnyQuantizedNonFused, ru_targets, self.nodes)
+        if RUTarget.BOPS in ru_targets:
+            assert len(tables.pairwise) == 1
+
+        all_cfgs = [dict(zip(self.nodes, inds)) for inds in
+                    itertools.product(*[range(len(n.candidates_quantization_cfg)) for n in self.nodes])]
+        for cfg in all_cfgs:
+            exp_ru, exp_detailed = self._compute_full(ru_calc, cfg, ru_targets)
+            assert tables.compute_resource_utilization(cfg) == exp_ru
+            util = tables.compute_utilization(cfg)
+            assert util.keys() == ru_targets
+            for target in ru_targets:
+                assert np.allclose(util[target], exp_detailed[target]), target
+            # any single node replacement
+            for n in self.nodes:
+                for ind in range(len(n.candidates_quantization_cfg)):
+                    new_cfg = {**cfg, n: ind}
+                    delta = tables.compute_utilization_delta(cfg, n, ind)
+                    _, exp_new_detailed = self._compute_full(ru_calc, new_cfg, ru_targets)
+                    for target in ru_targets:
+                        assert np.allclose(util[target] + delta[target], exp_new_detailed[target]), target
+
+    def test_compute_config_utilization_nodes_mismatch(self):
+        ru_calc = ResourceUtilizationCalculator(self.graph, self.fw_impl)
+        tables = ru_calc.compute_configuration_ru_tables(TIC.AnyQuantizedNonFused, {RUTarget.WEIGHTS}, self.nodes)
+        with pytest.raises(ValueError, match='Configuration nodes do not match'):
+            tables.compute_utilization({self.nodes[0]: 0, self.nodes[1]: 0})
+
+    def _compute_full(self, ru_calc, cfg, ru_targets):
+        act_qcs = {n.name: n.candidates_quantization_cfg[i].activation_quantization_cfg for n, i in cfg.items()}
+        w_qcs = {n.name: n.candidates_quantization_cfg[i].weights_quantization_cfg for n, i in cfg.items()}
+        ru, detailed = ru_calc.compute_resource_utilization(TIC.AnyQuantizedNonFused, BM.QCustom, act_qcs=act_qcs,
+                                                            w_qcs=w_qcs, ru_targets=ru_targets, allow_unused_qcs=True,
+                                                            return_detailed=True)
+        detailed = {target: np.array([ru.get_resource_utilization_dict()[target]])
+                    if target in [RUTarget.WEIGHTS, RUTarget.BOPS] else np.array(list(detailed[target].values()))
+                    for target in ru_targets}
+        return ru, detailed
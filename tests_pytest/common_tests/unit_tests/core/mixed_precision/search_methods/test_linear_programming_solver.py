@@ -126,6 +126,17 @@ class TestMixedPrecisionIntegerLPSolver:
         ru[RUTarget.BOPS][4, 0] += 0.1
         self._run_test(sensitivity, ru, ru_constraints, {'n1': 2, 'n2': 0, 'n3': 0})
 
+    @pytest.mark.parametrize('warm_start', [{'n1': 0, 'n2': 1, 'n3': 3},     # infeasible start
+                                            {'n1': 2, 'n2': 1, 'n3': 0},     # feasible non-optimal start
+                                            {'n1': 0, 'n2': 1, 'n3': 1}])    # optimal start
+    def test_warm_start(self, warm_start):
+        """ Test that warm-starting the solver from a previous solution doesn't change the selected solution. """
+        sensitivity = {'n1': [0.1, 0.4, 0.3], 'n2': [0.35, 0.3], 'n3': [0.7, 0.3, 0.8, 0.2]}
+        ru = {RUTarget.WEIGHTS: np.array([3, 2, 1] + [4, 4] + [5, 6, 7, 8])[:, None]}
+        solver = MixedPrecisionIntegerLPSolver(sensitivity, ru, {RUTarget.WEIGHTS: np.array([13])})
+        res = solver.run(warm_start_config=warm_start)
+        assert res == {'n1': 0, 'n2': 1, 'n3': 1}
+
     def _run_test(self, sensitivity, ru, ru_constraints, exp_res):
         solver = MixedPrecisionIntegerLPSolver(sensitivity, ru, ru_constraints)
         res = solver.run()
@@ -221,6 +221,30 @@ class TestMixedPrecisionSearchManager:
         with pytest.raises(ValueError, match='model cannot be quantized to meet the specified resource utilization'):
             run(w_mem=42*2/8+142*4/8-1, sensitivity={n2: [1, 1, 1], n3: [1, 1, 1]}, exp_cfg=None)
 
+    def test_search_frontier(self, patch_fw_info, fw_impl_mock):
+        """ Tests mp search over multiple weights ru constraints with a single sensitivity computation. """
+        g, [n1, n2, n3, n4, n5] = build_graph(patch_fw_info, w_mp=True, a_mp=False)
+        sensitivity = {n3: [2, 1, 3], n4: [4, 6, 5]}
+        w_mems = [42*8/8+142*12/8, 42*8/8+142*8/8, 42*2/8+142*4/8]
+        trus = [ResourceUtilization(weights_memory=w_mem) for w_mem in w_mems]
+
+        mgr = MixedPrecisionSearchManager(g, fw_impl=fw_impl_mock, sensitivity_evaluator=Mock(),
+                                          target_resource_utilization=trus[0], mp_config=Mock())
+        mgr._build_sensitivity_mapping = Mock(return_value=sensitivity)
+        res = mgr.search_frontier(trus)
+        mgr._build_sensitivity_mapping.assert_called_once()
+        assert mgr.layers_candidates_sensitivity == sensitivity
+
+        exp_cfgs = [{n3: 1, n4: 0}, {n3: 1, n4: 2}, {n3: 2, n4: 1}]
+        assert [cfg for cfg, _ in res] == exp_cfgs
+        assert [s for _, s in res] == pytest.approx([5, 6, 9])
+        # each frontier point is identical to a search with its own target
+        for tru, exp_cfg in zip(trus, exp_cfgs):
+            self._run_search_test(g, tru, sensitivity, exp_cfg, fw_impl_mock)
+
+        with pytest.raises(ValueError, match='to restrict the targets'):
+            mgr.search_frontier([trus[0], ResourceUtilization(activation_memory=100)])
+
     def test_search_activation(self, patch_fw_info, fw_impl_mock):
         """ Tests mp search with activation ru constraint.  """
         g, [n1, n2, n3, n4, n5] = build_graph(patch_fw_info, w_mp=False, a_mp=True)
@@ -390,6 +414,33 @@ class TestMixedPrecisionSearchManager:
         assert np.allclose(res[w_conf], np.array([0, 0.1]))
         assert np.allclose(res[aw_conf], np.array([0, 1.1, 2.2, 3.3]))
 
+    def test_build_sensitivity_mapping_with_workers(self, patch_fw_info, fw_impl_mock):
+        """ Test that with multiple sensitivity evaluation workers, all configurations are passed to
+            compute_metrics at once, and the sensitivity mapping is built from its results by order. """
+        patch_fw_info.get_kernel_op_attribute = lambda nt: None
+
+        ph = build_node('ph', qcs=[build_nbits_qc()])
+        n1 = build_node('n1', qcs=[build_nbits_qc(nb) for nb in (4, 2, 8)])
+        n2 = build_node('n2', qcs=[build_nbits_qc(nb) for nb in (4, 8)])
+        g = Graph(name='g', input_nodes=[ph], nodes=[n1], output_nodes=[n2],
+                  edge_list=[Edge(ph, n1, 0, 0), Edge(n1, n2, 0, 0)])
+
+        se = Mock(spec_set=SensitivityEvaluation)
+        se.compute_metrics = Mock(return_value=[1, 2, 3, 4, 5])
+
+        mp_config = MixedPrecisionQuantizationConfig(metric_normalization=MpMetricNormalization.NONE,
+                                                     metric_epsilon=None, sensitivity_evaluation_num_workers=4)
+        mgr = MixedPrecisionSearchManager(g, fw_impl=fw_impl_mock,
+                                          sensitivity_evaluator=se,
+                                          target_resource_utilization=ResourceUtilization(activation_memory=100),
+                                          mp_config=mp_config)
+        res = mgr._build_sensitivity_mapping()
+        se.compute_metrics.assert_called_once_with([({'n1': 0}, {}), ({'n1': 1}, {}), ({'n1': 2}, {}),
+                                                    ({'n2': 0}, {}), ({'n2': 1}, {})], 4)
+        se.compute_metric.assert_not_called()
+        assert np.array_equal(res[n1], np.array([1, 2, 3]))
+        assert np.array_equal(res[n2], np.array([4, 5]))
+
     def test_build_sensitivity_mapping_virtual_graph(self, graph_mock, patch_fw_info, fw_impl_mock, mocker):
         """ Test build_sensitivity method for virtual graph. We only test apis integration:
             - mock virtual graph, config reconstructor and sensitivity evaluator.
@@ -17,6 +17,8 @@ import numpy as np
 
 from unittest.mock import Mock
 from model_compression_toolkit.core.common import Graph, BaseNode
+from model_compression_toolkit.core.common.framework_info import ChannelAxisMapping
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import qparams_computation
 from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_computation import \
     calculate_quantization_params
 from model_compression_toolkit.core.common.quantization.candidate_node_quantization_config import \
@@ -115,3 +117,95 @@ class TestCalculateQuantizationParams:
             else:
                 assert 'threshold' not in candidate_qc.activation_quantization_cfg.activation_quantization_params.keys()
                 assert 'is_signed' not in candidate_qc.activation_quantization_cfg.activation_quantization_params.keys()
+
+    def test_weights_params_memoized_across_candidates(self, mocker):
+        """
+        Tests that weights quantization params are computed once per distinct weights attribute config.
+        """
+        graph = self.get_test_graph('node', ActivationQuantizationMode.NO_QUANT, [0.7, 1.4, 2.1])
+        node = list(graph.nodes)[0]
+        node.kernel_attr = 'kernel'
+        node.get_node_weights_attributes.return_value = ['kernel']
+        node.is_weights_quantization_enabled.return_value = True
+        node.get_weights_by_keys.return_value = np.ones((3, 4))
+
+        def build_candidate(n_bits):
+            attr_cfg = Mock(weights_quantization_method=QuantizationMethod.POWER_OF_TWO, weights_n_bits=n_bits,
+                            weights_per_channel_threshold=True, weights_channels_axis=ChannelAxisMapping(0, 1))
+            candidate = Mock(spec=CandidateNodeQuantizationConfig)
+            candidate.activation_quantization_cfg = node.candidates_quantization_cfg[0].activation_quantization_cfg
+            candidate.weights_quantization_cfg = Mock(spec=NodeWeightsQuantizationConfig)
+            candidate.weights_quantization_cfg.get_attr_config.return_value = attr_cfg
+            return candidate
+
+        # candidates that differ only in activation bit-width share the weights attribute config
+        node.candidates_quantization_cfg = [build_candidate(n_bits) for n_bits in [8, 8, 4, 8, 4]]
+        compute_mock = mocker.patch.object(qparams_computation, 'compute_weights_qparams',
+                                           side_effect=lambda data, attr_cfg, *args, **kwargs:
+                                           ({'threshold': attr_cfg.weights_n_bits}, 0))
+
+        calculate_quantization_params(graph, QuantizationConfig(), Mock(), Mock())
+
+        assert compute_mock.call_count == 2
+        for candidate in node.candidates_quantization_cfg:
+            attr_cfg = candidate.weights_quantization_cfg.get_attr_config('kernel')
+            attr_cfg.set_weights_quantization_param.assert_called_once_with({'threshold': attr_cfg.weights_n_bits})
+
+    def test_parallel_computation(self):
+        """
+        Tests that computing the params in worker processes sets the same params as the sequential computation.
+        """
+        def build_graph():
+            rng = np.random.default_rng(0)
+            nodes = []
+            for i in range(5):
+                node = self.build_node(f'node{i}', q_mode=ActivationQuantizationMode.QUANT)
+                node.kernel_attr = 'kernel'
+                node.get_node_weights_attributes.return_value = ['kernel']
+                node.is_weights_quantization_enabled.return_value = True
+                node.get_weights_by_keys.return_value = rng.normal(size=(4, 3))
+                candidates = []
+                for n_bits in [8, 4]:
+                    candidate = Mock(spec=CandidateNodeQuantizationConfig)
+                    candidate.activation_quantization_cfg = NodeActivationQuantizationConfig(op_cfg=self.build_op_cfg())
+                    candidate.weights_quantization_cfg = Mock(spec=NodeWeightsQuantizationConfig)
+                    candidate.weights_quantization_cfg.get_attr_config.return_value = Mock(
+                        weights_quantization_method=QuantizationMethod.SYMMETRIC, weights_n_bits=n_bits,
+                        weights_per_channel_threshold=True, weights_channels_axis=ChannelAxisMapping(0, 1))
+                    candidates.append(candidate)
+                node.candidates_quantization_cfg = candidates
+                nodes.append(node)
+            graph = Graph('graph_name', input_nodes=[nodes[0]], nodes=nodes, output_nodes=[nodes[-1]], edge_list=[])
+            graph.node_to_out_stats_collector = dict()
+            for i, n in enumerate(nodes):
+                n.prior_info = NodePriorInfo()
+                graph.node_to_out_stats_collector[n] = StatsCollector(init_min_value=0.0, init_max_value=1.0,
+                                                                      out_channel_axis=0)
+                graph.node_to_out_stats_collector[n].hc._n_bins = 3
+                graph.node_to_out_stats_collector[n].hc._bins = np.array([0.4, 0.8, 1.2]) * (i + 1)
+                graph.node_to_out_stats_collector[n].hc._counts = np.array([1, 1])
+            return graph
+
+        def get_params(graph):
+            params = []
+            for n in graph.get_topo_sorted_nodes():
+                for candidate in n.candidates_quantization_cfg:
+                    attr_cfg = candidate.weights_quantization_cfg.get_attr_config('kernel')
+                    params.append((attr_cfg.set_weights_quantization_param.call_args.args[0],
+                                   attr_cfg.weights_channels_axis,
+                                   candidate.activation_quantization_cfg.activation_quantization_params))
+            return params
+
+        sequential_graph, parallel_graph = build_graph(), build_graph()
+        calculate_quantization_params(sequential_graph, QuantizationConfig(), Mock(), Mock())
+        calculate_quantization_params(parallel_graph, QuantizationConfig(qparams_computation_num_workers=2), Mock(),
+                                      Mock())
+
+        sequential_params, parallel_params = get_params(sequential_graph), get_params(parallel_graph)
+        assert len(sequential_params) == len(parallel_params) == 10
+        for (w_params, w_axis, a_params), (exp_w_params, exp_w_axis, exp_a_params) in zip(parallel_params,
+                                                                                          sequential_params):
+            assert w_params.keys() == exp_w_params.keys()
+            assert all(np.array_equal(w_params[k], exp_w_params[k]) for k in w_params)
+            assert w_axis == exp_w_axis
+            assert a_params == exp_a_params
@@ -0,0 +1,103 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from model_compression_toolkit.core import QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import error_functions, \
+    power_of_two_selection, symmetric_selection, uniform_selection
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
+    power_of_two_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
+    symmetric_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.uniform_selection import \
+    uniform_selection_tensor
+
+
+@pytest.fixture
+def tensor_data():
+    # Channels with different scales, so the best candidate differs between the channels.
+    scales = np.array([0.01, 0.1, 1., 10.]).reshape(-1, 1, 1, 1)
+    return (scales * np.random.default_rng(0).normal(size=(4, 3, 3, 8))).astype(np.float32)
+
+
+def test_hmse_error_function_per_channel(tensor_data):
+    """ Check that the per-channel HMSE error is the Hessian weighted MSE of each channel. """
+    hessian_scores = np.abs(np.random.default_rng(1).normal(size=tensor_data.shape))
+    fxp_tensor = np.round(tensor_data * 10) / 10
+    x, q = tensor_data.reshape(4, -1), fxp_tensor.reshape(4, -1)
+    w = hessian_scores.reshape(4, -1)
+
+    error = error_functions._hmse_error_function_wrapper(x, q, axis=-1, norm=False, hessian_scores=hessian_scores)
+    assert np.allclose(error, np.mean((w * (x - q)) ** 2, axis=-1))
+
+    norm_error = error_functions._hmse_error_function_wrapper(x, q, axis=-1, norm=True, hessian_scores=hessian_scores)
+    assert np.allclose(norm_error, error / (np.mean(x ** 2, axis=-1) + 1e-8))
+
+
+@pytest.mark.parametrize('selection_fn', [power_of_two_selection_tensor, symmetric_selection_tensor,
+                                          uniform_selection_tensor])
+@pytest.mark.parametrize('batch_search', [True, False])
+def test_hmse_per_channel_selection(selection_fn, batch_search, tensor_data, mocker):
+    """ Check that the per-channel HMSE search with constant Hessian scores selects the per-channel MSE params. """
+    if not batch_search:
+        for module in [power_of_two_selection, symmetric_selection, uniform_selection]:
+            mocker.patch.object(module, 'get_threshold_selection_tensor_batch_error_function', return_value=None)
+    hessian_info_service = Mock()
+    hessian_info_service.fetch_hessian.return_value = {'node': np.ones((4,) + tensor_data.shape, dtype=np.float32)}
+    node = Mock()
+    node.name = 'node'
+    kwargs = dict(p=2, n_bits=4, per_channel=True, channel_axis=0)
+
+    params, _ = selection_fn(tensor_data, quant_error_method=QuantizationErrorMethod.HMSE, node=node,
+                             hessian_info_service=hessian_info_service, **kwargs)
+    exp_params, _ = selection_fn(tensor_data, quant_error_method=QuantizationErrorMethod.MSE, **kwargs)
+
+    assert params.keys() == exp_params.keys()
+    for k in params:
+        assert np.allclose(params[k], exp_params[k], rtol=1e-6, atol=0), k
+
+
+@pytest.mark.parametrize('selection_fn, exp_params', [
+    (power_of_two_selection_tensor, {'threshold': [0.03125, 0.25, 2., 32.]}),
+    (symmetric_selection_tensor, {'threshold': [0.025420595806791322, 0.2179473762116256, 2.213952766518592,
+                                                33.44527094908985]}),
+    (uniform_selection_tensor, {'range_min': [-0.025508909225463866, -0.2086038811202103, -1.8903245577302579,
+                                              -30.27580887299562],
+                                'range_max': [0.022116262258163516, 0.19954480489519735, 2.252211015854294,
+                                              32.40132088043379]}),
+])
+@pytest.mark.parametrize('batch_search', [True, False])
+def test_hmse_per_channel_selection_regression(selection_fn, exp_params, batch_search, tensor_data, mocker):
+    """ Pin the per-channel HMSE params since the error is computed per channel. Before that, all channels were
+        selected by a single error (e.g. the power of two thresholds were [0.015625, 0.125, 2, 32]). """
+    if not batch_search:
+        for module in [power_of_two_selection, symmetric_selection, uniform_selection]:
+            mocker.patch.object(module, 'get_threshold_selection_tensor_batch_error_function', return_value=None)
+    hessian_info_service = Mock()
+    hessian_info_service.fetch_hessian.return_value = {
+        'node': np.abs(np.random.default_rng(1).normal(size=(4,) + tensor_data.shape)).astype(np.float32)}
+    node = Mock()
+    node.name = 'node'
+
+    params, _ = selection_fn(tensor_data, p=2, n_bits=4, per_channel=True, channel_axis=0,
+                             quant_error_method=QuantizationErrorMethod.HMSE, node=node,
+                             hessian_info_service=hessian_info_service)
+
+    assert params.keys() == exp_params.keys()
+    for k in params:
+        assert np.allclose(np.asarray(params[k]).flatten(), exp_params[k], rtol=1e-6, atol=0), k
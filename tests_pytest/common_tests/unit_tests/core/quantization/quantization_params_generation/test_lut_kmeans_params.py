@@ -0,0 +1,119 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import itertools
+
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+
+from model_compression_toolkit.constants import LUT_VALUES, SCALE_PER_CHANNEL, THRESHOLD, SIGNED, LUT_VALUES_BITWIDTH
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.lut_kmeans_params import \
+    lut_kmeans_tensor, lut_kmeans_histogram
+from model_compression_toolkit.core.common.quantization.quantizers.quantizers_helpers import kmeans_1d, \
+    int_quantization_with_threshold
+
+
+def _clustering_error(data, centers, sample_weight=None):
+    sample_weight = np.ones(data.size) if sample_weight is None else sample_weight
+    return np.sum(np.min((data.reshape([-1, 1]) - centers.reshape([1, -1])) ** 2, axis=1) * sample_weight)
+
+
+def _sklearn_centers(data, n_clusters, sample_weight=None):
+    """ Cluster centers computed by sklearn's k-means, as in the previous implementation of the LUT quantizers. """
+    kmeans = KMeans(n_clusters=n_clusters, n_init=10, random_state=0)
+    kmeans.fit(data.reshape(-1, 1), sample_weight=sample_weight)
+    return kmeans.cluster_centers_
+
+
+class TestKmeans1D:
+    def test_optimal_clustering(self):
+        """ Check the clustering of integer data against a brute force search over all the clusterings. """
+        rng = np.random.default_rng(0)
+        data = np.arange(-4, 6)
+        sample_weight = rng.integers(1, 10, size=data.size)
+        n_clusters = 4
+
+        best_error = np.inf
+        for bounds in itertools.combinations(range(1, data.size), n_clusters - 1):
+            clusters = np.split(np.arange(data.size), bounds)
+            centers = np.array([np.average(data[c], weights=sample_weight[c]) for c in clusters])
+            best_error = min(best_error, _clustering_error(data, centers, sample_weight))
+
+        centers = kmeans_1d(data, n_clusters, sample_weight=sample_weight)
+        assert centers.shape == (n_clusters, 1)
+        assert np.all(np.diff(centers.flatten()) > 0)
+        assert np.isclose(_clustering_error(data, centers, sample_weight), best_error)
+
+    def test_equal_to_sklearn_on_separated_clusters(self):
+        rng = np.random.default_rng(1)
+        exp_centers = np.array([-100., -30., 10., 70.])
+        data = np.concatenate([c + rng.normal(scale=2, size=1000) for c in exp_centers])
+        centers = kmeans_1d(data, len(exp_centers))
+        assert np.allclose(centers, np.sort(_sklearn_centers(data, len(exp_centers)), axis=0))
+        assert np.allclose(np.round(centers.flatten()), exp_centers)
+
+    def test_not_worse_than_sklearn(self):
+        rng = np.random.default_rng(2)
+        data = int_quantization_with_threshold(rng.normal(size=20000), 4., LUT_VALUES_BITWIDTH)
+        sample_weight = rng.uniform(size=data.size)
+        for n_clusters in [2, 4, 16]:
+            error = _clustering_error(data, kmeans_1d(data, n_clusters, sample_weight), sample_weight)
+            sklearn_error = _clustering_error(data, _sklearn_centers(data, n_clusters, sample_weight), sample_weight)
+            assert error <= sklearn_error * (1 + 1e-3)
+
+    def test_fewer_bins_than_clusters(self):
+        data = np.array([-3., -3.1, 2., 2.2, 7.])
+        sample_weight = np.array([1., 1., 1., 3., 0.])
+        centers = kmeans_1d(data, 4, sample_weight=sample_weight)
+        assert np.allclose(centers.flatten(), [-3.05, 2.15])
+
+
+class TestLutKmeansParams:
+    @pytest.mark.parametrize('n_bits', [2, 4])
+    @pytest.mark.parametrize('is_symmetric', [True, False])
+    def test_lut_kmeans_tensor(self, n_bits, is_symmetric):
+        """ Check the LUT values against the previous implementation with sklearn's k-means. """
+        tensor_data = np.random.default_rng(3).normal(size=(16, 8, 3, 3))
+        params, channel_axis = lut_kmeans_tensor(tensor_data, p=2, n_bits=n_bits, per_channel=True, channel_axis=0,
+                                                 is_symmetric=is_symmetric)
+        assert channel_axis == 0
+        lut_values = params[LUT_VALUES]
+        assert lut_values.shape == (2 ** n_bits, 1)
+        assert np.any(lut_values == 0)
+
+        tensor_for_kmeans = int_quantization_with_threshold(tensor_data, params[SCALE_PER_CHANNEL],
+                                                            LUT_VALUES_BITWIDTH)
+        exp_lut_values = np.round(_sklearn_centers(tensor_for_kmeans, 2 ** n_bits))
+        exp_lut_values[np.argmin(np.abs(exp_lut_values))] = 0
+        # The centers are rounded and the one closest to zero is set to zero, so close clusterings may end up with
+        # slightly different errors.
+        assert (_clustering_error(tensor_for_kmeans, lut_values) <=
+                _clustering_error(tensor_for_kmeans, exp_lut_values) * (1 + 5e-2))
+
+    @pytest.mark.parametrize('n_bits', [2, 4])
+    def test_lut_kmeans_histogram(self, n_bits):
+        """ Check the LUT values against the previous implementation with sklearn's k-means. """
+        counts, bins = np.histogram(np.random.default_rng(4).normal(size=10000), bins=100)
+        params = lut_kmeans_histogram(bins, counts, p=2, n_bits=n_bits, min_value=bins[0], max_value=bins[-1])
+        assert params[SIGNED]
+        lut_values = params[LUT_VALUES]
+        assert lut_values.dtype == np.float32
+        assert lut_values.shape == (2 ** n_bits, 1)
+
+        tensor_for_kmeans = int_quantization_with_threshold(bins, params[THRESHOLD], LUT_VALUES_BITWIDTH)
+        sample_weight = np.insert(counts, 0, 0)
+        exp_lut_values = np.round(_sklearn_centers(tensor_for_kmeans, 2 ** n_bits, sample_weight))
+        assert (_clustering_error(tensor_for_kmeans, lut_values, sample_weight) <=
+                _clustering_error(tensor_for_kmeans, exp_lut_values, sample_weight) * (1 + 1e-2))
@@ -0,0 +1,140 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from model_compression_toolkit.core import QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation import error_functions, \
+    power_of_two_selection, symmetric_selection, uniform_selection, qparams_search
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    QParamsSearchBackend
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
+    power_of_two_selection_tensor, power_of_two_selection_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
+    symmetric_selection_tensor, symmetric_selection_histogram
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.uniform_selection import \
+    uniform_selection_tensor, uniform_selection_histogram
+
+
+selection_modules = [power_of_two_selection, symmetric_selection, uniform_selection]
+error_methods = [QuantizationErrorMethod.MSE, QuantizationErrorMethod.MAE, QuantizationErrorMethod.LP,
+                 QuantizationErrorMethod.HMSE]
+
+
+def _disable_batch_search(mocker):
+    for module in selection_modules:
+        mocker.patch.object(module, 'get_threshold_selection_tensor_batch_error_function', return_value=None)
+        mocker.patch.object(module, 'get_threshold_selection_histogram_batch_error_function', return_value=None)
+
+
+def _assert_params_equal(params, exp_params):
+    assert params.keys() == exp_params.keys()
+    for k in params:
+        assert np.allclose(params[k], exp_params[k], rtol=1e-6, atol=0), k
+
+
+@pytest.fixture
+def tensor_data():
+    return np.random.default_rng(0).normal(size=(3, 3, 8, 16)).astype(np.float32)
+
+
+@pytest.fixture
+def hessian_info_service(tensor_data):
+    hessians = np.abs(np.random.default_rng(1).normal(size=(4,) + tensor_data.shape)).astype(np.float32)
+    service = Mock()
+    service.fetch_hessian.return_value = {'node': hessians}
+    return service
+
+
+class TestVectorizedTensorSearch:
+    @pytest.mark.parametrize('selection_fn', [power_of_two_selection_tensor, symmetric_selection_tensor,
+                                              uniform_selection_tensor])
+    @pytest.mark.parametrize('error_method', error_methods)
+    @pytest.mark.parametrize('per_channel, channel_axis', [(True, 0), (True, 3), (False, None), (True, None)])
+    def test_equal_to_iterative_search(self, selection_fn, error_method, per_channel, channel_axis, tensor_data,
+                                       hessian_info_service, mocker):
+        """ Check that the vectorized candidates search selects the same params as the iterative search. """
+        if error_method == QuantizationErrorMethod.HMSE and per_channel and channel_axis != 0:
+            pytest.skip('HMSE per-channel search expects the kernel output channel axis.')
+        kwargs = dict(p=3, n_bits=4, per_channel=per_channel, channel_axis=channel_axis,
+                      quant_error_method=error_method, node=Mock(name='node'),
+                      hessian_info_service=hessian_info_service)
+        kwargs['node'].name = 'node'
+        batch_spy = mocker.spy(qparams_search, '_compute_candidates_errors')
+
+        params, axis = selection_fn(tensor_data, **kwargs)
+        assert batch_spy.call_count > 0
+
+        _disable_batch_search(mocker)
+        exp_params, exp_axis = selection_fn(tensor_data, **kwargs)
+        assert axis == exp_axis
+        _assert_params_equal(params, exp_params)
+
+    def test_chunked_evaluation(self, tensor_data, mocker):
+        """ Check that evaluating the candidates in chunks doesn't change the result. """
+        params, _ = symmetric_selection_tensor(tensor_data, p=2, n_bits=8, per_channel=True, channel_axis=3)
+        mocker.patch.object(QParamsSearchBackend, 'max_batch_elements', 3 * tensor_data.size)
+        batch_spy = mocker.spy(qparams_search, '_compute_candidates_errors')
+        chunked_params, _ = symmetric_selection_tensor(tensor_data, p=2, n_bits=8, per_channel=True, channel_axis=3)
+        _assert_params_equal(chunked_params, params)
+        assert all(len(spy_res) == 30 for spy_res in batch_spy.spy_return_list)
+
+    def test_chunk_size(self, mocker):
+        backend = QParamsSearchBackend()
+        # small tensors are batched up to the max batch elements
+        assert backend.get_chunk_size(1000) == QParamsSearchBackend.max_batch_elements // 1000
+        # on the host, the candidates of a realistically sized kernel are evaluated one by one
+        kernel_size = 256 * 256 * 3 * 3
+        assert backend.get_chunk_size(kernel_size) == 1
+
+        # with a min number of candidates, large tensors are batched as long as they fit in the memory budget
+        backend.min_batch_candidates = 8
+        chunk_nbytes = kernel_size * backend.batch_element_nbytes
+        mocker.patch.object(backend, 'get_available_memory', return_value=100 * chunk_nbytes)
+        assert backend.get_chunk_size(kernel_size) == 8
+        mocker.patch.object(backend, 'get_available_memory', return_value=30 * chunk_nbytes)
+        assert backend.get_chunk_size(kernel_size) == 3
+        mocker.patch.object(backend, 'get_available_memory', return_value=chunk_nbytes)
+        assert backend.get_chunk_size(kernel_size) == 1
+        assert backend.get_chunk_size(1000) == QParamsSearchBackend.max_batch_elements // 1000
+
+    def test_kl_is_not_batched(self):
+        assert error_functions.get_threshold_selection_tensor_batch_error_function(QuantizationErrorMethod.KL,
+                                                                                   p=2) is None
+        assert error_functions.get_threshold_selection_histogram_batch_error_function(QuantizationErrorMethod.KL,
+                                                                                      p=2) is None
+
+
+class TestVectorizedHistogramSearch:
+    @pytest.mark.parametrize('selection_fn', [power_of_two_selection_histogram, symmetric_selection_histogram,
+                                              uniform_selection_histogram])
+    @pytest.mark.parametrize('error_method', [QuantizationErrorMethod.MSE, QuantizationErrorMethod.MAE,
+                                              QuantizationErrorMethod.LP])
+    @pytest.mark.parametrize('signed', [True, False])
+    def test_equal_to_iterative_search(self, selection_fn, error_method, signed, mocker):
+        """ Check that the vectorized candidates search selects the same params as the iterative search. """
+        data = np.random.default_rng(2).normal(size=10000)
+        counts, bins = np.histogram(data if signed else np.abs(data), bins=256)
+        kwargs = dict(p=3, n_bits=8, min_value=bins[0], max_value=bins[-1], quant_error_method=error_method)
+        batch_spy = mocker.spy(qparams_search, '_compute_candidates_errors')
+
+        params = selection_fn(bins, counts, **kwargs)
+        assert batch_spy.call_count > 0
+
+        _disable_batch_search(mocker)
+        exp_params = selection_fn(bins, counts, **kwargs)
+        _assert_params_equal(params, exp_params)
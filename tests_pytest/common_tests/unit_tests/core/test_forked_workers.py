@@ -0,0 +1,83 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from model_compression_toolkit.core.common.framework_implementation import FrameworkImplementation
+from model_compression_toolkit.core.common.forked_workers import map_in_forked_workers
+from model_compression_toolkit.logger import Logger
+
+_initialized_worker = False
+
+
+def _init_forked_worker():
+    global _initialized_worker
+    _initialized_worker = True
+
+
+@pytest.fixture
+def fw_impl():
+    fw_impl = Mock(spec=FrameworkImplementation)
+    fw_impl.supports_forked_workers.return_value = True
+    fw_impl.supports_forked_inference.return_value = True
+    fw_impl.init_forked_worker.side_effect = _init_forked_worker
+    return fw_impl
+
+
+def _run(fw_impl, num_workers=3, **kwargs):
+    # The function references a local object, which is inherited by the workers without pickling.
+    offset = {'value': 10}
+    return list(map_in_forked_workers(lambda x: (x + offset['value'], os.getpid(), _initialized_worker), range(7),
+                                      num_workers, fw_impl, 'test task', **kwargs))
+
+
+@pytest.mark.parametrize('chunksize', [1, 3])
+def test_map_in_workers(fw_impl, chunksize):
+    results = _run(fw_impl, chunksize=chunksize)
+    assert [r[0] for r in results] == list(range(10, 17))
+    assert all(pid != os.getpid() for _, pid, _ in results)
+    assert all(initialized for _, _, initialized in results)
+    assert not _initialized_worker
+
+
+@pytest.mark.parametrize('num_workers', [1, 0])
+def test_single_worker(fw_impl, num_workers, mocker):
+    warn_spy = mocker.patch.object(Logger, 'warning')
+    results = _run(fw_impl, num_workers=num_workers)
+    assert results == [(x, os.getpid(), False) for x in range(10, 17)]
+    warn_spy.assert_not_called()
+
+
+@pytest.mark.parametrize('fork_supported, inference_supported, requires_inference, exp_msg', [
+    (False, True, False, "can't fork worker processes"),
+    (True, False, True, 'is not supported by'),
+])
+def test_fallback_to_current_process(fw_impl, fork_supported, inference_supported, requires_inference, exp_msg,
+                                     mocker):
+    fw_impl.supports_forked_workers.return_value = fork_supported
+    fw_impl.supports_forked_inference.return_value = inference_supported
+    warn_spy = mocker.patch.object(Logger, 'warning')
+    results = _run(fw_impl, requires_inference=requires_inference)
+    assert results == [(x, os.getpid(), False) for x in range(10, 17)]
+    assert f'Parallel test task {exp_msg}' in warn_spy.call_args.args[0]
+
+
+def test_no_inference_ignores_inference_support(fw_impl):
+    fw_impl.supports_forked_inference.return_value = False
+    results = _run(fw_impl, requires_inference=False)
+    assert [r[0] for r in results] == list(range(10, 17))
+    assert all(pid != os.getpid() for _, pid, _ in results)
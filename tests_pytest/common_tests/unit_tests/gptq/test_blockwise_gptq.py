@@ -0,0 +1,138 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from model_compression_toolkit.core.common import Graph
+from model_compression_toolkit.core.common.graph.base_graph import OutTensor
+from model_compression_toolkit.core.common.graph.edge import Edge
+from model_compression_toolkit.gptq.common.blockwise_gptq import get_gptq_blocks, get_block_graph, BlockInputsCache, \
+    blockwise_gptq_training
+from tests_pytest._test_util.graph_builder_utils import build_node, build_nbits_qc
+
+
+@pytest.fixture
+def graph(patch_fw_info):
+    """ in -> c1 -> (r1, c2) -> add -> c3 -> c4 """
+    nodes = {name: build_node(name, qcs=[build_nbits_qc()]) for name in ['in', 'c1', 'r1', 'c2', 'add', 'c3', 'c4']}
+    edges = [Edge(nodes['in'], nodes['c1'], 0, 0), Edge(nodes['c1'], nodes['r1'], 0, 0),
+             Edge(nodes['c1'], nodes['c2'], 0, 0), Edge(nodes['r1'], nodes['add'], 0, 0),
+             Edge(nodes['c2'], nodes['add'], 0, 1), Edge(nodes['add'], nodes['c3'], 0, 0),
+             Edge(nodes['c3'], nodes['c4'], 0, 0)]
+    graph = Graph('g', list(nodes.values()), [nodes['in']], [OutTensor(nodes['c4'], 0)], edges)
+    graph.fqc = Mock()
+    return graph
+
+
+def _names(blocks):
+    return [[n.name for n in block] for block in blocks]
+
+
+class TestGetGPTQBlocks:
+    def _compare_points(self, graph):
+        return [n for n in graph.get_topo_sorted_nodes() if n.name in ['c1', 'c2', 'c3', 'c4']]
+
+    @pytest.mark.parametrize('per_block, exp_blocks', [
+        (1, [['in', 'c1'], ['r1', 'c2', 'add'], ['c3'], ['c4']]),
+        (2, [['in', 'c1', 'r1', 'c2', 'add'], ['c3', 'c4']]),
+        # the last block must contain per_block compare points, so the remaining compare point is not split
+        (3, [['in', 'c1', 'r1', 'c2', 'add', 'c3', 'c4']]),
+        (4, [['in', 'c1', 'r1', 'c2', 'add', 'c3', 'c4']]),
+    ])
+    def test_blocks(self, graph, per_block, exp_blocks):
+        blocks = get_gptq_blocks(graph, self._compare_points(graph), per_block)
+        assert _names(blocks) == exp_blocks
+
+    def test_reused_nodes(self, graph):
+        c3, c4 = [graph.find_node_by_name(name)[0] for name in ['c3', 'c4']]
+        c3.reuse_group = c4.reuse_group = 'c'
+        blocks = get_gptq_blocks(graph, self._compare_points(graph), 1)
+        assert _names(blocks) == [['in', 'c1'], ['r1', 'c2', 'add'], ['c3', 'c4']]
+
+    def test_graph_output_in_block(self, graph):
+        # an intermediate graph output is used by the last block
+        graph.output_nodes = [OutTensor(graph.find_node_by_name('c1')[0], 0)] + graph.output_nodes
+        blocks = get_gptq_blocks(graph, self._compare_points(graph), 1)
+        assert _names(blocks) == [['in', 'c1', 'r1', 'c2', 'add', 'c3', 'c4']]
+
+
+class TestGetBlockGraph:
+    def test_first_block(self, graph):
+        blocks = get_gptq_blocks(graph, [], 1)
+        in_, c1, r1, c2, add = blocks[0][:5]
+        block_graph = get_block_graph(graph, [in_, c1, r1, c2, add], None, False, Mock())
+        assert block_graph.get_inputs() == [in_]
+        assert block_graph.get_outputs() == [OutTensor(add, 0)]
+        assert set(block_graph.nodes) == {in_, c1, r1, c2, add}
+        assert len(block_graph.edges) == 5
+        assert block_graph.user_info is not graph.user_info
+
+    def test_block_input(self, graph):
+        c1, r1, c2, add = [graph.find_node_by_name(name)[0] for name in ['c1', 'r1', 'c2', 'add']]
+        fw_impl = Mock()
+        fw_impl.get_block_input_node = lambda name, shape: build_node(name, output_shape=shape)
+        block_graph = get_block_graph(graph, [r1, c2, add], c1, False, fw_impl)
+
+        [input_node] = block_graph.get_inputs()
+        assert input_node is not c1 and input_node.name == 'c1'
+        assert input_node.is_activation_quantization_enabled()
+        assert set(block_graph.nodes) == {input_node, r1, c2, add}
+        assert {(e.source_node, e.sink_node) for e in block_graph.out_edges(input_node)} == {(input_node, r1),
+                                                                                           (input_node, c2)}
+        assert block_graph.get_outputs() == [OutTensor(add, 0)]
+        assert block_graph.user_info.input_scale == 1
+
+    def test_last_block(self, graph):
+        add, c3, c4 = [graph.find_node_by_name(name)[0] for name in ['add', 'c3', 'c4']]
+        fw_impl = Mock()
+        fw_impl.get_block_input_node = lambda name, shape: build_node(name, output_shape=shape)
+        block_graph = get_block_graph(graph, [c3, c4], add, True, fw_impl)
+        assert block_graph.get_outputs() == graph.get_outputs()
+        assert [n.name for n in block_graph.get_topo_sorted_nodes()] == ['add', 'c3', 'c4']
+
+
+@pytest.mark.parametrize('max_host_memory, is_memmap', [(10 * 6 * 4 + 10 * 5 * 2, False),
+                                                         (10 * 6 * 4 + 10 * 5 * 2 - 1, True), (0, True)])
+def test_block_inputs_cache(tmp_path, max_host_memory, is_memmap):
+    x = np.random.randn(10, 2, 3).astype(np.float32)
+    y = np.random.randn(10, 5).astype(np.float16)
+    cache = BlockInputsCache(max_host_memory=max_host_memory, cache_dir=str(tmp_path))
+    # the inputs move to files once they exceed the host memory limit (after the last batch, or the first)
+    for start in range(0, 10, 3):
+        cache.append([x[start: start + 3], y[start: start + 3]])
+    assert cache.is_memmap == is_memmap
+    assert len(os.listdir(tmp_path)) == is_memmap
+
+    for _ in range(2):
+        batches = list(cache.data_gen())
+        assert [b[0].shape[0] for b in batches] == [3, 3, 3, 1]
+        assert np.array_equal(np.concatenate([b[0] for b in batches]), x)
+        assert np.array_equal(np.concatenate([b[1] for b in batches]), y)
+        assert all(isinstance(b[0], np.memmap) == is_memmap for b in batches)
+
+    cache.close()
+    assert cache.batches == []
+    assert os.listdir(tmp_path) == []
+
+
+def test_unsupported_framework(graph):
+    fw_impl = Mock()
+    fw_impl.supports_blockwise_gptq.return_value = False
+    with pytest.raises(Exception, match='Block-wise GPTQ is not supported'):
+        blockwise_gptq_training(graph, graph, Mock(), Mock(), fw_impl)
+    fw_impl.get_gptq_trainer_obj.assert_not_called()
@@ -22,7 +22,9 @@ from model_compression_toolkit.core.common import StatsCollector, NoStatsCollect
 from model_compression_toolkit.core.common.graph.base_graph import OutTensor
 from model_compression_toolkit.core.common.graph.edge import Edge
 from model_compression_toolkit.core.common.hessian import HessianInfoService
-from model_compression_toolkit.core.common.model_collector import create_stats_collector_for_node, create_tensor2node, ModelCollector
+from model_compression_toolkit.core.common.model_collector import create_stats_collector_for_node, create_tensor2node, ModelCollector, \
+    get_stats_collector_plan
+from model_compression_toolkit.core.common.quantization.quantization_config import QuantizationConfig
 from tests_pytest._test_util.graph_builder_utils import build_node, DummyLayer, build_nbits_qc as build_qc
 
 
@@ -226,7 +228,7 @@ class TestModelCollectorInit:
 
         calls = []
         # Define a fake function to record call arguments for create_tensor2node.
-        def fake_create_tensor2node(graph, node):
+        def fake_create_tensor2node(graph, node, *args):
             calls.append((graph, node))
 
         # Patch create_tensor2node in the model_collector module.
@@ -491,3 +493,42 @@ class TestFLNModelCollectorInfer:
 
         assert calls[2][0][0] is self.fake_output3
         assert calls[2][0][1] is None
+
+
+class TestStatsCollectorPlan:
+    @pytest.mark.parametrize('error_method', [QuantizationErrorMethod.MSE, QuantizationErrorMethod.NOCLIPPING,
+                                              QuantizationErrorMethod.KL])
+    def test_plan_non_hmse(self, error_method):
+        plan = get_stats_collector_plan(QuantizationConfig(activation_error_method=error_method,
+                                                           weights_bias_correction=False))
+        assert plan.histogram and not plan.weighted_histogram and not plan.mean
+
+    @pytest.mark.parametrize('snc, abc, expected_histogram', [(False, False, False),
+                                                              (True, False, True),
+                                                              (False, True, True)])
+    def test_plan_hmse(self, snc, abc, expected_histogram):
+        plan = get_stats_collector_plan(QuantizationConfig(activation_error_method=QuantizationErrorMethod.HMSE,
+                                                           shift_negative_activation_correction=snc,
+                                                           activation_bias_correction=abc))
+        assert plan.histogram == expected_histogram
+        assert plan.weighted_histogram
+        assert plan.mean
+
+    def test_model_collector_uses_plan(self, fw_impl_mock, patch_fw_info):
+        patch_fw_info.get_kernel_op_attribute = Mock(return_value=None)
+        node1 = build_node('node1', output_shape=(None, 3, 14))
+        node2 = build_node('node2', output_shape=(None, 3, 14))
+        for node in [node1, node2]:
+            node.is_activation_quantization_enabled = Mock(return_value=True)
+            node.is_fln_quantization = Mock(return_value=False)
+        graph = Graph('g', input_nodes=[node1], nodes=[node1, node2], output_nodes=[OutTensor(node2, 0)],
+                      edge_list=[Edge(node1, node2, 0, 0)])
+
+        qc = QuantizationConfig(activation_error_method=QuantizationErrorMethod.NOCLIPPING,
+                                weights_bias_correction=False, streaming_histogram_collection=True)
+        ModelCollector(graph, fw_impl_mock, qc=qc)
+        for node in [node1, node2]:
+            sc = graph.get_out_stats_collector(node)
+            assert sc.hc is not None and sc.hc._streaming
+            assert sc.weighted_hc is None
+            assert sc.mc is None
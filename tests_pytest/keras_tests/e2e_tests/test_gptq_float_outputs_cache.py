@@ -0,0 +1,80 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import tensorflow as tf
+from tensorflow import keras
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.gptq.keras.gptq_training import KerasGPTQTrainer
+
+
+def get_model():
+    tf.random.set_seed(0)
+    x_in = keras.layers.Input((8, 8, 3))
+    x = keras.layers.Conv2D(8, kernel_size=3, padding='same', activation='relu')(x_in)
+    x = keras.layers.Conv2D(8, kernel_size=3, padding='same', activation='relu')(x)
+    x = keras.layers.Flatten()(x)
+    return keras.Model(inputs=x_in, outputs=keras.layers.Dense(10)(x))
+
+
+def data_gen():
+    for i in range(3):
+        yield [np.random.RandomState(i).randn(4, 8, 8, 3).astype(np.float32)]
+
+
+def run_gptq(float_outputs_cache, use_hessian_sample_attention=False):
+    gptq_config = mct.gptq.get_keras_gptq_config(n_epochs=3, use_hessian_based_weights=use_hessian_sample_attention,
+                                                 use_hessian_sample_attention=use_hessian_sample_attention,
+                                                 gradual_activation_quantization=False,
+                                                 float_outputs_cache=float_outputs_cache)
+    tf.random.set_seed(1)
+    with patch.object(KerasGPTQTrainer, 'nano_training_step', autospec=True,
+                      side_effect=KerasGPTQTrainer.nano_training_step) as nano_training_step:
+        q_model, _ = mct.gptq.keras_gradient_post_training_quantization(get_model(), data_gen,
+                                                                        gptq_config=gptq_config)
+    return q_model, nano_training_step
+
+
+@pytest.mark.parametrize('use_hessian_sample_attention', [False, True])
+def test_cached_outputs_match_samples(use_hessian_sample_attention):
+    """ Check that the cached float outputs of each training step are the float outputs of its inputs. """
+    _, nano_training_step = run_gptq(float_outputs_cache=True,
+                                     use_hessian_sample_attention=use_hessian_sample_attention)
+    assert nano_training_step.call_count == 3 * 3
+    for call in nano_training_step.call_args_list:
+        trainer, input_data = call.args[:2]
+        y_float = call.args[7]
+        assert y_float is not None
+        exp_y_float = trainer.float_model(input_data)
+        assert len(y_float) == len(exp_y_float)
+        for y, exp_y in zip(y_float, exp_y_float):
+            assert np.allclose(y.numpy(), exp_y.numpy(), atol=1e-5)
+
+
+def test_cached_run_matches_uncached_run():
+    """ Without SLA, the samples are not shuffled, so caching the float outputs doesn't change the training. """
+    q_model, nano_training_step = run_gptq(float_outputs_cache=False)
+    q_model_cached, nano_training_step_cached = run_gptq(float_outputs_cache=True)
+    assert all(call.args[7] is None for call in nano_training_step.call_args_list)
+    assert nano_training_step.call_count == nano_training_step_cached.call_count
+
+    weights, weights_cached = q_model.get_weights(), q_model_cached.get_weights()
+    assert len(weights) == len(weights_cached)
+    for w, w_cached in zip(weights, weights_cached):
+        # allow rare rounding flips due to numerical differences
+        assert np.isclose(w, w_cached, atol=1e-5).mean() > 0.99
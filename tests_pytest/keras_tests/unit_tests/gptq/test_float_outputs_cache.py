@@ -0,0 +1,116 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+import tensorflow as tf
+from tensorflow import keras
+
+from model_compression_toolkit.gptq import GPTQFloatOutputsCacheConfig
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCacheStorage
+from model_compression_toolkit.gptq.keras.float_outputs_cache import KerasFloatOutputsCache
+from model_compression_toolkit.gptq.keras.gptq_training import KerasGPTQTrainer
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(42)
+    x = tf.convert_to_tensor(rng.standard_normal((10, 8, 8, 3)), dtype=tf.float32)
+    y = tf.convert_to_tensor(rng.standard_normal((10, 4)), dtype=tf.float32)
+    return list(zip(x, y))
+
+
+@pytest.fixture
+def float_model():
+    tf.random.set_seed(0)
+    x_in = keras.layers.Input((8, 8, 3))
+    y_in = keras.layers.Input((4,))
+    out = keras.layers.Conv2D(4, kernel_size=3)(x_in)
+    return keras.Model(inputs=[x_in, y_in], outputs=[out, keras.layers.GlobalAveragePooling2D()(out) + y_in])
+
+
+# cache size of the samples: 10 * (6*6*4 + 4) * 4 bytes
+CACHE_SIZE = 5920
+
+
+@pytest.mark.parametrize('max_device_memory, max_host_memory, exp_storage', [
+    (CACHE_SIZE, CACHE_SIZE, FloatOutputsCacheStorage.DEVICE),
+    (CACHE_SIZE - 1, CACHE_SIZE, FloatOutputsCacheStorage.HOST),
+    (0, CACHE_SIZE - 1, FloatOutputsCacheStorage.MEMMAP),
+])
+def test_cache_outputs(float_model, samples, tmp_path, max_device_memory, max_host_memory, exp_storage):
+    cfg = GPTQFloatOutputsCacheConfig(max_device_memory=max_device_memory, max_host_memory=max_host_memory,
+                                      cache_dir=str(tmp_path))
+    # batch size doesn't divide the number of samples
+    cache = KerasFloatOutputsCache(float_model, samples, batch_size=4, input_scale=2., cache_config=cfg)
+    assert cache.storage == exp_storage
+    assert len(cache) == len(samples)
+
+    indices = tf.constant([7, 0, 9, 3])
+    x = tf.stack([samples[i][0] for i in indices.numpy()])
+    y = tf.stack([samples[i][1] for i in indices.numpy()])
+    exp_outputs = float_model([2 * x, 2 * y])
+
+    outputs = cache[indices]
+    assert len(outputs) == 2
+    for out, exp_out in zip(outputs, exp_outputs):
+        assert isinstance(out, tf.Tensor)
+        assert out.dtype == exp_out.dtype
+        assert np.allclose(out.numpy(), exp_out.numpy(), atol=1e-6)
+
+    if exp_storage == FloatOutputsCacheStorage.MEMMAP:
+        [cache_dir] = os.listdir(tmp_path)
+        assert len(os.listdir(tmp_path / cache_dir)) == 2
+        del cache
+        assert os.listdir(tmp_path) == []
+    else:
+        assert os.listdir(tmp_path) == []
+
+
+def test_non_sla_dataloader_with_float_outputs_cache():
+    """ Check that the train dataloader yields the samples with their indices in the float outputs cache. """
+    trainer = Mock(compare_points=[Mock(), Mock()],
+                   gptq_config=Mock(hessian_weights_config=None,
+                                    float_outputs_cache_config=GPTQFloatOutputsCacheConfig()))
+
+    def data_gen():
+        for i in range(3):
+            yield [np.random.RandomState(i).randn(4, 5).astype(np.float32)]
+
+    loader = KerasGPTQTrainer._prepare_train_dataloader_for_non_sla(trainer, data_gen)
+    samples, batch_size = trainer._build_float_outputs_cache.call_args.args
+    assert batch_size == 4
+    assert len(samples) == 12
+
+    all_indices = []
+    for inputs, indices, loss_weights, reg_weights in loader:
+        assert len(inputs) == 1
+        for x, i in zip(inputs[0].numpy(), indices.numpy()):
+            assert np.array_equal(x, samples[i][0].numpy())
+        all_indices.extend(indices.numpy())
+        assert np.allclose(loss_weights.numpy(), [0.5, 0.5])
+        assert np.allclose(reg_weights.numpy(), [1., 1.])
+    assert sorted(all_indices) == list(range(12))
+
+
+def test_flush_losses():
+    trainer = Mock(loss_list=[])
+    KerasGPTQTrainer._flush_losses(trainer, [])
+    assert trainer.loss_list == []
+    KerasGPTQTrainer._flush_losses(trainer, [tf.constant(float(i)) for i in range(3)])
+    KerasGPTQTrainer._flush_losses(trainer, [tf.constant(3.)])
+    assert trainer.loss_list == [0., 1., 2., 3.]
@@ -0,0 +1,97 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Per-forward latency of a model built from a graph, interpreted (PytorchModel.forward) vs. compiled into a
+torch.fx GraphModule.
+
+Run with:
+    python -m tests_pytest.pytorch_tests.benchmarks.benchmark_fx_model_builder
+"""
+import argparse
+import time
+
+import torch
+from torch import nn
+
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from tests_pytest._test_util.tpc_util import minimal_tpc
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+class ResidualBlock(nn.Module):
+    def __init__(self, channels):
+        super().__init__()
+        self.conv1 = nn.Conv2d(channels, channels, kernel_size=3, padding=1)
+        self.bn = nn.BatchNorm2d(channels)
+        self.conv2 = nn.Conv2d(channels, channels, kernel_size=3, padding=1)
+
+    def forward(self, x):
+        return torch.relu(x + self.conv2(torch.relu(self.bn(self.conv1(x)))))
+
+
+def get_model(num_blocks, channels):
+    return nn.Sequential(nn.Conv2d(3, channels, kernel_size=3, padding=1),
+                         *[ResidualBlock(channels) for _ in range(num_blocks)],
+                         nn.AdaptiveAvgPool2d(1),
+                         nn.Flatten(),
+                         nn.Linear(channels, 10))
+
+
+def time_forward(model, x, iters):
+    """ Returns the average forward latency in milliseconds. """
+    with torch.no_grad():
+        for _ in range(min(iters, 10)):
+            model(x)
+        if x.is_cuda:
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        for _ in range(iters):
+            model(x)
+        if x.is_cuda:
+            torch.cuda.synchronize()
+    return (time.perf_counter() - start) / iters * 1e3
+
+
+class _GraphPreparation(BaseTorchIntegrationTest):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-blocks', type=int, default=16)
+    parser.add_argument('--channels', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=1)
+    parser.add_argument('--resolution', type=int, default=16)
+    parser.add_argument('--iters', type=int, default=200)
+    args = parser.parse_args()
+
+    input_shape = (args.batch_size, 3, args.resolution, args.resolution)
+    graph = _GraphPreparation().run_graph_preparation(model=get_model(args.num_blocks, args.channels).eval(),
+                                                      datagen=_GraphPreparation.get_basic_data_gen([input_shape]),
+                                                      tpc=minimal_tpc())
+    x = torch.randn(input_shape).to(get_working_device())
+    model, _ = FloatPyTorchModelBuilder(graph).build_model()
+    fx_model, _ = FloatPyTorchModelBuilder(graph, use_fx_graph_module=True).build_model()
+
+    interpreted_ms = time_forward(model, x, args.iters)
+    fx_ms = time_forward(fx_model, x, args.iters)
+    print(f'nodes: {len(graph.nodes)}, input: {input_shape}, device: {x.device}')
+    print(f'interpreted PytorchModel: {interpreted_ms:.3f} ms/forward')
+    print(f'fx GraphModule:           {fx_ms:.3f} ms/forward ({interpreted_ms / fx_ms:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Per-step latency of the PyTorch GPTQ training loop, with and without a log function (a log function requires the
+gradients and the loss value on the host in each step).
+
+Run with:
+    python -m tests_pytest.pytorch_tests.benchmarks.benchmark_gptq_training_step
+"""
+import argparse
+import time
+from unittest.mock import patch
+
+import numpy as np
+import torch
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+from tests_pytest.pytorch_tests.benchmarks.benchmark_fx_model_builder import get_model
+
+
+def time_gptq_step(model, data_gen, n_epochs, log_function):
+    """ Returns the average GPTQ training step latency in milliseconds. """
+    timing = {}
+    orig_loop = PytorchGPTQTrainer.micro_training_loop
+
+    def micro_training_loop(trainer, n_epochs):
+        if get_working_device().type == 'cuda':
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        orig_loop(trainer, n_epochs)
+        if get_working_device().type == 'cuda':
+            torch.cuda.synchronize()
+        timing['time'] = time.perf_counter() - start
+        timing['steps'] = len(trainer.loss_list)
+
+    gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=n_epochs, use_hessian_based_weights=False,
+                                                   use_hessian_sample_attention=False,
+                                                   gradual_activation_quantization=False)
+    gptq_config.log_function = log_function
+    with patch.object(PytorchGPTQTrainer, 'micro_training_loop', micro_training_loop):
+        mct.gptq.pytorch_gradient_post_training_quantization(model, data_gen, gptq_config=gptq_config)
+    return 1000 * timing['time'] / timing['steps']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-blocks', type=int, default=8)
+    parser.add_argument('--channels', type=int, default=16)
+    parser.add_argument('--batch-size', type=int, default=16)
+    parser.add_argument('--resolution', type=int, default=32)
+    parser.add_argument('--n-batches', type=int, default=10)
+    parser.add_argument('--n-epochs', type=int, default=5)
+    args = parser.parse_args()
+
+    model = get_model(args.num_blocks, args.channels).eval()
+    data = [np.random.randn(args.batch_size, 3, args.resolution, args.resolution).astype(np.float32)
+            for _ in range(args.n_batches)]
+
+    def data_gen():
+        for x in data:
+            yield [x]
+
+    print(f'blocks: {args.num_blocks}, batch: {args.batch_size}, device: {get_working_device()}')
+    no_log_ms = time_gptq_step(model, data_gen, args.n_epochs, log_function=None)
+    print(f'without log function: {no_log_ms:8.2f} ms/step')
+    log_ms = time_gptq_step(model, data_gen, args.n_epochs, log_function=lambda *args: None)
+    print(f'with log function:    {log_ms:8.2f} ms/step')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Throughput (Hessian samples per second) of the PyTorch Hessian scores calculators, for requests that target all
+the conv/linear layers of a model.
+
+Run with:
+    python -m tests_pytest.pytorch_tests.benchmarks.benchmark_hessian_calculators
+"""
+import argparse
+import time
+
+import torch
+
+from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianMode, \
+    HessianScoresGranularity
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from tests_pytest._test_util.tpc_util import minimal_tpc
+from tests_pytest.pytorch_tests.benchmarks.benchmark_fx_model_builder import get_model
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+class _GraphPreparation(BaseTorchIntegrationTest):
+    pass
+
+
+def run(fw_impl, graph, target_nodes, mode, input_shape, n_iter, n_batches):
+    """ Returns the number of Hessian samples computed per second. """
+    request = HessianScoresRequest(mode=mode, granularity=HessianScoresGranularity.PER_TENSOR,
+                                   target_nodes=target_nodes, data_loader=None, n_samples=1)
+    start = time.perf_counter()
+    for _ in range(n_batches):
+        inputs = [torch.randn(input_shape).to(get_working_device())]
+        fw_impl.get_hessian_scores_calculator(graph=graph, input_images=inputs, hessian_scores_request=request,
+                                              num_iterations_for_approximation=n_iter).compute()
+    return n_batches * input_shape[0] / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--num-blocks', type=int, default=16)
+    parser.add_argument('--channels', type=int, default=8)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--resolution', type=int, default=16)
+    parser.add_argument('--n-iter', type=int, default=20, help='Hutchinson iterations per batch')
+    parser.add_argument('--n-batches', type=int, default=3)
+    args = parser.parse_args()
+
+    input_shape = (args.batch_size, 3, args.resolution, args.resolution)
+    test = _GraphPreparation()
+    graph = test.run_graph_preparation(model=get_model(args.num_blocks, args.channels).eval(),
+                                       datagen=test.get_basic_data_gen([input_shape]), tpc=minimal_tpc())
+    output_nodes = [ot.node for ot in graph.get_outputs()]
+    kernel_nodes = [n for n in graph.get_topo_sorted_nodes() if n.kernel_attr and n not in output_nodes]
+    print(f'nodes: {len(graph.nodes)}, target layers: {len(kernel_nodes)}, device: {get_working_device()}')
+
+    act_rate = run(test.fw_impl, graph, kernel_nodes, HessianMode.ACTIVATION, input_shape, args.n_iter,
+                   args.n_batches)
+    print(f'activation hessians, batch {args.batch_size}: {act_rate:8.2f} samples/s')
+    # Weights hessians are computed per image.
+    weights_rate = run(test.fw_impl, graph, kernel_nodes, HessianMode.WEIGHTS, (1,) + input_shape[1:],
+                       args.n_iter, args.n_batches)
+    print(f'weights hessians, batch 1:    {weights_rate:8.2f} samples/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import pytest
+
+from model_compression_toolkit.core import ResourceUtilization, CoreConfig, MixedPrecisionQuantizationConfig
+from model_compression_toolkit.core.common.mixed_precision import mixed_precision_search_facade
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_candidates_filter import \
+    filter_candidates_for_mixed_precision
+from model_compression_toolkit.core.common.mixed_precision.mixed_precision_search_facade import \
+    search_bit_width_frontier
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.ptq import pytorch_post_training_quantization
+from tests_pytest.pytorch_tests.e2e_tests.mixed_precision.test_mixed_precision import Model, build_tpc
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+# weights: conv1 216, conv2 3200, fc 200
+min_ru = ResourceUtilization(weights_memory=216*2/8 + 3200*2/8 + 200*4/8)
+second_min_ru = ResourceUtilization(weights_memory=216*4/8 + 3200*2/8 + 200*4/8)
+mid_ru = ResourceUtilization(weights_memory=3416*8/8 + 200*8/8)
+max_ru = ResourceUtilization(weights_memory=3416*16/8 + 200*8/8)
+
+
+class TestMixedPrecisionFrontier(BaseTorchIntegrationTest):
+    w_layers = ['conv1', 'conv2', 'fc']
+
+    @pytest.fixture
+    def model(self):
+        return Model((1, 3, 16, 16))
+
+    @pytest.fixture
+    def datagen(self):
+        return self.get_basic_data_gen([(1, 3, 16, 16)])
+
+    @pytest.fixture
+    def tpc(self):
+        # Only the weights are configurable, so the candidates are not filtered before the search.
+        return build_tpc(default_a_bit=4, conv_a_bits=[4], conv_w_bits=[16, 8, 4, 2], fc_a_bits=[4],
+                         fc_w_bits=[4, 8], bn_a_bits=[4])
+
+    def _search_frontier(self, model, datagen, tpc, target_rus, mp_config=None):
+        core_config = CoreConfig(mixed_precision_config=mp_config or MixedPrecisionQuantizationConfig())
+        graph = self.run_graph_preparation(model, datagen, tpc, quant_config=core_config.quantization_config, mp=True)
+        graph = quantization_preparation_runner(graph, datagen, core_config=core_config, fw_impl=self.fw_impl,
+                                                hessian_info_service=None)
+        filter_candidates_for_mixed_precision(graph, target_rus[0])
+        frontier = search_bit_width_frontier(graph, self.fw_impl, target_rus, core_config.mixed_precision_config,
+                                             datagen)
+        return graph, frontier
+
+    @staticmethod
+    def _get_weights_nbits(graph, bit_widths_config):
+        nodes = graph.get_configurable_sorted_nodes()
+        assert len(nodes) == len(bit_widths_config)
+        return {n.name: n.candidates_quantization_cfg[i].weights_quantization_cfg.get_attr_config(n.kernel_attr)
+                .weights_n_bits for n, i in zip(nodes, bit_widths_config)}
+
+    def test_frontier(self, model, datagen, tpc):
+        """ Test that each frontier point is the configuration PTQ finds for its target, and that its bit-widths
+            config and resource utilization match the quantized model. """
+        target_rus = [min_ru, second_min_ru, mid_ru, max_ru]
+        graph, frontier = self._search_frontier(model, datagen, tpc, target_rus)
+
+        assert [p.target_resource_utilization for p in frontier] == target_rus
+        exp_nbits = [{'conv1': 2, 'conv2': 2, 'fc': 4}, {'conv1': 4, 'conv2': 2, 'fc': 4}, None,
+                     {'conv1': 16, 'conv2': 16, 'fc': 8}]
+        for point, exp in zip(frontier, exp_nbits):
+            assert point.target_resource_utilization.is_satisfied_by(point.resource_utilization)
+            nbits = self._get_weights_nbits(graph, point.bit_widths_config)
+            if exp is not None:
+                assert nbits == exp
+
+            # The point's configuration is the configuration found by PTQ for the target.
+            qmodel, user_info = pytorch_post_training_quantization(
+                model, datagen, target_resource_utilization=point.target_resource_utilization,
+                target_platform_capabilities=tpc)
+            assert user_info.mixed_precision_cfg == point.bit_widths_config
+            assert user_info.final_resource_utilization == point.resource_utilization
+            for layer in self.w_layers:
+                assert self.fetch_weight_quantizer(getattr(qmodel, layer), 'weight').num_bits == nbits[layer]
+
+        # Lower targets can't have a lower sensitivity.
+        sensitivities = [p.sensitivity for p in frontier]
+        assert sensitivities == sorted(sensitivities, reverse=True)
+        assert frontier[-1].sensitivity < frontier[0].sensitivity
+
+    def test_refinement(self, model, datagen, tpc, mocker):
+        """ Test that a refined configuration replaces the searched configuration, with its resource utilization
+            and sensitivity. """
+        _, (exp_point, ) = self._search_frontier(model, datagen, tpc, [max_ru])
+
+        exp_sensitivities = []
+
+        def refine(nodes_bit_cfg, search_manager, target_ru):
+            # Refine the configuration to the max configuration.
+            refined_cfg = dict(zip(nodes_bit_cfg.keys(), exp_point.bit_widths_config))
+            exp_sensitivities.append(sum(search_manager.layers_candidates_sensitivity[n][i]
+                                         for n, i in refined_cfg.items()))
+            return refined_cfg
+        refine_mock = mocker.patch.object(mixed_precision_search_facade, 'greedy_solution_refinement_procedure',
+                                          side_effect=refine)
+        graph, frontier = self._search_frontier(model, datagen, tpc, [min_ru, second_min_ru])
+
+        assert [c.args[2] for c in refine_mock.call_args_list] == [min_ru, second_min_ru]
+        for point, exp_sensitivity in zip(frontier, exp_sensitivities):
+            assert point.bit_widths_config == exp_point.bit_widths_config
+            assert self._get_weights_nbits(graph, point.bit_widths_config) == {'conv1': 16, 'conv2': 16, 'fc': 8}
+            assert point.resource_utilization == exp_point.resource_utilization
+            assert point.sensitivity == pytest.approx(exp_sensitivity)
+
+    def test_no_refinement(self, model, datagen, tpc, mocker):
+        """ Test that the configurations are not refined if refine_mp_solution is disabled. """
+        refine_spy = mocker.spy(mixed_precision_search_facade, 'greedy_solution_refinement_procedure')
+        _, frontier = self._search_frontier(model, datagen, tpc, [min_ru, max_ru],
+                                            mp_config=MixedPrecisionQuantizationConfig(refine_mp_solution=False))
+        refine_spy.assert_not_called()
+        assert len(frontier) == 2
@@ -0,0 +1,54 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+import torch
+from mct_quantizers import PytorchActivationQuantizationHolder
+from torch import nn
+
+from model_compression_toolkit.core import QuantizationConfig, CoreConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.common.collectors.weighted_histogram_collector import WeightedHistogramCollector
+from model_compression_toolkit.ptq import pytorch_post_training_quantization
+
+
+def get_model():
+    torch.manual_seed(0)
+    return nn.Sequential(nn.Conv2d(3, 8, kernel_size=3), nn.BatchNorm2d(8), nn.ReLU(),
+                         nn.Conv2d(8, 4, kernel_size=1)).eval()
+
+
+def rep_data_gen():
+    for i in range(2):
+        yield [np.random.RandomState(i).randn(2, 3, 8, 8).astype(np.float32)]
+
+
+@pytest.mark.parametrize('activation_error_method', [QuantizationErrorMethod.MSE, QuantizationErrorMethod.HMSE])
+def test_second_moment_correction(activation_error_method, mocker):
+    """
+    Tests PTQ with second moment correction. The statistics recollected after the correction are the ones required
+    by the activation error method, so the activation params of HMSE are computed from weighted histograms.
+    """
+    get_weighted_histogram = mocker.spy(WeightedHistogramCollector, 'get_histogram')
+    core_config = CoreConfig(quantization_config=QuantizationConfig(activation_error_method=activation_error_method,
+                                                                    weights_second_moment_correction=True))
+    q_model, _ = pytorch_post_training_quantization(get_model(), rep_data_gen, core_config=core_config)
+
+    holders = [m for m in q_model.modules() if isinstance(m, PytorchActivationQuantizationHolder)]
+    assert len(holders) > 0
+    if activation_error_method == QuantizationErrorMethod.HMSE:
+        # the weighted histograms are used in the params computation and after the second moment correction
+        assert get_weighted_histogram.call_count >= 2 * len(holders)
+    else:
+        get_weighted_histogram.assert_not_called()
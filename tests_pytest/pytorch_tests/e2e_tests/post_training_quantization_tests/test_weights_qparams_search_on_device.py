@@ -0,0 +1,100 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+import torch
+from mct_quantizers import QuantizationMethod, PytorchQuantizationWrapper, PytorchActivationQuantizationHolder
+from torch import nn
+
+from model_compression_toolkit.core import QuantizationConfig, CoreConfig, QuantizationErrorMethod
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.quantization.qparams_search_backend import PytorchQParamsSearchBackend
+from model_compression_toolkit.ptq import pytorch_post_training_quantization
+from model_compression_toolkit.target_platform_capabilities.constants import KERNEL_ATTR, BIAS_ATTR
+from model_compression_toolkit.target_platform_capabilities.schema.mct_current_schema import OpQuantizationConfig, \
+    AttributeQuantizationConfig, Signedness
+from tests.common_tests.helpers.tpcs_for_tests.v4.tpc import generate_tpc
+
+
+def get_model():
+    torch.manual_seed(0)
+    return nn.Sequential(nn.Conv2d(3, 8, kernel_size=3), nn.ReLU(), nn.Conv2d(8, 4, kernel_size=1))
+
+
+def rep_data_gen():
+    for i in range(2):
+        yield [np.random.RandomState(i).randn(2, 3, 8, 8).astype(np.float32)]
+
+
+def get_tpc(quantization_method):
+    kernel_cfg = AttributeQuantizationConfig(weights_quantization_method=quantization_method, weights_n_bits=8,
+                                             weights_per_channel_threshold=True, enable_weights_quantization=True)
+    op_cfg = OpQuantizationConfig(default_weight_attr_config=AttributeQuantizationConfig(),
+                                  attr_weights_configs_mapping={KERNEL_ATTR: kernel_cfg,
+                                                                BIAS_ATTR: AttributeQuantizationConfig()},
+                                  activation_quantization_method=quantization_method,
+                                  activation_n_bits=8,
+                                  supported_input_activation_n_bits=8,
+                                  enable_activation_quantization=True,
+                                  quantization_preserving=False,
+                                  fixed_scale=None,
+                                  fixed_zero_point=None,
+                                  simd_size=32,
+                                  signedness=Signedness.AUTO)
+    return generate_tpc(default_config=op_cfg, base_config=op_cfg, mixed_precision_cfg_list=[op_cfg], name='test_tpc')
+
+
+def get_quantizer_params(quantizer):
+    return {k: np.asarray(getattr(quantizer, k)) for k in ['threshold_np', 'min_range', 'max_range']
+            if hasattr(quantizer, k)}
+
+
+def get_quantizers_params(q_model):
+    weights_params, activation_params = [], []
+    for m in q_model.modules():
+        if isinstance(m, PytorchQuantizationWrapper):
+            weights_params.extend(get_quantizer_params(q) for q in m.weights_quantizers.values())
+        elif isinstance(m, PytorchActivationQuantizationHolder):
+            activation_params.append(get_quantizer_params(m.activation_holder_quantizer))
+    return weights_params, activation_params
+
+
+@pytest.mark.parametrize('quantization_method', [QuantizationMethod.POWER_OF_TWO, QuantizationMethod.SYMMETRIC,
+                                                 QuantizationMethod.UNIFORM])
+def test_weights_qparams_search_on_device(quantization_method, mocker):
+    """
+    Tests PTQ with the weights params search on device. The activation params are searched on histograms (in
+    numpy) for any quantization method. The search runs in float64, so all params are the same as without the
+    search on device.
+    """
+    get_backend = mocker.patch.object(PytorchImplementation, 'get_qparams_search_backend',
+                                      return_value=PytorchQParamsSearchBackend(dtype=torch.float64))
+
+    def run(on_device):
+        core_config = CoreConfig(quantization_config=QuantizationConfig(
+            weights_error_method=QuantizationErrorMethod.MSE, activation_error_method=QuantizationErrorMethod.MSE,
+            weights_qparams_search_on_device=on_device))
+        q_model, _ = pytorch_post_training_quantization(get_model(), rep_data_gen, core_config=core_config,
+                                                        target_platform_capabilities=get_tpc(quantization_method))
+        return get_quantizers_params(q_model)
+
+    weights_params, activation_params = run(on_device=True)
+    get_backend.assert_called_once()
+    exp_weights_params, exp_activation_params = run(on_device=False)
+
+    assert len(weights_params) == 2 and len(activation_params) == len(exp_activation_params) > 0
+    for params, exp_params in zip(activation_params + weights_params, exp_activation_params + exp_weights_params):
+        assert params.keys() == exp_params.keys() and len(params) > 0
+        assert all(np.allclose(v, exp_params[k]) for k, v in params.items())
@@ -0,0 +1,142 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.core.common.hessian import HessianInfoService
+from model_compression_toolkit.gptq import GPTQBlockwiseConfig
+from model_compression_toolkit.gptq.common import blockwise_gptq
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+
+
+class ResidualBlock(nn.Module):
+    def __init__(self, channels):
+        super().__init__()
+        self.conv1 = nn.Conv2d(channels, channels, kernel_size=3, padding=1)
+        self.conv2 = nn.Conv2d(channels, channels, kernel_size=3, padding=1)
+
+    def forward(self, x):
+        return torch.relu(x + self.conv2(torch.relu(self.conv1(x))))
+
+
+def get_model():
+    torch.manual_seed(0)
+    return nn.Sequential(nn.Conv2d(3, 4, kernel_size=3, padding=1), ResidualBlock(4), ResidualBlock(4),
+                         nn.Flatten(), nn.Linear(4 * 8 * 8, 3))
+
+
+def get_data_gen(n_batches=3):
+    def data_gen():
+        for i in range(n_batches):
+            yield [np.random.RandomState(i).randn(4, 3, 8, 8).astype(np.float32)]
+    return data_gen
+
+
+data_gen = get_data_gen()
+
+
+def run_gptq(blockwise):
+    gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=2, use_hessian_based_weights=False,
+                                                   use_hessian_sample_attention=False,
+                                                   gradual_activation_quantization=False, float_outputs_cache=True,
+                                                   blockwise=blockwise)
+    torch.manual_seed(1)
+    q_model, _ = mct.gptq.pytorch_gradient_post_training_quantization(get_model(), data_gen,
+                                                                      gptq_config=gptq_config)
+    return q_model
+
+
+def test_single_block_matches_full_model():
+    """ Block-wise GPTQ with a single block is the same as the regular GPTQ. """
+    q_model = run_gptq(blockwise=False)
+    q_model_blockwise = run_gptq(blockwise=GPTQBlockwiseConfig(compare_points_per_block=100))
+    sd = q_model.state_dict()
+    sd_blockwise = q_model_blockwise.state_dict()
+    assert sd.keys() == sd_blockwise.keys()
+    for k in sd:
+        assert torch.equal(sd[k], sd_blockwise[k]), k
+
+
+@pytest.mark.parametrize('max_host_memory', [2 ** 30, 0])
+def test_blockwise(tmp_path, max_host_memory):
+    blocks = []
+
+    def get_gptq_blocks(*args, **kwargs):
+        blocks.extend(get_gptq_blocks_orig(*args, **kwargs))
+        return blocks
+
+    get_gptq_blocks_orig = blockwise_gptq.get_gptq_blocks
+    cfg = GPTQBlockwiseConfig(compare_points_per_block=1, max_host_memory=max_host_memory, cache_dir=str(tmp_path))
+    with patch.object(blockwise_gptq, 'get_gptq_blocks', get_gptq_blocks):
+        q_model = run_gptq(blockwise=cfg)
+
+    assert len(blocks) == 4
+    x = torch.from_numpy(next(data_gen())[0]).to(next(q_model.parameters()).device)
+    with torch.no_grad():
+        y_float = get_model().to(x.device)(x)
+        y_q = q_model(x)
+    assert torch.allclose(y_q, y_float, atol=0.1)
+    # memory-mapped inputs were removed
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize('compare_points_per_block', [1, 4])
+@pytest.mark.parametrize('use_hessian_sample_attention', [True, False])
+def test_blockwise_default_hessian_settings(compare_points_per_block, use_hessian_sample_attention):
+    """ Block-wise GPTQ with the default Hessian-based loss weights and gradual activation quantization. """
+    gptq_config = mct.gptq.get_pytorch_gptq_config(
+        n_epochs=1, use_hessian_sample_attention=use_hessian_sample_attention,
+        blockwise=GPTQBlockwiseConfig(compare_points_per_block=compare_points_per_block))
+    # 32 samples for the Hessians of the non-SLA loss weights
+    q_model, _ = mct.gptq.pytorch_gradient_post_training_quantization(get_model(), get_data_gen(n_batches=8),
+                                                                      gptq_config=gptq_config)
+    x = torch.from_numpy(next(data_gen())[0]).to(next(q_model.parameters()).device)
+    with torch.no_grad():
+        y_q = q_model(x)
+    assert torch.isfinite(y_q).all()
+
+
+def test_blockwise_random_dataset(mocker):
+    """
+    The representative dataset is read once, so all blocks are trained on the same samples even if the dataset is
+    random. The Hessians of each block are computed on the block's float inputs.
+    """
+    n_calls = 0
+
+    def random_data_gen():
+        nonlocal n_calls
+        n_calls += 1
+        for _ in range(3):
+            yield [np.random.randn(4, 3, 8, 8).astype(np.float32)]
+
+    fetch_hessian = mocker.spy(HessianInfoService, 'fetch_hessian')
+    get_float_dataset = mocker.spy(PytorchGPTQTrainer, '_get_float_dataset')
+    gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=1, gradual_activation_quantization=False,
+                                                   blockwise=GPTQBlockwiseConfig(compare_points_per_block=2))
+    mct.gptq.pytorch_gradient_post_training_quantization(get_model(), data_gen, gptq_config=gptq_config,
+                                                         gptq_representative_data_gen=random_data_gen)
+    assert n_calls == 1
+
+    float_datasets = get_float_dataset.spy_return_list
+    hessians_datasets = [c.args[1].data_loader.dataset for c in fetch_hessian.call_args_list]
+    assert len(float_datasets) == len(hessians_datasets) == 2
+    assert all(d is float_d for d, float_d in zip(hessians_datasets, float_datasets))
+    # the second block's float model runs on its own inputs
+    assert get_float_dataset.call_args_list[1].args[1] is not float_datasets[1]
@@ -0,0 +1,80 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+from mct_quantizers import PytorchQuantizationWrapper
+from torch import nn
+
+import model_compression_toolkit as mct
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+
+
+def get_model():
+    torch.manual_seed(0)
+    return nn.Sequential(nn.Conv2d(3, 8, kernel_size=3, padding=1), nn.ReLU(),
+                         nn.Conv2d(8, 8, kernel_size=3, padding=1), nn.ReLU(),
+                         nn.Flatten(), nn.Linear(8 * 8 * 8, 10))
+
+
+def data_gen():
+    for i in range(4):
+        yield [np.random.RandomState(i).randn(8, 3, 8, 8).astype(np.float32)]
+
+
+def run_gptq(autocast_dtype, float_outputs_cache=False):
+    gptq_config = mct.gptq.get_pytorch_gptq_config(n_epochs=20, use_hessian_based_weights=False,
+                                                   use_hessian_sample_attention=False,
+                                                   gradual_activation_quantization=False,
+                                                   float_outputs_cache=float_outputs_cache,
+                                                   autocast_dtype=autocast_dtype)
+    torch.manual_seed(1)
+    with patch.object(PytorchGPTQTrainer, 'compute_gradients', autospec=True,
+                      side_effect=PytorchGPTQTrainer.compute_gradients) as compute_gradients:
+        q_model, _ = mct.gptq.pytorch_gradient_post_training_quantization(get_model(), data_gen,
+                                                                          gptq_config=gptq_config)
+    # dtype of the float model outputs (computed in the training loop)
+    y_float_dtype = compute_gradients.call_args.args[1][0].dtype
+    return q_model, y_float_dtype
+
+
+def get_quantized_weights(q_model):
+    return {name: m.weights_quantizers['weight'](m.weight).detach() for name, m in q_model.named_modules()
+            if isinstance(m, PytorchQuantizationWrapper)}
+
+
+@pytest.mark.parametrize('float_outputs_cache', [False, True])
+def test_bf16_autocast_rounding_matches_fp32(float_outputs_cache):
+    """ The rounding decisions of GPTQ with bfloat16 autocast are close to the float32 ones. """
+    q_model_fp32, y_float_dtype_fp32 = run_gptq(autocast_dtype=None, float_outputs_cache=float_outputs_cache)
+    q_model_bf16, y_float_dtype_bf16 = run_gptq(autocast_dtype=torch.bfloat16,
+                                                float_outputs_cache=float_outputs_cache)
+    # the float model outputs are computed in full precision, with or without the float outputs cache
+    assert y_float_dtype_fp32 == y_float_dtype_bf16 == torch.float32
+
+    q_weights_fp32 = get_quantized_weights(q_model_fp32)
+    q_weights_bf16 = get_quantized_weights(q_model_bf16)
+    assert len(q_weights_fp32) == 3 and q_weights_fp32.keys() == q_weights_bf16.keys()
+    for name, w_fp32 in q_weights_fp32.items():
+        w_bf16 = q_weights_bf16[name]
+        assert w_bf16.dtype == torch.float32
+        assert (w_fp32 == w_bf16).float().mean() > 0.9, name
+
+
+def test_invalid_autocast_dtype():
+    with pytest.raises(ValueError, match='autocast_dtype'):
+        mct.gptq.get_pytorch_gptq_config(n_epochs=1, autocast_dtype=torch.float64)
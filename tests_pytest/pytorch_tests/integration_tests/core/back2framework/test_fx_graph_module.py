@@ -0,0 +1,140 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+
+import pytest
+import torch
+from torch import nn
+import torch.fx
+import torch.testing as ptt
+
+from model_compression_toolkit.core.common.model_builder_mode import ModelBuilderMode
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from model_compression_toolkit.core.pytorch.back2framework.pytorch_model_builder import PytorchFxGraphModule
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+def get_model():
+    class Model(nn.Module):
+
+        def __init__(self):
+            super().__init__()
+            self.conv = nn.Conv2d(3, 4, kernel_size=3)
+            self.fc = nn.Linear(4, 5)
+
+        def forward(self, x, y):
+            x1 = self.conv(x)
+            x2 = torch.relu(x1) + x1
+            x3 = x2.mean((2, 3))
+            x4 = torch.split(x3, 2, dim=1)
+            return self.fc(x3), x4[0] + y.sum(), torch.cat([x2, x1], dim=1).reshape(x2.shape[0], -1)
+
+    return Model()
+
+
+class TestFxGraphModule(BaseTorchIntegrationTest):
+    """
+    Test building a model from a graph into a torch.fx GraphModule.
+    """
+    input_shapes = [(1, 3, 8, 8), (1, 2)]
+
+    def _get_graph(self, model, minimal_tpc):
+        return self.run_graph_preparation(model=model, datagen=self.get_basic_data_gen(self.input_shapes),
+                                          tpc=minimal_tpc)
+
+    def _get_inputs(self):
+        return [torch.randn(shape).to(get_working_device()) for shape in self.input_shapes]
+
+    def test_float_model_outputs(self, minimal_tpc):
+        """ Test that the GraphModule is built and that its outputs are identical to the interpreted model. """
+        graph = self._get_graph(get_model().eval(), minimal_tpc)
+        model, _ = FloatPyTorchModelBuilder(graph).build_model()
+        fx_model, _ = FloatPyTorchModelBuilder(graph, use_fx_graph_module=True).build_model()
+        assert isinstance(fx_model, torch.fx.GraphModule)
+        assert not isinstance(model, torch.fx.GraphModule)
+
+        inputs = self._get_inputs()
+        outputs, fx_outputs = model(*inputs), fx_model(*inputs)
+        assert len(outputs) == len(fx_outputs) == 3
+        for out, fx_out in zip(outputs, fx_outputs):
+            ptt.assert_close(out, fx_out, rtol=0, atol=0)
+
+    def test_shares_layers_with_model(self, minimal_tpc):
+        """ Test that the GraphModule holds a single call per graph node and uses the model's layers. """
+        graph = self._get_graph(get_model().eval(), minimal_tpc)
+        model, _ = FloatPyTorchModelBuilder(graph).build_model()
+        fx_model = model.to_fx_graph_module()
+
+        call_module_targets = [n.target for n in fx_model.graph.nodes if n.op == 'call_module']
+        assert fx_model.get_submodule('conv') is model.conv
+        assert 'conv' in call_module_targets and 'fc' in call_module_targets
+        assert len(call_module_targets) == len(set(call_module_targets))
+
+    def test_append2output(self, minimal_tpc):
+        """ Test the GraphModule returns the appended intermediate nodes outputs. """
+        graph = self._get_graph(get_model().eval(), minimal_tpc)
+        append2output = [graph.find_node_by_name('conv')[0], graph.find_node_by_name('fc')[0]]
+        model, _ = FloatPyTorchModelBuilder(graph, append2output=append2output).build_model()
+        fx_model, _ = FloatPyTorchModelBuilder(graph, append2output=append2output,
+                                               use_fx_graph_module=True).build_model()
+
+        inputs = self._get_inputs()
+        outputs, fx_outputs = model(*inputs), fx_model(*inputs)
+        assert len(fx_outputs) == 2
+        for out, fx_out in zip(outputs, fx_outputs):
+            ptt.assert_close(out, fx_out, rtol=0, atol=0)
+
+    @pytest.mark.parametrize('use_fx_graph_module', [False, True])
+    def test_model_builder(self, minimal_tpc, use_fx_graph_module):
+        """ Test that the framework's model builder builds a GraphModule by the flag. """
+        graph = self._get_graph(get_model().eval(), minimal_tpc)
+        model, _ = FloatPyTorchModelBuilder(graph).build_model()
+        built_model, _ = self.fw_impl.model_builder(graph, ModelBuilderMode.FLOAT,
+                                                    use_fx_graph_module=use_fx_graph_module)
+        assert isinstance(built_model, PytorchFxGraphModule) == use_fx_graph_module
+
+        inputs = self._get_inputs()
+        for out, built_out in zip(model(*inputs), built_model(*inputs)):
+            ptt.assert_close(out, built_out, rtol=0, atol=0)
+
+    @pytest.mark.parametrize('use_fx_graph_module', [False, True])
+    def test_partial_inference(self, minimal_tpc, use_fx_graph_module):
+        """ Test that both model types run the partial inference from cached outputs. """
+        graph = self._get_graph(get_model().eval(), minimal_tpc)
+        model, _ = FloatPyTorchModelBuilder(graph, use_fx_graph_module=use_fx_graph_module).build_model()
+        conv = graph.find_node_by_name('conv')[0]
+        nodes_to_run = {n.name for n in graph.get_topo_sorted_nodes()} - {conv.name} - \
+                       {n.name for n in graph.get_inputs()}
+
+        inputs = self._get_inputs()
+        outputs = model(*inputs)
+        for m in [model, copy.deepcopy(model)]:
+            cached_outputs_, cached = m.forward_and_cache(*inputs, nodes_to_cache=[conv.name, 'y'])
+            partial_outputs = m.forward_from_cache(cached, nodes_to_run)
+            for out, cached_out, partial_out in zip(outputs, cached_outputs_, partial_outputs):
+                ptt.assert_close(out, cached_out, rtol=0, atol=0)
+                ptt.assert_close(out, partial_out, rtol=0, atol=0)
+
+    def test_deepcopy(self, minimal_tpc):
+        """ Test that a copied GraphModule runs the partial inference with its own copied layers. """
+        graph = self._get_graph(get_model().eval(), minimal_tpc)
+        fx_model, _ = FloatPyTorchModelBuilder(graph, use_fx_graph_module=True).build_model()
+        fx_copy = copy.deepcopy(fx_model)
+        assert isinstance(fx_copy, PytorchFxGraphModule)
+        assert fx_copy.conv is not fx_model.conv
+        assert fx_copy._pytorch_model.conv is fx_copy.conv
+        assert 'conv.weight' in fx_copy.state_dict()
+        assert not any(k.startswith('_pytorch_model') for k in fx_copy.state_dict())
@@ -0,0 +1,97 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import torch
+from torch import nn
+import torch.testing as ptt
+
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModel
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+def get_data_generator():
+    def data_gen():
+        yield [torch.rand(1, 3, 8, 8)]
+    return data_gen
+
+
+def get_branching_model():
+    class Model(nn.Module):
+
+        def __init__(self):
+            super().__init__()
+            self.conv1 = nn.Conv2d(3, 4, kernel_size=3, padding=1)
+            self.conv2 = nn.Conv2d(4, 4, kernel_size=3, padding=1)
+            self.conv3 = nn.Conv2d(4, 4, kernel_size=3, padding=1)
+
+        def forward(self, x):
+            x1 = self.conv1(x)
+            x2 = self.conv2(x1)
+            x3 = self.conv3(x2)
+            return x1 + x3, torch.relu(x2)
+
+    return Model()
+
+
+class TestTensorsLiveness(BaseTorchIntegrationTest):
+    """
+    Test that the PyTorch model built from a graph releases intermediate tensors once their last consumer has run,
+    without changing the model's outputs.
+    """
+
+    def _build_model(self, minimal_tpc, append2output=None):
+        model = get_branching_model().eval()
+        graph = self.run_graph_preparation(model=model, datagen=get_data_generator(), tpc=minimal_tpc)
+        if append2output is not None:
+            append2output = [graph.find_node_by_name(name)[0] for name in append2output]
+        return model, graph, FloatPyTorchModel(graph=graph, append2output=append2output)
+
+    def test_released_after_last_consumer(self, minimal_tpc):
+        """ Test that each non-output node is released exactly once, right after its last consumer. """
+        _, _, pytorch_model = self._build_model(minimal_tpc)
+        graph = pytorch_model.graph
+        output_nodes = [ot.node for ot in graph.get_outputs()]
+        node_position = {n: i for i, n in enumerate(pytorch_model.node_sort)}
+
+        released = [n for nodes in pytorch_model._get_node_to_released_nodes().values() for n in nodes]
+        assert len(released) == len(set(released))
+        assert set(released) == set(pytorch_model.node_sort) - set(output_nodes)
+
+        for node, released_nodes in pytorch_model._get_node_to_released_nodes().items():
+            for released_node in released_nodes:
+                consumers_positions = [node_position[oe.sink_node] for oe in graph.out_edges(released_node)]
+                assert node_position[node] == max(consumers_positions)
+
+    def test_outputs_match_float_model(self, minimal_tpc):
+        """ Test that releasing tensors doesn't change the outputs of the model. """
+        model, _, pytorch_model = self._build_model(minimal_tpc)
+        x = next(get_data_generator()())[0]
+        expected = model(x)
+        outputs = pytorch_model(x.to(get_working_device()))
+        assert len(outputs) == len(expected)
+        for out, exp in zip(outputs, expected):
+            ptt.assert_close(out.cpu(), exp)
+
+    def test_append2output_intermediate_nodes(self, minimal_tpc):
+        """ Test that intermediate nodes that are appended to the output are kept until the end of the forward. """
+        model, _, pytorch_model = self._build_model(minimal_tpc, append2output=['conv1', 'conv2'])
+        released = {n.name for nodes in pytorch_model._get_node_to_released_nodes().values() for n in nodes}
+        assert not {'conv1', 'conv2'} & released
+
+        x = next(get_data_generator()())[0]
+        outputs = pytorch_model(x.to(get_working_device()))
+        assert len(outputs) == 2
+        ptt.assert_close(outputs[0].cpu(), model.conv1(x))
+        ptt.assert_close(outputs[1].cpu(), model.conv2(model.conv1(x)))
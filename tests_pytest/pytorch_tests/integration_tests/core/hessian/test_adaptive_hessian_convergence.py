@@ -0,0 +1,106 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from functools import partial
+
+import numpy as np
+import torch
+
+from model_compression_toolkit.constants import MIN_HESSIAN_ITER
+from model_compression_toolkit.core.common.hessian import HessianInfoService, HessianScoresRequest, HessianMode, \
+    HessianScoresGranularity
+from model_compression_toolkit.core.common.hessian.hessian_info_utils import HutchinsonConvergenceTracker
+from model_compression_toolkit.core.pytorch.hessian import activation_hessian_scores_calculator_pytorch
+from model_compression_toolkit.core.pytorch.hessian.hessian_scores_calculator_pytorch import \
+    HessianScoresCalculatorPytorch
+from tests_pytest._test_util.tpc_util import minimal_tpc
+from tests_pytest.pytorch_tests.integration_tests.core.hessian.test_multi_target_hessian_gradients import Model
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+class TestAdaptiveHessianConvergence(BaseTorchIntegrationTest):
+    input_shape = (2, 3, 8, 8)
+
+    def _prepare(self):
+        graph = self.run_graph_preparation(model=Model(), datagen=self.get_basic_data_gen([self.input_shape]),
+                                           tpc=minimal_tpc())
+        target_nodes = [n for n in graph.get_topo_sorted_nodes() if n.kernel_attr][:3]
+        return graph, target_nodes
+
+    def _fetch(self, service, target_nodes, n_samples):
+        request = HessianScoresRequest(mode=HessianMode.ACTIVATION, granularity=HessianScoresGranularity.PER_TENSOR,
+                                       target_nodes=target_nodes,
+                                       data_loader=[[torch.randn(self.input_shape)] for _ in range(n_samples)],
+                                       n_samples=n_samples)
+        return service.fetch_hessian(request)
+
+    def test_converged_targets_stop(self, mocker):
+        """ Check that targets whose estimation has converged no longer participate in the backward pass, and that
+            the achieved iterations are exposed by the service. """
+        graph, target_nodes = self._prepare()
+
+        class Tracker(HutchinsonConvergenceTracker):
+            # the first target converges after the min number of iterations, the others never converge
+            def update(self, target, estimation):
+                super().update(target, estimation)
+                if target == 0 and self.num_iterations[0] == self.min_iterations:
+                    self.freeze(0)
+
+        mocker.patch.object(activation_hessian_scores_calculator_pytorch, 'HutchinsonConvergenceTracker',
+                            partial(Tracker, tolerance=0))
+        grad_spy = mocker.spy(HessianScoresCalculatorPytorch, '_compute_gradients')
+        n_iter = MIN_HESSIAN_ITER + 5
+        service = HessianInfoService(graph, self.fw_impl, num_iterations_for_approximation=n_iter)
+
+        res = self._fetch(service, target_nodes, n_samples=4)
+
+        assert all(res[n.name].shape == (4, 1) and np.all(res[n.name] > 0) for n in target_nodes)
+        n_grad_inputs = [len(call.args[2]) for call in grad_spy.call_args_list]
+        assert n_grad_inputs == 2 * ([3] * MIN_HESSIAN_ITER + [2] * 5)
+        assert service.get_achieved_iterations() == {target_nodes[0].name: [MIN_HESSIAN_ITER] * 2,
+                                                     target_nodes[1].name: [n_iter] * 2,
+                                                     target_nodes[2].name: [n_iter] * 2}
+
+    def test_all_converged_stops_iterations(self, mocker):
+        """ Check that the estimation stops once all targets have converged. """
+        graph, target_nodes = self._prepare()
+        mocker.patch.object(activation_hessian_scores_calculator_pytorch, 'HutchinsonConvergenceTracker',
+                            partial(HutchinsonConvergenceTracker, tolerance=np.inf))
+        grad_spy = mocker.spy(HessianScoresCalculatorPytorch, '_compute_gradients')
+        service = HessianInfoService(graph, self.fw_impl, num_iterations_for_approximation=100)
+
+        self._fetch(service, target_nodes, n_samples=2)
+
+        assert grad_spy.call_count == MIN_HESSIAN_ITER
+        assert service.get_achieved_iterations() == {n.name: [MIN_HESSIAN_ITER] for n in target_nodes}
+
+    def test_single_sync_per_iteration(self, mocker):
+        """ Check that the per-sample estimations of all targets are fetched from the device once per iteration. """
+        graph, target_nodes = self._prepare()
+        mocker.patch.object(activation_hessian_scores_calculator_pytorch, 'HutchinsonConvergenceTracker',
+                            partial(HutchinsonConvergenceTracker, tolerance=0))
+        update_spy = mocker.spy(HutchinsonConvergenceTracker, 'update_targets')
+        to_numpy_spy = mocker.spy(activation_hessian_scores_calculator_pytorch, 'torch_tensor_to_numpy')
+        item_spy = mocker.spy(torch.Tensor, 'item')
+        n_iter = MIN_HESSIAN_ITER + 2
+        service = HessianInfoService(graph, self.fw_impl, num_iterations_for_approximation=n_iter)
+
+        self._fetch(service, target_nodes, n_samples=4)
+
+        # 2 batches: an update per iteration, with the estimations of the 3 targets for the 2 samples of the batch.
+        assert update_spy.call_count == 2 * n_iter
+        assert all(call.args[1] == [0, 1, 2] and call.args[2].shape == (3, 2) for call in update_spy.call_args_list)
+        # A conversion per iteration, and of the 3 results per batch.
+        assert to_numpy_spy.call_count == 2 * (n_iter + 3)
+        item_spy.assert_not_called()
@@ -0,0 +1,99 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import copy
+
+import torch
+
+from model_compression_toolkit.core.common.hessian import HessianInfoService, HessianScoresRequest, HessianMode, \
+    HessianScoresGranularity
+from model_compression_toolkit.core.pytorch.back2framework.float_model_builder import FloatPyTorchModelBuilder
+from tests_pytest._test_util.tpc_util import minimal_tpc
+from tests_pytest.pytorch_tests.integration_tests.core.hessian.test_multi_target_hessian_gradients import Model
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+class TestHessianModelsPool(BaseTorchIntegrationTest):
+    input_shape = (1, 3, 8, 8)
+
+    def _data_loader(self, n_batches):
+        return [[torch.randn(self.input_shape)] for _ in range(n_batches)]
+
+    def test_models_reused_across_batches_and_requests(self, mocker):
+        """ Check that the service builds a float model once per set of appended outputs. """
+        graph = self.run_graph_preparation(model=Model(), datagen=self.get_basic_data_gen([self.input_shape]),
+                                           tpc=minimal_tpc())
+        conv1, conv2, conv3 = [n for n in graph.get_topo_sorted_nodes() if n.kernel_attr][:3]
+        service = HessianInfoService(graph, self.fw_impl, num_iterations_for_approximation=2)
+        build_spy = mocker.spy(FloatPyTorchModelBuilder, 'build_model')
+
+        def fetch(mode, target_nodes, n_samples):
+            request = HessianScoresRequest(mode=mode, granularity=HessianScoresGranularity.PER_TENSOR,
+                                           target_nodes=target_nodes, data_loader=self._data_loader(n_samples),
+                                           n_samples=n_samples)
+            res = service.fetch_hessian(request)
+            assert all(res[n.name].shape == (n_samples, 1) for n in target_nodes)
+
+        fetch(HessianMode.ACTIVATION, [conv1, conv2], n_samples=3)
+        assert build_spy.call_count == 1
+        # More samples for the same targets.
+        fetch(HessianMode.ACTIVATION, [conv1, conv2], n_samples=5)
+        assert build_spy.call_count == 1
+        # Different targets require different model outputs.
+        fetch(HessianMode.ACTIVATION, [conv3], n_samples=2)
+        assert build_spy.call_count == 2
+        # Weights hessians of any targets are computed on the same model.
+        fetch(HessianMode.WEIGHTS, [conv1, conv2], n_samples=2)
+        fetch(HessianMode.WEIGHTS, [conv3], n_samples=2)
+        assert build_spy.call_count == 3
+
+        service.clear_cache()
+        fetch(HessianMode.WEIGHTS, [conv3], n_samples=1)
+        assert build_spy.call_count == 4
+
+    def test_models_rebuilt_for_modified_graph(self, mocker):
+        """ Check that float models built from the graph are not reused after the graph is replaced, or after the
+            cache is cleared for a graph modified in place. """
+        graph = self.run_graph_preparation(model=Model(), datagen=self.get_basic_data_gen([self.input_shape]),
+                                           tpc=minimal_tpc())
+        conv1 = [n for n in graph.get_topo_sorted_nodes() if n.kernel_attr][0]
+        service = HessianInfoService(graph, self.fw_impl, num_iterations_for_approximation=2)
+        build_spy = mocker.spy(FloatPyTorchModelBuilder, 'build_model')
+        fingerprint_spy = mocker.spy(service, '_get_graph_fingerprint')
+        request = HessianScoresRequest(mode=HessianMode.WEIGHTS, granularity=HessianScoresGranularity.PER_TENSOR,
+                                       target_nodes=[conv1], data_loader=self._data_loader(1), n_samples=1)
+
+        service.fetch_hessian(request, force_compute=True)
+        service.fetch_hessian(request, force_compute=True)
+        assert build_spy.call_count == 1
+        # the graph is fingerprinted only for the persistent cache
+        assert fingerprint_spy.call_count == 0
+
+        def assert_model_weights(float_model, node):
+            assert torch.allclose(getattr(float_model, node.name).weight.detach().cpu(),
+                                  torch.as_tensor(node.get_weights_by_keys(node.kernel_attr)).float())
+
+        conv1.weights = {k: w * 2 for k, w in conv1.weights.items()}
+        service.clear_cache()
+        service.fetch_hessian(request, force_compute=True)
+        assert build_spy.call_count == 2
+        assert_model_weights(build_spy.spy_return[0], conv1)
+
+        new_graph = copy.deepcopy(graph)
+        new_conv1 = new_graph.find_node_by_name(conv1.name)[0]
+        new_conv1.weights = {k: w * 2 for k, w in new_conv1.weights.items()}
+        service.graph = new_graph
+        service.fetch_hessian(request.clone(target_nodes=[new_conv1]), force_compute=True)
+        assert build_spy.call_count == 3
+        assert_model_weights(build_spy.spy_return[0], new_conv1)
@@ -0,0 +1,86 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+import torch
+from torch import nn
+
+from model_compression_toolkit.core.common.hessian import HessianScoresRequest, HessianMode, \
+    HessianScoresGranularity
+from model_compression_toolkit.core.pytorch.hessian import hessian_scores_calculator_pytorch
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from tests_pytest._test_util.tpc_util import minimal_tpc
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+class Model(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.conv2 = nn.Conv2d(4, 4, kernel_size=3, padding=1)
+        self.conv3 = nn.Conv2d(4, 4, kernel_size=3, padding=1)
+        self.flatten = nn.Flatten()
+        self.fc = nn.Linear(4 * 8 * 8, 10)
+
+    def forward(self, x):
+        x = torch.relu(self.conv1(x))
+        x = torch.relu(self.conv2(x)) + x
+        x = self.conv3(x)
+        return self.fc(self.flatten(x))
+
+
+class TestMultiTargetHessianGradients(BaseTorchIntegrationTest):
+    input_shape = (2, 3, 8, 8)
+
+    @pytest.mark.parametrize('mode', [HessianMode.ACTIVATION, HessianMode.WEIGHTS])
+    @pytest.mark.parametrize('granularity', [HessianScoresGranularity.PER_TENSOR,
+                                             HessianScoresGranularity.PER_OUTPUT_CHANNEL])
+    def test_chunked_gradients(self, mode, granularity, mocker):
+        """ Check that the hessians computed with a backward pass per chunk of targets are identical to the
+            hessians computed with a backward pass per target. """
+        graph = self.run_graph_preparation(model=Model(), datagen=self.get_basic_data_gen([self.input_shape]),
+                                           tpc=minimal_tpc())
+        target_nodes = [n for n in graph.get_topo_sorted_nodes() if n.kernel_attr][:-1]
+        assert len(target_nodes) == 3
+        request = HessianScoresRequest(mode=mode, granularity=granularity, target_nodes=target_nodes,
+                                       data_loader=None, n_samples=1)
+        batch_size = self.input_shape[0] if mode == HessianMode.ACTIVATION else 1
+        x = torch.randn((batch_size,) + self.input_shape[1:]).to(get_working_device())
+        n_iter = 5
+
+        def compute(max_grad_targets):
+            mocker.patch.object(hessian_scores_calculator_pytorch, 'HESSIAN_MAX_GRAD_TARGETS', max_grad_targets)
+            grad_spy = mocker.spy(hessian_scores_calculator_pytorch.autograd, 'grad')
+            torch.manual_seed(0)
+            calc = self.fw_impl.get_hessian_scores_calculator(graph=graph, input_images=[x.clone()],
+                                                              hessian_scores_request=request,
+                                                              num_iterations_for_approximation=n_iter)
+            res = calc.compute()
+            n_calls = grad_spy.call_count
+            mocker.stop(grad_spy)
+            return res, n_calls
+
+        single_res, single_n_calls = compute(1)
+        multi_res, multi_n_calls = compute(64)
+        chunked_res, chunked_n_calls = compute(2)
+
+        assert single_n_calls == 3 * n_iter
+        assert multi_n_calls == n_iter
+        assert chunked_n_calls == 2 * n_iter
+        for res in [multi_res, chunked_res]:
+            assert len(res) == len(single_res)
+            for h, single_h in zip(res, single_res):
+                assert h.shape == single_h.shape
+                assert np.allclose(h, single_h, rtol=1e-5, atol=1e-8)
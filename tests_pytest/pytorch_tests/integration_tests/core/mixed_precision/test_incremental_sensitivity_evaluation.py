@@ -0,0 +1,130 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import torch
+from torch import nn
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfig, CoreConfig, QuantizationConfig
+from model_compression_toolkit.core.common.mixed_precision.sensitivity_eval.sensitivity_evaluation import \
+    SensitivityEvaluation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.target_platform_capabilities import AttributeQuantizationConfig, \
+    OpQuantizationConfig, Signedness, QuantizationConfigOptions, OperatorSetNames, TargetPlatformCapabilities, \
+    QuantizationMethod
+from model_compression_toolkit.target_platform_capabilities.constants import KERNEL_ATTR, BIAS_ATTR
+from tests_pytest._test_util.tpc_util import configure_mp_opsets_for_kernel_bias_ops, configure_mp_activation_opsets
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+def build_tpc():
+    w_cfg = AttributeQuantizationConfig(weights_quantization_method=QuantizationMethod.POWER_OF_TWO,
+                                        weights_n_bits=8,
+                                        weights_per_channel_threshold=True,
+                                        enable_weights_quantization=True)
+    op_cfg = OpQuantizationConfig(default_weight_attr_config=w_cfg.clone_and_edit(enable_weights_quantization=False),
+                                  attr_weights_configs_mapping={},
+                                  activation_quantization_method=QuantizationMethod.POWER_OF_TWO,
+                                  activation_n_bits=8,
+                                  supported_input_activation_n_bits=[16, 8],
+                                  enable_activation_quantization=True,
+                                  quantization_preserving=False,
+                                  fixed_scale=None, fixed_zero_point=None, simd_size=32, signedness=Signedness.AUTO)
+    w_op_cfg = op_cfg.clone_and_edit(attr_weights_configs_mapping={KERNEL_ATTR: w_cfg,
+                                                                   BIAS_ATTR: w_cfg.clone_and_edit(
+                                                                       enable_weights_quantization=False)})
+    # configurable activation + weights
+    ops_conv, _ = configure_mp_opsets_for_kernel_bias_ops(opset_names=[OperatorSetNames.CONV],
+                                                          base_w_config=w_cfg, base_op_config=w_op_cfg,
+                                                          w_nbits=(8, 4), a_nbits=(16, 8))
+    # configurable weights
+    ops_fc, _ = configure_mp_opsets_for_kernel_bias_ops(opset_names=[OperatorSetNames.FULLY_CONNECTED],
+                                                        base_w_config=w_cfg, base_op_config=w_op_cfg,
+                                                        w_nbits=(8, 4, 2), a_nbits=(8,))
+    # configurable activations
+    ops_relu, _ = configure_mp_activation_opsets(opset_names=[OperatorSetNames.RELU],
+                                                 base_op_config=op_cfg, a_nbits=(16, 8))
+    return TargetPlatformCapabilities(default_qco=QuantizationConfigOptions(quantization_configurations=[op_cfg]),
+                                      tpc_platform_type='test', operator_set=ops_conv + ops_fc + ops_relu,
+                                      fusing_patterns=None)
+
+
+class Model(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv1 = nn.Conv2d(3, 4, kernel_size=3, padding=1)
+        self.relu = nn.ReLU()
+        self.conv2 = nn.Conv2d(4, 4, kernel_size=3, padding=1)
+        self.flatten = nn.Flatten()
+        self.fc = nn.Linear(8 * 8 * 8, 10)
+
+    def forward(self, x):
+        x = self.relu(self.conv1(x))
+        x = torch.cat([self.conv2(x), x], dim=1)
+        return self.fc(self.flatten(x))
+
+
+class TestIncrementalSensitivityEvaluation(BaseTorchIntegrationTest):
+    input_shape = (2, 3, 8, 8)
+
+    def repr_datagen(self):
+        np.random.seed(42)
+        yield [np.random.rand(*self.input_shape).astype(np.float32)]
+
+    def _setup(self):
+        core_config = CoreConfig(quantization_config=QuantizationConfig(weights_bias_correction=False),
+                                 mixed_precision_config=MixedPrecisionQuantizationConfig(num_of_images=2))
+        graph = self.run_graph_preparation(Model(), self.repr_datagen, tpc=build_tpc(),
+                                           quant_config=core_config.quantization_config, mp=True)
+        graph = quantization_preparation_runner(graph, self.repr_datagen, core_config=core_config,
+                                                fw_impl=self.fw_impl, hessian_info_service=None)
+
+        def get_se(incremental):
+            mp_config = MixedPrecisionQuantizationConfig(num_of_images=2,
+                                                         incremental_sensitivity_evaluation=incremental)
+            return SensitivityEvaluation(graph, mp_config, self.repr_datagen, fw_impl=self.fw_impl)
+        return graph, get_se(False), get_se(True)
+
+    def test_subgraphs(self):
+        """ Test the sub-graphs to run per configurable node and the cached outputs. """
+        graph, _, se = self._setup()
+        calc = se.metric_calculator
+        conv1, relu, conv2, cat, flatten, fc = [n.name for n in graph.get_topo_sorted_nodes()][1:]
+        assert calc.conf_node_to_subgraph == {conv1: {conv1, relu, conv2, cat, flatten, fc},
+                                              relu: {relu, conv2, cat, flatten, fc},
+                                              conv2: {conv2, cat, flatten, fc},
+                                              fc: {fc}}
+        # cached: inputs to sub-graphs from outside (including the skip connection) and interest points
+        exp_cached = {graph.get_inputs()[0].name, conv1, relu, flatten} | {n.name for n in calc.all_interest_points}
+        assert len(calc.mp_cached_outputs) == 1
+        assert set(calc.mp_cached_outputs[0].keys()) == exp_cached
+
+    def test_compute_metric(self, mocker):
+        """ Test metrics computed incrementally are identical to metrics computed by running the full model. """
+        graph, se_full, se_incremental = self._setup()
+        partial_inference_spy = mocker.spy(self.fw_impl, 'sensitivity_eval_partial_inference')
+
+        for n in graph.get_configurable_sorted_nodes():
+            for i in range(len(n.candidates_quantization_cfg)):
+                a_cfg = {n.name: i} if n.has_configurable_activation() else {}
+                w_cfg = {n.name: i} if n.has_any_configurable_weight() else {}
+                with torch.no_grad():
+                    full = se_full.compute_metric(a_cfg, w_cfg)
+                    incremental = se_incremental.compute_metric(a_cfg, w_cfg)
+                assert np.isclose(full, incremental, rtol=1e-6, atol=0)
+                assert partial_inference_spy.call_args.args[2] == se_incremental.metric_calculator.conf_node_to_subgraph[n.name]
+
+        conv1, _, conv2 = [n.name for n in graph.get_configurable_sorted_nodes()][:3]
+        assert np.isclose(se_full.compute_metric({conv1: 1, conv2: 1}, {}),
+                          se_incremental.compute_metric({conv1: 1, conv2: 1}, {}), rtol=1e-6, atol=0)
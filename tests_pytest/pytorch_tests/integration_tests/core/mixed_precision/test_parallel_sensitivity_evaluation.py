@@ -0,0 +1,67 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+
+from model_compression_toolkit.core import MixedPrecisionQuantizationConfig, CoreConfig, QuantizationConfig
+from model_compression_toolkit.core.common.mixed_precision.sensitivity_eval.sensitivity_evaluation import \
+    SensitivityEvaluation
+from model_compression_toolkit.core.quantization_prep_runner import quantization_preparation_runner
+from model_compression_toolkit.logger import Logger
+from tests_pytest.pytorch_tests.integration_tests.core.mixed_precision.test_incremental_sensitivity_evaluation import \
+    Model, build_tpc
+from tests_pytest.pytorch_tests.torch_test_util.torch_test_mixin import BaseTorchIntegrationTest
+
+
+class TestParallelSensitivityEvaluation(BaseTorchIntegrationTest):
+    input_shape = (2, 3, 8, 8)
+
+    def repr_datagen(self):
+        np.random.seed(42)
+        yield [np.random.rand(*self.input_shape).astype(np.float32)]
+
+    def _setup(self, incremental=False):
+        core_config = CoreConfig(quantization_config=QuantizationConfig(weights_bias_correction=False),
+                                 mixed_precision_config=MixedPrecisionQuantizationConfig(num_of_images=2))
+        graph = self.run_graph_preparation(Model(), self.repr_datagen, tpc=build_tpc(),
+                                           quant_config=core_config.quantization_config, mp=True)
+        graph = quantization_preparation_runner(graph, self.repr_datagen, core_config=core_config,
+                                                fw_impl=self.fw_impl, hessian_info_service=None)
+        mp_config = MixedPrecisionQuantizationConfig(num_of_images=2, incremental_sensitivity_evaluation=incremental)
+        se = SensitivityEvaluation(graph, mp_config, self.repr_datagen, fw_impl=self.fw_impl)
+        mp_cfgs = []
+        for n in graph.get_configurable_sorted_nodes():
+            for i in range(len(n.candidates_quantization_cfg)):
+                mp_cfgs.append(({n.name: i} if n.has_configurable_activation() else {},
+                                {n.name: i} if n.has_any_configurable_weight() else {}))
+        return se, mp_cfgs
+
+    def test_parallel_metrics_identical_to_serial(self):
+        """ Test that metrics computed by worker processes are identical to the serially computed metrics. """
+        for incremental in [False, True]:
+            se, mp_cfgs = self._setup(incremental)
+            serial = [se.compute_metric(a_cfg, w_cfg) for a_cfg, w_cfg in mp_cfgs]
+            parallel = se.compute_metrics(mp_cfgs, num_workers=3)
+            assert parallel == serial
+
+    def test_fallback_to_serial(self, mocker):
+        """ Test that metrics are computed in the main process if forked inference is not supported. """
+        se, mp_cfgs = self._setup()
+        mocker.patch.object(self.fw_impl, 'supports_forked_inference', return_value=False)
+        warn_spy = mocker.patch.object(Logger, 'warning')
+        compute_metric_spy = mocker.spy(se, 'compute_metric')
+        metrics = se.compute_metrics(mp_cfgs, num_workers=3)
+        assert 'Parallel sensitivity evaluation is not supported' in warn_spy.call_args.args[0]
+        assert compute_metric_spy.call_count == len(mp_cfgs)
+        assert metrics == [se.compute_metric(a_cfg, w_cfg) for a_cfg, w_cfg in mp_cfgs]
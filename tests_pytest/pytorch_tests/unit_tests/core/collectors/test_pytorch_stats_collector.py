@@ -0,0 +1,118 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import numpy as np
+import pytest
+import torch
+
+from model_compression_toolkit.core.common import StatsCollector
+from model_compression_toolkit.core.common.collectors.statistics_collector import scale_statistics, shift_statistics, \
+    StatsCollectorPlan
+from model_compression_toolkit.core.pytorch.collectors.pytorch_stats_collector import PytorchStatsCollector
+
+
+def _collect(x_list, weights_list, axis, init_min_value=None, init_max_value=None, histogram_streaming=False):
+    np_sc = StatsCollector(axis, init_min_value=init_min_value, init_max_value=init_max_value,
+                           collectors_plan=StatsCollectorPlan(histogram_streaming=histogram_streaming))
+    torch_sc = PytorchStatsCollector(axis, init_min_value=init_min_value, init_max_value=init_max_value,
+                                     collectors_plan=StatsCollectorPlan(histogram_streaming=histogram_streaming))
+    for x, w in zip(x_list, weights_list):
+        np_sc.update_statistics(x, w)
+        torch_sc.update_statistics(torch.from_numpy(x), w)
+    return np_sc, torch_sc
+
+
+def _assert_same_stats(np_sc, torch_sc, counts_rtol=1e-5):
+    assert np_sc.get_min_max_values() == torch_sc.get_min_max_values()
+    assert np.array_equal(np_sc.mpcc.state, torch_sc.mpcc.state)
+    assert np.allclose(np_sc.get_mean(), torch_sc.get_mean())
+    for hc_name in ['hc', 'weighted_hc']:
+        np_bins, np_counts = getattr(np_sc, hc_name).get_histogram()
+        torch_bins, torch_counts = getattr(torch_sc, hc_name).get_histogram()
+        assert np.allclose(np_bins, torch_bins)
+        assert np.allclose(np_counts, torch_counts, rtol=counts_rtol, atol=counts_rtol * np_counts.max())
+
+
+class TestPytorchStatsCollector:
+
+    @pytest.mark.parametrize('axis', [None, 1, -1])
+    def test_statistics_match_numpy_collector(self, axis):
+        x_list = [(np.random.randn(4, 8, 5, 5) * (i + 1)).astype(np.float32) for i in range(4)]
+        weights_list = [np.abs(np.random.randn(4, 8, 5, 5)), None, np.zeros((4, 8, 1, 1)), np.random.rand(4, 1, 1, 1)]
+
+        np_sc, torch_sc = _collect(x_list, weights_list, axis)
+        _assert_same_stats(np_sc, torch_sc)
+
+    def test_streaming_histograms_match_numpy_collector(self):
+        x_list = [(np.random.randn(4, 8, 5, 5) * (1 + i / 4) + i / 10).astype(np.float32) for i in range(8)]
+        weights_list = [np.abs(np.random.randn(4, 8, 5, 5)) for _ in range(8)]
+
+        np_sc, torch_sc = _collect(x_list, weights_list, 1, histogram_streaming=True)
+        assert torch_sc.hc._device_running_histogram is not None
+        assert len(torch_sc.hc._device_histograms) == 0
+        _assert_same_stats(np_sc, torch_sc, counts_rtol=1e-6)
+        assert len(torch_sc.hc._histogram_per_iteration) == 0
+
+    def test_state_kept_on_device_until_accessed(self):
+        torch_sc = PytorchStatsCollector(1)
+        torch_sc.update_statistics(torch.randn(2, 3, 4))
+        torch_sc.update_statistics(torch.randn(2, 3, 4))
+
+        assert isinstance(torch_sc.mpcc._device_state, torch.Tensor)
+        assert isinstance(torch_sc.mc._device_sum, torch.Tensor)
+        assert len(torch_sc.hc._device_histograms) == 2
+        assert len(torch_sc.hc._histogram_per_iteration) == 0
+
+        torch_sc.get_min_max_values()
+        torch_sc.get_mean()
+        torch_sc.hc.get_histogram()
+        assert torch_sc.mpcc._device_state is None and isinstance(torch_sc.mpcc.state, np.ndarray)
+        assert torch_sc.mc._device_sum is None and isinstance(torch_sc.get_mean(), np.ndarray)
+        assert len(torch_sc.hc._device_histograms) == 0
+
+    def test_update_after_access(self):
+        x_list = [np.random.randn(2, 3, 4).astype(np.float32) * (i + 1) for i in range(3)]
+        np_sc, torch_sc = _collect(x_list[:1], [None], 1)
+        torch_sc.get_min_max_values()
+        torch_sc.get_mean()
+        for x in x_list[1:]:
+            np_sc.update_statistics(x)
+            torch_sc.update_statistics(torch.from_numpy(x))
+
+        assert np_sc.get_min_max_values() == torch_sc.get_min_max_values()
+        assert np.allclose(np_sc.get_mean(), torch_sc.get_mean())
+
+    def test_constant_tensor_and_init_values(self):
+        x_list = [np.full((2, 3), 1.5, dtype=np.float32)]
+        np_sc, torch_sc = _collect(x_list, [None], 1, init_min_value=-2., init_max_value=None)
+        _assert_same_stats(np_sc, torch_sc)
+
+    def test_scale_and_shift(self):
+        x_list = [np.random.randn(2, 3, 4).astype(np.float32) for _ in range(2)]
+        np_sc, torch_sc = _collect(x_list, [None, None], 1)
+
+        _assert_same_stats(scale_statistics(np_sc, np.array([2.])), scale_statistics(torch_sc, np.array([2.])))
+        _assert_same_stats(shift_statistics(np_sc, np.array([-1.])), shift_statistics(torch_sc, np.array([-1.])))
+        per_channel = np.array([1., 2., 3.])
+        np_scaled, torch_scaled = scale_statistics(np_sc, per_channel), scale_statistics(torch_sc, per_channel)
+        assert np.array_equal(np_scaled.mpcc.state, torch_scaled.mpcc.state)
+        assert np.allclose(np_scaled.get_mean(), torch_scaled.get_mean())
+        assert not torch_scaled.hc.is_legal
+
+    def test_collectors_plan(self):
+        torch_sc = PytorchStatsCollector(1, collectors_plan=StatsCollectorPlan(histogram=False, weighted_histogram=False,
+                                                                               mean=False))
+        assert torch_sc.hc is None and torch_sc.weighted_hc is None and torch_sc.mc is None
+        torch_sc.update_statistics(torch.tensor([[1., -2., 3.]]))
+        assert torch_sc.get_min_max_values() == (-2., 3.)
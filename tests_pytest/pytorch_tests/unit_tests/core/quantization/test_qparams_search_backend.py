@@ -0,0 +1,94 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+import torch
+
+from model_compression_toolkit.core import QuantizationErrorMethod
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.qparams_search_backend import \
+    get_qparams_search_backend, set_qparams_search_backend
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.power_of_two_selection import \
+    power_of_two_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.symmetric_selection import \
+    symmetric_selection_tensor
+from model_compression_toolkit.core.common.quantization.quantization_params_generation.uniform_selection import \
+    uniform_selection_tensor
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.core.pytorch.quantization.qparams_search_backend import PytorchQParamsSearchBackend
+
+
+@pytest.fixture
+def set_backend():
+    default_backend = get_qparams_search_backend()
+    yield set_qparams_search_backend
+    set_qparams_search_backend(default_backend)
+
+
+def test_chunk_size(mocker):
+    """ Check that on an accelerator, the candidates of large tensors are batched by the available device memory. """
+    mem_get_info = mocker.patch('torch.cuda.mem_get_info', return_value=(8 * 2 ** 30, 16 * 2 ** 30))
+    backend = PytorchQParamsSearchBackend(device=torch.device('cuda'))
+    assert backend.min_batch_candidates == 8
+    # conv kernel and linear kernel
+    assert backend.get_chunk_size(512 * 512 * 3 * 3) == 8
+    assert backend.get_chunk_size(4096 * 4096) == 3
+    mem_get_info.assert_called_with(backend.device)
+    mem_get_info.return_value = (2 ** 28, 16 * 2 ** 30)
+    assert backend.get_chunk_size(4096 * 4096) == 1
+
+    # on the host, large tensors are memory bound, so their candidates are evaluated one by one
+    assert PytorchQParamsSearchBackend(device=torch.device('cpu')).get_chunk_size(512 * 512 * 3 * 3) == 1
+
+
+def test_pytorch_implementation_backend():
+    assert isinstance(PytorchImplementation().get_qparams_search_backend(), PytorchQParamsSearchBackend)
+
+
+@pytest.mark.parametrize('selection_fn', [power_of_two_selection_tensor, symmetric_selection_tensor,
+                                          uniform_selection_tensor])
+@pytest.mark.parametrize('error_method', [QuantizationErrorMethod.MSE, QuantizationErrorMethod.MAE,
+                                          QuantizationErrorMethod.LP, QuantizationErrorMethod.HMSE])
+@pytest.mark.parametrize('per_channel', [True, False])
+def test_search_with_pytorch_backend(selection_fn, error_method, per_channel, set_backend):
+    """ Check that the search with torch tensors selects the same numpy params as the search in numpy. """
+    tensor_data = np.random.default_rng(0).normal(size=(16, 8, 3, 3)).astype(np.float32)
+    hessian_info_service = Mock()
+    hessian_info_service.fetch_hessian.return_value = {
+        'node': np.abs(np.random.default_rng(1).normal(size=(2,) + tensor_data.shape)).astype(np.float32)}
+    node = Mock()
+    node.name = 'node'
+    kwargs = dict(p=3, n_bits=4, per_channel=per_channel, channel_axis=0, quant_error_method=error_method,
+                  node=node, hessian_info_service=hessian_info_service)
+
+    exp_params, exp_axis = selection_fn(tensor_data, **kwargs)
+
+    set_backend(PytorchQParamsSearchBackend(device=torch.device('cpu'), dtype=torch.float64))
+    params, axis = selection_fn(tensor_data, **kwargs)
+    assert axis == exp_axis
+    assert params.keys() == exp_params.keys()
+    for k in params:
+        assert type(params[k]) == type(exp_params[k])
+        assert np.allclose(params[k], exp_params[k], rtol=1e-6, atol=0), k
+
+    # With float32 tensors, near equal candidates errors may be ordered differently and lead the iterative search to
+    # different params, so only the params types and shapes are compared.
+    set_backend(PytorchQParamsSearchBackend(device=torch.device('cpu'), dtype=torch.float32))
+    params, axis = selection_fn(tensor_data, **kwargs)
+    assert axis == exp_axis
+    for k in params:
+        assert type(params[k]) == type(exp_params[k])
+        assert np.shape(params[k]) == np.shape(exp_params[k])
@@ -0,0 +1,42 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+
+import torch
+
+from model_compression_toolkit.core.common.forked_workers import map_in_forked_workers
+from model_compression_toolkit.core.pytorch.pytorch_implementation import PytorchImplementation
+from model_compression_toolkit.logger import Logger
+
+
+def test_workers_use_single_thread():
+    num_threads = torch.get_num_threads()
+    results = list(map_in_forked_workers(lambda _: (os.getpid(), torch.get_num_threads()), range(4), 2,
+                                         PytorchImplementation(), 'test task'))
+    assert all(pid != os.getpid() and n_threads == 1 for pid, n_threads in results)
+    assert torch.get_num_threads() == num_threads
+
+
+def test_no_fork_after_cuda_init(mocker):
+    mocker.patch('torch.cuda.is_initialized', return_value=True)
+    warn_spy = mocker.patch.object(Logger, 'warning')
+    fw_impl = PytorchImplementation()
+    assert not fw_impl.supports_forked_workers()
+
+    results = list(map_in_forked_workers(lambda x: (x, os.getpid()), range(4), 2, fw_impl, 'test task',
+                                         requires_inference=False))
+    assert results == [(x, os.getpid()) for x in range(4)]
+    assert "can't fork worker processes after PytorchImplementation initialized a GPU runtime" in \
+           warn_spy.call_args.args[0]
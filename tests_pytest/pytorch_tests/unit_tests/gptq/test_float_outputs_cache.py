@@ -0,0 +1,94 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+
+import pytest
+import torch
+
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from model_compression_toolkit.gptq import GPTQFloatOutputsCacheConfig
+from model_compression_toolkit.gptq.common.float_outputs_cache import FloatOutputsCacheStorage, \
+    get_float_outputs_cache_storage
+from model_compression_toolkit.gptq.pytorch.float_outputs_cache import PytorchFloatOutputsCache
+
+
+class FloatModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 4, kernel_size=3)
+
+    def forward(self, inputs):
+        x, y = inputs
+        out = self.conv(x)
+        return [out, out.mean(dim=(2, 3)) + y]
+
+
+@pytest.fixture
+def samples():
+    gen = torch.Generator().manual_seed(42)
+    return list(zip(torch.randn((10, 3, 8, 8), generator=gen), torch.randn((10, 4), generator=gen)))
+
+
+@pytest.fixture
+def float_model():
+    torch.manual_seed(0)
+    return FloatModel().to(get_working_device())
+
+
+# cache size of the samples: 10 * (4*6*6 + 4) * 4 bytes
+CACHE_SIZE = 5920
+
+
+def test_get_storage():
+    cfg = GPTQFloatOutputsCacheConfig(max_device_memory=100, max_host_memory=1000)
+    assert get_float_outputs_cache_storage(100, cfg) == FloatOutputsCacheStorage.DEVICE
+    assert get_float_outputs_cache_storage(101, cfg) == FloatOutputsCacheStorage.HOST
+    assert get_float_outputs_cache_storage(1000, cfg) == FloatOutputsCacheStorage.HOST
+    assert get_float_outputs_cache_storage(1001, cfg) == FloatOutputsCacheStorage.MEMMAP
+
+
+@pytest.mark.parametrize('max_device_memory, max_host_memory, exp_storage', [
+    (CACHE_SIZE, CACHE_SIZE, FloatOutputsCacheStorage.DEVICE),
+    (CACHE_SIZE - 1, CACHE_SIZE, FloatOutputsCacheStorage.HOST),
+    (0, CACHE_SIZE - 1, FloatOutputsCacheStorage.MEMMAP),
+])
+def test_cache_outputs(float_model, samples, tmp_path, max_device_memory, max_host_memory, exp_storage):
+    cfg = GPTQFloatOutputsCacheConfig(max_device_memory=max_device_memory, max_host_memory=max_host_memory,
+                                      cache_dir=str(tmp_path))
+    # batch size doesn't divide the number of samples
+    cache = PytorchFloatOutputsCache(float_model, samples, batch_size=4, input_scale=2., cache_config=cfg)
+    assert cache.storage == exp_storage
+    assert len(cache) == len(samples)
+
+    indices = torch.tensor([7, 0, 9, 3])
+    x = torch.stack([samples[i][0] for i in indices]).to(get_working_device())
+    y = torch.stack([samples[i][1] for i in indices]).to(get_working_device())
+    with torch.no_grad():
+        exp_outputs = float_model([2 * x, 2 * y])
+
+    outputs = cache[indices]
+    assert len(outputs) == 2
+    for out, exp_out in zip(outputs, exp_outputs):
+        assert out.device == exp_out.device
+        assert not out.requires_grad
+        assert torch.allclose(out, exp_out, atol=1e-6)
+
+    if exp_storage == FloatOutputsCacheStorage.MEMMAP:
+        [cache_dir] = os.listdir(tmp_path)
+        assert len(os.listdir(tmp_path / cache_dir)) == 2
+        del cache
+        assert os.listdir(tmp_path) == []
+    else:
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,34 @@
+# Copyright 2025 Sony Semiconductor Israel, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from unittest.mock import Mock
+
+import torch
+
+from model_compression_toolkit.core.pytorch.pytorch_device_config import get_working_device
+from model_compression_toolkit.gptq.pytorch.gptq_training import PytorchGPTQTrainer
+
+
+def test_flush_losses():
+    trainer = Mock(loss_list=[])
+    losses = [torch.tensor(float(i), device=get_working_device()) for i in range(5)]
+
+    pending = PytorchGPTQTrainer._flush_losses(trainer, losses[:3], None)
+    # values are appended to the loss list only on the next flush
+    assert trainer.loss_list == []
+    pending = PytorchGPTQTrainer._flush_losses(trainer, losses[3:], pending)
+    assert trainer.loss_list == [0., 1., 2.]
+    pending = PytorchGPTQTrainer._flush_losses(trainer, [], pending)
+    assert trainer.loss_list == [0., 1., 2., 3., 4.]
+    assert pending is None